@@ -24,6 +24,8 @@ namespace ximu3 {
 
 #define XIMU3_CHAR_ARRAY_SIZE 256
 
+#define XIMU3_CLOSURE_TIMING_HISTOGRAM_LENGTH 16
+
 typedef enum XIMU3_ChargingStatus
 {
     XIMU3_ChargingStatusNotConnected,
@@ -61,6 +63,21 @@ typedef enum XIMU3_FileConverterStatus
     XIMU3_FileConverterStatusInProgress,
 } XIMU3_FileConverterStatus;
 
+typedef enum XIMU3_QueuePolicy
+{
+    XIMU3_QueuePolicyBlock,
+    XIMU3_QueuePolicyDropNewest,
+    XIMU3_QueuePolicyDropOldest,
+    XIMU3_QueuePolicyConflate,
+} XIMU3_QueuePolicy;
+
+typedef enum XIMU3_RateLimit
+{
+    XIMU3_RateLimitDecimate,
+    XIMU3_RateLimitMaxRate,
+    XIMU3_RateLimitConflate,
+} XIMU3_RateLimit;
+
 typedef enum XIMU3_Result
 {
     XIMU3_ResultOk,
@@ -77,6 +94,8 @@ typedef struct XIMU3_NetworkAnnouncement XIMU3_NetworkAnnouncement;
 
 typedef struct XIMU3_PortScanner XIMU3_PortScanner;
 
+typedef struct XIMU3_Subscription XIMU3_Subscription;
+
 typedef struct XIMU3_CharArrays
 {
     char (*array)[XIMU3_CHAR_ARRAY_SIZE];
@@ -131,6 +150,22 @@ typedef struct XIMU3_PingResponse
 
 typedef void (*XIMU3_CallbackCharArrays)(struct XIMU3_CharArrays data, void *context);
 
+typedef struct XIMU3_ClosureTiming
+{
+    uint64_t closure_id;
+    uint64_t count;
+    uint64_t total_time;
+    uint64_t max_time;
+    uint64_t histogram[XIMU3_CLOSURE_TIMING_HISTOGRAM_LENGTH];
+} XIMU3_ClosureTiming;
+
+typedef struct XIMU3_ClosureTimings
+{
+    struct XIMU3_ClosureTiming *array;
+    uint32_t length;
+    uint32_t capacity;
+} XIMU3_ClosureTimings;
+
 typedef struct XIMU3_Statistics
 {
     uint64_t timestamp;
@@ -140,6 +175,8 @@ typedef struct XIMU3_Statistics
     uint32_t message_rate;
     uint64_t error_total;
     uint32_t error_rate;
+    uint64_t skipped_total;
+    uint64_t dropped_total;
 } XIMU3_Statistics;
 
 typedef void (*XIMU3_CallbackDecodeError)(enum XIMU3_DecodeError data, void *context);
@@ -159,6 +196,8 @@ typedef struct XIMU3_InertialMessage
 
 typedef void (*XIMU3_CallbackInertialMessage)(struct XIMU3_InertialMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackInertialMessage)(const struct XIMU3_InertialMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_MagnetometerMessage
 {
     uint64_t timestamp;
@@ -169,6 +208,8 @@ typedef struct XIMU3_MagnetometerMessage
 
 typedef void (*XIMU3_CallbackMagnetometerMessage)(struct XIMU3_MagnetometerMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackMagnetometerMessage)(const struct XIMU3_MagnetometerMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_QuaternionMessage
 {
     uint64_t timestamp;
@@ -180,6 +221,8 @@ typedef struct XIMU3_QuaternionMessage
 
 typedef void (*XIMU3_CallbackQuaternionMessage)(struct XIMU3_QuaternionMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackQuaternionMessage)(const struct XIMU3_QuaternionMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_RotationMatrixMessage
 {
     uint64_t timestamp;
@@ -196,6 +239,8 @@ typedef struct XIMU3_RotationMatrixMessage
 
 typedef void (*XIMU3_CallbackRotationMatrixMessage)(struct XIMU3_RotationMatrixMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackRotationMatrixMessage)(const struct XIMU3_RotationMatrixMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_EulerAnglesMessage
 {
     uint64_t timestamp;
@@ -206,6 +251,8 @@ typedef struct XIMU3_EulerAnglesMessage
 
 typedef void (*XIMU3_CallbackEulerAnglesMessage)(struct XIMU3_EulerAnglesMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackEulerAnglesMessage)(const struct XIMU3_EulerAnglesMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_LinearAccelerationMessage
 {
     uint64_t timestamp;
@@ -220,6 +267,8 @@ typedef struct XIMU3_LinearAccelerationMessage
 
 typedef void (*XIMU3_CallbackLinearAccelerationMessage)(struct XIMU3_LinearAccelerationMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackLinearAccelerationMessage)(const struct XIMU3_LinearAccelerationMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_EarthAccelerationMessage
 {
     uint64_t timestamp;
@@ -234,6 +283,8 @@ typedef struct XIMU3_EarthAccelerationMessage
 
 typedef void (*XIMU3_CallbackEarthAccelerationMessage)(struct XIMU3_EarthAccelerationMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackEarthAccelerationMessage)(const struct XIMU3_EarthAccelerationMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_AhrsStatusMessage
 {
     uint64_t timestamp;
@@ -245,6 +296,8 @@ typedef struct XIMU3_AhrsStatusMessage
 
 typedef void (*XIMU3_CallbackAhrsStatusMessage)(struct XIMU3_AhrsStatusMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackAhrsStatusMessage)(const struct XIMU3_AhrsStatusMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_HighGAccelerometerMessage
 {
     uint64_t timestamp;
@@ -255,6 +308,8 @@ typedef struct XIMU3_HighGAccelerometerMessage
 
 typedef void (*XIMU3_CallbackHighGAccelerometerMessage)(struct XIMU3_HighGAccelerometerMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackHighGAccelerometerMessage)(const struct XIMU3_HighGAccelerometerMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_TemperatureMessage
 {
     uint64_t timestamp;
@@ -263,6 +318,8 @@ typedef struct XIMU3_TemperatureMessage
 
 typedef void (*XIMU3_CallbackTemperatureMessage)(struct XIMU3_TemperatureMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackTemperatureMessage)(const struct XIMU3_TemperatureMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_BatteryMessage
 {
     uint64_t timestamp;
@@ -273,6 +330,8 @@ typedef struct XIMU3_BatteryMessage
 
 typedef void (*XIMU3_CallbackBatteryMessage)(struct XIMU3_BatteryMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackBatteryMessage)(const struct XIMU3_BatteryMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_RssiMessage
 {
     uint64_t timestamp;
@@ -282,6 +341,8 @@ typedef struct XIMU3_RssiMessage
 
 typedef void (*XIMU3_CallbackRssiMessage)(struct XIMU3_RssiMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackRssiMessage)(const struct XIMU3_RssiMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_SerialAccessoryMessage
 {
     uint64_t timestamp;
@@ -291,6 +352,8 @@ typedef struct XIMU3_SerialAccessoryMessage
 
 typedef void (*XIMU3_CallbackSerialAccessoryMessage)(struct XIMU3_SerialAccessoryMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackSerialAccessoryMessage)(const struct XIMU3_SerialAccessoryMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_NotificationMessage
 {
     uint64_t timestamp;
@@ -300,6 +363,8 @@ typedef struct XIMU3_NotificationMessage
 
 typedef void (*XIMU3_CallbackNotificationMessage)(struct XIMU3_NotificationMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackNotificationMessage)(const struct XIMU3_NotificationMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_ErrorMessage
 {
     uint64_t timestamp;
@@ -309,6 +374,8 @@ typedef struct XIMU3_ErrorMessage
 
 typedef void (*XIMU3_CallbackErrorMessage)(struct XIMU3_ErrorMessage data, void *context);
 
+typedef void (*XIMU3_BatchCallbackErrorMessage)(const struct XIMU3_ErrorMessage *data, uint32_t length, void *context);
+
 typedef struct XIMU3_FileConverterProgress
 {
     enum XIMU3_FileConverterStatus status;
@@ -368,6 +435,10 @@ void XIMU3_char_arrays_free(struct XIMU3_CharArrays char_arrays);
 
 const char *XIMU3_charging_status_to_string(enum XIMU3_ChargingStatus charging_status);
 
+const char *XIMU3_closure_timing_to_string(struct XIMU3_ClosureTiming closure_timing);
+
+void XIMU3_closure_timings_free(struct XIMU3_ClosureTimings closure_timings);
+
 struct XIMU3_Connection *XIMU3_connection_new_usb(struct XIMU3_UsbConnectionInfo connection_info);
 
 struct XIMU3_Connection *XIMU3_connection_new_serial(struct XIMU3_SerialConnectionInfo connection_info);
@@ -410,42 +481,186 @@ struct XIMU3_FileConnectionInfo XIMU3_connection_get_info_file(struct XIMU3_Conn
 
 struct XIMU3_Statistics XIMU3_connection_get_statistics(struct XIMU3_Connection *connection);
 
+struct XIMU3_ClosureTimings XIMU3_connection_get_closure_timings(struct XIMU3_Connection *connection);
+
+void XIMU3_connection_set_max_frame_size(struct XIMU3_Connection *connection, uint32_t max_frame_size);
+
+void XIMU3_connection_set_queue_capacity(struct XIMU3_Connection *connection, uint32_t queue_capacity);
+
+void XIMU3_connection_set_queue_policy(struct XIMU3_Connection *connection, enum XIMU3_QueuePolicy queue_policy);
+
+void XIMU3_connection_set_inline_dispatch(struct XIMU3_Connection *connection, bool inline_dispatch);
+
+void XIMU3_connection_set_reactor_enabled(struct XIMU3_Connection *connection, bool reactor_enabled);
+
+void XIMU3_connection_set_receive_buffer_size(struct XIMU3_Connection *connection, uint32_t receive_buffer_size);
+
+void XIMU3_connection_set_receive_port_shared(struct XIMU3_Connection *connection, bool receive_port_shared);
+
+void XIMU3_connection_set_tcp_no_delay(struct XIMU3_Connection *connection, bool tcp_no_delay);
+
+void XIMU3_connection_set_memory_mapped(struct XIMU3_Connection *connection, bool memory_mapped);
+
+void XIMU3_connection_set_replay(struct XIMU3_Connection *connection, float speed, uint64_t start_time, uint64_t stop_time);
+
 uint64_t XIMU3_connection_add_decode_error_callback(struct XIMU3_Connection *connection, XIMU3_CallbackDecodeError callback, void *context);
 
 uint64_t XIMU3_connection_add_statistics_callback(struct XIMU3_Connection *connection, XIMU3_CallbackStatistics callback, void *context);
 
 uint64_t XIMU3_connection_add_inertial_callback(struct XIMU3_Connection *connection, XIMU3_CallbackInertialMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_inertial_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackInertialMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_inertial_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackInertialMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_inertial(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_inertial(struct XIMU3_Subscription *subscription, struct XIMU3_InertialMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_magnetometer_callback(struct XIMU3_Connection *connection, XIMU3_CallbackMagnetometerMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_magnetometer_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackMagnetometerMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_magnetometer_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackMagnetometerMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_magnetometer(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_magnetometer(struct XIMU3_Subscription *subscription, struct XIMU3_MagnetometerMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_quaternion_callback(struct XIMU3_Connection *connection, XIMU3_CallbackQuaternionMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_quaternion_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackQuaternionMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_quaternion_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackQuaternionMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_quaternion(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_quaternion(struct XIMU3_Subscription *subscription, struct XIMU3_QuaternionMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_rotation_matrix_callback(struct XIMU3_Connection *connection, XIMU3_CallbackRotationMatrixMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_rotation_matrix_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackRotationMatrixMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_rotation_matrix_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackRotationMatrixMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_rotation_matrix(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_rotation_matrix(struct XIMU3_Subscription *subscription, struct XIMU3_RotationMatrixMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_euler_angles_callback(struct XIMU3_Connection *connection, XIMU3_CallbackEulerAnglesMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_euler_angles_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackEulerAnglesMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_euler_angles_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackEulerAnglesMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_euler_angles(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_euler_angles(struct XIMU3_Subscription *subscription, struct XIMU3_EulerAnglesMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_linear_acceleration_callback(struct XIMU3_Connection *connection, XIMU3_CallbackLinearAccelerationMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_linear_acceleration_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackLinearAccelerationMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_linear_acceleration_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackLinearAccelerationMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_linear_acceleration(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_linear_acceleration(struct XIMU3_Subscription *subscription, struct XIMU3_LinearAccelerationMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_earth_acceleration_callback(struct XIMU3_Connection *connection, XIMU3_CallbackEarthAccelerationMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_earth_acceleration_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackEarthAccelerationMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_earth_acceleration_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackEarthAccelerationMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_earth_acceleration(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_earth_acceleration(struct XIMU3_Subscription *subscription, struct XIMU3_EarthAccelerationMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_ahrs_status_callback(struct XIMU3_Connection *connection, XIMU3_CallbackAhrsStatusMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_ahrs_status_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackAhrsStatusMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_ahrs_status_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackAhrsStatusMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_ahrs_status(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_ahrs_status(struct XIMU3_Subscription *subscription, struct XIMU3_AhrsStatusMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_high_g_accelerometer_callback(struct XIMU3_Connection *connection, XIMU3_CallbackHighGAccelerometerMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_high_g_accelerometer_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackHighGAccelerometerMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_high_g_accelerometer_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackHighGAccelerometerMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_high_g_accelerometer(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_high_g_accelerometer(struct XIMU3_Subscription *subscription, struct XIMU3_HighGAccelerometerMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_temperature_callback(struct XIMU3_Connection *connection, XIMU3_CallbackTemperatureMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_temperature_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackTemperatureMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_temperature_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackTemperatureMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_temperature(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_temperature(struct XIMU3_Subscription *subscription, struct XIMU3_TemperatureMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_battery_callback(struct XIMU3_Connection *connection, XIMU3_CallbackBatteryMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_battery_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackBatteryMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_battery_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackBatteryMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_battery(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_battery(struct XIMU3_Subscription *subscription, struct XIMU3_BatteryMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_rssi_callback(struct XIMU3_Connection *connection, XIMU3_CallbackRssiMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_rssi_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackRssiMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_rssi_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackRssiMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_rssi(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_rssi(struct XIMU3_Subscription *subscription, struct XIMU3_RssiMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_serial_accessory_callback(struct XIMU3_Connection *connection, XIMU3_CallbackSerialAccessoryMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_serial_accessory_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackSerialAccessoryMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_serial_accessory_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackSerialAccessoryMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_serial_accessory(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_serial_accessory(struct XIMU3_Subscription *subscription, struct XIMU3_SerialAccessoryMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_notification_callback(struct XIMU3_Connection *connection, XIMU3_CallbackNotificationMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_notification_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackNotificationMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_notification_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackNotificationMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_notification(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_notification(struct XIMU3_Subscription *subscription, struct XIMU3_NotificationMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_error_callback(struct XIMU3_Connection *connection, XIMU3_CallbackErrorMessage callback, void *context);
 
+uint64_t XIMU3_connection_add_error_batch_callback(struct XIMU3_Connection *connection, uint32_t max_batch, uint32_t max_latency, XIMU3_BatchCallbackErrorMessage callback, void *context);
+
+uint64_t XIMU3_connection_add_error_rate_limited_callback(struct XIMU3_Connection *connection, enum XIMU3_RateLimit rate_limit, uint32_t value, XIMU3_CallbackErrorMessage callback, void *context);
+
+struct XIMU3_Subscription *XIMU3_connection_subscribe_error(struct XIMU3_Connection *connection, uint32_t capacity);
+
+uint32_t XIMU3_connection_poll_error(struct XIMU3_Subscription *subscription, struct XIMU3_ErrorMessage *messages, uint32_t length);
+
 uint64_t XIMU3_connection_add_end_of_file_callback(struct XIMU3_Connection *connection, void (*callback)(void *context), void *context);
 
+uint64_t XIMU3_connection_add_time_budget_callback(struct XIMU3_Connection *connection, uint32_t time_budget, void (*callback)(uint64_t closure_id, uint64_t time, void *context), void *context);
+
 void XIMU3_connection_remove_callback(struct XIMU3_Connection *connection, uint64_t callback_id);
 
 const char *XIMU3_usb_connection_info_to_string(struct XIMU3_UsbConnectionInfo connection_info);
@@ -562,10 +777,19 @@ struct XIMU3_Devices XIMU3_port_scanner_scan_filter(enum XIMU3_ConnectionType co
 
 struct XIMU3_CharArrays XIMU3_port_scanner_get_port_names(void);
 
+const char *XIMU3_queue_policy_to_string(enum XIMU3_QueuePolicy queue_policy);
+
+const char *XIMU3_rate_limit_to_string(enum XIMU3_RateLimit rate_limit);
+
 const char *XIMU3_result_to_string(enum XIMU3_Result result);
 
 const char *XIMU3_statistics_to_string(struct XIMU3_Statistics statistics);
 
+/**
+ * Must be called before XIMU3_connection_free is called for the connection that created the subscription.
+ */
+void XIMU3_subscription_free(struct XIMU3_Subscription *subscription);
+
 #ifdef __cplusplus
 } // extern "C"
 #endif // __cplusplus
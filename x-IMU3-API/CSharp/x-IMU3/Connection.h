@@ -7,6 +7,7 @@
 #include "EventArgs.h"
 #include "Helpers.h"
 #include "PingResponse.h"
+#include "QueuePolicy.h"
 #include "Result.h"
 #include "Statistics.h"
 
@@ -127,6 +128,56 @@ namespace Ximu3
             return gcnew Statistics(ximu3::XIMU3_connection_get_statistics(connection));
         }
 
+        void SetMaxFrameSize(UInt32 maxFrameSize)
+        {
+            ximu3::XIMU3_connection_set_max_frame_size(connection, maxFrameSize);
+        }
+
+        void SetQueueCapacity(UInt32 queueCapacity)
+        {
+            ximu3::XIMU3_connection_set_queue_capacity(connection, queueCapacity);
+        }
+
+        void SetQueuePolicy(QueuePolicy queuePolicy)
+        {
+            ximu3::XIMU3_connection_set_queue_policy(connection, (ximu3::XIMU3_QueuePolicy)queuePolicy);
+        }
+
+        void SetInlineDispatch(bool inlineDispatch)
+        {
+            ximu3::XIMU3_connection_set_inline_dispatch(connection, inlineDispatch);
+        }
+
+        void SetReactorEnabled(bool reactorEnabled)
+        {
+            ximu3::XIMU3_connection_set_reactor_enabled(connection, reactorEnabled);
+        }
+
+        void SetReceiveBufferSize(UInt32 receiveBufferSize)
+        {
+            ximu3::XIMU3_connection_set_receive_buffer_size(connection, receiveBufferSize);
+        }
+
+        void SetReceivePortShared(bool receivePortShared)
+        {
+            ximu3::XIMU3_connection_set_receive_port_shared(connection, receivePortShared);
+        }
+
+        void SetTcpNoDelay(bool tcpNoDelay)
+        {
+            ximu3::XIMU3_connection_set_tcp_no_delay(connection, tcpNoDelay);
+        }
+
+        void SetMemoryMapped(bool memoryMapped)
+        {
+            ximu3::XIMU3_connection_set_memory_mapped(connection, memoryMapped);
+        }
+
+        void SetReplay(float speed, UInt64 startTime, UInt64 stopTime)
+        {
+            ximu3::XIMU3_connection_set_replay(connection, speed, startTime, stopTime);
+        }
+
     internal:
         ximu3::XIMU3_Connection* connection;
 
@@ -0,0 +1,14 @@
+#pragma once
+
+#include "../../C/Ximu3.h"
+
+namespace Ximu3
+{
+    public enum class QueuePolicy
+    {
+        Block = ximu3::XIMU3_QueuePolicyBlock,
+        DropNewest = ximu3::XIMU3_QueuePolicyDropNewest,
+        DropOldest = ximu3::XIMU3_QueuePolicyDropOldest,
+        Conflate = ximu3::XIMU3_QueuePolicyConflate,
+    };
+}
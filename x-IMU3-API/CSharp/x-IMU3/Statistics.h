@@ -75,6 +75,22 @@ namespace Ximu3
             }
         }
 
+        property uint64_t SkippedTotal
+        {
+            uint64_t get()
+            {
+                return statistics->skipped_total;
+            }
+        }
+
+        property uint64_t DroppedTotal
+        {
+            uint64_t get()
+            {
+                return statistics->dropped_total;
+            }
+        }
+
         String^ ToString() override
         {
             return gcnew String(ximu3::XIMU3_statistics_to_string(*statistics));
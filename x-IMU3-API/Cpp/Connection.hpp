@@ -139,6 +139,56 @@ namespace ximu3
             return XIMU3_connection_get_statistics(connection);
         }
 
+        void setMaxFrameSize(const uint32_t maxFrameSize)
+        {
+            XIMU3_connection_set_max_frame_size(connection, maxFrameSize);
+        }
+
+        void setQueueCapacity(const uint32_t queueCapacity)
+        {
+            XIMU3_connection_set_queue_capacity(connection, queueCapacity);
+        }
+
+        void setQueuePolicy(const XIMU3_QueuePolicy queuePolicy)
+        {
+            XIMU3_connection_set_queue_policy(connection, queuePolicy);
+        }
+
+        void setInlineDispatch(const bool inlineDispatch)
+        {
+            XIMU3_connection_set_inline_dispatch(connection, inlineDispatch);
+        }
+
+        void setReactorEnabled(const bool reactorEnabled)
+        {
+            XIMU3_connection_set_reactor_enabled(connection, reactorEnabled);
+        }
+
+        void setReceiveBufferSize(const uint32_t receiveBufferSize)
+        {
+            XIMU3_connection_set_receive_buffer_size(connection, receiveBufferSize);
+        }
+
+        void setReceivePortShared(const bool receivePortShared)
+        {
+            XIMU3_connection_set_receive_port_shared(connection, receivePortShared);
+        }
+
+        void setTcpNoDelay(const bool tcpNoDelay)
+        {
+            XIMU3_connection_set_tcp_no_delay(connection, tcpNoDelay);
+        }
+
+        void setMemoryMapped(const bool memoryMapped)
+        {
+            XIMU3_connection_set_memory_mapped(connection, memoryMapped);
+        }
+
+        void setReplay(const float speed, const uint64_t startTime, const uint64_t stopTime)
+        {
+            XIMU3_connection_set_replay(connection, speed, startTime, stopTime);
+        }
+
         uint64_t addDecodeErrorCallback(std::function<void(XIMU3_DecodeError)>& callback)
         {
             return XIMU3_connection_add_decode_error_callback(connection, Helpers::wrapCallable<XIMU3_DecodeError>(callback), &callback);
@@ -156,76 +206,225 @@ namespace ximu3
             return XIMU3_connection_add_inertial_callback(connection, Helpers::wrapCallable<XIMU3_InertialMessage>(callback), &callback);
         }
 
+        uint64_t addInertialBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_InertialMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_inertial_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_InertialMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addInertialRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_InertialMessage)>& callback)
+        {
+            return XIMU3_connection_add_inertial_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_InertialMessage>(callback), &callback);
+        }
+
         uint64_t addMagnetometerCallback(std::function<void(XIMU3_MagnetometerMessage)>& callback)
         {
             return XIMU3_connection_add_magnetometer_callback(connection, Helpers::wrapCallable<XIMU3_MagnetometerMessage>(callback), &callback);
         }
 
+        uint64_t addMagnetometerBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_MagnetometerMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_magnetometer_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_MagnetometerMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addMagnetometerRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_MagnetometerMessage)>& callback)
+        {
+            return XIMU3_connection_add_magnetometer_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_MagnetometerMessage>(callback), &callback);
+        }
+
         uint64_t addQuaternionCallback(std::function<void(XIMU3_QuaternionMessage)>& callback)
         {
             return XIMU3_connection_add_quaternion_callback(connection, Helpers::wrapCallable<XIMU3_QuaternionMessage>(callback), &callback);
         }
 
+        uint64_t addQuaternionBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_QuaternionMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_quaternion_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_QuaternionMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addQuaternionRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_QuaternionMessage)>& callback)
+        {
+            return XIMU3_connection_add_quaternion_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_QuaternionMessage>(callback), &callback);
+        }
+
         uint64_t addRotationMatrixCallback(std::function<void(XIMU3_RotationMatrixMessage)>& callback)
         {
             return XIMU3_connection_add_rotation_matrix_callback(connection, Helpers::wrapCallable<XIMU3_RotationMatrixMessage>(callback), &callback);
         }
 
+        uint64_t addRotationMatrixBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_RotationMatrixMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_rotation_matrix_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_RotationMatrixMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addRotationMatrixRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_RotationMatrixMessage)>& callback)
+        {
+            return XIMU3_connection_add_rotation_matrix_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_RotationMatrixMessage>(callback), &callback);
+        }
+
         uint64_t addEulerAnglesCallback(std::function<void(XIMU3_EulerAnglesMessage)>& callback)
         {
             return XIMU3_connection_add_euler_angles_callback(connection, Helpers::wrapCallable<XIMU3_EulerAnglesMessage>(callback), &callback);
         }
 
+        uint64_t addEulerAnglesBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_EulerAnglesMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_euler_angles_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_EulerAnglesMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addEulerAnglesRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_EulerAnglesMessage)>& callback)
+        {
+            return XIMU3_connection_add_euler_angles_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_EulerAnglesMessage>(callback), &callback);
+        }
+
         uint64_t addLinearAccelerationCallback(std::function<void(XIMU3_LinearAccelerationMessage)>& callback)
         {
             return XIMU3_connection_add_linear_acceleration_callback(connection, Helpers::wrapCallable<XIMU3_LinearAccelerationMessage>(callback), &callback);
         }
 
+        uint64_t addLinearAccelerationBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_LinearAccelerationMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_linear_acceleration_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_LinearAccelerationMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addLinearAccelerationRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_LinearAccelerationMessage)>& callback)
+        {
+            return XIMU3_connection_add_linear_acceleration_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_LinearAccelerationMessage>(callback), &callback);
+        }
+
         uint64_t addEarthAccelerationCallback(std::function<void(XIMU3_EarthAccelerationMessage)>& callback)
         {
             return XIMU3_connection_add_earth_acceleration_callback(connection, Helpers::wrapCallable<XIMU3_EarthAccelerationMessage>(callback), &callback);
         }
 
+        uint64_t addEarthAccelerationBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_EarthAccelerationMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_earth_acceleration_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_EarthAccelerationMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addEarthAccelerationRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_EarthAccelerationMessage)>& callback)
+        {
+            return XIMU3_connection_add_earth_acceleration_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_EarthAccelerationMessage>(callback), &callback);
+        }
+
         uint64_t addAhrsStatusCallback(std::function<void(XIMU3_AhrsStatusMessage)>& callback)
         {
             return XIMU3_connection_add_ahrs_status_callback(connection, Helpers::wrapCallable<XIMU3_AhrsStatusMessage>(callback), &callback);
         }
 
+        uint64_t addAhrsStatusBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_AhrsStatusMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_ahrs_status_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_AhrsStatusMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addAhrsStatusRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_AhrsStatusMessage)>& callback)
+        {
+            return XIMU3_connection_add_ahrs_status_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_AhrsStatusMessage>(callback), &callback);
+        }
+
         uint64_t addHighGAccelerometerCallback(std::function<void(XIMU3_HighGAccelerometerMessage)>& callback)
         {
             return XIMU3_connection_add_high_g_accelerometer_callback(connection, Helpers::wrapCallable<XIMU3_HighGAccelerometerMessage>(callback), &callback);
         }
 
+        uint64_t addHighGAccelerometerBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_HighGAccelerometerMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_high_g_accelerometer_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_HighGAccelerometerMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addHighGAccelerometerRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_HighGAccelerometerMessage)>& callback)
+        {
+            return XIMU3_connection_add_high_g_accelerometer_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_HighGAccelerometerMessage>(callback), &callback);
+        }
+
         uint64_t addTemperatureCallback(std::function<void(XIMU3_TemperatureMessage)>& callback)
         {
             return XIMU3_connection_add_temperature_callback(connection, Helpers::wrapCallable<XIMU3_TemperatureMessage>(callback), &callback);
         }
 
+        uint64_t addTemperatureBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_TemperatureMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_temperature_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_TemperatureMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addTemperatureRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_TemperatureMessage)>& callback)
+        {
+            return XIMU3_connection_add_temperature_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_TemperatureMessage>(callback), &callback);
+        }
+
         uint64_t addBatteryCallback(std::function<void(XIMU3_BatteryMessage)>& callback)
         {
             return XIMU3_connection_add_battery_callback(connection, Helpers::wrapCallable<XIMU3_BatteryMessage>(callback), &callback);
         }
 
+        uint64_t addBatteryBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_BatteryMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_battery_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_BatteryMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addBatteryRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_BatteryMessage)>& callback)
+        {
+            return XIMU3_connection_add_battery_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_BatteryMessage>(callback), &callback);
+        }
+
         uint64_t addRssiCallback(std::function<void(XIMU3_RssiMessage)>& callback)
         {
             return XIMU3_connection_add_rssi_callback(connection, Helpers::wrapCallable<XIMU3_RssiMessage>(callback), &callback);
         }
 
+        uint64_t addRssiBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_RssiMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_rssi_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_RssiMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addRssiRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_RssiMessage)>& callback)
+        {
+            return XIMU3_connection_add_rssi_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_RssiMessage>(callback), &callback);
+        }
+
         uint64_t addSerialAccessoryCallback(std::function<void(XIMU3_SerialAccessoryMessage)>& callback)
         {
             return XIMU3_connection_add_serial_accessory_callback(connection, Helpers::wrapCallable<XIMU3_SerialAccessoryMessage>(callback), &callback);
         }
 
+        uint64_t addSerialAccessoryBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_SerialAccessoryMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_serial_accessory_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_SerialAccessoryMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addSerialAccessoryRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_SerialAccessoryMessage)>& callback)
+        {
+            return XIMU3_connection_add_serial_accessory_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_SerialAccessoryMessage>(callback), &callback);
+        }
+
         uint64_t addNotificationCallback(std::function<void(XIMU3_NotificationMessage)>& callback)
         {
             return XIMU3_connection_add_notification_callback(connection, Helpers::wrapCallable<XIMU3_NotificationMessage>(callback), &callback);
         }
 
+        uint64_t addNotificationBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_NotificationMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_notification_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_NotificationMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addNotificationRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_NotificationMessage)>& callback)
+        {
+            return XIMU3_connection_add_notification_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_NotificationMessage>(callback), &callback);
+        }
+
         uint64_t addErrorCallback(std::function<void(XIMU3_ErrorMessage)>& callback)
         {
             return XIMU3_connection_add_error_callback(connection, Helpers::wrapCallable<XIMU3_ErrorMessage>(callback), &callback);
         }
 
+        uint64_t addErrorBatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_ErrorMessage*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_error_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_ErrorMessage*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t addErrorRateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_ErrorMessage)>& callback)
+        {
+            return XIMU3_connection_add_error_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_ErrorMessage>(callback), &callback);
+        }
         // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
         uint64_t addEndOfFileCallback(std::function<void()>& callback)
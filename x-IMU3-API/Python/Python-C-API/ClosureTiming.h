@@ -0,0 +1,99 @@
+#ifndef CLOSURE_TIMING_H
+#define CLOSURE_TIMING_H
+
+#include "../../C/Ximu3.h"
+#include <Python.h>
+
+typedef struct
+{
+    PyObject_HEAD
+    XIMU3_ClosureTiming closure_timing;
+} ClosureTiming;
+
+static void closure_timing_free(ClosureTiming* self)
+{
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* closure_timing_get_closure_id(ClosureTiming* self)
+{
+    return Py_BuildValue("K", self->closure_timing.closure_id);
+}
+
+static PyObject* closure_timing_get_count(ClosureTiming* self)
+{
+    return Py_BuildValue("K", self->closure_timing.count);
+}
+
+static PyObject* closure_timing_get_total_time(ClosureTiming* self)
+{
+    return Py_BuildValue("K", self->closure_timing.total_time);
+}
+
+static PyObject* closure_timing_get_max_time(ClosureTiming* self)
+{
+    return Py_BuildValue("K", self->closure_timing.max_time);
+}
+
+static PyObject* closure_timing_get_histogram(ClosureTiming* self)
+{
+    PyObject* const histogram = PyList_New(XIMU3_CLOSURE_TIMING_HISTOGRAM_LENGTH);
+
+    for (int index = 0; index < XIMU3_CLOSURE_TIMING_HISTOGRAM_LENGTH; index++)
+    {
+        PyList_SetItem(histogram, index, Py_BuildValue("K", self->closure_timing.histogram[index]));
+    }
+
+    return histogram;
+}
+
+static PyObject* closure_timing_to_string(ClosureTiming* self, PyObject* args)
+{
+    return Py_BuildValue("s", XIMU3_closure_timing_to_string(self->closure_timing));
+}
+
+static PyGetSetDef closure_timing_get_set[] = {
+        { "closure_id", (getter) closure_timing_get_closure_id, NULL, "", NULL },
+        { "count",      (getter) closure_timing_get_count,      NULL, "", NULL },
+        { "total_time", (getter) closure_timing_get_total_time, NULL, "", NULL },
+        { "max_time",   (getter) closure_timing_get_max_time,   NULL, "", NULL },
+        { "histogram",  (getter) closure_timing_get_histogram,  NULL, "", NULL },
+        { NULL }  /* sentinel */
+};
+
+static PyMethodDef closure_timing_methods[] = {
+        { "to_string", (PyCFunction) closure_timing_to_string, METH_NOARGS, "" },
+        { NULL } /* sentinel */
+};
+
+static PyTypeObject closure_timing_object = {
+        PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "ximu3.ClosureTiming",
+        .tp_basicsize = sizeof(ClosureTiming),
+        .tp_dealloc = (destructor) closure_timing_free,
+        .tp_new = PyType_GenericNew,
+        .tp_getset = closure_timing_get_set,
+        .tp_methods = closure_timing_methods,
+};
+
+static PyObject* closure_timing_from(const XIMU3_ClosureTiming* const closure_timing)
+{
+    ClosureTiming* const self = (ClosureTiming*) closure_timing_object.tp_alloc(&closure_timing_object, 0);
+    self->closure_timing = *closure_timing;
+    return (PyObject*) self;
+}
+
+static PyObject* closure_timings_to_list_and_free(const XIMU3_ClosureTimings closure_timings)
+{
+    PyObject* const closure_timings_list = PyList_New(closure_timings.length);
+
+    for (uint32_t index = 0; index < closure_timings.length; index++)
+    {
+        PyList_SetItem(closure_timings_list, index, closure_timing_from(&closure_timings.array[index]));
+    }
+
+    XIMU3_closure_timings_free(closure_timings);
+    return closure_timings_list;
+}
+
+#endif
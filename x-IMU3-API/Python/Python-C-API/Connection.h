@@ -3,12 +3,14 @@
 
 #include "../../C/Ximu3.h"
 #include "CharArraysCallback.h"
+#include "ClosureTiming.h"
 #include "ConnectionInfo.h"
 #include "DataMessages/DataMessages.h"
 #include "DecodeError.h"
 #include "Helpers.h"
 #include "PingResponse.h"
 #include <Python.h>
+#include "QueuePolicy.h"
 #include "Result.h"
 #include "Statistics.h"
 
@@ -255,11 +257,889 @@ static PyObject* connection_get_statistics(Connection* self, PyObject* args)
     return statistics_from(&statistics);
 }
 
+static PyObject* connection_get_closure_timings(Connection* self, PyObject* args)
+{
+    return closure_timings_to_list_and_free(XIMU3_connection_get_closure_timings(self->connection));
+}
+
+static PyObject* connection_set_max_frame_size(Connection* self, PyObject* args)
+{
+    unsigned long max_frame_size;
+
+    if (PyArg_ParseTuple(args, "k", &max_frame_size) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_max_frame_size(self->connection, (uint32_t) max_frame_size);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_queue_capacity(Connection* self, PyObject* args)
+{
+    unsigned long queue_capacity;
+
+    if (PyArg_ParseTuple(args, "k", &queue_capacity) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_queue_capacity(self->connection, (uint32_t) queue_capacity);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_queue_policy(Connection* self, PyObject* args)
+{
+    int queue_policy_int;
+
+    if (PyArg_ParseTuple(args, "i", &queue_policy_int) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    const XIMU3_QueuePolicy queue_policy_enum = (XIMU3_QueuePolicy) queue_policy_int;
+
+    switch (queue_policy_enum)
+    {
+        case XIMU3_QueuePolicyBlock:
+        case XIMU3_QueuePolicyDropNewest:
+        case XIMU3_QueuePolicyDropOldest:
+        case XIMU3_QueuePolicyConflate:
+            XIMU3_connection_set_queue_policy(self->connection, queue_policy_enum);
+            Py_INCREF(Py_None);
+            return Py_None;
+    }
+
+    PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+    return NULL;
+}
+
+static PyObject* connection_set_inline_dispatch(Connection* self, PyObject* args)
+{
+    bool inline_dispatch;
+
+    if (PyArg_ParseTuple(args, "p", &inline_dispatch) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_inline_dispatch(self->connection, inline_dispatch);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_reactor_enabled(Connection* self, PyObject* args)
+{
+    bool reactor_enabled;
+
+    if (PyArg_ParseTuple(args, "p", &reactor_enabled) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_reactor_enabled(self->connection, reactor_enabled);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_receive_buffer_size(Connection* self, PyObject* args)
+{
+    unsigned long receive_buffer_size;
+
+    if (PyArg_ParseTuple(args, "k", &receive_buffer_size) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_receive_buffer_size(self->connection, (uint32_t) receive_buffer_size);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_receive_port_shared(Connection* self, PyObject* args)
+{
+    bool receive_port_shared;
+
+    if (PyArg_ParseTuple(args, "p", &receive_port_shared) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_receive_port_shared(self->connection, receive_port_shared);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_tcp_no_delay(Connection* self, PyObject* args)
+{
+    bool tcp_no_delay;
+
+    if (PyArg_ParseTuple(args, "p", &tcp_no_delay) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_tcp_no_delay(self->connection, tcp_no_delay);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_memory_mapped(Connection* self, PyObject* args)
+{
+    bool memory_mapped;
+
+    if (PyArg_ParseTuple(args, "p", &memory_mapped) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_memory_mapped(self->connection, memory_mapped);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject* connection_set_replay(Connection* self, PyObject* args)
+{
+    float speed;
+    unsigned long long start_time;
+    unsigned long long stop_time;
+
+    if (PyArg_ParseTuple(args, "fKK", &speed, &start_time, &stop_time) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    XIMU3_connection_set_replay(self->connection, speed, (uint64_t) start_time, (uint64_t) stop_time);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyObject* connection_add_decode_error_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_decode_error_callback(self->connection, decode_error_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_statistics_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_statistics_callback(self->connection, statistics_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+// Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+static PyObject* connection_add_inertial_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_inertial_callback(self->connection, inertial_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_inertial_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_inertial_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, inertial_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_inertial_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_inertial_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, inertial_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_magnetometer_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_magnetometer_callback(self->connection, magnetometer_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_magnetometer_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_magnetometer_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, magnetometer_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_magnetometer_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_magnetometer_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, magnetometer_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_quaternion_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_quaternion_callback(self->connection, quaternion_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_quaternion_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_quaternion_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, quaternion_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_quaternion_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_quaternion_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, quaternion_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_rotation_matrix_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_rotation_matrix_callback(self->connection, rotation_matrix_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_rotation_matrix_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_rotation_matrix_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, rotation_matrix_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_rotation_matrix_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_rotation_matrix_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, rotation_matrix_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_euler_angles_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_euler_angles_callback(self->connection, euler_angles_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_euler_angles_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_euler_angles_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, euler_angles_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_euler_angles_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_euler_angles_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, euler_angles_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_linear_acceleration_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_linear_acceleration_callback(self->connection, linear_acceleration_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_linear_acceleration_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_linear_acceleration_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, linear_acceleration_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_linear_acceleration_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_linear_acceleration_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, linear_acceleration_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_earth_acceleration_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_earth_acceleration_callback(self->connection, earth_acceleration_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_earth_acceleration_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_earth_acceleration_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, earth_acceleration_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_earth_acceleration_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_earth_acceleration_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, earth_acceleration_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_ahrs_status_callback(Connection* self, PyObject* args)
+{
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_ahrs_status_callback(self->connection, ahrs_status_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_ahrs_status_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
@@ -275,21 +1155,34 @@ static PyObject* connection_add_decode_error_callback(Connection* self, PyObject
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_decode_error_callback(self->connection, decode_error_callback, callable);
+        id = XIMU3_connection_add_ahrs_status_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, ahrs_status_messages_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_statistics_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_ahrs_status_rate_limited_callback(Connection* self, PyObject* args)
 {
+    int rate_limit;
+    unsigned long value;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
     }
 
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
     if (PyCallable_Check(callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
@@ -300,14 +1193,12 @@ static PyObject* connection_add_statistics_callback(Connection* self, PyObject*
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_statistics_callback(self->connection, statistics_callback, callable);
+        id = XIMU3_connection_add_ahrs_status_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, ahrs_status_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-// Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-
-static PyObject* connection_add_inertial_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_high_g_accelerometer_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
 
@@ -327,16 +1218,18 @@ static PyObject* connection_add_inertial_callback(Connection* self, PyObject* ar
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_inertial_callback(self->connection, inertial_message_callback, callable);
+        id = XIMU3_connection_add_high_g_accelerometer_callback(self->connection, high_g_accelerometer_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_magnetometer_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_high_g_accelerometer_batch_callback(Connection* self, PyObject* args)
 {
+    unsigned long max_batch;
+    unsigned long max_latency;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
@@ -352,21 +1245,34 @@ static PyObject* connection_add_magnetometer_callback(Connection* self, PyObject
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_magnetometer_callback(self->connection, magnetometer_message_callback, callable);
+        id = XIMU3_connection_add_high_g_accelerometer_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, high_g_accelerometer_messages_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_quaternion_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_high_g_accelerometer_rate_limited_callback(Connection* self, PyObject* args)
 {
+    int rate_limit;
+    unsigned long value;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
     }
 
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
     if (PyCallable_Check(callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
@@ -377,12 +1283,12 @@ static PyObject* connection_add_quaternion_callback(Connection* self, PyObject*
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_quaternion_callback(self->connection, quaternion_message_callback, callable);
+        id = XIMU3_connection_add_high_g_accelerometer_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, high_g_accelerometer_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_rotation_matrix_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_temperature_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
 
@@ -402,16 +1308,18 @@ static PyObject* connection_add_rotation_matrix_callback(Connection* self, PyObj
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_rotation_matrix_callback(self->connection, rotation_matrix_message_callback, callable);
+        id = XIMU3_connection_add_temperature_callback(self->connection, temperature_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_euler_angles_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_temperature_batch_callback(Connection* self, PyObject* args)
 {
+    unsigned long max_batch;
+    unsigned long max_latency;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
@@ -427,21 +1335,34 @@ static PyObject* connection_add_euler_angles_callback(Connection* self, PyObject
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_euler_angles_callback(self->connection, euler_angles_message_callback, callable);
+        id = XIMU3_connection_add_temperature_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, temperature_messages_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_linear_acceleration_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_temperature_rate_limited_callback(Connection* self, PyObject* args)
 {
+    int rate_limit;
+    unsigned long value;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
     }
 
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
     if (PyCallable_Check(callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
@@ -452,12 +1373,12 @@ static PyObject* connection_add_linear_acceleration_callback(Connection* self, P
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_linear_acceleration_callback(self->connection, linear_acceleration_message_callback, callable);
+        id = XIMU3_connection_add_temperature_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, temperature_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_earth_acceleration_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_battery_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
 
@@ -477,16 +1398,18 @@ static PyObject* connection_add_earth_acceleration_callback(Connection* self, Py
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_earth_acceleration_callback(self->connection, earth_acceleration_message_callback, callable);
+        id = XIMU3_connection_add_battery_callback(self->connection, battery_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_ahrs_status_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_battery_batch_callback(Connection* self, PyObject* args)
 {
+    unsigned long max_batch;
+    unsigned long max_latency;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
@@ -502,21 +1425,34 @@ static PyObject* connection_add_ahrs_status_callback(Connection* self, PyObject*
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_ahrs_status_callback(self->connection, ahrs_status_message_callback, callable);
+        id = XIMU3_connection_add_battery_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, battery_messages_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_high_g_accelerometer_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_battery_rate_limited_callback(Connection* self, PyObject* args)
 {
+    int rate_limit;
+    unsigned long value;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
     }
 
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
     if (PyCallable_Check(callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
@@ -527,12 +1463,12 @@ static PyObject* connection_add_high_g_accelerometer_callback(Connection* self,
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_high_g_accelerometer_callback(self->connection, high_g_accelerometer_message_callback, callable);
+        id = XIMU3_connection_add_battery_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, battery_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_temperature_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_rssi_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
 
@@ -552,16 +1488,18 @@ static PyObject* connection_add_temperature_callback(Connection* self, PyObject*
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_temperature_callback(self->connection, temperature_message_callback, callable);
+        id = XIMU3_connection_add_rssi_callback(self->connection, rssi_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_battery_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_rssi_batch_callback(Connection* self, PyObject* args)
 {
+    unsigned long max_batch;
+    unsigned long max_latency;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
@@ -577,21 +1515,34 @@ static PyObject* connection_add_battery_callback(Connection* self, PyObject* arg
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_battery_callback(self->connection, battery_message_callback, callable);
+        id = XIMU3_connection_add_rssi_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, rssi_messages_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
 
-static PyObject* connection_add_rssi_callback(Connection* self, PyObject* args)
+static PyObject* connection_add_rssi_rate_limited_callback(Connection* self, PyObject* args)
 {
+    int rate_limit;
+    unsigned long value;
     PyObject* callable;
 
-    if (PyArg_ParseTuple(args, "O:set_callback", &callable) == 0)
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
         return NULL;
     }
 
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
     if (PyCallable_Check(callable) == 0)
     {
         PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
@@ -602,7 +1553,7 @@ static PyObject* connection_add_rssi_callback(Connection* self, PyObject* args)
 
     uint64_t id;
     Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
-        id = XIMU3_connection_add_rssi_callback(self->connection, rssi_message_callback, callable);
+        id = XIMU3_connection_add_rssi_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, rssi_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
@@ -632,6 +1583,71 @@ static PyObject* connection_add_serial_accessory_callback(Connection* self, PyOb
     return Py_BuildValue("K", id);
 }
 
+static PyObject* connection_add_serial_accessory_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_serial_accessory_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, serial_accessory_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_serial_accessory_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_serial_accessory_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, serial_accessory_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
 static PyObject* connection_add_notification_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
@@ -657,6 +1673,71 @@ static PyObject* connection_add_notification_callback(Connection* self, PyObject
     return Py_BuildValue("K", id);
 }
 
+static PyObject* connection_add_notification_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_notification_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, notification_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_notification_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_notification_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, notification_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
 static PyObject* connection_add_error_callback(Connection* self, PyObject* args)
 {
     PyObject* callable;
@@ -681,6 +1762,71 @@ static PyObject* connection_add_error_callback(Connection* self, PyObject* args)
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
 }
+
+static PyObject* connection_add_error_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_error_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, error_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_error_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_error_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, error_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
 // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 static void end_of_file_callback(void* context)
@@ -717,6 +1863,43 @@ static PyObject* connection_add_end_of_file_callback(Connection* self, PyObject*
     return Py_BuildValue("K", id);
 }
 
+static void time_budget_callback(uint64_t closure_id, uint64_t time, void* context)
+{
+    const PyGILState_STATE state = PyGILState_Ensure();
+
+    PyObject* const tuple = Py_BuildValue("(KK)", closure_id, time);
+    Py_DECREF(PyObject_CallObject((PyObject*) context, tuple));
+    Py_DECREF(tuple);
+
+    PyGILState_Release(state);
+}
+
+static PyObject* connection_add_time_budget_callback(Connection* self, PyObject* args)
+{
+    unsigned long time_budget;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kO:set_callback", &time_budget, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_time_budget_callback(self->connection, (uint32_t) time_budget, time_budget_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
 static PyObject* connection_remove_callback(Connection* self, PyObject* args)
 {
     unsigned long long callback_id;
@@ -743,26 +1926,68 @@ static PyMethodDef connection_methods[] = {
         { "send_commands_async",               (PyCFunction) connection_send_commands_async,               METH_VARARGS, "" },
         { "get_info",                          (PyCFunction) connection_get_info,                          METH_NOARGS,  "" },
         { "get_statistics",                    (PyCFunction) connection_get_statistics,                    METH_NOARGS,  "" },
+        { "get_closure_timings",               (PyCFunction) connection_get_closure_timings,               METH_NOARGS,  "" },
+        { "set_max_frame_size",                (PyCFunction) connection_set_max_frame_size,                METH_VARARGS, "" },
+        { "set_queue_capacity",                (PyCFunction) connection_set_queue_capacity,                METH_VARARGS, "" },
+        { "set_queue_policy",                  (PyCFunction) connection_set_queue_policy,                  METH_VARARGS, "" },
+        { "set_inline_dispatch",               (PyCFunction) connection_set_inline_dispatch,               METH_VARARGS, "" },
+        { "set_reactor_enabled",               (PyCFunction) connection_set_reactor_enabled,               METH_VARARGS, "" },
+        { "set_receive_buffer_size",           (PyCFunction) connection_set_receive_buffer_size,           METH_VARARGS, "" },
+        { "set_receive_port_shared",           (PyCFunction) connection_set_receive_port_shared,           METH_VARARGS, "" },
+        { "set_tcp_no_delay",                  (PyCFunction) connection_set_tcp_no_delay,                  METH_VARARGS, "" },
+        { "set_memory_mapped",                 (PyCFunction) connection_set_memory_mapped,                 METH_VARARGS, "" },
+        { "set_replay",                        (PyCFunction) connection_set_replay,                        METH_VARARGS, "" },
         { "add_decode_error_callback",         (PyCFunction) connection_add_decode_error_callback,         METH_VARARGS, "" },
         { "add_statistics_callback",           (PyCFunction) connection_add_statistics_callback,           METH_VARARGS, "" },
         // Start of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
         { "add_inertial_callback",             (PyCFunction) connection_add_inertial_callback,             METH_VARARGS, "" },
+        { "add_inertial_batch_callback",       (PyCFunction) connection_add_inertial_batch_callback,       METH_VARARGS, "" },
+        { "add_inertial_rate_limited_callback", (PyCFunction) connection_add_inertial_rate_limited_callback, METH_VARARGS, "" },
         { "add_magnetometer_callback",         (PyCFunction) connection_add_magnetometer_callback,         METH_VARARGS, "" },
+        { "add_magnetometer_batch_callback",   (PyCFunction) connection_add_magnetometer_batch_callback,   METH_VARARGS, "" },
+        { "add_magnetometer_rate_limited_callback", (PyCFunction) connection_add_magnetometer_rate_limited_callback, METH_VARARGS, "" },
         { "add_quaternion_callback",           (PyCFunction) connection_add_quaternion_callback,           METH_VARARGS, "" },
+        { "add_quaternion_batch_callback",     (PyCFunction) connection_add_quaternion_batch_callback,     METH_VARARGS, "" },
+        { "add_quaternion_rate_limited_callback", (PyCFunction) connection_add_quaternion_rate_limited_callback, METH_VARARGS, "" },
         { "add_rotation_matrix_callback",      (PyCFunction) connection_add_rotation_matrix_callback,      METH_VARARGS, "" },
+        { "add_rotation_matrix_batch_callback", (PyCFunction) connection_add_rotation_matrix_batch_callback, METH_VARARGS, "" },
+        { "add_rotation_matrix_rate_limited_callback", (PyCFunction) connection_add_rotation_matrix_rate_limited_callback, METH_VARARGS, "" },
         { "add_euler_angles_callback",         (PyCFunction) connection_add_euler_angles_callback,         METH_VARARGS, "" },
+        { "add_euler_angles_batch_callback",   (PyCFunction) connection_add_euler_angles_batch_callback,   METH_VARARGS, "" },
+        { "add_euler_angles_rate_limited_callback", (PyCFunction) connection_add_euler_angles_rate_limited_callback, METH_VARARGS, "" },
         { "add_linear_acceleration_callback",  (PyCFunction) connection_add_linear_acceleration_callback,  METH_VARARGS, "" },
+        { "add_linear_acceleration_batch_callback", (PyCFunction) connection_add_linear_acceleration_batch_callback, METH_VARARGS, "" },
+        { "add_linear_acceleration_rate_limited_callback", (PyCFunction) connection_add_linear_acceleration_rate_limited_callback, METH_VARARGS, "" },
         { "add_earth_acceleration_callback",   (PyCFunction) connection_add_earth_acceleration_callback,   METH_VARARGS, "" },
+        { "add_earth_acceleration_batch_callback", (PyCFunction) connection_add_earth_acceleration_batch_callback, METH_VARARGS, "" },
+        { "add_earth_acceleration_rate_limited_callback", (PyCFunction) connection_add_earth_acceleration_rate_limited_callback, METH_VARARGS, "" },
         { "add_ahrs_status_callback",          (PyCFunction) connection_add_ahrs_status_callback,          METH_VARARGS, "" },
+        { "add_ahrs_status_batch_callback",    (PyCFunction) connection_add_ahrs_status_batch_callback,    METH_VARARGS, "" },
+        { "add_ahrs_status_rate_limited_callback", (PyCFunction) connection_add_ahrs_status_rate_limited_callback, METH_VARARGS, "" },
         { "add_high_g_accelerometer_callback", (PyCFunction) connection_add_high_g_accelerometer_callback, METH_VARARGS, "" },
+        { "add_high_g_accelerometer_batch_callback", (PyCFunction) connection_add_high_g_accelerometer_batch_callback, METH_VARARGS, "" },
+        { "add_high_g_accelerometer_rate_limited_callback", (PyCFunction) connection_add_high_g_accelerometer_rate_limited_callback, METH_VARARGS, "" },
         { "add_temperature_callback",          (PyCFunction) connection_add_temperature_callback,          METH_VARARGS, "" },
+        { "add_temperature_batch_callback",    (PyCFunction) connection_add_temperature_batch_callback,    METH_VARARGS, "" },
+        { "add_temperature_rate_limited_callback", (PyCFunction) connection_add_temperature_rate_limited_callback, METH_VARARGS, "" },
         { "add_battery_callback",              (PyCFunction) connection_add_battery_callback,              METH_VARARGS, "" },
+        { "add_battery_batch_callback",        (PyCFunction) connection_add_battery_batch_callback,        METH_VARARGS, "" },
+        { "add_battery_rate_limited_callback", (PyCFunction) connection_add_battery_rate_limited_callback, METH_VARARGS, "" },
         { "add_rssi_callback",                 (PyCFunction) connection_add_rssi_callback,                 METH_VARARGS, "" },
+        { "add_rssi_batch_callback",           (PyCFunction) connection_add_rssi_batch_callback,           METH_VARARGS, "" },
+        { "add_rssi_rate_limited_callback",    (PyCFunction) connection_add_rssi_rate_limited_callback,    METH_VARARGS, "" },
         { "add_serial_accessory_callback",     (PyCFunction) connection_add_serial_accessory_callback,     METH_VARARGS, "" },
+        { "add_serial_accessory_batch_callback", (PyCFunction) connection_add_serial_accessory_batch_callback, METH_VARARGS, "" },
+        { "add_serial_accessory_rate_limited_callback", (PyCFunction) connection_add_serial_accessory_rate_limited_callback, METH_VARARGS, "" },
         { "add_notification_callback",         (PyCFunction) connection_add_notification_callback,         METH_VARARGS, "" },
+        { "add_notification_batch_callback",   (PyCFunction) connection_add_notification_batch_callback,   METH_VARARGS, "" },
+        { "add_notification_rate_limited_callback", (PyCFunction) connection_add_notification_rate_limited_callback, METH_VARARGS, "" },
         { "add_error_callback",                (PyCFunction) connection_add_error_callback,                METH_VARARGS, "" },
+        { "add_error_batch_callback",          (PyCFunction) connection_add_error_batch_callback,          METH_VARARGS, "" },
+        { "add_error_rate_limited_callback",   (PyCFunction) connection_add_error_rate_limited_callback,   METH_VARARGS, "" },
         // End of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
         { "add_end_of_file_callback",          (PyCFunction) connection_add_end_of_file_callback,          METH_VARARGS, "" },
+        { "add_time_budget_callback",          (PyCFunction) connection_add_time_budget_callback,          METH_VARARGS, "" },
         { "remove_callback",                   (PyCFunction) connection_remove_callback,                   METH_VARARGS, "" },
         { NULL } /* sentinel */
 };
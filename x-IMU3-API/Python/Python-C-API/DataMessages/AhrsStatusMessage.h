@@ -90,4 +90,23 @@ static void ahrs_status_message_callback(XIMU3_AhrsStatusMessage data, void* con
     PyGILState_Release(state);
 }
 
+static void ahrs_status_messages_callback(const XIMU3_AhrsStatusMessage* const data, const uint32_t length, void* context)
+{
+    const PyGILState_STATE state = PyGILState_Ensure();
+
+    PyObject* const list = PyList_New(length);
+
+    for (uint32_t index = 0; index < length; index++)
+    {
+        PyList_SetItem(list, index, ahrs_status_message_from(&data[index]));
+    }
+
+    PyObject* const tuple = Py_BuildValue("(O)", list);
+    Py_DECREF(PyObject_CallObject((PyObject*) context, tuple));
+    Py_DECREF(tuple);
+    Py_DECREF(list);
+
+    PyGILState_Release(state);
+}
+
 #endif
@@ -84,4 +84,23 @@ static void battery_message_callback(XIMU3_BatteryMessage data, void* context)
     PyGILState_Release(state);
 }
 
+static void battery_messages_callback(const XIMU3_BatteryMessage* const data, const uint32_t length, void* context)
+{
+    const PyGILState_STATE state = PyGILState_Ensure();
+
+    PyObject* const list = PyList_New(length);
+
+    for (uint32_t index = 0; index < length; index++)
+    {
+        PyList_SetItem(list, index, battery_message_from(&data[index]));
+    }
+
+    PyObject* const tuple = Py_BuildValue("(O)", list);
+    Py_DECREF(PyObject_CallObject((PyObject*) context, tuple));
+    Py_DECREF(tuple);
+    Py_DECREF(list);
+
+    PyGILState_Release(state);
+}
+
 #endif
@@ -111,4 +111,23 @@ static void earth_acceleration_message_callback(XIMU3_EarthAccelerationMessage d
     PyGILState_Release(state);
 }
 
+static void earth_acceleration_messages_callback(const XIMU3_EarthAccelerationMessage* const data, const uint32_t length, void* context)
+{
+    const PyGILState_STATE state = PyGILState_Ensure();
+
+    PyObject* const list = PyList_New(length);
+
+    for (uint32_t index = 0; index < length; index++)
+    {
+        PyList_SetItem(list, index, earth_acceleration_message_from(&data[index]));
+    }
+
+    PyObject* const tuple = Py_BuildValue("(O)", list);
+    Py_DECREF(PyObject_CallObject((PyObject*) context, tuple));
+    Py_DECREF(tuple);
+    Py_DECREF(list);
+
+    PyGILState_Release(state);
+}
+
 #endif
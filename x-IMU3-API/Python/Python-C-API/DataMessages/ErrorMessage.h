@@ -78,4 +78,23 @@ static void error_message_callback(XIMU3_ErrorMessage data, void* context)
     PyGILState_Release(state);
 }
 
+static void error_messages_callback(const XIMU3_ErrorMessage* const data, const uint32_t length, void* context)
+{
+    const PyGILState_STATE state = PyGILState_Ensure();
+
+    PyObject* const list = PyList_New(length);
+
+    for (uint32_t index = 0; index < length; index++)
+    {
+        PyList_SetItem(list, index, error_message_from(&data[index]));
+    }
+
+    PyObject* const tuple = Py_BuildValue("(O)", list);
+    Py_DECREF(PyObject_CallObject((PyObject*) context, tuple));
+    Py_DECREF(tuple);
+    Py_DECREF(list);
+
+    PyGILState_Release(state);
+}
+
 #endif
@@ -0,0 +1,38 @@
+#ifndef QUEUE_POLICY_H
+#define QUEUE_POLICY_H
+
+#include "../../C/Ximu3.h"
+#include "Helpers.h"
+#include <Python.h>
+
+static PyObject* queue_policy_to_string(PyObject* self, PyObject* args)
+{
+    int queue_policy_int;
+
+    if (PyArg_ParseTuple(args, "i", &queue_policy_int) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    const XIMU3_QueuePolicy queue_policy_enum = (XIMU3_QueuePolicy) queue_policy_int;
+
+    switch (queue_policy_enum)
+    {
+        case XIMU3_QueuePolicyBlock:
+        case XIMU3_QueuePolicyDropNewest:
+        case XIMU3_QueuePolicyDropOldest:
+        case XIMU3_QueuePolicyConflate:
+            return Py_BuildValue("s", XIMU3_queue_policy_to_string(queue_policy_enum));
+    }
+
+    PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+    return NULL;
+}
+
+static PyMethodDef queue_policy_methods[] = {
+        { "queue_policy_to_string", (PyCFunction) queue_policy_to_string, METH_VARARGS, "" },
+        { NULL } /* sentinel */
+};
+
+#endif
@@ -0,0 +1,37 @@
+#ifndef RATE_LIMIT_H
+#define RATE_LIMIT_H
+
+#include "../../C/Ximu3.h"
+#include "Helpers.h"
+#include <Python.h>
+
+static PyObject* rate_limit_to_string(PyObject* self, PyObject* args)
+{
+    int rate_limit_int;
+
+    if (PyArg_ParseTuple(args, "i", &rate_limit_int) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    const XIMU3_RateLimit rate_limit_enum = (XIMU3_RateLimit) rate_limit_int;
+
+    switch (rate_limit_enum)
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            return Py_BuildValue("s", XIMU3_rate_limit_to_string(rate_limit_enum));
+    }
+
+    PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+    return NULL;
+}
+
+static PyMethodDef rate_limit_methods[] = {
+        { "rate_limit_to_string", (PyCFunction) rate_limit_to_string, METH_VARARGS, "" },
+        { NULL } /* sentinel */
+};
+
+#endif
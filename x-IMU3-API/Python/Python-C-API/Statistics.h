@@ -50,6 +50,16 @@ static PyObject* statistics_get_error_rate(Statistics* self)
     return Py_BuildValue("k", self->statistics.error_rate);
 }
 
+static PyObject* statistics_get_skipped_total(Statistics* self)
+{
+    return Py_BuildValue("K", self->statistics.skipped_total);
+}
+
+static PyObject* statistics_get_dropped_total(Statistics* self)
+{
+    return Py_BuildValue("K", self->statistics.dropped_total);
+}
+
 static PyObject* statistics_to_string(Statistics* self, PyObject* args)
 {
     return Py_BuildValue("s", XIMU3_statistics_to_string(self->statistics));
@@ -63,6 +73,8 @@ static PyGetSetDef statistics_get_set[] = {
         { "message_rate",  (getter) statistics_get_message_rate,  NULL, "", NULL },
         { "error_total",   (getter) statistics_get_error_total,   NULL, "", NULL },
         { "error_rate",    (getter) statistics_get_error_rate,    NULL, "", NULL },
+        { "skipped_total", (getter) statistics_get_skipped_total, NULL, "", NULL },
+        { "dropped_total", (getter) statistics_get_dropped_total, NULL, "", NULL },
         { NULL }  /* sentinel */
 };
 
@@ -1,5 +1,6 @@
 #include "../../C/Ximu3.h"
 #include "ChargingStatus.h"
+#include "ClosureTiming.h"
 #include "Connection.h"
 #include "ConnectionInfo.h"
 #include "ConnectionType.h"
@@ -14,6 +15,8 @@
 #include "NetworkAnnouncementMessage.h"
 #include "PingResponse.h"
 #include "PortScanner.h"
+#include "QueuePolicy.h"
+#include "RateLimit.h"
 #include <Python.h>
 #include "Result.h"
 #include "Statistics.h"
@@ -67,12 +70,21 @@ PyMODINIT_FUNC PyInit_ximu3()
         (PyModule_AddIntConstant(module, "FILE_CONVERTER_STATUS_COMPLETE", XIMU3_FileConverterStatusComplete) == 0) &&
         (PyModule_AddIntConstant(module, "FILE_CONVERTER_STATUS_FAILED", XIMU3_FileConverterStatusFailed) == 0) &&
         (PyModule_AddIntConstant(module, "FILE_CONVERTER_STATUS_IN_PROGRESS", XIMU3_FileConverterStatusInProgress) == 0) &&
+        (PyModule_AddIntConstant(module, "QUEUE_POLICY_BLOCK", XIMU3_QueuePolicyBlock) == 0) &&
+        (PyModule_AddIntConstant(module, "QUEUE_POLICY_DROP_NEWEST", XIMU3_QueuePolicyDropNewest) == 0) &&
+        (PyModule_AddIntConstant(module, "QUEUE_POLICY_DROP_OLDEST", XIMU3_QueuePolicyDropOldest) == 0) &&
+        (PyModule_AddIntConstant(module, "QUEUE_POLICY_CONFLATE", XIMU3_QueuePolicyConflate) == 0) &&
+        (PyModule_AddIntConstant(module, "RATE_LIMIT_DECIMATE", XIMU3_RateLimitDecimate) == 0) &&
+        (PyModule_AddIntConstant(module, "RATE_LIMIT_MAX_RATE", XIMU3_RateLimitMaxRate) == 0) &&
+        (PyModule_AddIntConstant(module, "RATE_LIMIT_CONFLATE", XIMU3_RateLimitConflate) == 0) &&
         (PyModule_AddIntConstant(module, "RESULT_OK", XIMU3_ResultOk) == 0) &&
         (PyModule_AddIntConstant(module, "RESULT_ERROR", XIMU3_ResultError) == 0) &&
         (PyModule_AddFunctions(module, charging_status_methods) == 0) &&
         (PyModule_AddFunctions(module, connection_type_methods) == 0) &&
         (PyModule_AddFunctions(module, decode_error_methods) == 0) &&
         (PyModule_AddFunctions(module, file_converter_status_methods) == 0) &&
+        (PyModule_AddFunctions(module, queue_policy_methods) == 0) &&
+        (PyModule_AddFunctions(module, rate_limit_methods) == 0) &&
         (PyModule_AddFunctions(module, result_methods) == 0) &&
         add_object(module, &connection_object, "Connection") &&
         add_object(module, &usb_connection_info_object, "UsbConnectionInfo") &&
@@ -106,7 +118,8 @@ PyMODINIT_FUNC PyInit_ximu3()
         add_object(module, &port_scanner_object, "PortScanner") &&
         add_object(module, &device_object, "Device") &&
         add_object(module, &ping_response_object, "PingResponse") &&
-        add_object(module, &statistics_object, "Statistics"))
+        add_object(module, &statistics_object, "Statistics") &&
+        add_object(module, &closure_timing_object, "ClosureTiming"))
     {
         return module;
     }
@@ -0,0 +1,178 @@
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion, Throughput};
+use std::time::Duration;
+use ximu3::batch_decoder::*;
+
+const CHUNK_SIZES: [usize; 3] = [1, 64, 2048]; // 2048 bytes is the size of each connection read
+
+const NUMBER_OF_MESSAGES: usize = 1000;
+
+const MESSAGES: [(&str, char, usize); 15] = [ // name, ASCII identifier and number of arguments (0 for char array messages)
+    // Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+    ("inertial", 'I', 6),
+    ("magnetometer", 'M', 3),
+    ("quaternion", 'Q', 4),
+    ("rotation_matrix", 'R', 9),
+    ("euler_angles", 'A', 3),
+    ("linear_acceleration", 'L', 7),
+    ("earth_acceleration", 'E', 7),
+    ("ahrs_status", 'U', 4),
+    ("high_g_accelerometer", 'H', 3),
+    ("temperature", 'T', 1),
+    ("battery", 'B', 3),
+    ("rssi", 'W', 2),
+    ("serial_accessory", 'S', 0),
+    ("notification", 'N', 0),
+    ("error", 'F', 0),
+    // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+];
+
+struct Random {
+    state: u64,
+}
+
+impl Random {
+    fn new() -> Random {
+        Random { state: 0x2545F4914F6CDD1D }
+    }
+
+    fn next(&mut self) -> u64 { // xorshift64
+        self.state ^= self.state << 13;
+        self.state ^= self.state >> 7;
+        self.state ^= self.state << 17;
+        self.state
+    }
+
+    fn next_f32(&mut self) -> f32 {
+        (self.next() % 2000000) as f32 / 1000.0 - 1000.0
+    }
+}
+
+fn ascii_message(ascii_id: char, number_of_arguments: usize, timestamp: u64, random: &mut Random) -> Vec<u8> {
+    let mut message = format!("{},{}", ascii_id, timestamp);
+
+    if number_of_arguments == 0 {
+        message += ",Lorem ipsum dolor sit amet";
+    }
+
+    for _ in 0..number_of_arguments {
+        message += &format!(",{:.4}", random.next_f32());
+    }
+
+    message += "\r\n";
+    message.into_bytes()
+}
+
+fn binary_message(ascii_id: char, number_of_arguments: usize, timestamp: u64, values: &mut dyn FnMut() -> f32) -> Vec<u8> {
+    let mut message = vec![0x80 + ascii_id as u8];
+    message.extend_from_slice(&timestamp.to_le_bytes());
+
+    if number_of_arguments == 0 {
+        message.extend_from_slice(b"Lorem ipsum dolor sit amet");
+    }
+
+    for _ in 0..number_of_arguments {
+        message.extend_from_slice(&values().to_le_bytes());
+    }
+
+    let mut stuffed = Vec::with_capacity(2 * message.len() + 1);
+
+    for byte in message {
+        match byte {
+            0x0A => stuffed.extend_from_slice(&[0xDB, 0xDC]),
+            0xDB => stuffed.extend_from_slice(&[0xDB, 0xDD]),
+            _ => stuffed.push(byte),
+        }
+    }
+
+    stuffed.push(b'\n');
+    stuffed
+}
+
+fn bench_stream(criterion: &mut Criterion, name: &str, stream: &[u8], number_of_messages: usize) {
+    let throughputs = [
+        ("MB per second", Throughput::BytesDecimal(stream.len() as u64)),
+        ("messages per second", Throughput::Elements(number_of_messages as u64)),
+    ];
+
+    for (unit, throughput) in throughputs.iter() {
+        let mut group = criterion.benchmark_group(format!("{} ({})", name, unit));
+        group.throughput(throughput.clone());
+
+        for chunk_size in CHUNK_SIZES.iter() {
+            group.bench_with_input(BenchmarkId::new("chunk size", chunk_size), chunk_size, |bencher, &chunk_size| {
+                let mut decoder = BatchDecoder::new();
+                let mut batch = Batch::new();
+
+                bencher.iter(|| {
+                    for chunk in stream.chunks(chunk_size) {
+                        decoder.decode_into(black_box(chunk), &mut batch);
+                    }
+                    batch.clear();
+                });
+            });
+        }
+
+        group.finish();
+    }
+}
+
+fn message_types(criterion: &mut Criterion) {
+    let mut random = Random::new();
+
+    for &(name, ascii_id, number_of_arguments) in MESSAGES.iter() {
+        let stream: Vec<u8> = (0..NUMBER_OF_MESSAGES).flat_map(|index| ascii_message(ascii_id, number_of_arguments, index as u64, &mut random)).collect();
+        bench_stream(criterion, &format!("{} ascii", name), &stream, NUMBER_OF_MESSAGES);
+
+        let stream: Vec<u8> = (0..NUMBER_OF_MESSAGES).flat_map(|index| binary_message(ascii_id, number_of_arguments, index as u64, &mut || random.next_f32())).collect();
+        bench_stream(criterion, &format!("{} binary", name), &stream, NUMBER_OF_MESSAGES);
+    }
+}
+
+fn byte_stuffing(criterion: &mut Criterion) {
+    let mut escaped_value = || f32::from_le_bytes([0x0A, 0xDB, 0x0A, 0xDB]); // every byte must be escaped
+
+    let stream: Vec<u8> = (0..NUMBER_OF_MESSAGES).flat_map(|index| binary_message('I', 6, index as u64, &mut escaped_value)).collect();
+    bench_stream(criterion, "byte stuffing", &stream, NUMBER_OF_MESSAGES);
+}
+
+fn mixed_stream(random: &mut Random) -> Vec<u8> {
+    (0..NUMBER_OF_MESSAGES).flat_map(|index| {
+        let (_, ascii_id, number_of_arguments) = MESSAGES[index % MESSAGES.len()];
+
+        if index % 2 == 0 {
+            ascii_message(ascii_id, number_of_arguments, index as u64, random)
+        } else {
+            let mut values = || random.next_f32();
+            binary_message(ascii_id, number_of_arguments, index as u64, &mut values)
+        }
+    }).collect()
+}
+
+fn process_bytes(criterion: &mut Criterion) {
+    let mut random = Random::new();
+
+    let stream = mixed_stream(&mut random);
+    bench_stream(criterion, "mixed", &stream, NUMBER_OF_MESSAGES);
+
+    let mut stream = mixed_stream(&mut random); // 1% of bytes corrupted
+    let length = stream.len();
+
+    for _ in 0..(length / 100) {
+        let index = random.next() as usize % length;
+        stream[index] = random.next() as u8;
+    }
+    bench_stream(criterion, "mixed 1% corrupted", &stream, NUMBER_OF_MESSAGES);
+
+    let mut stream = mixed_stream(&mut random); // oversized frame of garbage
+    let length = stream.len();
+
+    stream.splice((length / 2)..(length / 2), vec![b'x'; 10000]);
+    bench_stream(criterion, "mixed oversized frame", &stream, NUMBER_OF_MESSAGES);
+}
+
+criterion_group! {
+    name = benches;
+    config = Criterion::default().warm_up_time(Duration::from_millis(500)).measurement_time(Duration::from_secs(2));
+    targets = message_types, byte_stuffing, process_bytes
+}
+criterion_main!(benches);
@@ -0,0 +1,292 @@
+use criterion::{criterion_group, criterion_main, Criterion, Throughput};
+use std::io::{BufWriter, Read, Write};
+use std::net::{Ipv4Addr, TcpListener};
+use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::mpsc::Receiver;
+use std::time::{Duration, Instant};
+use ximu3::connection::*;
+use ximu3::connection_info::*;
+use ximu3::data_messages::*;
+use ximu3::encoder::*;
+
+fn simulated_device() -> u16 { // streams inertial messages at 1 kHz and echoes commands
+    let listener = TcpListener::bind((Ipv4Addr::LOCALHOST, 0)).unwrap();
+    let port = listener.local_addr().unwrap().port();
+
+    std::thread::spawn(move || {
+        let (mut stream, _) = listener.accept().unwrap();
+
+        stream.set_read_timeout(Some(Duration::from_millis(1))).ok();
+
+        let mut buffer = vec![0; 2048];
+        let mut bytes = Vec::new();
+        let mut timestamp = 0;
+
+        loop {
+            let message = InertialMessage { timestamp, gyroscope_x: 1.0, gyroscope_y: 2.0, gyroscope_z: 3.0, accelerometer_x: 4.0, accelerometer_y: 5.0, accelerometer_z: 6.0 };
+
+            bytes.clear();
+            encode_binary(&message, &mut bytes);
+
+            if stream.write_all(&bytes).is_err() {
+                return;
+            }
+
+            timestamp += 1000;
+
+            match stream.read(&mut buffer) {
+                Ok(0) => return,
+                Ok(number_of_bytes) => {
+                    stream.write_all(&buffer[..number_of_bytes]).ok();
+                }
+                Err(_) => {}
+            }
+        }
+    });
+
+    port
+}
+
+fn triggered_device(trigger: Receiver<()>, write_time: Arc<Mutex<Instant>>) -> u16 { // writes one inertial message per trigger
+    let listener = TcpListener::bind((Ipv4Addr::LOCALHOST, 0)).unwrap();
+    let port = listener.local_addr().unwrap().port();
+
+    std::thread::spawn(move || {
+        let (mut stream, _) = listener.accept().unwrap();
+
+        stream.set_nodelay(true).ok();
+
+        let message = InertialMessage { timestamp: 0, gyroscope_x: 1.0, gyroscope_y: 2.0, gyroscope_z: 3.0, accelerometer_x: 4.0, accelerometer_y: 5.0, accelerometer_z: 6.0 };
+
+        let mut bytes = Vec::new();
+        encode_binary(&message, &mut bytes);
+
+        while trigger.recv().is_ok() {
+            *write_time.lock().unwrap() = Instant::now();
+
+            if stream.write_all(&bytes).is_err() {
+                return;
+            }
+        }
+    });
+
+    port
+}
+
+fn device_to_callback_latency(criterion: &mut Criterion) { // median on a Linux desktop: dispatcher thread ~6.8 us, inline dispatch ~3-5 us
+    for &(name, inline_dispatch) in [("dispatcher thread", false), ("inline dispatch", true)].iter() {
+        let (trigger_sender, trigger_receiver) = std::sync::mpsc::channel();
+        let write_time = Arc::new(Mutex::new(Instant::now()));
+        let port = triggered_device(trigger_receiver, write_time.clone());
+        let connection = Connection::new(&ConnectionInfo::TcpConnectionInfo(TcpConnectionInfo { ip_address: Ipv4Addr::LOCALHOST, port }));
+
+        connection.set_reactor_enabled(false); // inline dispatch is not permitted on shared reactor threads
+        connection.open().unwrap();
+        connection.set_inline_dispatch(inline_dispatch);
+
+        let (latency_sender, latency_receiver) = std::sync::mpsc::channel();
+
+        connection.add_inertial_closure(Box::new(move |_| {
+            latency_sender.send(write_time.lock().unwrap().elapsed()).ok();
+        }));
+
+        criterion.bench_function(&format!("device to callback latency ({})", name), |bencher| {
+            bencher.iter_custom(|iterations| (0..iterations).map(|_| {
+                trigger_sender.send(()).unwrap();
+                latency_receiver.recv().unwrap()
+            }).sum());
+        });
+
+        connection.close();
+    }
+}
+
+fn mixed_file(number_of_ticks: u64) -> std::path::PathBuf { // 1 kHz inertial and quaternion messages with lower rate status messages
+    let file_path = std::env::temp_dir().join(format!("ximu3_mixed_{}.ximu3", std::process::id()));
+    let mut bytes = Vec::new();
+
+    for tick in 0..number_of_ticks {
+        let timestamp = tick * 1000;
+
+        encode_binary(&InertialMessage { timestamp, gyroscope_x: 1.0, gyroscope_y: 2.0, gyroscope_z: 3.0, accelerometer_x: 4.0, accelerometer_y: 5.0, accelerometer_z: 6.0 }, &mut bytes);
+        encode_binary(&QuaternionMessage { timestamp, w: 1.0, x: 0.0, y: 0.0, z: 0.0 }, &mut bytes);
+
+        if tick % 10 == 0 {
+            encode_binary(&HighGAccelerometerMessage { timestamp, x: 1.0, y: 2.0, z: 3.0 }, &mut bytes);
+        }
+
+        if tick % 100 == 0 {
+            encode_binary(&TemperatureMessage { timestamp, temperature: 25.0 }, &mut bytes);
+            encode_binary(&BatteryMessage { timestamp, percentage: 100.0, voltage: 4.2, charging_status: 0.0 }, &mut bytes);
+            encode_binary(&RssiMessage { timestamp, percentage: 100.0, power: -40.0 }, &mut bytes);
+        }
+    }
+
+    std::fs::write(&file_path, bytes).unwrap();
+    file_path
+}
+
+fn subscribed_types(criterion: &mut Criterion) {
+    let file_path = mixed_file(100000);
+
+    for &(name, all_types) in [("all types", true), ("quaternion and battery", false)].iter() {
+        criterion.bench_function(&format!("mixed file subscribed to {}", name), |bencher| {
+            bencher.iter_custom(|iterations| (0..iterations).map(|_| {
+                let connection = Connection::new(&ConnectionInfo::FileConnectionInfo(FileConnectionInfo { file_path: file_path.to_str().unwrap().to_owned() }));
+                let (end_of_file_sender, end_of_file_receiver) = std::sync::mpsc::channel();
+
+                connection.add_end_of_file_closure(Box::new(move || {
+                    end_of_file_sender.send(()).ok();
+                }));
+                connection.add_quaternion_closure(Box::new(|_| {}));
+                connection.add_battery_closure(Box::new(|_| {}));
+
+                if all_types {
+                    connection.add_inertial_closure(Box::new(|_| {}));
+                    connection.add_high_g_accelerometer_closure(Box::new(|_| {}));
+                    connection.add_temperature_closure(Box::new(|_| {}));
+                    connection.add_rssi_closure(Box::new(|_| {}));
+                }
+
+                let start = Instant::now();
+
+                connection.open().unwrap();
+                end_of_file_receiver.recv().unwrap();
+
+                let elapsed = start.elapsed();
+
+                connection.close();
+                elapsed
+            }).sum());
+        });
+    }
+
+    std::fs::remove_file(file_path).ok();
+}
+
+fn large_file(size: u64) -> std::path::PathBuf { // mixed file repeated until size reached
+    let file_path = mixed_file(100000);
+    let bytes = std::fs::read(&file_path).unwrap();
+    let mut writer = BufWriter::new(std::fs::File::create(&file_path).unwrap());
+
+    for _ in 0..(size / bytes.len() as u64) {
+        writer.write_all(&bytes).unwrap();
+    }
+
+    writer.flush().unwrap();
+    file_path
+}
+
+fn file_reading(criterion: &mut Criterion) {
+    let file_path = large_file(1 << 30);
+    let file_size = std::fs::metadata(&file_path).unwrap().len();
+
+    let mut group = criterion.benchmark_group("1 GB file");
+
+    group.throughput(Throughput::Bytes(file_size));
+    group.sample_size(10);
+    group.measurement_time(Duration::from_secs(60));
+
+    for &(name, memory_mapped) in [("reader", false), ("memory mapped", true)].iter() {
+        group.bench_function(name, |bencher| {
+            bencher.iter_custom(|iterations| (0..iterations).map(|_| {
+                let connection = Connection::new(&ConnectionInfo::FileConnectionInfo(FileConnectionInfo { file_path: file_path.to_str().unwrap().to_owned() }));
+                let (end_of_file_sender, end_of_file_receiver) = std::sync::mpsc::channel();
+
+                connection.set_memory_mapped(memory_mapped);
+                connection.add_end_of_file_closure(Box::new(move || {
+                    end_of_file_sender.send(()).ok();
+                }));
+
+                let start = Instant::now();
+
+                connection.open().unwrap();
+                end_of_file_receiver.recv().unwrap();
+
+                let elapsed = start.elapsed();
+
+                connection.close();
+                elapsed
+            }).sum());
+        });
+    }
+
+    group.finish();
+
+    std::fs::remove_file(file_path).ok();
+}
+
+fn control_contention(criterion: &mut Criterion) {
+    let file_path = mixed_file(100000);
+
+    for &(name, contended) in [("no control thread", false), ("control thread adding closures and reading statistics", true)].iter() {
+        criterion.bench_function(&format!("mixed file with {}", name), |bencher| {
+            bencher.iter_custom(|iterations| (0..iterations).map(|_| {
+                let connection = Connection::new(&ConnectionInfo::FileConnectionInfo(FileConnectionInfo { file_path: file_path.to_str().unwrap().to_owned() }));
+                let (end_of_file_sender, end_of_file_receiver) = std::sync::mpsc::channel();
+
+                connection.add_end_of_file_closure(Box::new(move || {
+                    end_of_file_sender.send(()).ok();
+                }));
+                connection.add_inertial_closure(Box::new(|_| {}));
+
+                let end_of_file = AtomicBool::new(false);
+
+                std::thread::scope(|scope| {
+                    if contended {
+                        scope.spawn(|| while end_of_file.load(Ordering::Relaxed) == false {
+                            let closure_id = connection.add_temperature_closure(Box::new(|_| {}));
+
+                            connection.get_statistics();
+                            connection.remove_closure(closure_id);
+                        });
+                    }
+
+                    let start = Instant::now();
+
+                    connection.open().unwrap();
+                    end_of_file_receiver.recv().unwrap();
+
+                    let elapsed = start.elapsed();
+
+                    end_of_file.store(true, Ordering::Relaxed);
+                    connection.close();
+                    elapsed
+                })
+            }).sum());
+        });
+    }
+
+    std::fs::remove_file(file_path).ok();
+}
+
+fn send_commands_while_streaming(criterion: &mut Criterion) {
+    let port = simulated_device();
+    let connection = Connection::new(&ConnectionInfo::TcpConnectionInfo(TcpConnectionInfo { ip_address: Ipv4Addr::LOCALHOST, port }));
+
+    connection.set_tcp_no_delay(true);
+    connection.open().unwrap();
+
+    let number_of_messages = Arc::new(AtomicU64::new(0));
+    let closure_number_of_messages = number_of_messages.clone();
+
+    connection.add_inertial_closure(Box::new(move |_| {
+        closure_number_of_messages.fetch_add(1, Ordering::Relaxed);
+    }));
+
+    criterion.bench_function("send_commands during 1 kHz streaming", |bencher| {
+        bencher.iter(|| connection.send_commands(vec!["{\"ping\":null}"], 0, 500));
+    });
+
+    assert!(number_of_messages.load(Ordering::Relaxed) > 0);
+
+    connection.close();
+}
+
+criterion_group! {
+    name = benches;
+    config = Criterion::default().measurement_time(Duration::from_secs(5));
+    targets = device_to_callback_latency, subscribed_types, file_reading, control_contention, send_commands_while_streaming
+}
+criterion_main!(benches);
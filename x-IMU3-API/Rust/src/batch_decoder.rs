@@ -0,0 +1,175 @@
+use crate::data_messages::*;
+use crate::decode_error::*;
+use crate::decoder::*;
+use crate::dispatcher::*;
+use crate::statistics::*;
+
+#[derive(Clone, Default)]
+pub struct Batch {
+    pub decode_errors: Vec<DecodeError>,
+    pub commands: Vec<String>,
+    // Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+    pub inertial: InertialColumns,
+    pub magnetometer: MagnetometerColumns,
+    pub quaternion: QuaternionColumns,
+    pub rotation_matrix: RotationMatrixColumns,
+    pub euler_angles: EulerAnglesColumns,
+    pub linear_acceleration: LinearAccelerationColumns,
+    pub earth_acceleration: EarthAccelerationColumns,
+    pub ahrs_status: AhrsStatusColumns,
+    pub high_g_accelerometer: HighGAccelerometerColumns,
+    pub temperature: TemperatureColumns,
+    pub battery: BatteryColumns,
+    pub rssi: RssiColumns,
+    pub serial_accessory: SerialAccessoryColumns,
+    pub notification: NotificationColumns,
+    pub error: ErrorColumns,
+    // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+}
+
+impl Batch {
+    pub fn new() -> Batch {
+        Default::default()
+    }
+
+    pub fn clear(&mut self) {
+        self.decode_errors.clear();
+        self.commands.clear();
+        // Start of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+        self.inertial.clear();
+        self.magnetometer.clear();
+        self.quaternion.clear();
+        self.rotation_matrix.clear();
+        self.euler_angles.clear();
+        self.linear_acceleration.clear();
+        self.earth_acceleration.clear();
+        self.ahrs_status.clear();
+        self.high_g_accelerometer.clear();
+        self.temperature.clear();
+        self.battery.clear();
+        self.rssi.clear();
+        self.serial_accessory.clear();
+        self.notification.clear();
+        self.error.clear();
+        // End of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+    }
+
+    fn push(&mut self, data: DispatcherData) {
+        match data {
+            DispatcherData::Command(command) => self.commands.push(command.json),
+            // Start of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            DispatcherData::Inertial(message) => self.inertial.push(message),
+            DispatcherData::Magnetometer(message) => self.magnetometer.push(message),
+            DispatcherData::Quaternion(message) => self.quaternion.push(message),
+            DispatcherData::RotationMatrix(message) => self.rotation_matrix.push(message),
+            DispatcherData::EulerAngles(message) => self.euler_angles.push(message),
+            DispatcherData::LinearAcceleration(message) => self.linear_acceleration.push(message),
+            DispatcherData::EarthAcceleration(message) => self.earth_acceleration.push(message),
+            DispatcherData::AhrsStatus(message) => self.ahrs_status.push(message),
+            DispatcherData::HighGAccelerometer(message) => self.high_g_accelerometer.push(message),
+            DispatcherData::Temperature(message) => self.temperature.push(message),
+            DispatcherData::Battery(message) => self.battery.push(message),
+            DispatcherData::Rssi(message) => self.rssi.push(message),
+            DispatcherData::SerialAccessory(message) => self.serial_accessory.push(message),
+            DispatcherData::Notification(message) => self.notification.push(message),
+            DispatcherData::Error(message) => self.error.push(message),
+            // End of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            _ => {}
+        }
+    }
+}
+
+pub struct BatchDecoder {
+    stream_decoder: StreamDecoder,
+    statistics: Statistics,
+}
+
+impl BatchDecoder {
+    pub fn new() -> BatchDecoder {
+        BatchDecoder {
+            stream_decoder: StreamDecoder::new(),
+            statistics: Default::default(),
+        }
+    }
+
+    pub fn decode_into(&mut self, bytes: &[u8], batch: &mut Batch) {
+        self.statistics.data_total += bytes.len() as u64;
+
+        let statistics = &mut self.statistics;
+
+        let skipped = self.stream_decoder.process_bytes(bytes, ALL_SUBSCRIPTIONS, |result| {
+            match result {
+                Ok(Some(data)) => {
+                    statistics.message_total += 1;
+                    batch.push(data);
+                }
+                Ok(None) => statistics.message_total += 1,
+                Err(decode_error) => {
+                    statistics.error_total += 1;
+                    batch.decode_errors.push(decode_error);
+                }
+            }
+        });
+
+        self.statistics.skipped_total += skipped as u64;
+    }
+
+    pub fn set_max_frame_size(&mut self, max_frame_size: usize) {
+        self.stream_decoder.set_max_frame_size(max_frame_size);
+    }
+
+    pub fn get_statistics(&self) -> Statistics {
+        self.statistics
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::encoder::*;
+    use super::*;
+
+    #[test]
+    fn decode_into_fills_columns() {
+        let mut bytes = Vec::new();
+
+        encode_binary(&TemperatureMessage { timestamp: 1, temperature: 20.0 }, &mut bytes);
+        bytes.extend_from_slice(b"T,2,21.0\r\n");
+        bytes.extend_from_slice(b"N,3,Hello, world!\r\n");
+        encode_binary(&InertialMessage { timestamp: 4, gyroscope_x: 1.0, gyroscope_y: 2.0, gyroscope_z: 3.0, accelerometer_x: 4.0, accelerometer_y: 5.0, accelerometer_z: 6.0 }, &mut bytes);
+        bytes.extend_from_slice(b"{\"ping\":null}\r\n");
+        bytes.extend_from_slice(b"X,5\r\n"); // unknown identifier
+        bytes.extend_from_slice(b"S,6,\r\n");
+        bytes.extend_from_slice(b"T,7,not a number\r\n");
+
+        let mut batch_decoder = BatchDecoder::new();
+        let mut batch = Batch::new();
+
+        for chunk in bytes.chunks(7) { // messages split across calls
+            batch_decoder.decode_into(chunk, &mut batch);
+        }
+
+        assert_eq!(batch.temperature.timestamp, vec![1, 2]);
+        assert_eq!(batch.temperature.temperature, vec![20.0, 21.0]);
+        assert_eq!(batch.notification.timestamp, vec![3]);
+        assert_eq!(batch.notification.string, vec!["Hello, world!".to_owned()]);
+        assert_eq!(batch.serial_accessory.timestamp, vec![6]);
+        assert_eq!(batch.serial_accessory.string, vec![String::new()]);
+        assert_eq!(batch.inertial.timestamp, vec![4]);
+        assert_eq!(batch.inertial.accelerometer_z, vec![6.0]);
+        assert_eq!(batch.commands, vec!["{\"ping\":null}".to_owned()]);
+        assert!(matches!(batch.decode_errors.as_slice(), [DecodeError::InvalidMessageIdentifier, DecodeError::UnableToParseAsciiMessage]));
+        assert!(batch.quaternion.timestamp.is_empty());
+
+        let statistics = batch_decoder.get_statistics();
+        assert_eq!(statistics.data_total, bytes.len() as u64);
+        assert_eq!(statistics.message_total, 6);
+        assert_eq!(statistics.error_total, 2);
+        assert_eq!(statistics.skipped_total, 0);
+
+        batch.clear();
+        batch_decoder.decode_into(b"T,8,22.0\r\n", &mut batch);
+
+        assert_eq!(batch.temperature.timestamp, vec![8]);
+        assert!(batch.notification.string.is_empty() && batch.commands.is_empty() && batch.decode_errors.is_empty());
+    }
+}
@@ -0,0 +1,73 @@
+use std::fmt;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::Duration;
+
+pub const CLOSURE_TIMING_HISTOGRAM_LENGTH: usize = 16;
+
+#[repr(C)]
+#[derive(Clone, Copy)]
+pub struct ClosureTiming {
+    pub closure_id: u64,
+    pub count: u64,
+    pub total_time: u64, // nanoseconds
+    pub max_time: u64, // nanoseconds
+    pub histogram: [u64; CLOSURE_TIMING_HISTOGRAM_LENGTH], // bin 0 is < 1 us, bin n is < 2^n us, last bin is everything longer
+}
+
+impl fmt::Display for ClosureTiming {
+    fn fmt(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        let mean_time = if self.count > 0 { self.total_time / self.count } else { 0 };
+
+        write!(formatter, "{:>8} id {:>8} calls {:>8} ns mean {:>8} ns max {:?}",
+               self.closure_id,
+               self.count,
+               mean_time,
+               self.max_time,
+               self.histogram)
+    }
+}
+
+pub(crate) struct AtomicClosureTiming {
+    pub closure_id: u64,
+    count: AtomicU64,
+    total_time: AtomicU64,
+    max_time: AtomicU64,
+    histogram: [AtomicU64; CLOSURE_TIMING_HISTOGRAM_LENGTH],
+}
+
+impl AtomicClosureTiming {
+    pub fn new(closure_id: u64) -> AtomicClosureTiming {
+        AtomicClosureTiming {
+            closure_id,
+            count: AtomicU64::new(0),
+            total_time: AtomicU64::new(0),
+            max_time: AtomicU64::new(0),
+            histogram: Default::default(),
+        }
+    }
+
+    pub fn record(&self, time: Duration) {
+        let nanoseconds = time.as_nanos() as u64;
+        let microseconds = nanoseconds / 1000;
+        let bin = std::cmp::min((64 - microseconds.leading_zeros()) as usize, CLOSURE_TIMING_HISTOGRAM_LENGTH - 1);
+
+        self.count.fetch_add(1, Ordering::Relaxed);
+        self.total_time.fetch_add(nanoseconds, Ordering::Relaxed);
+        self.max_time.fetch_max(nanoseconds, Ordering::Relaxed);
+        self.histogram[bin].fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn snapshot(&self) -> ClosureTiming {
+        let mut histogram = [0; CLOSURE_TIMING_HISTOGRAM_LENGTH];
+
+        histogram.iter_mut().zip(self.histogram.iter()).for_each(|(bin, atomic_bin)| *bin = atomic_bin.load(Ordering::Relaxed));
+
+        ClosureTiming {
+            closure_id: self.closure_id,
+            count: self.count.load(Ordering::Relaxed),
+            total_time: self.total_time.load(Ordering::Relaxed),
+            max_time: self.max_time.load(Ordering::Relaxed),
+            histogram,
+        }
+    }
+}
@@ -1,8 +1,10 @@
-use crossbeam::channel::Sender;
 use std::ops::Drop;
 use std::sync::{Arc, Mutex};
 use std::time::{SystemTime, UNIX_EPOCH};
+use crate::closure_timing::*;
 use crate::command_message::*;
+#[cfg(feature = "async")]
+use crate::connection_async::*;
 use crate::connection_info::*;
 use crate::connections::*;
 use crate::data_messages::*;
@@ -10,11 +12,15 @@ use crate::decode_error::*;
 use crate::decoder::*;
 use crate::dispatcher::*;
 use crate::ping_response::*;
+use crate::queue_policy::*;
+use crate::rate_limit::*;
 use crate::statistics::*;
+use crate::subscription::*;
 
 pub struct Connection {
     dropped: Arc<Mutex<bool>>,
     internal: Arc<Mutex<Box<dyn GenericConnection + Send>>>,
+    decoder: DecoderHandle, // closures and statistics accessed without locking internal or decoder
 }
 
 impl Connection {
@@ -30,35 +36,28 @@ impl Connection {
             ConnectionInfo::FileConnectionInfo(connection_info) => internal = Box::new(FileConnection::new(connection_info)),
         }
 
+        let decoder = internal.get_decoder();
+        let statistics = decoder.statistics.clone();
+        let sender = decoder.dispatcher.sender.clone();
+
         let connection = Connection {
             dropped: Arc::new(Mutex::new(false)),
             internal: Arc::new(Mutex::new(internal)),
+            decoder,
         };
 
         let dropped = connection.dropped.clone();
-        let decoder = connection.internal.lock().unwrap().get_decoder();
         let initial_time = SystemTime::now().duration_since(UNIX_EPOCH).unwrap().as_micros();
         let mut previous_statistics: Statistics = Default::default();
 
-        std::thread::spawn(move || loop {
+        std::thread::spawn(move || loop { // statistics are atomic so the decoder is not locked
             std::thread::sleep(std::time::Duration::from_secs(1));
 
-            if let Ok(mut decoder) = decoder.lock() {
-                decoder.statistics.timestamp = (SystemTime::now().duration_since(UNIX_EPOCH).unwrap().as_micros() - initial_time) as u64;
-
-                let delta_time = (decoder.statistics.timestamp - previous_statistics.timestamp) as f32 / 1E6;
-                let delta_data = decoder.statistics.data_total - previous_statistics.data_total;
-                let delta_message = decoder.statistics.message_total - previous_statistics.message_total;
-                let delta_error = decoder.statistics.error_total - previous_statistics.error_total;
+            let timestamp = (SystemTime::now().duration_since(UNIX_EPOCH).unwrap().as_micros() - initial_time) as u64;
 
-                decoder.statistics.data_rate = (delta_data as f32 / delta_time).round() as u32;
-                decoder.statistics.message_rate = (delta_message as f32 / delta_time).round() as u32;
-                decoder.statistics.error_rate = (delta_error as f32 / delta_time).round() as u32;
+            previous_statistics = statistics.update_rates(timestamp, &previous_statistics);
 
-                previous_statistics = decoder.statistics;
-
-                decoder.dispatcher.sender.send(DispatcherData::Statistics(decoder.statistics)).ok();
-            }
+            sender.send(DispatcherData::Statistics(previous_statistics)).ok();
 
             if *dropped.lock().unwrap() {
                 return;
@@ -94,6 +93,11 @@ impl Connection {
         });
     }
 
+    #[cfg(feature = "async")]
+    pub fn open_future(&self) -> OpenFuture {
+        OpenFuture::new(self.internal.clone())
+    }
+
     pub fn close(&self) {
         self.internal.lock().unwrap().close();
     }
@@ -109,14 +113,14 @@ impl Connection {
     }
 
     pub fn send_commands(&self, commands: Vec<&str>, retries: u32, timeout: u32) -> Vec<String> {
-        let decoder = self.internal.lock().unwrap().get_decoder();
+        let decoder = self.decoder.clone();
         let write_sender = self.internal.lock().unwrap().get_write_sender();
 
         Self::send_commands_internal(decoder, write_sender, commands, retries, timeout) // argument must not include lock() because this could cause deadlock
     }
 
     pub fn send_commands_async(&self, commands: Vec<&str>, retries: u32, timeout: u32, closure: Box<dyn FnOnce(Vec<String>) + Send>) {
-        let decoder = self.internal.lock().unwrap().get_decoder();
+        let decoder = self.decoder.clone();
         let write_sender = self.internal.lock().unwrap().get_write_sender();
         let dropped = self.dropped.clone();
         let commands: Vec<String> = commands.iter().map(|&string| string.to_owned()).collect();
@@ -133,7 +137,30 @@ impl Connection {
         });
     }
 
-    fn send_commands_internal(decoder: Arc<Mutex<Decoder>>, write_sender: Option<Sender<String>>, commands: Vec<&str>, retries: u32, timeout: u32) -> Vec<String> {
+    #[cfg(feature = "async")]
+    pub fn ping_future(&self) -> impl std::future::Future<Output=Result<PingResponse, ()>> {
+        let future = self.send_commands_future(vec!["{\"ping\":null}"], 4, 200); // 4 retries with 200 ms timeout = 1 second
+
+        async move {
+            let response = future.await;
+
+            if response.len() == 0 {
+                return Err(());
+            }
+
+            PingResponse::parse_json(response[0].as_str())
+        }
+    }
+
+    #[cfg(feature = "async")]
+    pub fn send_commands_future(&self, commands: Vec<&str>, retries: u32, timeout: u32) -> CommandsFuture {
+        let decoder = self.decoder.clone();
+        let write_sender = self.internal.lock().unwrap().get_write_sender();
+
+        CommandsFuture::new(decoder, write_sender, commands, retries, timeout)
+    }
+
+    fn send_commands_internal(decoder: DecoderHandle, write_sender: Option<WriteSender>, commands: Vec<&str>, retries: u32, timeout: u32) -> Vec<String> {
         struct Transaction {
             command: Option<CommandMessage>,
             response: String,
@@ -149,21 +176,19 @@ impl Connection {
 
         let (response_sender, response_receiver) = crossbeam::channel::unbounded();
 
-        let closure_id = decoder.lock().unwrap().dispatcher.add_command_closure(Box::new(move |command: CommandMessage| {
+        let closure_id = decoder.dispatcher.add_command_closure(Box::new(move |command: CommandMessage| {
             response_sender.send(command).ok();
         }));
 
         for _ in 0..(1 + retries) {
-            for transaction in transactions.iter().filter(|&transaction| transaction.command.is_some()) {
-                if let Some(write_sender) = write_sender.clone() {
-                    write_sender.send(transaction.command.as_ref().unwrap().terminated_json.clone()).ok();
-                }
+            if let Some(write_sender) = &write_sender { // all commands sent together so that writes are coalesced
+                write_sender.send_all(transactions.iter().filter_map(|transaction| transaction.command.as_ref()).map(|command| command.terminated_json.clone().into_bytes()).collect()).ok();
             }
 
             let end_time = SystemTime::now().duration_since(UNIX_EPOCH).unwrap().as_millis() + timeout as u128;
 
             while SystemTime::now().duration_since(UNIX_EPOCH).unwrap().as_millis() < end_time {
-                if let Ok(response) = response_receiver.try_recv() {
+                for response in response_receiver.try_iter() {
                     for index in 0..transactions.len() {
                         if transactions[index].command.is_some() && response.key == transactions[index].command.as_ref().unwrap().key {
                             transactions[index] = Transaction { command: None, response: response.json.clone() };
@@ -172,7 +197,7 @@ impl Connection {
                 }
 
                 if transactions.iter().all(|transaction| transaction.command.as_ref().is_none()) {
-                    decoder.lock().unwrap().dispatcher.remove_closure(closure_id);
+                    decoder.dispatcher.remove_closure(closure_id);
                     transactions.retain(|transaction| transaction.response.is_empty() == false);
                     return transactions.iter().map(|transaction| transaction.response.clone()).collect();
                 }
@@ -181,7 +206,7 @@ impl Connection {
             }
         }
 
-        decoder.lock().unwrap().dispatcher.remove_closure(closure_id);
+        decoder.dispatcher.remove_closure(closure_id);
         transactions.retain(|transaction| transaction.response.is_empty() == false);
         return transactions.iter().map(|transaction| transaction.response.clone()).collect();
     }
@@ -191,101 +216,287 @@ impl Connection {
     }
 
     pub fn get_statistics(&self) -> Statistics {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().statistics
+        self.decoder.statistics.snapshot()
+    }
+
+    pub(crate) fn get_atomic_statistics(&self) -> Arc<AtomicStatistics> {
+        self.decoder.statistics.clone()
+    }
+
+    pub fn get_closure_timings(&self) -> Vec<ClosureTiming> {
+        self.decoder.dispatcher.get_closure_timings()
+    }
+
+    pub fn set_max_frame_size(&self, max_frame_size: usize) { // limited to 1 byte to 1 MiB
+        self.decoder.set_max_frame_size(max_frame_size);
+    }
+
+    pub fn set_queue_capacity(&self, capacity: usize) {
+        self.decoder.dispatcher.set_queue_capacity(capacity);
+    }
+
+    pub fn set_queue_policy(&self, policy: QueuePolicy) { // Block stalls the read thread while the queue is full, DropOldest used instead on reactor threads because they are shared by connections
+        self.decoder.dispatcher.set_queue_policy(policy);
+    }
+
+    pub fn set_inline_dispatch(&self, inline_dispatch: bool) { // closures called by read thread must not block or call Connection methods, ignored while reactor enabled because reactor threads are shared by connections
+        self.decoder.dispatcher.set_inline_dispatch(inline_dispatch);
+    }
+
+    pub fn set_reactor_enabled(&self, reactor_enabled: bool) { // must be called before open, disabled by default
+        self.internal.lock().unwrap().set_reactor_enabled(reactor_enabled);
+    }
+
+    pub fn set_receive_buffer_size(&self, receive_buffer_size: usize) { // must be called before open, 0 for operating system default
+        self.internal.lock().unwrap().set_receive_buffer_size(receive_buffer_size);
+    }
+
+    pub fn set_receive_port_shared(&self, receive_port_shared: bool) { // must be called before open, UDP connections sharing a port are identified by IP address
+        self.internal.lock().unwrap().set_receive_port_shared(receive_port_shared);
+    }
+
+    pub fn set_tcp_no_delay(&self, tcp_no_delay: bool) { // must be called before open, disabled by default, enabling reduces command latency as queued commands are already coalesced
+        self.internal.lock().unwrap().set_tcp_no_delay(tcp_no_delay);
+    }
+
+    pub fn set_memory_mapped(&self, memory_mapped: bool) { // must be called before open, file connections only, disabled by default, falls back to reads if file cannot be mapped, process terminated by SIGBUS if file is truncated while open
+        self.internal.lock().unwrap().set_memory_mapped(memory_mapped);
+    }
+
+    pub fn set_replay(&self, speed: f32, start_time: u64, stop_time: u64) { // must be called before open, file connections only, speed of 0 is as fast as possible, times are microseconds from first message and stop time of 0 is end of file
+        self.internal.lock().unwrap().set_replay(speed, start_time, stop_time);
     }
 
     pub fn add_decode_error_closure(&self, closure: Box<dyn Fn(DecodeError) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_decode_error_closure(closure)
+        self.decoder.dispatcher.add_decode_error_closure(closure)
     }
 
     pub fn add_statistics_closure(&self, closure: Box<dyn Fn(Statistics) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_statistics_closure(closure)
+        self.decoder.dispatcher.add_statistics_closure(closure)
     }
 
     pub(crate) fn add_command_closure(&self, closure: Box<dyn Fn(CommandMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_command_closure(closure)
+        self.decoder.dispatcher.add_command_closure(closure)
     }
 
-    pub(crate) fn add_data_closure(&self, closure: Box<dyn Fn(Box<dyn DataMessage>) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_data_closure(closure)
+    pub(crate) fn add_data_closure(&self, closure: Box<dyn Fn(&DispatcherData) + Send>) -> u64 {
+        self.decoder.dispatcher.add_data_closure(closure)
     }
 
     // Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
     pub fn add_inertial_closure(&self, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_inertial_closure(closure)
+        self.decoder.dispatcher.add_inertial_closure(closure)
+    }
+
+    pub fn add_inertial_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[InertialMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_inertial_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_inertial_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_inertial_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_magnetometer_closure(&self, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_magnetometer_closure(closure)
+        self.decoder.dispatcher.add_magnetometer_closure(closure)
+    }
+
+    pub fn add_magnetometer_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[MagnetometerMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_magnetometer_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_magnetometer_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_magnetometer_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_quaternion_closure(&self, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_quaternion_closure(closure)
+        self.decoder.dispatcher.add_quaternion_closure(closure)
+    }
+
+    pub fn add_quaternion_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[QuaternionMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_quaternion_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_quaternion_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_quaternion_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_rotation_matrix_closure(&self, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_rotation_matrix_closure(closure)
+        self.decoder.dispatcher.add_rotation_matrix_closure(closure)
+    }
+
+    pub fn add_rotation_matrix_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[RotationMatrixMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_rotation_matrix_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_rotation_matrix_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_rotation_matrix_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_euler_angles_closure(&self, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_euler_angles_closure(closure)
+        self.decoder.dispatcher.add_euler_angles_closure(closure)
+    }
+
+    pub fn add_euler_angles_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[EulerAnglesMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_euler_angles_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_euler_angles_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_euler_angles_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_linear_acceleration_closure(&self, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_linear_acceleration_closure(closure)
+        self.decoder.dispatcher.add_linear_acceleration_closure(closure)
+    }
+
+    pub fn add_linear_acceleration_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[LinearAccelerationMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_linear_acceleration_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_linear_acceleration_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_linear_acceleration_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_earth_acceleration_closure(&self, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_earth_acceleration_closure(closure)
+        self.decoder.dispatcher.add_earth_acceleration_closure(closure)
+    }
+
+    pub fn add_earth_acceleration_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[EarthAccelerationMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_earth_acceleration_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_earth_acceleration_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_earth_acceleration_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_ahrs_status_closure(&self, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_ahrs_status_closure(closure)
+        self.decoder.dispatcher.add_ahrs_status_closure(closure)
+    }
+
+    pub fn add_ahrs_status_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[AhrsStatusMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_ahrs_status_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_ahrs_status_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_ahrs_status_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_high_g_accelerometer_closure(&self, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_high_g_accelerometer_closure(closure)
+        self.decoder.dispatcher.add_high_g_accelerometer_closure(closure)
+    }
+
+    pub fn add_high_g_accelerometer_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[HighGAccelerometerMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_high_g_accelerometer_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_high_g_accelerometer_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_high_g_accelerometer_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_temperature_closure(&self, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_temperature_closure(closure)
+        self.decoder.dispatcher.add_temperature_closure(closure)
+    }
+
+    pub fn add_temperature_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[TemperatureMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_temperature_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_temperature_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_temperature_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_battery_closure(&self, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_battery_closure(closure)
+        self.decoder.dispatcher.add_battery_closure(closure)
+    }
+
+    pub fn add_battery_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[BatteryMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_battery_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_battery_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_battery_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_rssi_closure(&self, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_rssi_closure(closure)
+        self.decoder.dispatcher.add_rssi_closure(closure)
+    }
+
+    pub fn add_rssi_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[RssiMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_rssi_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_rssi_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_rssi_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_serial_accessory_closure(&self, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_serial_accessory_closure(closure)
+        self.decoder.dispatcher.add_serial_accessory_closure(closure)
+    }
+
+    pub fn add_serial_accessory_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[SerialAccessoryMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_serial_accessory_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_serial_accessory_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_serial_accessory_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_notification_closure(&self, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_notification_closure(closure)
+        self.decoder.dispatcher.add_notification_closure(closure)
+    }
+
+    pub fn add_notification_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[NotificationMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_notification_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_notification_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_notification_rate_limited_closure(rate_limit, value, closure)
     }
 
     pub fn add_error_closure(&self, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_error_closure(closure)
+        self.decoder.dispatcher.add_error_closure(closure)
+    }
+
+    pub fn add_error_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[ErrorMessage]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_error_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_error_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
+        self.decoder.dispatcher.add_error_rate_limited_closure(rate_limit, value, closure)
     }
     // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
     pub fn add_end_of_file_closure(&self, closure: Box<dyn Fn() + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_end_of_file_closure(closure)
+        self.decoder.dispatcher.add_end_of_file_closure(closure)
+    }
+
+    pub fn add_time_budget_closure(&self, time_budget: u32, closure: Box<dyn Fn(u64, u64) + Send>) -> u64 { // closure called with closure ID and time in nanoseconds when a closure takes longer than time budget in microseconds
+        self.decoder.dispatcher.add_time_budget_closure(time_budget, closure)
+    }
+
+    pub fn subscribe<T: Subscribable>(&self, capacity: usize) -> Subscription<'_, T> {
+        Subscription::new(self, capacity)
+    }
+
+    #[cfg(feature = "async")]
+    pub fn stream<T: Subscribable>(&self, capacity: usize) -> MessageStream<'_, T> {
+        MessageStream::new(self, capacity)
     }
 
     pub fn remove_closure(&self, id: u64) {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.remove_closure(id);
+        self.decoder.dispatcher.remove_closure(id);
+    }
+
+    #[cfg(feature = "async")]
+    pub(crate) fn remove_closure_without_waiting(&self, id: u64) {
+        self.decoder.dispatcher.remove_closure_without_waiting(id);
     }
 }
 
 impl Drop for Connection {
     fn drop(&mut self) {
         *self.dropped.lock().unwrap() = true;
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.remove_all_closures();
+        self.decoder.dispatcher.remove_all_closures();
         self.close(); // call after open_sync complete
     }
 }
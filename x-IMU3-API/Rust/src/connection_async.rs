@@ -0,0 +1,442 @@
+use crossbeam::channel::{Receiver, RecvTimeoutError, Sender};
+use futures_core::Stream;
+use std::future::Future;
+use std::ops::Drop;
+use std::pin::Pin;
+use std::sync::{Arc, Mutex, OnceLock};
+use std::task::{Context, Poll, Waker};
+use std::time::{Duration, Instant};
+use crate::command_message::*;
+use crate::connection::*;
+use crate::connections::*;
+use crate::decoder::*;
+use crate::subscription::*;
+
+const NUMBER_OF_OPEN_THREADS: usize = 4;
+
+static OPEN_SENDER: OnceLock<Sender<Box<dyn FnOnce() + Send>>> = OnceLock::new();
+
+static TIMER_SENDER: OnceLock<Sender<(Instant, Waker)>> = OnceLock::new();
+
+fn open_sender() -> &'static Sender<Box<dyn FnOnce() + Send>> { // open blocks so is run by a shared pool of threads rather than a thread per call
+    OPEN_SENDER.get_or_init(|| {
+        let (sender, receiver) = crossbeam::channel::unbounded::<Box<dyn FnOnce() + Send>>();
+
+        for _ in 0..NUMBER_OF_OPEN_THREADS {
+            let receiver = receiver.clone();
+
+            std::thread::spawn(move || {
+                while let Ok(open) = receiver.recv() {
+                    open();
+                }
+            });
+        }
+
+        sender
+    })
+}
+
+fn wake_at(deadline: Instant, waker: Waker) { // single timer thread shared by all futures
+    let sender = TIMER_SENDER.get_or_init(|| {
+        let (sender, receiver) = crossbeam::channel::unbounded::<(Instant, Waker)>();
+
+        std::thread::spawn(move || {
+            let mut timers: Vec<(Instant, Waker)> = Vec::new();
+
+            loop {
+                let now = Instant::now();
+
+                timers.retain(|(deadline, waker)| {
+                    if *deadline <= now {
+                        waker.wake_by_ref();
+                        return false;
+                    }
+                    true
+                });
+
+                let result = match timers.iter().map(|(deadline, _)| *deadline).min() {
+                    Some(deadline) => receiver.recv_timeout(deadline.saturating_duration_since(now)),
+                    None => receiver.recv().map_err(|_| RecvTimeoutError::Disconnected),
+                };
+
+                match result {
+                    Ok(timer) => timers.push(timer),
+                    Err(RecvTimeoutError::Timeout) => (),
+                    Err(RecvTimeoutError::Disconnected) => return,
+                }
+            }
+        });
+
+        sender
+    });
+
+    sender.send((deadline, waker)).ok();
+}
+
+pub struct OpenFuture {
+    state: Arc<Mutex<(Option<std::io::Result<()>>, Option<Waker>)>>, // result and waker
+}
+
+impl OpenFuture {
+    pub(crate) fn new(internal: Arc<Mutex<Box<dyn GenericConnection + Send>>>) -> OpenFuture {
+        let state: Arc<Mutex<(Option<std::io::Result<()>>, Option<Waker>)>> = Arc::new(Mutex::new((None, None)));
+        let open_state = state.clone();
+
+        open_sender().send(Box::new(move || {
+            let result = internal.lock().unwrap().open();
+            let mut state = open_state.lock().unwrap();
+
+            state.0 = Some(result);
+
+            if let Some(waker) = state.1.take() {
+                waker.wake();
+            }
+        })).ok();
+
+        OpenFuture {
+            state,
+        }
+    }
+}
+
+impl Future for OpenFuture {
+    type Output = std::io::Result<()>;
+
+    fn poll(self: Pin<&mut Self>, context: &mut Context<'_>) -> Poll<Self::Output> {
+        let mut state = self.state.lock().unwrap();
+
+        if let Some(result) = state.0.take() {
+            return Poll::Ready(result);
+        }
+
+        state.1 = Some(context.waker().clone());
+        Poll::Pending
+    }
+}
+
+struct Transaction {
+    command: Option<CommandMessage>,
+    response: String,
+}
+
+pub struct CommandsFuture {
+    decoder: DecoderHandle,
+    write_sender: Option<WriteSender>,
+    transactions: Vec<Transaction>,
+    retries: u32,
+    timeout: Duration,
+    deadline: Option<Instant>,
+    timer_deadline: Option<Instant>,
+    response_receiver: Receiver<CommandMessage>,
+    waker: Arc<Mutex<Option<Waker>>>,
+    closure_id: Option<u64>,
+}
+
+impl CommandsFuture {
+    pub(crate) fn new(decoder: DecoderHandle, write_sender: Option<WriteSender>, commands: Vec<&str>, retries: u32, timeout: u32) -> CommandsFuture {
+        let transactions: Vec<Transaction> = commands.iter().map(|&command| {
+            if let Ok(command) = CommandMessage::parse_json(command) {
+                Transaction { command: Some(command), response: "".to_owned() }
+            } else {
+                Transaction { command: None, response: "".to_owned() }
+            }
+        }).collect();
+
+        let (response_sender, response_receiver) = crossbeam::channel::unbounded();
+
+        let waker: Arc<Mutex<Option<Waker>>> = Arc::new(Mutex::new(None));
+        let closure_waker = waker.clone();
+
+        let closure_id = decoder.dispatcher.add_command_closure(Box::new(move |command: CommandMessage| {
+            response_sender.send(command).ok();
+
+            if let Some(waker) = closure_waker.lock().unwrap().as_ref() {
+                waker.wake_by_ref();
+            }
+        }));
+
+        CommandsFuture {
+            decoder,
+            write_sender,
+            transactions,
+            retries,
+            timeout: Duration::from_millis(timeout as u64),
+            deadline: None,
+            timer_deadline: None,
+            response_receiver,
+            waker,
+            closure_id: Some(closure_id),
+        }
+    }
+
+    fn complete(&mut self) -> Vec<String> {
+        if let Some(closure_id) = self.closure_id.take() {
+            self.decoder.dispatcher.remove_closure_without_waiting(closure_id); // must not block executor
+        }
+
+        self.transactions.retain(|transaction| transaction.response.is_empty() == false);
+        self.transactions.iter().map(|transaction| transaction.response.clone()).collect()
+    }
+}
+
+impl Future for CommandsFuture {
+    type Output = Vec<String>;
+
+    fn poll(self: Pin<&mut Self>, context: &mut Context<'_>) -> Poll<Self::Output> {
+        let future = self.get_mut();
+
+        *future.waker.lock().unwrap() = Some(context.waker().clone()); // must be stored before responses are received
+
+        for response in future.response_receiver.try_iter() {
+            for transaction in future.transactions.iter_mut() {
+                if transaction.command.is_some() && response.key == transaction.command.as_ref().unwrap().key {
+                    *transaction = Transaction { command: None, response: response.json.clone() };
+                }
+            }
+        }
+
+        if future.transactions.iter().all(|transaction| transaction.command.as_ref().is_none()) {
+            return Poll::Ready(future.complete());
+        }
+
+        let now = Instant::now();
+
+        if future.deadline.map_or(true, |deadline| now >= deadline) {
+            if future.deadline.is_some() {
+                if future.retries == 0 {
+                    return Poll::Ready(future.complete());
+                }
+                future.retries -= 1;
+            }
+
+            if let Some(write_sender) = &future.write_sender {
+                write_sender.send_all(future.transactions.iter().filter_map(|transaction| transaction.command.as_ref()).map(|command| command.terminated_json.clone().into_bytes()).collect()).ok();
+            }
+
+            future.deadline = Some(now + future.timeout);
+        }
+
+        if future.timer_deadline != future.deadline {
+            future.timer_deadline = future.deadline;
+            wake_at(future.deadline.unwrap(), context.waker().clone());
+        }
+
+        Poll::Pending
+    }
+}
+
+impl Drop for CommandsFuture {
+    fn drop(&mut self) {
+        if let Some(closure_id) = self.closure_id {
+            self.decoder.dispatcher.remove_closure_without_waiting(closure_id);
+        }
+    }
+}
+
+pub struct MessageStream<'a, T> {
+    connection: &'a Connection,
+    receiver: Receiver<T>,
+    waker: Arc<Mutex<Option<Waker>>>,
+    closure_id: u64,
+}
+
+impl<T: Subscribable> MessageStream<'_, T> {
+    pub fn new<'a>(connection: &'a Connection, capacity: usize) -> MessageStream<'a, T> {
+        let waker: Arc<Mutex<Option<Waker>>> = Arc::new(Mutex::new(None));
+        let closure_waker = waker.clone();
+
+        let (receiver, closure_id) = add_bounded_closure(connection, capacity, move || {
+            if let Some(waker) = closure_waker.lock().unwrap().as_ref() {
+                waker.wake_by_ref();
+            }
+        });
+
+        MessageStream {
+            connection,
+            receiver,
+            waker,
+            closure_id,
+        }
+    }
+}
+
+impl<T> Stream for MessageStream<'_, T> {
+    type Item = T;
+
+    fn poll_next(self: Pin<&mut Self>, context: &mut Context<'_>) -> Poll<Option<T>> {
+        if let Ok(message) = self.receiver.try_recv() {
+            return Poll::Ready(Some(message));
+        }
+
+        *self.waker.lock().unwrap() = Some(context.waker().clone());
+
+        match self.receiver.try_recv() { // message may have been received before waker was stored
+            Ok(message) => Poll::Ready(Some(message)),
+            Err(_) => Poll::Pending,
+        }
+    }
+}
+
+impl<T> Drop for MessageStream<'_, T> {
+    fn drop(&mut self) {
+        self.connection.remove_closure_without_waiting(self.closure_id); // must not block executor
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::io::{Read, Write};
+    use std::net::{Ipv4Addr, TcpListener};
+    use std::task::Wake;
+    use crate::connection_info::*;
+    use crate::data_messages::*;
+    use crate::encoder::*;
+    use super::*;
+
+    struct ThreadWaker(std::thread::Thread);
+
+    impl Wake for ThreadWaker {
+        fn wake(self: Arc<Self>) {
+            self.0.unpark();
+        }
+    }
+
+    fn block_on<F: Future>(future: F) -> F::Output { // minimal executor so that tests do not need an async runtime
+        let waker = Waker::from(Arc::new(ThreadWaker(std::thread::current())));
+        let mut context = Context::from_waker(&waker);
+        let mut future = Box::pin(future);
+
+        loop {
+            if let Poll::Ready(output) = future.as_mut().poll(&mut context) {
+                return output;
+            }
+            std::thread::park_timeout(Duration::from_secs(1));
+        }
+    }
+
+    fn simulated_device(echo: bool) -> (Connection, Receiver<Vec<u8>>) { // streams temperature messages at 1 kHz and echoes commands if enabled, receiver yields bytes written to device
+        let listener = TcpListener::bind((Ipv4Addr::LOCALHOST, 0)).unwrap();
+        let port = listener.local_addr().unwrap().port();
+        let (sender, receiver) = crossbeam::channel::unbounded();
+
+        std::thread::spawn(move || {
+            let (mut stream, _) = listener.accept().unwrap();
+
+            stream.set_read_timeout(Some(Duration::from_millis(1))).ok();
+
+            let mut buffer = vec![0; 2048];
+            let mut bytes = Vec::new();
+            let mut timestamp = 0;
+
+            loop {
+                bytes.clear();
+                encode_binary(&TemperatureMessage { timestamp, temperature: 0.0 }, &mut bytes);
+
+                if stream.write_all(&bytes).is_err() {
+                    return;
+                }
+
+                timestamp += 1000;
+
+                match stream.read(&mut buffer) {
+                    Ok(0) => return,
+                    Ok(number_of_bytes) => {
+                        sender.send(buffer[..number_of_bytes].to_vec()).ok();
+
+                        if echo {
+                            stream.write_all(&buffer[..number_of_bytes]).ok();
+                        }
+                    }
+                    Err(_) => {}
+                }
+            }
+        });
+
+        let connection = Connection::new(&ConnectionInfo::TcpConnectionInfo(TcpConnectionInfo { ip_address: Ipv4Addr::LOCALHOST, port }));
+        block_on(connection.open_future()).unwrap();
+
+        (connection, receiver)
+    }
+
+    fn closure_count(connection: &Connection, closure_id: u64) -> u64 { // zero once closure removed by dispatcher
+        connection.get_closure_timings().iter().find(|timing| timing.closure_id == closure_id).map_or(0, |timing| timing.count)
+    }
+
+    #[test]
+    fn send_commands_future_resolves_with_responses() {
+        let (connection, _) = simulated_device(true);
+
+        let responses = block_on(connection.send_commands_future(vec!["{\"ping\":null}", "{\"serial_number\":null}"], 2, 500));
+
+        assert_eq!(responses, vec!["{\"ping\":null}".to_owned(), "{\"serial_number\":null}".to_owned()]);
+
+        connection.close();
+    }
+
+    #[test]
+    fn send_commands_future_retries_then_completes_empty() {
+        let (connection, receiver) = simulated_device(false);
+        let start = Instant::now();
+
+        let responses = block_on(connection.send_commands_future(vec!["{\"ping\":null}"], 2, 50));
+
+        assert!(responses.is_empty());
+        assert!(start.elapsed() >= Duration::from_millis(150)); // timeout after each of 3 attempts
+
+        std::thread::sleep(Duration::from_millis(50)); // device may not have read last attempt yet
+        let written: Vec<u8> = receiver.try_iter().flatten().collect();
+
+        assert_eq!(written, b"{\"ping\":null}\n".repeat(3));
+
+        connection.close();
+    }
+
+    #[test]
+    fn dropped_message_stream_is_not_called() {
+        let (connection, _) = simulated_device(true);
+
+        let mut stream = connection.stream::<TemperatureMessage>(16);
+        let closure_id = stream.closure_id;
+
+        let waker = Waker::from(Arc::new(ThreadWaker(std::thread::current())));
+        let mut context = Context::from_waker(&waker);
+
+        let start = Instant::now();
+
+        while let Poll::Pending = Pin::new(&mut stream).poll_next(&mut context) {
+            assert!(start.elapsed() < Duration::from_secs(5));
+            std::thread::park_timeout(Duration::from_millis(10));
+        }
+
+        while closure_count(&connection, closure_id) == 0 { // timing recorded after message received
+            assert!(start.elapsed() < Duration::from_secs(5));
+            std::thread::sleep(Duration::from_millis(1));
+        }
+
+        drop(stream);
+        std::thread::sleep(Duration::from_millis(10)); // call in progress when dropped may still complete
+
+        let count = closure_count(&connection, closure_id);
+        std::thread::sleep(Duration::from_millis(100)); // device still streaming
+
+        assert!(closure_count(&connection, closure_id) <= count);
+
+        connection.close();
+    }
+
+    #[test]
+    fn dropped_commands_future_is_not_called() {
+        let (connection, _) = simulated_device(true);
+
+        let future = connection.send_commands_future(vec!["{\"ping\":null}"], 0, 500);
+        let closure_id = future.closure_id.unwrap();
+
+        drop(future); // never polled so still pending
+
+        assert_eq!(connection.send_commands(vec!["{\"ping\":null}"], 2, 500).len(), 1); // response dispatched to command closures
+
+        assert_eq!(closure_count(&connection, closure_id), 0);
+
+        connection.close();
+    }
+}
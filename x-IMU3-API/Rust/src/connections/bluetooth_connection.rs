@@ -1,5 +1,3 @@
-use crossbeam::channel::Sender;
-use std::sync::{Arc, Mutex};
 use crate::connection_info::*;
 use crate::connections::*;
 use crate::decoder::*;
@@ -34,11 +32,15 @@ impl GenericConnection for BluetoothConnection {
         ConnectionInfo::BluetoothConnectionInfo(self.connection_info.clone())
     }
 
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>> {
+    fn get_decoder(&self) -> DecoderHandle {
         self.serial_connection.get_decoder()
     }
 
-    fn get_write_sender(&self) -> Option<Sender<String>> {
+    fn get_write_sender(&self) -> Option<WriteSender> {
         self.serial_connection.get_write_sender()
     }
+
+    fn set_reactor_enabled(&mut self, reactor_enabled: bool) {
+        self.serial_connection.set_reactor_enabled(reactor_enabled);
+    }
 }
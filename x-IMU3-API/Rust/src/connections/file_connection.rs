@@ -1,15 +1,19 @@
 use crossbeam::channel::Sender;
-use std::fs::OpenOptions;
+use std::fs::{File, OpenOptions};
 use std::io::Read;
-use std::sync::{Arc, Mutex};
 use crate::connection_info::*;
 use crate::connections::*;
 use crate::decoder::*;
-use crate::dispatcher::*;
+
+const MEMORY_MAPPED_SLICE_SIZE: usize = 1 << 20; // large enough that per-call overhead is negligible, small enough for close to be responsive
 
 pub struct FileConnection {
     connection_info: FileConnectionInfo,
-    decoder: Arc<Mutex<Decoder>>,
+    decoder: DecoderHandle,
+    memory_mapped: bool,
+    replay_speed: f32,
+    replay_start_time: u64,
+    replay_stop_time: u64,
     close_sender: Option<Sender<()>>,
 }
 
@@ -17,34 +21,119 @@ impl FileConnection {
     pub fn new(connection_info: &FileConnectionInfo) -> FileConnection {
         FileConnection {
             connection_info: connection_info.clone(),
-            decoder: Arc::new(Mutex::new(Decoder::new())),
+            decoder: DecoderHandle::new(),
+            memory_mapped: false,
+            replay_speed: 0.0,
+            replay_start_time: 0,
+            replay_stop_time: 0,
             close_sender: None,
         }
     }
 }
 
+#[cfg(unix)]
+struct MemoryMap { // file must not be truncated while mapped
+    pointer: *mut libc::c_void,
+    length: usize,
+}
+
+#[cfg(unix)]
+unsafe impl Send for MemoryMap {}
+
+#[cfg(unix)]
+impl MemoryMap {
+    fn new(file: &File) -> std::io::Result<MemoryMap> {
+        use std::os::unix::io::AsRawFd;
+
+        let metadata = file.metadata()?;
+
+        if metadata.is_file() == false {
+            return Err(std::io::Error::new(std::io::ErrorKind::Unsupported, "Not a regular file")); // length of pipes and devices is not known
+        }
+
+        let length = metadata.len() as usize;
+
+        if length == 0 {
+            return Ok(MemoryMap { pointer: std::ptr::null_mut(), length }); // zero length mappings are not permitted
+        }
+
+        let pointer = unsafe { libc::mmap(std::ptr::null_mut(), length, libc::PROT_READ, libc::MAP_PRIVATE, file.as_raw_fd(), 0) };
+
+        if pointer == libc::MAP_FAILED {
+            return Err(std::io::Error::last_os_error());
+        }
+
+        unsafe { libc::madvise(pointer, length, libc::MADV_SEQUENTIAL) }; // hint only so result ignored
+
+        Ok(MemoryMap { pointer, length })
+    }
+
+    fn as_slice(&self) -> &[u8] {
+        if self.length == 0 {
+            return &[];
+        }
+        unsafe { std::slice::from_raw_parts(self.pointer as *const u8, self.length) }
+    }
+}
+
+#[cfg(unix)]
+impl Drop for MemoryMap {
+    fn drop(&mut self) {
+        if self.length > 0 {
+            unsafe { libc::munmap(self.pointer, self.length) };
+        }
+    }
+}
+
 impl GenericConnection for FileConnection {
     fn open(&mut self) -> std::io::Result<()> {
         let mut file = OpenOptions::new().read(true).open(&self.connection_info.file_path)?;
 
-        let decoder = self.decoder.clone();
-
         let (close_sender, close_receiver) = crossbeam::channel::bounded(1);
 
+        let mut replay = Replay::new(Decoder::new(&self.decoder), close_receiver, self.replay_speed, self.replay_start_time, self.replay_stop_time);
+
+        #[cfg(unix)]
+        if let Some(memory_map) = if self.memory_mapped { MemoryMap::new(&file).ok() } else { None } { // falls back to reads if file cannot be mapped, e.g. pipes and character devices
+            self.close_sender = Some(close_sender);
+
+            std::thread::spawn(move || {
+                for bytes in memory_map.as_slice().chunks(MEMORY_MAPPED_SLICE_SIZE) {
+                    if replay.process_bytes(bytes) == false {
+                        break;
+                    }
+                }
+
+                replay.end_of_file();
+            });
+
+            return Ok(());
+        }
+
         self.close_sender = Some(close_sender);
 
+        let buffer_size = if self.memory_mapped { MEMORY_MAPPED_SLICE_SIZE } else { 2048 }; // memory mapped mode falls back to large reads where not supported or mapping fails
+
         std::thread::spawn(move || {
-            let mut buffer: Vec<u8> = vec![0; 2048];
+            let mut buffer: Vec<u8> = vec![0; buffer_size];
 
-            while let Err(_) = close_receiver.try_recv() {
-                if let Ok(number_of_bytes) = file.read(&mut buffer) {
-                    if number_of_bytes == 0 {
-                        decoder.lock().unwrap().dispatcher.sender.send(DispatcherData::EndOfFile()).ok();
-                        break;
+            loop {
+                match file.read(&mut buffer) {
+                    Ok(0) => break,
+                    Ok(number_of_bytes) => {
+                        if replay.process_bytes(&buffer.as_mut_slice()[..number_of_bytes]) == false {
+                            break;
+                        }
+                    }
+                    Err(_) => {
+                        if replay.process_bytes(&[]) == false { // close still checked if file cannot be read
+                            break;
+                        }
                     }
-                    decoder.lock().unwrap().process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
                 }
             }
+
+            replay.end_of_file();
         });
 
         Ok(())
@@ -60,11 +149,68 @@ impl GenericConnection for FileConnection {
         ConnectionInfo::FileConnectionInfo(self.connection_info.clone())
     }
 
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>> {
+    fn get_decoder(&self) -> DecoderHandle {
         self.decoder.clone()
     }
 
-    fn get_write_sender(&self) -> Option<Sender<String>> {
+    fn get_write_sender(&self) -> Option<WriteSender> {
         None
     }
+
+    fn set_memory_mapped(&mut self, memory_mapped: bool) {
+        self.memory_mapped = memory_mapped;
+    }
+
+    fn set_replay(&mut self, speed: f32, start_time: u64, stop_time: u64) {
+        self.replay_speed = speed;
+        self.replay_start_time = start_time;
+        self.replay_stop_time = stop_time;
+    }
+}
+
+#[cfg(all(test, unix))]
+mod tests {
+    use super::*;
+    use std::io::Write;
+    use std::time::Duration;
+    use crate::data_messages::*;
+    use crate::encoder::*;
+
+    #[test]
+    fn memory_mapped_falls_back_to_reads_for_pipe() {
+        let path = std::env::temp_dir().join(format!("ximu3_file_connection_test_{}", std::process::id()));
+        let path_c_string = std::ffi::CString::new(path.to_str().unwrap()).unwrap();
+
+        assert_eq!(unsafe { libc::mkfifo(path_c_string.as_ptr(), 0o600) }, 0);
+
+        let mut bytes = Vec::new();
+
+        for timestamp in 0..100 {
+            encode_binary(&TemperatureMessage { timestamp, temperature: 0.0 }, &mut bytes);
+        }
+
+        let writer_path = path.clone();
+        let writer = std::thread::spawn(move || std::fs::OpenOptions::new().write(true).open(writer_path).unwrap().write_all(&bytes).unwrap());
+
+        let mut connection = FileConnection::new(&FileConnectionInfo { file_path: path.to_str().unwrap().to_owned() });
+        let (sender, receiver) = crossbeam::channel::unbounded();
+
+        let temperature_sender = sender.clone();
+        connection.decoder.dispatcher.add_temperature_closure(Box::new(move |message| temperature_sender.send(Some(message.timestamp)).unwrap()));
+        connection.decoder.dispatcher.add_end_of_file_closure(Box::new(move || sender.send(None).unwrap()));
+
+        connection.set_memory_mapped(true);
+        connection.open().unwrap(); // pipe has no length so cannot be mapped
+        writer.join().unwrap();
+
+        let mut timestamps = Vec::new();
+
+        while let Some(timestamp) = receiver.recv_timeout(Duration::from_secs(5)).unwrap() {
+            timestamps.push(timestamp);
+        }
+
+        std::fs::remove_file(&path).unwrap();
+
+        assert_eq!(timestamps, (0..100).collect::<Vec<u64>>());
+    }
 }
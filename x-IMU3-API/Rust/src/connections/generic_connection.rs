@@ -1,12 +1,44 @@
-use crossbeam::channel::Sender;
-use std::sync::{Arc, Mutex};
+use crossbeam::channel::{SendError, Sender};
 use crate::connection_info::*;
+use crate::connections::*;
 use crate::decoder::*;
 
 pub trait GenericConnection {
     fn open(&mut self) -> std::io::Result<()>;
     fn close(&self);
     fn get_info(&self) -> ConnectionInfo;
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>>;
-    fn get_write_sender(&self) -> Option<Sender<String>>;
+    fn get_decoder(&self) -> DecoderHandle;
+    fn get_write_sender(&self) -> Option<WriteSender>;
+    fn set_reactor_enabled(&mut self, _reactor_enabled: bool) {}
+    fn set_receive_buffer_size(&mut self, _receive_buffer_size: usize) {}
+    fn set_receive_port_shared(&mut self, _receive_port_shared: bool) {}
+    fn set_tcp_no_delay(&mut self, _tcp_no_delay: bool) {}
+    fn set_memory_mapped(&mut self, _memory_mapped: bool) {}
+    fn set_replay(&mut self, _speed: f32, _start_time: u64, _stop_time: u64) {}
+}
+
+#[derive(Clone)]
+pub struct WriteSender {
+    sender: Sender<Vec<u8>>,
+    reactor: Option<ReactorHandle>, // woken after each write if connection is driven by a reactor
+}
+
+impl WriteSender {
+    pub fn new(sender: Sender<Vec<u8>>, reactor: Option<ReactorHandle>) -> WriteSender {
+        WriteSender {
+            sender,
+            reactor,
+        }
+    }
+
+    pub fn send_all(&self, buffers: Vec<Vec<u8>>) -> Result<(), SendError<Vec<u8>>> { // reactor woken once so that all buffers are coalesced
+        for bytes in buffers {
+            self.sender.send(bytes)?;
+        }
+
+        if let Some(reactor) = &self.reactor {
+            reactor.write();
+        }
+        Ok(())
+    }
 }
@@ -5,6 +5,9 @@ pub use self::tcp_connection::*;
 pub use self::udp_connection::*;
 pub use self::bluetooth_connection::*;
 pub use self::file_connection::*;
+pub use self::reactor::*;
+pub use self::replay::*;
+pub use self::write_queue::*;
 
 mod generic_connection;
 mod usb_connection;
@@ -13,3 +16,6 @@ mod tcp_connection;
 mod udp_connection;
 mod bluetooth_connection;
 mod file_connection;
+mod reactor;
+mod replay;
+mod write_queue;
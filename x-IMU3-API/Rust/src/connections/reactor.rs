@@ -0,0 +1,216 @@
+use crossbeam::channel::{Receiver, Sender};
+use mio::event::Source;
+use mio::{Events, Interest, Poll, Token, Waker};
+use std::collections::HashMap;
+use std::io::{ErrorKind, IoSlice};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::Duration;
+use crate::connections::*;
+use crate::dispatcher::*;
+
+const MAX_NUMBER_OF_REACTORS: usize = 4;
+
+const WAKER_TOKEN: Token = Token(usize::MAX);
+
+pub trait ReactorSource: Source + Send {
+    fn receive(&mut self, buffer: &mut [u8]) -> std::io::Result<usize>; // reads and decodes received bytes, must only return 0 at end of stream
+    fn write(&mut self, buffers: &[IoSlice]) -> std::io::Result<usize>;
+}
+
+struct Registration {
+    source: Box<dyn ReactorSource>,
+    write_queue: Option<WriteQueue>, // none if source is receive only
+}
+
+impl Registration {
+    fn read(&mut self, buffer: &mut [u8]) {
+        loop { // events are edge-triggered so must read until would block
+            match self.source.receive(buffer) {
+                Ok(0) => return,
+                Ok(_) => (),
+                Err(error) if error.kind() == ErrorKind::Interrupted => (),
+                Err(_) => return,
+            }
+        }
+    }
+
+    fn write(&mut self) {
+        if let Some(write_queue) = &mut self.write_queue {
+            let source = &mut self.source;
+
+            write_queue.write(|buffers| source.write(buffers)); // resumed by writable event if would block
+        }
+    }
+}
+
+enum Command {
+    Register(Token, Registration, Sender<std::io::Result<()>>), // result returned to caller of register
+    Write(Token),
+    Close(Token),
+}
+
+struct Reactor {
+    command_sender: Sender<Command>,
+    waker: Arc<Mutex<Waker>>, // replaced if poll is rebuilt
+}
+
+impl Reactor {
+    fn new() -> std::io::Result<Reactor> {
+        let mut poll = Poll::new()?;
+        let waker = Arc::new(Mutex::new(Waker::new(poll.registry(), WAKER_TOKEN)?));
+        let thread_waker = waker.clone();
+
+        let (command_sender, command_receiver) = crossbeam::channel::unbounded();
+
+        std::thread::spawn(move || {
+            let mut events = Events::with_capacity(1024);
+            let mut registrations: HashMap<Token, Registration> = HashMap::new();
+            let mut buffer: Vec<u8> = vec![0; 2048];
+
+            set_shared_thread(); // closures and a full queue must not stall other connections served by this thread
+
+            loop {
+                if let Err(error) = poll.poll(&mut events, None) {
+                    if error.kind() == ErrorKind::Interrupted {
+                        continue;
+                    }
+                    poll = Reactor::rebuild(poll, &thread_waker, &mut registrations, &command_receiver, &mut buffer);
+                    continue;
+                }
+
+                for event in events.iter() {
+                    if let Some(registration) = registrations.get_mut(&event.token()) {
+                        if event.is_readable() {
+                            registration.read(&mut buffer);
+                        }
+                        if event.is_writable() {
+                            registration.write();
+                        }
+                    }
+                }
+
+                for command in command_receiver.try_iter() {
+                    match command {
+                        Command::Register(token, mut registration, result_sender) => {
+                            let result = poll.registry().register(&mut registration.source, token, Interest::READABLE | Interest::WRITABLE);
+
+                            if result.is_ok() {
+                                registration.read(&mut buffer); // bytes may have been received before registration
+                                registrations.insert(token, registration);
+                            }
+                            result_sender.send(result).ok();
+                        }
+                        Command::Write(token) => {
+                            if let Some(registration) = registrations.get_mut(&token) {
+                                registration.write();
+                            }
+                        }
+                        Command::Close(token) => {
+                            if let Some(mut registration) = registrations.remove(&token) {
+                                poll.registry().deregister(&mut registration.source).ok();
+                            }
+                        }
+                    }
+                }
+            }
+        });
+
+        Ok(Reactor {
+            command_sender,
+            waker,
+        })
+    }
+
+    fn rebuild(mut poll: Poll, waker: &Mutex<Waker>, registrations: &mut HashMap<Token, Registration>, command_receiver: &Receiver<Command>, buffer: &mut [u8]) -> Poll { // replaces a failed poll, retried until successful
+        registrations.values_mut().for_each(|registration| {
+            poll.registry().deregister(&mut registration.source).ok();
+        });
+
+        loop {
+            let result = Poll::new().and_then(|new_poll| {
+                *waker.lock().unwrap() = Waker::new(new_poll.registry(), WAKER_TOKEN)?;
+                Ok(new_poll)
+            });
+
+            match result {
+                Ok(new_poll) => {
+                    poll = new_poll;
+                    break;
+                }
+                Err(error) => {
+                    registrations.clear(); // sources closed rather than left without events
+
+                    for command in command_receiver.try_iter() {
+                        if let Command::Register(_, _, result_sender) = command {
+                            result_sender.send(Err(std::io::Error::new(error.kind(), error.to_string()))).ok();
+                        }
+                    }
+                    std::thread::sleep(Duration::from_millis(100));
+                }
+            }
+        }
+
+        registrations.retain(|token, registration| {
+            if poll.registry().register(&mut registration.source, *token, Interest::READABLE | Interest::WRITABLE).is_err() {
+                return false; // source closed
+            }
+            registration.read(buffer); // events may have been missed while poll failed
+            registration.write();
+            true
+        });
+
+        poll
+    }
+
+    fn send(&self, command: Command) {
+        self.command_sender.send(command).ok();
+        self.waker.lock().unwrap().wake().ok();
+    }
+}
+
+static REACTORS: OnceLock<Vec<Reactor>> = OnceLock::new();
+
+static TOKEN_COUNTER: AtomicUsize = AtomicUsize::new(0);
+
+#[derive(Clone)]
+pub struct ReactorHandle {
+    reactor: &'static Reactor,
+    token: Token,
+}
+
+impl ReactorHandle {
+    pub fn register(source: Box<dyn ReactorSource>, write_receiver: Option<Receiver<Vec<u8>>>) -> std::io::Result<ReactorHandle> {
+        let reactors = REACTORS.get_or_init(|| {
+            let number_of_reactors = std::thread::available_parallelism().map_or(1, |number| number.get()).min(MAX_NUMBER_OF_REACTORS);
+
+            (0..number_of_reactors).filter_map(|_| Reactor::new().ok()).collect()
+        });
+
+        if reactors.is_empty() {
+            return Err(std::io::Error::new(ErrorKind::Other, "Unable to create reactor"));
+        }
+
+        let token = Token(TOKEN_COUNTER.fetch_add(1, Ordering::Relaxed));
+        let reactor = &reactors[token.0 % reactors.len()]; // connections shared evenly between reactors
+
+        let (result_sender, result_receiver) = crossbeam::channel::bounded(1);
+
+        reactor.send(Command::Register(token, Registration { source, write_queue: write_receiver.map(WriteQueue::new) }, result_sender));
+
+        result_receiver.recv().map_err(|_| std::io::Error::new(ErrorKind::Other, "Reactor stopped"))??;
+
+        Ok(ReactorHandle {
+            reactor,
+            token,
+        })
+    }
+
+    pub fn write(&self) {
+        self.reactor.send(Command::Write(self.token));
+    }
+
+    pub fn close(&self) {
+        self.reactor.send(Command::Close(self.token));
+    }
+}
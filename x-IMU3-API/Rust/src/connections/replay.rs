@@ -0,0 +1,391 @@
+use crossbeam::channel::{Receiver, RecvTimeoutError};
+use std::time::{Duration, Instant};
+use crate::decoder::*;
+use crate::dispatcher::*;
+
+const NUMBER_OF_SLOTS: usize = 1024;
+
+const TICK_PERIOD: u64 = 1000; // microseconds, messages due within the same tick are dispatched together
+
+struct TimerWheel<T> {
+    slots: Vec<Vec<T>>,
+    tick: u64, // all slots before this tick have been expired
+    length: usize,
+}
+
+impl<T> TimerWheel<T> {
+    fn new() -> TimerWheel<T> {
+        TimerWheel {
+            slots: (0..NUMBER_OF_SLOTS).map(|_| Vec::new()).collect(),
+            tick: 0,
+            length: 0,
+        }
+    }
+
+    fn insert(&mut self, tick: u64, item: T) -> Result<(), T> { // item returned if tick is beyond the end of the wheel
+        if self.length == 0 && tick > self.tick {
+            self.tick = tick;
+        }
+
+        let tick = std::cmp::max(tick, self.tick); // items already due are expired with the current tick
+
+        if tick >= self.tick + NUMBER_OF_SLOTS as u64 {
+            return Err(item);
+        }
+
+        self.slots[(tick % NUMBER_OF_SLOTS as u64) as usize].push(item);
+        self.length += 1;
+        Ok(())
+    }
+
+    fn next_tick(&self) -> Option<u64> {
+        if self.length == 0 {
+            return None;
+        }
+        (self.tick..self.tick + NUMBER_OF_SLOTS as u64).find(|tick| self.slots[(tick % NUMBER_OF_SLOTS as u64) as usize].is_empty() == false)
+    }
+
+    fn expire<F>(&mut self, tick: u64, mut closure: F) where F: FnMut(T) { // expires all items up to and including tick
+        while self.tick <= tick && self.length > 0 {
+            let slot = &mut self.slots[(self.tick % NUMBER_OF_SLOTS as u64) as usize];
+
+            self.length -= slot.len();
+            slot.drain(..).for_each(&mut closure);
+            self.tick += 1;
+        }
+    }
+}
+
+pub struct Replay { // paces dispatch of decoded messages using message timestamps, bytes passed straight to decoder if replay disabled
+    decoder: Decoder,
+    close_receiver: Receiver<()>,
+    speed: f32,
+    start_time: u64,
+    stop_time: u64,
+    timer_wheel: TimerWheel<DispatcherData>,
+    first_timestamp: Option<u64>,
+    start: Option<Instant>,
+    tick: u64, // tick of latest timestamped message
+    messages: Vec<DispatcherData>,
+    closed: bool,
+}
+
+impl Replay {
+    pub fn new(decoder: Decoder, close_receiver: Receiver<()>, speed: f32, start_time: u64, stop_time: u64) -> Replay {
+        Replay {
+            decoder,
+            close_receiver,
+            speed,
+            start_time,
+            stop_time,
+            timer_wheel: TimerWheel::new(),
+            first_timestamp: None,
+            start: None,
+            tick: 0,
+            messages: Vec::new(),
+            closed: false,
+        }
+    }
+
+    fn is_enabled(&self) -> bool {
+        self.speed > 0.0 || self.start_time > 0 || self.stop_time > 0
+    }
+
+    pub fn process_bytes(&mut self, bytes: &[u8]) -> bool { // false if closed or stop time reached
+        if self.close_receiver.try_recv().is_ok() {
+            self.closed = true;
+            return false;
+        }
+
+        if self.is_enabled() == false {
+            self.decoder.process_bytes(bytes);
+            return true;
+        }
+
+        let mut messages = std::mem::take(&mut self.messages);
+
+        let subscriptions = match self.first_timestamp {
+            Some(_) => self.decoder.get_handle().dispatcher.get_subscriptions(),
+            None => ALL_SUBSCRIPTIONS, // start and stop times are relative to first message of any type
+        };
+
+        self.decoder.process_bytes_with(bytes, subscriptions, |data| messages.push(data));
+
+        let result = messages.drain(..).all(|data| self.schedule(data)); // unscheduled messages discarded if closed or stop time reached
+
+        self.messages = messages;
+        result
+    }
+
+    fn schedule(&mut self, data: DispatcherData) -> bool {
+        if let Some(timestamp) = data.get_timestamp() {
+            let time = timestamp.saturating_sub(*self.first_timestamp.get_or_insert(timestamp)); // timestamps earlier than first message dispatched immediately
+
+            if time < self.start_time {
+                return true;
+            }
+
+            if self.stop_time > 0 && time > self.stop_time {
+                return false;
+            }
+
+            self.tick = match self.speed > 0.0 {
+                true => (((time - self.start_time) as f64 / self.speed as f64) as u64) / TICK_PERIOD,
+                false => 0,
+            };
+
+            self.start.get_or_insert_with(Instant::now);
+        }
+
+        if self.start.is_none() { // messages without timestamps dispatched immediately until start time reached
+            self.decoder.get_handle().dispatcher.sender.send(data).ok();
+            return true;
+        }
+
+        if self.speed > 0.0 {
+            let mut data = data;
+
+            while let Err(returned) = self.timer_wheel.insert(self.tick, data) {
+                if self.expire_next() == false {
+                    return false;
+                }
+                data = returned;
+            }
+        } else {
+            self.decoder.get_handle().dispatcher.sender.send(data).ok();
+        }
+        true
+    }
+
+    fn expire_next(&mut self) -> bool { // waits until next tick is due, false if closed
+        let tick = match self.timer_wheel.next_tick() {
+            Some(tick) => tick,
+            None => return true,
+        };
+
+        let deadline = self.start.unwrap() + Duration::from_micros(tick * TICK_PERIOD);
+
+        if let Some(timeout) = deadline.checked_duration_since(Instant::now()) {
+            if let Ok(()) | Err(RecvTimeoutError::Disconnected) = self.close_receiver.recv_timeout(timeout) {
+                self.closed = true;
+                return false;
+            }
+        }
+
+        let sender = &self.decoder.get_handle().dispatcher.sender;
+
+        self.timer_wheel.expire(tick, |data| {
+            sender.send(data).ok();
+        });
+        true
+    }
+
+    pub fn end_of_file(mut self) { // dispatches remaining messages when due, end of file not reported if closed
+        if self.closed {
+            return;
+        }
+
+        while self.timer_wheel.next_tick().is_some() {
+            if self.expire_next() == false {
+                return;
+            }
+        }
+
+        self.decoder.get_handle().dispatcher.sender.send(DispatcherData::EndOfFile()).ok();
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crossbeam::channel::Sender;
+    use crate::data_messages::*;
+    use crate::encoder::*;
+
+    fn expire_all(timer_wheel: &mut TimerWheel<u64>) -> Vec<(u64, u64)> { // (tick, item)
+        let mut expired = Vec::new();
+
+        while let Some(tick) = timer_wheel.next_tick() {
+            timer_wheel.expire(tick, |item| expired.push((tick, item)));
+        }
+        expired
+    }
+
+    #[test]
+    fn timer_wheel_wraps_past_end_of_slots() {
+        let mut timer_wheel = TimerWheel::new();
+        let mut expired = Vec::new();
+
+        for tick in (1000..4000).step_by(7) { // wheel spans slots 1000 to 2023 until earliest items expired
+            let mut item = tick;
+
+            while let Err(returned) = timer_wheel.insert(tick, item) {
+                let next_tick = timer_wheel.next_tick().unwrap();
+                timer_wheel.expire(next_tick, |item| expired.push((next_tick, item)));
+                item = returned;
+            }
+        }
+
+        expired.extend(expire_all(&mut timer_wheel));
+
+        assert_eq!(expired, (1000..4000).step_by(7).map(|tick| (tick, tick)).collect::<Vec<_>>());
+        assert_eq!(timer_wheel.next_tick(), None);
+    }
+
+    #[test]
+    fn timer_wheel_returns_items_beyond_end_of_slots() {
+        let mut timer_wheel = TimerWheel::new();
+
+        assert!(timer_wheel.insert(10, 0).is_ok());
+        assert_eq!(timer_wheel.insert(10 + NUMBER_OF_SLOTS as u64 - 1, 1), Ok(()));
+        assert_eq!(timer_wheel.insert(10 + NUMBER_OF_SLOTS as u64, 2), Err(2));
+        assert_eq!(timer_wheel.insert(10 + 100 * NUMBER_OF_SLOTS as u64, 3), Err(3));
+
+        assert_eq!(expire_all(&mut timer_wheel), vec![(10, 0), (10 + NUMBER_OF_SLOTS as u64 - 1, 1)]);
+
+        assert_eq!(timer_wheel.insert(10 + 100 * NUMBER_OF_SLOTS as u64, 3), Ok(())); // empty wheel restarts at gap
+        assert_eq!(timer_wheel.next_tick(), Some(10 + 100 * NUMBER_OF_SLOTS as u64));
+        assert_eq!(expire_all(&mut timer_wheel), vec![(10 + 100 * NUMBER_OF_SLOTS as u64, 3)]);
+    }
+
+    #[test]
+    fn timer_wheel_expires_backwards_timestamps_with_current_tick() {
+        let mut timer_wheel = TimerWheel::new();
+
+        assert_eq!(timer_wheel.insert(100, 0), Ok(()));
+        assert_eq!(timer_wheel.insert(50, 1), Ok(()));
+        assert_eq!(timer_wheel.insert(0, 2), Ok(()));
+        assert_eq!(timer_wheel.insert(101, 3), Ok(()));
+        assert_eq!(timer_wheel.next_tick(), Some(100));
+
+        assert_eq!(expire_all(&mut timer_wheel), vec![(100, 0), (100, 1), (100, 2), (101, 3)]);
+
+        assert_eq!(timer_wheel.insert(20, 4), Ok(())); // empty wheel does not move backwards
+        assert_eq!(timer_wheel.next_tick(), Some(102));
+        assert_eq!(expire_all(&mut timer_wheel), vec![(102, 4)]);
+    }
+
+    fn inertial_bytes(timestamps: &[u64]) -> Vec<u8> {
+        let mut bytes = Vec::new();
+
+        for &timestamp in timestamps {
+            encode_binary(&InertialMessage {
+                timestamp,
+                gyroscope_x: 0.0,
+                gyroscope_y: 0.0,
+                gyroscope_z: 0.0,
+                accelerometer_x: 0.0,
+                accelerometer_y: 0.0,
+                accelerometer_z: 0.0,
+            }, &mut bytes);
+        }
+        bytes
+    }
+
+    fn replay(speed: f32, start_time: u64, stop_time: u64) -> (Replay, Sender<()>, Receiver<Option<u64>>) { // receiver yields timestamps then None for end of file
+        let handle = DecoderHandle::new();
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        let (close_sender, close_receiver) = crossbeam::channel::bounded(1);
+
+        let inertial_sender = sender.clone();
+        handle.dispatcher.add_inertial_closure(Box::new(move |message| inertial_sender.send(Some(message.timestamp)).unwrap()));
+        handle.dispatcher.add_end_of_file_closure(Box::new(move || sender.send(None).unwrap()));
+
+        (Replay::new(Decoder::new(&handle), close_receiver, speed, start_time, stop_time), close_sender, receiver)
+    }
+
+    fn receive_all(receiver: &Receiver<Option<u64>>) -> Vec<u64> { // until end of file
+        let mut timestamps = Vec::new();
+
+        while let Some(timestamp) = receiver.recv_timeout(Duration::from_secs(5)).unwrap() {
+            timestamps.push(timestamp);
+        }
+        timestamps
+    }
+
+    #[test]
+    fn replay_trims_to_start_and_stop_time_in_order() {
+        let timestamps: Vec<u64> = (0..100).map(|index| 1_000_000 + index * 10_000).collect();
+
+        for &speed in &[0.0, 100.0] {
+            let (mut replay, _close_sender, receiver) = replay(speed, 200_000, 500_000);
+
+            assert_eq!(replay.process_bytes(&inertial_bytes(&timestamps)), false); // stop time reached
+            assert!(replay.messages.is_empty() && replay.messages.capacity() > 0); // buffer kept for reuse
+
+            replay.end_of_file();
+
+            assert_eq!(receive_all(&receiver), (1_200_000..=1_500_000).step_by(10_000).collect::<Vec<u64>>(), "speed {}", speed);
+        }
+    }
+
+    #[test]
+    fn replay_dispatches_untimestamped_messages_before_first_timestamp() {
+        for &speed in &[0.0, 100.0] {
+            let handle = DecoderHandle::new();
+            let (sender, receiver) = crossbeam::channel::unbounded();
+            let (_close_sender, close_receiver) = crossbeam::channel::bounded(1);
+
+            let command_sender = sender.clone();
+            handle.dispatcher.add_command_closure(Box::new(move |command| command_sender.send(command.key).unwrap()));
+            let decode_error_sender = sender.clone();
+            handle.dispatcher.add_decode_error_closure(Box::new(move |decode_error| decode_error_sender.send(decode_error.to_string()).unwrap()));
+            let inertial_sender = sender.clone();
+            handle.dispatcher.add_inertial_closure(Box::new(move |message| inertial_sender.send(message.timestamp.to_string()).unwrap()));
+            handle.dispatcher.add_end_of_file_closure(Box::new(move || sender.send("end of file".to_owned()).unwrap()));
+
+            let mut replay = Replay::new(Decoder::new(&handle), close_receiver, speed, 0, 0);
+
+            let mut bytes = b"{\"ping\":null}\r\n".to_vec();
+            bytes.extend_from_slice(&[0x01, b'\n']); // unknown identifier
+            bytes.extend(inertial_bytes(&[0]));
+            assert!(replay.process_bytes(&bytes));
+
+            let mut bytes = b"Q,not a number\r\n".to_vec(); // unsubscribed so not parsed
+            bytes.extend(inertial_bytes(&[10_000]));
+            assert!(replay.process_bytes(&bytes));
+
+            replay.end_of_file();
+
+            let received: Vec<String> = (0..5).map(|_| receiver.recv_timeout(Duration::from_secs(5)).unwrap()).collect();
+
+            assert_eq!(received, vec!["ping", "Invalid message identifier", "0", "10000", "end of file"], "speed {}", speed);
+        }
+    }
+
+    #[test]
+    fn replay_paces_messages_across_calls() {
+        let (mut replay, _close_sender, receiver) = replay(10.0, 0, 0);
+        let start = Instant::now();
+
+        for chunk in [0, 500_000, 1_000_000, 1_000_000, 2_000_000].chunks(2) { // 0.2 s at 10 times speed
+            assert!(replay.process_bytes(&inertial_bytes(chunk)));
+        }
+        replay.end_of_file();
+
+        assert_eq!(receive_all(&receiver), vec![0, 500_000, 1_000_000, 1_000_000, 2_000_000]);
+        assert!(start.elapsed() >= Duration::from_millis(200));
+    }
+
+    #[test]
+    fn replay_close_interrupts_wait() {
+        let (mut replay, close_sender, receiver) = replay(1.0, 0, 0);
+        let start = Instant::now();
+
+        std::thread::spawn(move || {
+            std::thread::sleep(Duration::from_millis(50));
+            close_sender.send(()).unwrap();
+        });
+
+        let timestamps: Vec<u64> = (0..10).map(|index| index * 100 * TICK_PERIOD * NUMBER_OF_SLOTS as u64).collect(); // each beyond end of timer wheel
+
+        assert_eq!(replay.process_bytes(&inertial_bytes(&timestamps)), false);
+        assert!(start.elapsed() < Duration::from_secs(5));
+        assert!(replay.messages.is_empty() && replay.messages.capacity() > 0);
+
+        replay.end_of_file(); // end of file not reported if closed
+
+        assert_eq!(receiver.recv_timeout(Duration::from_secs(5)).unwrap(), Some(0));
+        assert!(receiver.recv_timeout(Duration::from_millis(100)).is_err());
+    }
+}
@@ -1,6 +1,6 @@
 use crossbeam::channel::Sender;
 use serialport::FlowControl;
-use std::sync::{Arc, Mutex};
+use std::io::IoSlice;
 use std::time::Duration;
 use crate::connection_info::*;
 use crate::connections::*;
@@ -8,49 +8,135 @@ use crate::decoder::*;
 
 pub struct SerialConnection {
     connection_info: SerialConnectionInfo,
-    decoder: Arc<Mutex<Decoder>>,
+    decoder: DecoderHandle,
+    reactor_enabled: bool,
+    reactor: Option<ReactorHandle>,
     close_sender: Option<Sender<()>>,
-    write_sender: Option<Sender<String>>,
+    write_sender: Option<WriteSender>,
 }
 
 impl SerialConnection {
     pub fn new(connection_info: &SerialConnectionInfo) -> SerialConnection {
         SerialConnection {
             connection_info: connection_info.clone(),
-            decoder: Arc::new(Mutex::new(Decoder::new())),
+            decoder: DecoderHandle::new(),
+            reactor_enabled: false,
+            reactor: None,
             close_sender: None,
             write_sender: None,
         }
     }
 }
 
+#[cfg(unix)]
+struct SerialSource {
+    serial_port: serialport::TTYPort,
+    decoder: Decoder,
+}
+
+#[cfg(unix)]
+impl SerialSource {
+    fn new(serial_port: serialport::TTYPort, decoder: Decoder) -> std::io::Result<SerialSource> {
+        use std::os::unix::io::AsRawFd;
+
+        let file_descriptor = serial_port.as_raw_fd();
+
+        unsafe {
+            let flags = libc::fcntl(file_descriptor, libc::F_GETFL);
+
+            if flags == -1 || libc::fcntl(file_descriptor, libc::F_SETFL, flags | libc::O_NONBLOCK) == -1 {
+                return Err(std::io::Error::last_os_error());
+            }
+        }
+
+        Ok(SerialSource { serial_port, decoder })
+    }
+
+    fn file_descriptor(&self) -> std::os::unix::io::RawFd {
+        use std::os::unix::io::AsRawFd;
+
+        self.serial_port.as_raw_fd()
+    }
+}
+
+#[cfg(unix)]
+impl mio::event::Source for SerialSource {
+    fn register(&mut self, registry: &mio::Registry, token: mio::Token, interests: mio::Interest) -> std::io::Result<()> {
+        mio::unix::SourceFd(&self.file_descriptor()).register(registry, token, interests)
+    }
+
+    fn reregister(&mut self, registry: &mio::Registry, token: mio::Token, interests: mio::Interest) -> std::io::Result<()> {
+        mio::unix::SourceFd(&self.file_descriptor()).reregister(registry, token, interests)
+    }
+
+    fn deregister(&mut self, registry: &mio::Registry) -> std::io::Result<()> {
+        mio::unix::SourceFd(&self.file_descriptor()).deregister(registry)
+    }
+}
+
+#[cfg(unix)]
+impl ReactorSource for SerialSource {
+    fn receive(&mut self, buffer: &mut [u8]) -> std::io::Result<usize> {
+        let number_of_bytes = match unsafe { libc::read(self.file_descriptor(), buffer.as_mut_ptr() as *mut libc::c_void, buffer.len()) } {
+            -1 => return Err(std::io::Error::last_os_error()),
+            number_of_bytes => number_of_bytes as usize,
+        };
+
+        self.decoder.process_bytes(&buffer[..number_of_bytes]);
+        Ok(number_of_bytes)
+    }
+
+    fn write(&mut self, buffers: &[IoSlice]) -> std::io::Result<usize> {
+        match unsafe { libc::writev(self.file_descriptor(), buffers.as_ptr() as *const libc::iovec, buffers.len() as libc::c_int) } { // IoSlice is ABI compatible with iovec
+            -1 => Err(std::io::Error::last_os_error()),
+            number_of_bytes => Ok(number_of_bytes as usize),
+        }
+    }
+}
+
 impl GenericConnection for SerialConnection {
     fn open(&mut self) -> std::io::Result<()> {
-        let mut serial_port = serialport::new(&self.connection_info.port_name, self.connection_info.baud_rate)
+        let builder = serialport::new(&self.connection_info.port_name, self.connection_info.baud_rate)
             .flow_control(if self.connection_info.rts_cts_enabled { FlowControl::Hardware } else { FlowControl::None })
-            .timeout(Duration::from_millis(1))
-            .open()?;
+            .timeout(Duration::from_millis(1));
+
+        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
+
+        #[cfg(unix)]
+        if self.reactor_enabled {
+            use serialport::SerialPort;
+
+            let mut serial_port = builder.open_native()?;
+
+            serial_port.write_data_terminal_ready(true).ok();
+
+            let reactor = ReactorHandle::register(Box::new(SerialSource::new(serial_port, Decoder::new(&self.decoder))?), Some(write_receiver))?;
+
+            self.write_sender = Some(WriteSender::new(write_sender, Some(reactor.clone())));
+            self.reactor = Some(reactor);
+            return Ok(());
+        }
+
+        let mut serial_port = builder.open()?; // reactor not supported on Windows
 
         serial_port.write_data_terminal_ready(true).ok();
 
-        let decoder = self.decoder.clone();
+        let mut decoder = Decoder::new(&self.decoder);
 
         let (close_sender, close_receiver) = crossbeam::channel::bounded(1);
-        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
 
         self.close_sender = Some(close_sender);
-        self.write_sender = Some(write_sender);
+        self.write_sender = Some(WriteSender::new(write_sender, None));
 
         std::thread::spawn(move || {
             let mut buffer: Vec<u8> = vec![0; 2048];
+            let mut write_queue = WriteQueue::new(write_receiver);
 
             while let Err(_) = close_receiver.try_recv() {
                 if let Ok(number_of_bytes) = serial_port.read(buffer.as_mut_slice()) {
-                    decoder.lock().unwrap().process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
-                }
-                while let Some(terminated_json) = write_receiver.try_recv().iter().next() {
-                    serial_port.write(terminated_json.as_bytes()).ok();
+                    decoder.process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
                 }
+                write_queue.write(|buffers| serial_port.write_vectored(buffers));
             }
         });
 
@@ -58,6 +144,9 @@ impl GenericConnection for SerialConnection {
     }
 
     fn close(&self) {
+        if let Some(reactor) = &self.reactor {
+            reactor.close();
+        }
         if let Some(close_sender) = &self.close_sender {
             close_sender.send(()).ok();
         }
@@ -67,11 +156,15 @@ impl GenericConnection for SerialConnection {
         ConnectionInfo::SerialConnectionInfo(self.connection_info.clone())
     }
 
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>> {
+    fn get_decoder(&self) -> DecoderHandle {
         self.decoder.clone()
     }
 
-    fn get_write_sender(&self) -> Option<Sender<String>> {
+    fn get_write_sender(&self) -> Option<WriteSender> {
         self.write_sender.clone()
     }
+
+    fn set_reactor_enabled(&mut self, reactor_enabled: bool) {
+        self.reactor_enabled = reactor_enabled;
+    }
 }
@@ -1,7 +1,8 @@
 use crossbeam::channel::Sender;
-use std::io::{Read, Write};
+use mio::event::Source;
+use mio::{Interest, Registry, Token};
+use std::io::{IoSlice, Read, Write};
 use std::net::{IpAddr, SocketAddr, TcpStream};
-use std::sync::{Arc, Mutex};
 use std::time::Duration;
 use crate::connection_info::*;
 use crate::connections::*;
@@ -9,46 +10,96 @@ use crate::decoder::*;
 
 pub struct TcpConnection {
     connection_info: TcpConnectionInfo,
-    decoder: Arc<Mutex<Decoder>>,
+    decoder: DecoderHandle,
+    reactor_enabled: bool,
+    tcp_no_delay: bool,
+    reactor: Option<ReactorHandle>,
     close_sender: Option<Sender<()>>,
-    write_sender: Option<Sender<String>>,
+    write_sender: Option<WriteSender>,
 }
 
 impl TcpConnection {
     pub fn new(connection_info: &TcpConnectionInfo) -> TcpConnection {
         TcpConnection {
             connection_info: connection_info.clone(),
-            decoder: Arc::new(Mutex::new(Decoder::new())),
+            decoder: DecoderHandle::new(),
+            reactor_enabled: false,
+            tcp_no_delay: false,
+            reactor: None,
             close_sender: None,
             write_sender: None,
         }
     }
 }
 
+struct TcpSource {
+    stream: mio::net::TcpStream,
+    decoder: Decoder,
+}
+
+impl Source for TcpSource {
+    fn register(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.stream.register(registry, token, interests)
+    }
+
+    fn reregister(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.stream.reregister(registry, token, interests)
+    }
+
+    fn deregister(&mut self, registry: &Registry) -> std::io::Result<()> {
+        self.stream.deregister(registry)
+    }
+}
+
+impl ReactorSource for TcpSource {
+    fn receive(&mut self, buffer: &mut [u8]) -> std::io::Result<usize> {
+        let number_of_bytes = self.stream.read(buffer)?;
+
+        self.decoder.process_bytes(&buffer[..number_of_bytes]);
+        Ok(number_of_bytes)
+    }
+
+    fn write(&mut self, buffers: &[IoSlice]) -> std::io::Result<usize> {
+        self.stream.write_vectored(buffers)
+    }
+}
+
 impl GenericConnection for TcpConnection {
     fn open(&mut self) -> std::io::Result<()> {
         let mut stream = TcpStream::connect_timeout(&SocketAddr::new(IpAddr::V4(self.connection_info.ip_address), self.connection_info.port), Duration::new(3, 0))?;
 
+        stream.set_nodelay(self.tcp_no_delay)?;
+
+        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
+
+        if self.reactor_enabled {
+            stream.set_nonblocking(true)?;
+
+            let reactor = ReactorHandle::register(Box::new(TcpSource { stream: mio::net::TcpStream::from_std(stream), decoder: Decoder::new(&self.decoder) }), Some(write_receiver))?;
+
+            self.write_sender = Some(WriteSender::new(write_sender, Some(reactor.clone())));
+            self.reactor = Some(reactor);
+            return Ok(());
+        }
+
         stream.set_read_timeout(Some(std::time::Duration::from_millis(1))).ok();
 
-        let decoder = self.decoder.clone();
+        let mut decoder = Decoder::new(&self.decoder);
 
         let (close_sender, close_receiver) = crossbeam::channel::bounded(1);
-        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
 
         self.close_sender = Some(close_sender);
-        self.write_sender = Some(write_sender);
+        self.write_sender = Some(WriteSender::new(write_sender, None));
 
         std::thread::spawn(move || {
             let mut buffer: Vec<u8> = vec![0; 2048];
+            let mut write_queue = WriteQueue::new(write_receiver);
 
             while let Err(_) = close_receiver.try_recv() {
                 if let Ok(number_of_bytes) = stream.read(&mut buffer) {
-                    decoder.lock().unwrap().process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
-                }
-                while let Some(terminated_json) = write_receiver.try_recv().iter().next() {
-                    stream.write(terminated_json.as_bytes()).ok();
+                    decoder.process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
                 }
+                write_queue.write(|buffers| stream.write_vectored(buffers));
             }
         });
 
@@ -56,6 +107,9 @@ impl GenericConnection for TcpConnection {
     }
 
     fn close(&self) {
+        if let Some(reactor) = &self.reactor {
+            reactor.close();
+        }
         if let Some(close_sender) = &self.close_sender {
             close_sender.send(()).ok();
         }
@@ -65,11 +119,19 @@ impl GenericConnection for TcpConnection {
         ConnectionInfo::TcpConnectionInfo(self.connection_info.clone())
     }
 
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>> {
+    fn get_decoder(&self) -> DecoderHandle {
         self.decoder.clone()
     }
 
-    fn get_write_sender(&self) -> Option<Sender<String>> {
+    fn get_write_sender(&self) -> Option<WriteSender> {
         self.write_sender.clone()
     }
+
+    fn set_reactor_enabled(&mut self, reactor_enabled: bool) {
+        self.reactor_enabled = reactor_enabled;
+    }
+
+    fn set_tcp_no_delay(&mut self, tcp_no_delay: bool) {
+        self.tcp_no_delay = tcp_no_delay;
+    }
 }
@@ -1,54 +1,378 @@
 use crossbeam::channel::Sender;
+use mio::event::Source;
+use mio::{Interest, Registry, Token};
+use std::collections::HashMap;
+use std::io::{ErrorKind, IoSlice};
 use std::net::{IpAddr, SocketAddr, UdpSocket};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 use crate::connection_info::*;
 use crate::connections::*;
 use crate::decoder::*;
 
+const BATCH_SIZE: usize = 32;
+
+const DATAGRAM_SIZE: usize = 2048;
+
+const MAX_WRITE_DATAGRAM_SIZE: usize = 1472; // coalesced commands must not be fragmented over Ethernet or Wi-Fi
+
 pub struct UdpConnection {
     connection_info: UdpConnectionInfo,
-    decoder: Arc<Mutex<Decoder>>,
+    decoder: DecoderHandle,
+    reactor_enabled: bool,
+    receive_buffer_size: usize,
+    receive_port_shared: bool,
+    reactor: Option<ReactorHandle>,
     close_sender: Option<Sender<()>>,
-    write_sender: Option<Sender<String>>,
+    write_sender: Option<WriteSender>,
 }
 
 impl UdpConnection {
     pub fn new(connection_info: &UdpConnectionInfo) -> UdpConnection {
         UdpConnection {
             connection_info: connection_info.clone(),
-            decoder: Arc::new(Mutex::new(Decoder::new())),
+            decoder: DecoderHandle::new(),
+            reactor_enabled: false,
+            receive_buffer_size: 0,
+            receive_port_shared: false,
+            reactor: None,
             close_sender: None,
             write_sender: None,
         }
     }
 }
 
+struct DatagramBatch {
+    buffer: Vec<u8>,
+    lengths: [usize; BATCH_SIZE],
+    addresses: [Option<SocketAddr>; BATCH_SIZE],
+    number_of_datagrams: usize,
+}
+
+impl DatagramBatch {
+    fn new() -> DatagramBatch {
+        DatagramBatch {
+            buffer: vec![0; BATCH_SIZE * DATAGRAM_SIZE],
+            lengths: [0; BATCH_SIZE],
+            addresses: [None; BATCH_SIZE],
+            number_of_datagrams: 0,
+        }
+    }
+
+    #[cfg(target_os = "linux")]
+    fn receive(&mut self, socket: &mio::net::UdpSocket) -> std::io::Result<usize> { // single system call for all datagrams
+        use std::os::unix::io::AsRawFd;
+
+        let mut addresses: [libc::sockaddr_storage; BATCH_SIZE] = unsafe { std::mem::zeroed() };
+        let mut iovecs: [libc::iovec; BATCH_SIZE] = unsafe { std::mem::zeroed() };
+        let mut messages: [libc::mmsghdr; BATCH_SIZE] = unsafe { std::mem::zeroed() };
+
+        for (index, datagram) in self.buffer.chunks_mut(DATAGRAM_SIZE).enumerate() {
+            iovecs[index].iov_base = datagram.as_mut_ptr() as *mut libc::c_void;
+            iovecs[index].iov_len = datagram.len();
+            messages[index].msg_hdr.msg_name = &mut addresses[index] as *mut libc::sockaddr_storage as *mut libc::c_void;
+            messages[index].msg_hdr.msg_namelen = std::mem::size_of::<libc::sockaddr_storage>() as libc::socklen_t;
+            messages[index].msg_hdr.msg_iov = &mut iovecs[index];
+            messages[index].msg_hdr.msg_iovlen = 1;
+        }
+
+        let number_of_datagrams = unsafe { libc::recvmmsg(socket.as_raw_fd(), messages.as_mut_ptr(), BATCH_SIZE as libc::c_uint, 0, std::ptr::null_mut()) };
+
+        if number_of_datagrams == -1 {
+            return Err(std::io::Error::last_os_error());
+        }
+
+        self.number_of_datagrams = number_of_datagrams as usize;
+
+        for index in 0..self.number_of_datagrams {
+            self.lengths[index] = std::cmp::min(messages[index].msg_len as usize, DATAGRAM_SIZE);
+            self.addresses[index] = socket_address(&addresses[index]);
+        }
+
+        Ok(self.number_of_datagrams)
+    }
+
+    #[cfg(not(target_os = "linux"))]
+    fn receive(&mut self, socket: &mio::net::UdpSocket) -> std::io::Result<usize> {
+        self.number_of_datagrams = 0;
+
+        for datagram in self.buffer.chunks_mut(DATAGRAM_SIZE) {
+            match socket.recv_from(datagram) {
+                Ok((number_of_bytes, address)) => {
+                    self.lengths[self.number_of_datagrams] = number_of_bytes;
+                    self.addresses[self.number_of_datagrams] = Some(address);
+                    self.number_of_datagrams += 1;
+                }
+                Err(error) => {
+                    if self.number_of_datagrams == 0 {
+                        return Err(error);
+                    }
+                    break;
+                }
+            }
+        }
+
+        Ok(self.number_of_datagrams)
+    }
+
+    fn datagrams(&self) -> impl Iterator<Item=(&[u8], Option<SocketAddr>)> {
+        self.buffer.chunks(DATAGRAM_SIZE).zip(self.lengths.iter().zip(self.addresses.iter())).take(self.number_of_datagrams).map(|(datagram, (&length, &address))| (&datagram[..length], address))
+    }
+}
+
+#[cfg(target_os = "linux")]
+fn socket_address(address: &libc::sockaddr_storage) -> Option<SocketAddr> {
+    match address.ss_family as libc::c_int {
+        libc::AF_INET => {
+            let address = unsafe { &*(address as *const libc::sockaddr_storage as *const libc::sockaddr_in) };
+            Some(SocketAddr::new(IpAddr::from(address.sin_addr.s_addr.to_ne_bytes()), u16::from_be(address.sin_port)))
+        }
+        libc::AF_INET6 => {
+            let address = unsafe { &*(address as *const libc::sockaddr_storage as *const libc::sockaddr_in6) };
+            Some(SocketAddr::new(IpAddr::from(address.sin6_addr.s6_addr), u16::from_be(address.sin6_port)))
+        }
+        _ => None,
+    }
+}
+
+fn coalesce(buffers: &[IoSlice], datagram: &mut Vec<u8>) { // whole buffers only so that a command is never split between datagrams
+    datagram.clear();
+
+    for buffer in buffers {
+        if datagram.is_empty() == false && datagram.len() + buffer.len() > MAX_WRITE_DATAGRAM_SIZE {
+            break;
+        }
+        datagram.extend_from_slice(buffer);
+    }
+}
+
+#[cfg(unix)]
+fn set_receive_buffer_size(socket: &UdpSocket, receive_buffer_size: usize) -> std::io::Result<()> {
+    use std::os::unix::io::AsRawFd;
+
+    let receive_buffer_size = receive_buffer_size as libc::c_int;
+
+    let result = unsafe {
+        libc::setsockopt(socket.as_raw_fd(),
+                         libc::SOL_SOCKET,
+                         libc::SO_RCVBUF,
+                         &receive_buffer_size as *const libc::c_int as *const libc::c_void,
+                         std::mem::size_of::<libc::c_int>() as libc::socklen_t)
+    };
+
+    if result == -1 {
+        return Err(std::io::Error::last_os_error());
+    }
+    Ok(())
+}
+
+#[cfg(not(unix))]
+fn set_receive_buffer_size(_socket: &UdpSocket, _receive_buffer_size: usize) -> std::io::Result<()> { // operating system default used on Windows
+    Ok(())
+}
+
+fn bind(receive_port: u16, receive_buffer_size: usize) -> std::io::Result<UdpSocket> {
+    let socket = UdpSocket::bind(SocketAddr::new("0.0.0.0".parse::<IpAddr>().unwrap(), receive_port))?;
+
+    if receive_buffer_size > 0 {
+        set_receive_buffer_size(&socket, receive_buffer_size)?;
+    }
+    Ok(socket)
+}
+
+struct UdpSource {
+    socket: mio::net::UdpSocket,
+    socket_address: SocketAddr,
+    decoder: Decoder,
+    batch: DatagramBatch,
+    datagram: Vec<u8>,
+}
+
+impl Source for UdpSource {
+    fn register(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.socket.register(registry, token, interests)
+    }
+
+    fn reregister(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.socket.reregister(registry, token, interests)
+    }
+
+    fn deregister(&mut self, registry: &Registry) -> std::io::Result<()> {
+        self.socket.deregister(registry)
+    }
+}
+
+impl ReactorSource for UdpSource {
+    fn receive(&mut self, _buffer: &mut [u8]) -> std::io::Result<usize> {
+        let number_of_datagrams = self.batch.receive(&self.socket)?;
+
+        for (datagram, _) in self.batch.datagrams() {
+            self.decoder.process_bytes(datagram);
+        }
+        Ok(number_of_datagrams) // empty datagram is not end of stream
+    }
+
+    fn write(&mut self, buffers: &[IoSlice]) -> std::io::Result<usize> {
+        coalesce(buffers, &mut self.datagram);
+        self.socket.send_to(&self.datagram, self.socket_address)
+    }
+}
+
+type Decoders = Arc<Mutex<HashMap<IpAddr, Decoder>>>; // only contended when a connection is added or removed
+
+struct SharedReceivePort {
+    decoders: Decoders,
+    reactor: ReactorHandle,
+}
+
+static SHARED_RECEIVE_PORTS: OnceLock<Mutex<HashMap<u16, SharedReceivePort>>> = OnceLock::new();
+
+struct SharedUdpSource {
+    socket: mio::net::UdpSocket,
+    decoders: Decoders,
+    batch: DatagramBatch,
+}
+
+impl Source for SharedUdpSource {
+    fn register(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.socket.register(registry, token, interests)
+    }
+
+    fn reregister(&mut self, registry: &Registry, token: Token, interests: Interest) -> std::io::Result<()> {
+        self.socket.reregister(registry, token, interests)
+    }
+
+    fn deregister(&mut self, registry: &Registry) -> std::io::Result<()> {
+        self.socket.deregister(registry)
+    }
+}
+
+impl ReactorSource for SharedUdpSource {
+    fn receive(&mut self, _buffer: &mut [u8]) -> std::io::Result<usize> {
+        let number_of_datagrams = self.batch.receive(&self.socket)?;
+
+        let mut decoders = self.decoders.lock().unwrap();
+
+        for (datagram, address) in self.batch.datagrams() {
+            if let Some(decoder) = address.and_then(|address| decoders.get_mut(&address.ip())) { // datagrams from unknown devices are discarded
+                decoder.process_bytes(datagram);
+            }
+        }
+        Ok(number_of_datagrams)
+    }
+
+    fn write(&mut self, _buffers: &[IoSlice]) -> std::io::Result<usize> {
+        Err(std::io::Error::new(ErrorKind::Unsupported, "Shared receive port is receive only"))
+    }
+}
+
+fn add_to_shared_receive_port(connection_info: &UdpConnectionInfo, decoder: Decoder, receive_buffer_size: usize) -> std::io::Result<()> {
+    let mut shared_receive_ports = SHARED_RECEIVE_PORTS.get_or_init(|| Mutex::new(HashMap::new())).lock().unwrap();
+
+    let ip_address = IpAddr::V4(connection_info.ip_address);
+
+    if let Some(shared_receive_port) = shared_receive_ports.get(&connection_info.receive_port) {
+        let mut decoders = shared_receive_port.decoders.lock().unwrap();
+
+        if decoders.contains_key(&ip_address) {
+            return Err(std::io::Error::new(ErrorKind::AddrInUse, "Device already receiving on shared port"));
+        }
+
+        decoders.insert(ip_address, decoder);
+        return Ok(());
+    }
+
+    let socket = bind(connection_info.receive_port, receive_buffer_size)?;
+
+    socket.set_nonblocking(true)?;
+
+    let decoders: Decoders = Arc::new(Mutex::new(HashMap::new()));
+
+    decoders.lock().unwrap().insert(ip_address, decoder);
+
+    let reactor = ReactorHandle::register(Box::new(SharedUdpSource { socket: mio::net::UdpSocket::from_std(socket), decoders: decoders.clone(), batch: DatagramBatch::new() }), None)?;
+
+    shared_receive_ports.insert(connection_info.receive_port, SharedReceivePort { decoders, reactor });
+    Ok(())
+}
+
+fn remove_from_shared_receive_port(connection_info: &UdpConnectionInfo, decoder: &DecoderHandle) {
+    if let Some(shared_receive_ports) = SHARED_RECEIVE_PORTS.get() {
+        let mut shared_receive_ports = shared_receive_ports.lock().unwrap();
+
+        let ip_address = IpAddr::V4(connection_info.ip_address);
+
+        if let Some(shared_receive_port) = shared_receive_ports.get(&connection_info.receive_port) {
+            let mut decoders = shared_receive_port.decoders.lock().unwrap();
+
+            if decoders.get(&ip_address).map_or(false, |shared_decoder| shared_decoder.get_handle() == decoder) {
+                decoders.remove(&ip_address);
+            }
+
+            if decoders.is_empty() {
+                drop(decoders);
+                shared_receive_port.reactor.close();
+                shared_receive_ports.remove(&connection_info.receive_port);
+            }
+        }
+    }
+}
+
 impl GenericConnection for UdpConnection {
     fn open(&mut self) -> std::io::Result<()> {
-        let socket = UdpSocket::bind(SocketAddr::new("0.0.0.0".parse::<IpAddr>().unwrap(), self.connection_info.receive_port))?;
+        let socket = if self.receive_port_shared {
+            if self.reactor_enabled == false {
+                return Err(std::io::Error::new(ErrorKind::InvalidInput, "Shared receive port requires reactor"));
+            }
 
-        socket.set_read_timeout(Some(std::time::Duration::from_millis(1))).ok();
+            add_to_shared_receive_port(&self.connection_info, Decoder::new(&self.decoder), self.receive_buffer_size)?;
+
+            match bind(0, 0) { // commands sent from an ephemeral port
+                Ok(socket) => socket,
+                Err(error) => {
+                    remove_from_shared_receive_port(&self.connection_info, &self.decoder);
+                    return Err(error);
+                }
+            }
+        } else {
+            bind(self.connection_info.receive_port, self.receive_buffer_size)?
+        };
 
         let socket_address = SocketAddr::new(IpAddr::V4(self.connection_info.ip_address), self.connection_info.send_port);
 
-        let decoder = self.decoder.clone();
+        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
+
+        if self.reactor_enabled {
+            socket.set_nonblocking(true)?;
+
+            let reactor = ReactorHandle::register(Box::new(UdpSource { socket: mio::net::UdpSocket::from_std(socket), socket_address, decoder: Decoder::new(&self.decoder), batch: DatagramBatch::new(), datagram: Vec::new() }), Some(write_receiver))?;
+
+            self.write_sender = Some(WriteSender::new(write_sender, Some(reactor.clone())));
+            self.reactor = Some(reactor);
+            return Ok(());
+        }
+
+        socket.set_read_timeout(Some(std::time::Duration::from_millis(1))).ok();
+
+        let mut decoder = Decoder::new(&self.decoder);
 
         let (close_sender, close_receiver) = crossbeam::channel::bounded(1);
-        let (write_sender, write_receiver) = crossbeam::channel::unbounded();
 
         self.close_sender = Some(close_sender);
-        self.write_sender = Some(write_sender);
+        self.write_sender = Some(WriteSender::new(write_sender, None));
 
         std::thread::spawn(move || {
-            let mut buffer: Vec<u8> = vec![0; 2048];
+            let mut buffer: Vec<u8> = vec![0; DATAGRAM_SIZE];
+            let mut write_queue = WriteQueue::new(write_receiver);
+            let mut datagram: Vec<u8> = Vec::new();
 
             while let Err(_) = close_receiver.try_recv() {
                 if let Ok((number_of_bytes, _)) = socket.recv_from(&mut buffer) {
-                    decoder.lock().unwrap().process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
-                }
-                while let Some(terminated_json) = write_receiver.try_recv().iter().next() {
-                    socket.send_to(terminated_json.as_bytes(), socket_address).ok();
+                    decoder.process_bytes(&buffer.as_mut_slice()[..number_of_bytes]);
                 }
+                write_queue.write(|buffers| {
+                    coalesce(buffers, &mut datagram);
+                    socket.send_to(&datagram, socket_address)
+                });
             }
         });
 
@@ -56,6 +380,12 @@ impl GenericConnection for UdpConnection {
     }
 
     fn close(&self) {
+        if self.receive_port_shared {
+            remove_from_shared_receive_port(&self.connection_info, &self.decoder);
+        }
+        if let Some(reactor) = &self.reactor {
+            reactor.close();
+        }
         if let Some(close_sender) = &self.close_sender {
             close_sender.send(()).ok();
         }
@@ -65,11 +395,23 @@ impl GenericConnection for UdpConnection {
         ConnectionInfo::UdpConnectionInfo(self.connection_info.clone())
     }
 
-    fn get_decoder(&self) -> Arc<Mutex<Decoder>> {
+    fn get_decoder(&self) -> DecoderHandle {
         self.decoder.clone()
     }
 
-    fn get_write_sender(&self) -> Option<Sender<String>> {
+    fn get_write_sender(&self) -> Option<WriteSender> {
         self.write_sender.clone()
     }
+
+    fn set_reactor_enabled(&mut self, reactor_enabled: bool) {
+        self.reactor_enabled = reactor_enabled;
+    }
+
+    fn set_receive_buffer_size(&mut self, receive_buffer_size: usize) {
+        self.receive_buffer_size = receive_buffer_size;
+    }
+
+    fn set_receive_port_shared(&mut self, receive_port_shared: bool) {
+        self.receive_port_shared = receive_port_shared;
+    }
 }
@@ -0,0 +1,111 @@
+use crossbeam::channel::Receiver;
+use std::collections::VecDeque;
+use std::io::{ErrorKind, IoSlice};
+
+const MAX_NUMBER_OF_BUFFERS: usize = 64; // slices are on the stack so kept well below IOV_MAX
+
+pub struct WriteQueue {
+    receiver: Receiver<Vec<u8>>,
+    buffers: VecDeque<Vec<u8>>,
+    offset: usize, // number of bytes of first buffer already written
+}
+
+impl WriteQueue {
+    pub fn new(receiver: Receiver<Vec<u8>>) -> WriteQueue {
+        WriteQueue {
+            receiver,
+            buffers: VecDeque::new(),
+            offset: 0,
+        }
+    }
+
+    pub fn write<F>(&mut self, mut write: F) where F: FnMut(&[IoSlice]) -> std::io::Result<usize> { // all queued buffers are coalesced into a single vectored write where possible
+        self.buffers.extend(self.receiver.try_iter());
+
+        while self.buffers.is_empty() == false {
+            let mut slices = [IoSlice::new(&[]); MAX_NUMBER_OF_BUFFERS]; // avoids allocating for every write
+            let mut number_of_slices = 0;
+
+            for (slice, buffer) in slices.iter_mut().zip(self.buffers.iter()) {
+                *slice = IoSlice::new(if number_of_slices == 0 { &buffer[self.offset..] } else { buffer });
+                number_of_slices += 1;
+            }
+
+            match write(&slices[..number_of_slices]) {
+                Ok(0) => self.discard(),
+                Ok(number_of_bytes) => self.advance(number_of_bytes),
+                Err(error) if error.kind() == ErrorKind::WouldBlock => return, // remaining buffers written when writable
+                Err(error) if error.kind() == ErrorKind::Interrupted => (),
+                Err(_) => self.discard(), // buffer discarded if it cannot be written
+            }
+        }
+    }
+
+    fn advance(&mut self, mut number_of_bytes: usize) {
+        while let Some(buffer) = self.buffers.front() {
+            let remaining = buffer.len() - self.offset;
+
+            if number_of_bytes < remaining {
+                self.offset += number_of_bytes;
+                return;
+            }
+
+            number_of_bytes -= remaining;
+            self.discard();
+        }
+    }
+
+    fn discard(&mut self) {
+        self.buffers.pop_front();
+        self.offset = 0;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn partial_writes_continue_from_offset() {
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        let mut write_queue = WriteQueue::new(receiver);
+
+        for index in 0..(MAX_NUMBER_OF_BUFFERS * 2) {
+            sender.send(vec![index as u8; 3]).unwrap();
+        }
+
+        let mut written = Vec::new();
+        let mut largest_write = 0;
+
+        write_queue.write(|slices| {
+            largest_write = largest_write.max(slices.len());
+
+            let bytes: Vec<u8> = slices.iter().flat_map(|slice| slice.iter().copied()).take(5).collect(); // never writes everything
+            written.extend_from_slice(&bytes);
+            Ok(bytes.len())
+        });
+
+        assert_eq!(largest_write, MAX_NUMBER_OF_BUFFERS);
+        assert_eq!(written, (0..(MAX_NUMBER_OF_BUFFERS * 2)).flat_map(|index| vec![index as u8; 3]).collect::<Vec<u8>>());
+        assert!(write_queue.buffers.is_empty());
+    }
+
+    #[test]
+    fn would_block_keeps_remaining_bytes() {
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        let mut write_queue = WriteQueue::new(receiver);
+
+        sender.send(vec![1, 2, 3, 4]).unwrap();
+
+        let mut blocked = false;
+        write_queue.write(|_| if blocked { Err(ErrorKind::WouldBlock.into()) } else { blocked = true; Ok(1) });
+
+        let mut written = Vec::new();
+        write_queue.write(|slices| {
+            written.extend_from_slice(&slices[0]);
+            Ok(slices[0].len())
+        });
+
+        assert_eq!(written, vec![2, 3, 4]);
+    }
+}
@@ -1,13 +1,20 @@
+use crossbeam::channel::TrySendError;
 use serde_json;
 use std::collections::HashMap;
 use std::fs::File;
 use std::io::{Seek, SeekFrom, Write};
 use std::ops::Drop;
 use std::path::Path;
+use std::sync::atomic::Ordering;
 use std::sync::{Arc, Mutex};
 use crate::connection::*;
+use crate::dispatcher::*;
 use crate::ping_response::*;
 
+const COMMAND_FILE_NAME: &str = "Command.json";
+
+const QUEUE_CAPACITY: usize = 10000;
+
 pub struct DataLogger<'a> {
     connections: Vec<&'a Connection>,
     closure_ids: Vec<Vec<u64>>,
@@ -48,31 +55,33 @@ impl DataLogger<'_> {
         }
 
         // Add closures
-        let (sender, receiver) = crossbeam::channel::unbounded();
-        const COMMAND_FILE_NAME: &str = "Command.json";
+        let (sender, receiver) = crossbeam::channel::bounded(QUEUE_CAPACITY); // preallocated so that closures do not allocate
 
         for (index, connection) in data_logger.connections.iter().enumerate() {
             data_logger.closure_ids.push(Vec::new());
 
             let sender_clone = sender.clone();
-            let path_clone = paths[index].clone();
+            let statistics = connection.get_atomic_statistics();
 
             data_logger.closure_ids[index].push(connection.add_decode_error_closure(Box::new(move |decode_error| {
-                sender_clone.send((Path::new(&path_clone).join("DecodeError.txt").to_str().unwrap().to_owned(), "", decode_error.to_string() + "\n")).ok();
+                if let Err(TrySendError::Full(_)) = sender_clone.try_send((index, DispatcherData::DecodeError(decode_error))) {
+                    statistics.dropped_total.fetch_add(1, Ordering::Relaxed);
+                }
             })));
 
             let sender_clone = sender.clone();
-            let path_clone = paths[index].clone();
 
             data_logger.closure_ids[index].push(connection.add_command_closure(Box::new(move |command| {
-                sender_clone.send((Path::new(&path_clone).join(COMMAND_FILE_NAME).to_str().unwrap().to_owned(), "[\n", "    ".to_owned() + command.json.as_str() + "\n]")).ok();
+                sender_clone.send((index, DispatcherData::Command(command))).ok(); // responses are needed to name connection directories so never dropped
             })));
 
             let sender_clone = sender.clone();
-            let path_clone = paths[index].clone();
+            let statistics = connection.get_atomic_statistics();
 
-            data_logger.closure_ids[index].push(connection.add_data_closure(Box::new(move |message| {
-                sender_clone.send((Path::new(&path_clone).join(message.get_csv_file_name()).to_str().unwrap().to_owned(), message.get_csv_headings(), message.to_csv_row())).ok();
+            data_logger.closure_ids[index].push(connection.add_data_closure(Box::new(move |data| {
+                if let Err(TrySendError::Full(_)) = sender_clone.try_send((index, data.clone())) { // copied rather than formatted so that dispatcher does not allocate
+                    statistics.dropped_total.fetch_add(1, Ordering::Relaxed); // dropped rather than blocking dispatcher if writer falls behind
+                }
             })));
         }
 
@@ -81,22 +90,31 @@ impl DataLogger<'_> {
         let in_progress = data_logger.in_progress.clone();
 
         std::thread::spawn(move || {
-            let mut files: HashMap<String, File> = HashMap::new();
+            let mut files: HashMap<(usize, &str), File> = HashMap::new();
 
             loop {
                 match receiver.recv() {
-                    Ok((path, preamble, line)) => {
-                        if let Some(mut file) = files.get(&path) {
-                            if path.contains(COMMAND_FILE_NAME) {
+                    Ok((index, data)) => {
+                        let (file_name, preamble, line) = match data {
+                            DispatcherData::DecodeError(decode_error) => ("DecodeError.txt", "", decode_error.to_string() + "\n"),
+                            DispatcherData::Command(command) => (COMMAND_FILE_NAME, "[\n", "    ".to_owned() + command.json.as_str() + "\n]"),
+                            data => match data.as_data_message() {
+                                Some(message) => (message.get_csv_file_name(), message.get_csv_headings(), message.to_csv_row()), // path is only created for new files
+                                None => continue,
+                            },
+                        };
+
+                        if let Some(mut file) = files.get(&(index, file_name)) {
+                            if file_name == COMMAND_FILE_NAME {
                                 file.seek(SeekFrom::End(-2)).ok(); // remove trailing "\n]"
                                 file.write_all(",\n".as_bytes()).ok();
                             }
                             file.write_all(line.as_bytes()).ok();
                         } else {
-                            if let Ok(mut file) = File::create(&path) {
+                            if let Ok(mut file) = File::create(Path::new(&paths[index]).join(file_name)) {
                                 file.write_all(preamble.as_bytes()).ok();
                                 file.write_all(line.as_bytes()).ok();
-                                files.insert(path, file);
+                                files.insert((index, file_name), file);
                             }
                         }
                     }
@@ -158,3 +176,4 @@ impl Drop for DataLogger<'_> {
         };
     }
 }
+
@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -20,35 +20,27 @@ impl DataMessage for AhrsStatusMessage {
         'U' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f},{f}\r\n",  char, u64, f32, f32, f32, f32) {
-            Ok((_, timestamp, initialising, angular_rate_recovery, acceleration_recovery, magnetic_recovery)) => Ok(AhrsStatusMessage { timestamp, initialising, angular_rate_recovery, acceleration_recovery, magnetic_recovery }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(AhrsStatusMessage { timestamp: parser.parse_u64()?, initialising: parser.parse_f32()?, angular_rate_recovery: parser.parse_f32()?, acceleration_recovery: parser.parse_f32()?, magnetic_recovery: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            initialising: f32,
-            angular_rate_recovery: f32,
-            acceleration_recovery: f32,
-            magnetic_recovery: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = AhrsStatusMessageView::new(message)?;
+        Ok(AhrsStatusMessage { timestamp: view.timestamp(), initialising: view.initialising(), angular_rate_recovery: view.angular_rate_recovery(), acceleration_recovery: view.acceleration_recovery(), magnetic_recovery: view.magnetic_recovery() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{},{}", 'U', self.timestamp, self.initialising, self.angular_rate_recovery, self.acceleration_recovery, self.magnetic_recovery).ok();
+    }
 
-        Ok(AhrsStatusMessage { timestamp: binary_message.timestamp, initialising: binary_message.initialising, angular_rate_recovery: binary_message.angular_rate_recovery, acceleration_recovery: binary_message.acceleration_recovery, magnetic_recovery: binary_message.magnetic_recovery })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.initialising.to_le_bytes());
+        bytes.extend_from_slice(&self.angular_rate_recovery.to_le_bytes());
+        bytes.extend_from_slice(&self.acceleration_recovery.to_le_bytes());
+        bytes.extend_from_slice(&self.magnetic_recovery.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -69,3 +61,70 @@ impl fmt::Display for AhrsStatusMessage {
         write!(formatter, "{:>8} us {:>8.3} {:>8.3} {:>8.3} {:>8.3}", self.timestamp, self.initialising, self.angular_rate_recovery, self.acceleration_recovery, self.magnetic_recovery)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct AhrsStatusMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> AhrsStatusMessageView<'a> {
+    const LENGTH: usize = 26; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(AhrsStatusMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn initialising(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn angular_rate_recovery(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn acceleration_recovery(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+
+    pub fn magnetic_recovery(&self) -> f32 {
+        read_f32(self.message, 21)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct AhrsStatusColumns {
+    pub timestamp: Vec<u64>,
+    pub initialising: Vec<f32>,
+    pub angular_rate_recovery: Vec<f32>,
+    pub acceleration_recovery: Vec<f32>,
+    pub magnetic_recovery: Vec<f32>,
+}
+
+impl AhrsStatusColumns {
+    pub fn push(&mut self, message: AhrsStatusMessage) {
+        self.timestamp.push(message.timestamp);
+        self.initialising.push(message.initialising);
+        self.angular_rate_recovery.push(message.angular_rate_recovery);
+        self.acceleration_recovery.push(message.acceleration_recovery);
+        self.magnetic_recovery.push(message.magnetic_recovery);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.initialising.clear();
+        self.angular_rate_recovery.clear();
+        self.acceleration_recovery.clear();
+        self.magnetic_recovery.clear();
+    }
+}
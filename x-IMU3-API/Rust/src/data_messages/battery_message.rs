@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -19,34 +19,26 @@ impl DataMessage for BatteryMessage {
         'B' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f}\r\n",  char, u64, f32, f32, f32) {
-            Ok((_, timestamp, percentage, voltage, charging_status)) => Ok(BatteryMessage { timestamp, percentage, voltage, charging_status }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(BatteryMessage { timestamp: parser.parse_u64()?, percentage: parser.parse_f32()?, voltage: parser.parse_f32()?, charging_status: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            percentage: f32,
-            voltage: f32,
-            charging_status: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = BatteryMessageView::new(message)?;
+        Ok(BatteryMessage { timestamp: view.timestamp(), percentage: view.percentage(), voltage: view.voltage(), charging_status: view.charging_status() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{}", 'B', self.timestamp, self.percentage, self.voltage, self.charging_status).ok();
+    }
 
-        Ok(BatteryMessage { timestamp: binary_message.timestamp, percentage: binary_message.percentage, voltage: binary_message.voltage, charging_status: binary_message.charging_status })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.percentage.to_le_bytes());
+        bytes.extend_from_slice(&self.voltage.to_le_bytes());
+        bytes.extend_from_slice(&self.charging_status.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -67,3 +59,63 @@ impl fmt::Display for BatteryMessage {
         write!(formatter, "{:>8} us {:>8.3} % {:>8.3} V {:>8.3}", self.timestamp, self.percentage, self.voltage, self.charging_status)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct BatteryMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> BatteryMessageView<'a> {
+    const LENGTH: usize = 22; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(BatteryMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn percentage(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn voltage(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn charging_status(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct BatteryColumns {
+    pub timestamp: Vec<u64>,
+    pub percentage: Vec<f32>,
+    pub voltage: Vec<f32>,
+    pub charging_status: Vec<f32>,
+}
+
+impl BatteryColumns {
+    pub fn push(&mut self, message: BatteryMessage) {
+        self.timestamp.push(message.timestamp);
+        self.percentage.push(message.percentage);
+        self.voltage.push(message.voltage);
+        self.charging_status.push(message.charging_status);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.percentage.clear();
+        self.voltage.clear();
+        self.charging_status.clear();
+    }
+}
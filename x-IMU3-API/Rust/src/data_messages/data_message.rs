@@ -1,4 +1,3 @@
-use std::str;
 use crate::decode_error::*;
 
 pub trait DataMessage {
@@ -10,10 +9,7 @@ pub trait DataMessage {
 
     fn parse(message: &[u8]) -> Result<Self, DecodeError> where Self: Sized {
         if message[0] == Self::get_ascii_id() {
-            if let Ok(message_str) = str::from_utf8(message) {
-                return Self::parse_ascii(message_str);
-            }
-            return Err(DecodeError::UnableToParseAsciiMessage);
+            return Self::parse_ascii(message);
         }
         if message[0] == Self::get_binary_id() {
             return Self::parse_binary(message);
@@ -21,8 +17,10 @@ pub trait DataMessage {
         Err(DecodeError::InvalidMessageIdentifier)
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> where Self: Sized;
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> where Self: Sized;
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> where Self: Sized;
+    fn write_ascii(&self, bytes: &mut Vec<u8>);
+    fn write_binary(&self, bytes: &mut Vec<u8>);
     fn get_csv_file_name(&self) -> &'static str;
     fn get_csv_headings(&self) -> &'static str;
     fn to_csv_row(&self) -> String;
@@ -2,7 +2,7 @@
 
 use libc::size_t;
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use std::os::raw::c_char;
 use crate::data_messages::*;
 use crate::decode_error::*;
@@ -26,35 +26,28 @@ impl DataMessage for ErrorMessage {
         'F' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{[^\n]}\r\n",  char, u64, String) {
-            Ok((_, timestamp, string)) => {
-                let (char_array, number_of_bytes) = str_to_char_array(string);
-                Ok(ErrorMessage { timestamp, char_array, number_of_bytes })
-            }
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        let timestamp = parser.parse_u64()?;
+        let (char_array, number_of_bytes) = slice_to_char_array(parser.parse_remaining()?);
+        Ok(ErrorMessage { timestamp, char_array, number_of_bytes })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-        }
-
-        if (message.len() - 1) < size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
-
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+        let view = ErrorMessageView::new(message)?;
+        let (char_array, number_of_bytes) = slice_to_char_array(view.char_array());
+        Ok(ErrorMessage { timestamp: view.timestamp(), char_array, number_of_bytes })
+    }
 
-        let (char_array, number_of_bytes) = slice_to_char_array(&message[size_of::<BinaryMessage>()..(message.len() - 1)]);
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},", 'F', self.timestamp).ok();
+        bytes.extend(self.char_array[..self.number_of_bytes].iter().map(|&character| to_printable(character as u8))); // other characters would break ASCII framing
+    }
 
-        Ok(ErrorMessage { timestamp: binary_message.timestamp, char_array, number_of_bytes })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend(self.char_array[..self.number_of_bytes].iter().map(|&character| character as u8));
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -75,3 +68,49 @@ impl fmt::Display for ErrorMessage {
         write!(formatter, "{:>8} us \"{}\"", self.timestamp, char_array_to_string(&self.char_array, self.number_of_bytes))
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct ErrorMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> ErrorMessageView<'a> {
+    const MINIMUM_LENGTH: usize = 10; // identifier, timestamp and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() < Self::MINIMUM_LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(ErrorMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn char_array(&self) -> &'a [u8] {
+        &self.message[9..(self.message.len() - 1)]
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct ErrorColumns {
+    pub timestamp: Vec<u64>,
+    pub string: Vec<String>,
+}
+
+impl ErrorColumns {
+    pub fn push(&mut self, message: ErrorMessage) {
+        self.timestamp.push(message.timestamp);
+        self.string.push(message.char_array_as_string());
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.string.clear();
+    }
+}
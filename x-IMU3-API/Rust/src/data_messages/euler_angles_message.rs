@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -19,34 +19,26 @@ impl DataMessage for EulerAnglesMessage {
         'A' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f}\r\n",  char, u64, f32, f32, f32) {
-            Ok((_, timestamp, roll, pitch, yaw)) => Ok(EulerAnglesMessage { timestamp, roll, pitch, yaw }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(EulerAnglesMessage { timestamp: parser.parse_u64()?, roll: parser.parse_f32()?, pitch: parser.parse_f32()?, yaw: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            roll: f32,
-            pitch: f32,
-            yaw: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = EulerAnglesMessageView::new(message)?;
+        Ok(EulerAnglesMessage { timestamp: view.timestamp(), roll: view.roll(), pitch: view.pitch(), yaw: view.yaw() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{}", 'A', self.timestamp, self.roll, self.pitch, self.yaw).ok();
+    }
 
-        Ok(EulerAnglesMessage { timestamp: binary_message.timestamp, roll: binary_message.roll, pitch: binary_message.pitch, yaw: binary_message.yaw })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.roll.to_le_bytes());
+        bytes.extend_from_slice(&self.pitch.to_le_bytes());
+        bytes.extend_from_slice(&self.yaw.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -67,3 +59,63 @@ impl fmt::Display for EulerAnglesMessage {
         write!(formatter, "{:>8} us {:>8.3} deg {:>8.3} deg {:>8.3} deg", self.timestamp, self.roll, self.pitch, self.yaw)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct EulerAnglesMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> EulerAnglesMessageView<'a> {
+    const LENGTH: usize = 22; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(EulerAnglesMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn roll(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn pitch(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn yaw(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct EulerAnglesColumns {
+    pub timestamp: Vec<u64>,
+    pub roll: Vec<f32>,
+    pub pitch: Vec<f32>,
+    pub yaw: Vec<f32>,
+}
+
+impl EulerAnglesColumns {
+    pub fn push(&mut self, message: EulerAnglesMessage) {
+        self.timestamp.push(message.timestamp);
+        self.roll.push(message.roll);
+        self.pitch.push(message.pitch);
+        self.yaw.push(message.yaw);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.roll.clear();
+        self.pitch.clear();
+        self.yaw.clear();
+    }
+}
@@ -115,28 +115,34 @@ for message in messages:
             template = file.read()
 
         arguments_struct = "".join(["pub " + helpers.snake_case(n) + ": f32,\n    " for n in message.argument_names]).rstrip("\n    ")
-        arguments_scan_format = "".join(["{f}," for _ in message.argument_names]).rstrip(",")
-        arguments_types = "".join(["f32, " for _ in message.argument_names]).rstrip(", ")
-        arguments_list = "".join([helpers.snake_case(n) + ", " for n in message.argument_names]).rstrip(", ")
-        arguments_packed_struct = "".join([helpers.snake_case(n) + ": f32,\n            " for n in message.argument_names]).rstrip("\n            ")
-        arguments_assign_struct = "".join([helpers.snake_case(n) + ": binary_message." + helpers.snake_case(n) + ", " for n in message.argument_names]).rstrip(", ")
+        arguments_parse_struct = "".join([helpers.snake_case(n) + ": parser.parse_f32()?, " for n in message.argument_names]).rstrip(", ")
+        arguments_view_getters = "".join(["pub fn " + helpers.snake_case(n) + "(&self) -> f32 {\n        read_f32(self.message, " + str(9 + 4 * i) + ")\n    }\n\n    " for i, n in enumerate(message.argument_names)]).rstrip("\n    ")
+        arguments_view_assign = "".join([helpers.snake_case(n) + ": view." + helpers.snake_case(n) + "(), " for n in message.argument_names]).rstrip(", ")
+        binary_length = str(1 + 8 + 4 * len(message.argument_names) + 1)
         arguments_csv_heading = "".join([n + ("," if u == "" else " (" + u + "),") for n, u in zip(message.argument_names, message.argument_units)]).rstrip(",")
         arguments_csv_format = "".join(["{:.6}," for _ in message.argument_names]).rstrip(",")
-        arguments_ascii_format = "".join(["{:.4}," for _ in message.argument_names]).rstrip(",")
+        arguments_ascii_format = "".join(["{}," for _ in message.argument_names]).rstrip(",")
+        arguments_write_binary = "".join(["bytes.extend_from_slice(&self." + helpers.snake_case(n) + ".to_le_bytes());\n        " for n in message.argument_names]).rstrip("\n        ")
         arguments_self_list = "".join(["self." + helpers.snake_case(n) + ", " for n in message.argument_names]).rstrip(", ")
         arguments_string_format = "".join([" {:>8.3}" + ("" if u == "" else " " + u) for u in message.argument_units]).rstrip(", ")
+        arguments_columns_struct = "".join(["pub " + helpers.snake_case(n) + ": Vec<f32>,\n    " for n in message.argument_names]).rstrip("\n    ")
+        arguments_columns_push = "".join(["self." + helpers.snake_case(n) + ".push(message." + helpers.snake_case(n) + ");\n        " for n in message.argument_names]).rstrip("\n        ")
+        arguments_columns_clear = "".join(["self." + helpers.snake_case(n) + ".clear();\n        " for n in message.argument_names]).rstrip("\n        ")
 
         template = template.replace("$arguments_struct$", arguments_struct)
-        template = template.replace("$arguments_scan_format$", arguments_scan_format)
-        template = template.replace("$arguments_types$", arguments_types)
-        template = template.replace("$arguments_list$", arguments_list)
-        template = template.replace("$arguments_packed_struct$", arguments_packed_struct)
-        template = template.replace("$arguments_assign_struct$", arguments_assign_struct)
+        template = template.replace("$arguments_parse_struct$", arguments_parse_struct)
+        template = template.replace("$arguments_view_getters$", arguments_view_getters)
+        template = template.replace("$arguments_view_assign$", arguments_view_assign)
+        template = template.replace("$binary_length$", binary_length)
         template = template.replace("$arguments_csv_format$", arguments_csv_format)
         template = template.replace("$csv_headings$", arguments_csv_heading)
         template = template.replace("$arguments_ascii_format$", arguments_ascii_format)
+        template = template.replace("$arguments_write_binary$", arguments_write_binary)
         template = template.replace("$arguments_self_list$", arguments_self_list)
         template = template.replace("$arguments_string_format$", arguments_string_format)
+        template = template.replace("$arguments_columns_struct$", arguments_columns_struct)
+        template = template.replace("$arguments_columns_push$", arguments_columns_push)
+        template = template.replace("$arguments_columns_clear$", arguments_columns_clear)
     else:
         with open("template_char_array.txt") as file:
             template = file.read()
@@ -159,6 +165,8 @@ def insert(file_path, template, id):
         modified = modified.replace("$name_camel_case$", helpers.camel_case(message.name))
         modified = modified.replace("$name_pascal_case$", helpers.pascal_case(message.name))
         modified = modified.replace("$name_snake_case$", helpers.snake_case(message.name))
+        modified = modified.replace("$ascii_id$", message.ascii_id)
+        modified = modified.replace("$number_of_arguments$", str(len(message.argument_names)))
 
         code += modified
 
@@ -179,7 +187,15 @@ insert(file_path, template, 1)
 # Insert code into x-IMU3-API/Rust/src/connection.rs
 template = """
     pub fn add_$name_snake_case$_closure(&self, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
-        self.internal.lock().unwrap().get_decoder().lock().unwrap().dispatcher.add_$name_snake_case$_closure(closure)
+        self.decoder.dispatcher.add_$name_snake_case$_closure(closure)
+    }
+
+    pub fn add_$name_snake_case$_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[$name_pascal_case$Message]) + Send>) -> u64 {
+        self.decoder.dispatcher.add_$name_snake_case$_batch_closure(max_batch, max_latency, closure)
+    }
+
+    pub fn add_$name_snake_case$_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
+        self.decoder.dispatcher.add_$name_snake_case$_rate_limited_closure(rate_limit, value, closure)
     }\n"""
 
 insert("../connection.rs", template, 0)
@@ -191,12 +207,70 @@ pub extern "C" fn XIMU3_connection_add_$name_snake_case$_callback(connection: *m
     let connection: &Connection = unsafe { &*connection };
     let void_ptr = VoidPtr(context);
     connection.add_$name_snake_case$_closure(Box::new(move |message: $name_pascal_case$Message| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_$name_snake_case$_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<$name_pascal_case$Message>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_$name_snake_case$_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[$name_pascal_case$Message]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_$name_snake_case$_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<$name_pascal_case$Message>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_$name_snake_case$_rate_limited_closure(rate_limit, value, Box::new(move |message: $name_pascal_case$Message| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_$name_snake_case$(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<$name_pascal_case$Message>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_$name_snake_case$(subscription: *mut SubscriptionC, messages: *mut $name_pascal_case$Message, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
 }\n"""
 
 insert("../ffi/connection.rs", template, 0)
 
+# Insert code into x-IMU3-API/Rust/src/subscription.rs
+template = """
+impl Subscribable for $name_pascal_case$Message {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
+        connection.add_$name_snake_case$_closure(closure)
+    }
+}\n"""
+
+insert("../subscription.rs", template, 0)
+
+# Insert code into x-IMU3-API/Rust/src/batch_decoder.rs
+file_path = "../batch_decoder.rs"
+
+template = "    pub $name_snake_case$: $name_pascal_case$Columns,\n"
+
+insert(file_path, template, 0)
+
+template = "        self.$name_snake_case$.clear();\n"
+
+insert(file_path, template, 1)
+
+template = "            DispatcherData::$name_pascal_case$(message) => self.$name_snake_case$.push(message),\n"
+
+insert(file_path, template, 2)
+
+# Insert code into x-IMU3-API/Rust/benches/decoder.rs
+file_path = "../../benches/decoder.rs"
+
+template = "    (\"$name_snake_case$\", '$ascii_id$', $number_of_arguments$),\n"
+
+insert(file_path, template, 0)
+
 # Insert code into x-IMU3-API/Rust/src/decoder.rs
-template = "        parse!($name_pascal_case$Message, $name_pascal_case$);\n"
+template = "    parser!('$ascii_id$', $name_pascal_case$Message, $name_pascal_case$);\n"
 
 insert("../decoder.rs", template, 0)
 
@@ -207,39 +281,57 @@ template = "    $name_pascal_case$($name_pascal_case$Message),\n"
 
 insert(file_path, template, 0)
 
-template = "    $name_snake_case$_closures: Arc<Mutex<Vec<(Box<dyn Fn($name_pascal_case$Message) + Send>, u64)>>>,\n"
+template = """\
+    $name_snake_case$_closures: Closures<$name_pascal_case$Message>,
+    $name_snake_case$_batch_closures: BatchClosures<$name_pascal_case$Message>,
+    $name_snake_case$_rate_limited_closures: RateLimitedClosures<$name_pascal_case$Message>,\n"""
 
 insert(file_path, template, 1)
 
-template = "            $name_snake_case$_closures: Arc::new(Mutex::new(Vec::new())),\n"
+template = """\
+            DispatcherData::$name_pascal_case$(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::$name_pascal_case$(message))));
+                subscribers.$name_snake_case$_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.$name_snake_case$_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.$name_snake_case$_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }\n"""
 
 insert(file_path, template, 2)
 
-template = "        let $name_snake_case$_closures = dispatcher.$name_snake_case$_closures.clone();\n"
+template = """
+    pub fn add_$name_snake_case$_closure(&self, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.$name_snake_case$_closures)
+    }
+
+    pub fn add_$name_snake_case$_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[$name_pascal_case$Message]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.$name_snake_case$_batch_closures)
+    }
+
+    pub fn add_$name_snake_case$_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.$name_snake_case$_rate_limited_closures)
+    }\n"""
 
 insert(file_path, template, 3)
 
 template = """\
-                        DispatcherData::$name_pascal_case$(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            $name_snake_case$_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }\n"""
+        self.$name_snake_case$_closures.retain(|(_, id)| id != &closure_id);
+        self.$name_snake_case$_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.$name_snake_case$_rate_limited_closures.retain(|(_, id)| id != &closure_id);\n"""
 
 insert(file_path, template, 4)
 
-template = """
-    pub fn add_$name_snake_case$_closure(&self, closure: Box<dyn Fn($name_pascal_case$Message) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.$name_snake_case$_closures.lock().unwrap().push((closure, id));
-        id
-    }\n"""
+template = "            ($name_pascal_case$Message::get_ascii_id(), self.$name_snake_case$_closures.len() + self.$name_snake_case$_batch_closures.len() + self.$name_snake_case$_rate_limited_closures.len()),\n"
 
 insert(file_path, template, 5)
 
-template = "        self.$name_snake_case$_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);\n"
+template = "            DispatcherData::$name_pascal_case$(message) => Some(message.timestamp),\n"
 
 insert(file_path, template, 6)
 
+template = "            DispatcherData::$name_pascal_case$(message) => Some(message),\n"
+
+insert(file_path, template, 7)
+
 # Insert code into x-IMU3-API/Rust/src/ffi/data_messages.rs
 template = """
 #[no_mangle]
@@ -254,6 +346,16 @@ template = """
         uint64_t add$name_pascal_case$Callback(std::function<void(XIMU3_$name_pascal_case$Message)>& callback)
         {
             return XIMU3_connection_add_$name_snake_case$_callback(connection, Helpers::wrapCallable<XIMU3_$name_pascal_case$Message>(callback), &callback);
+        }
+
+        uint64_t add$name_pascal_case$BatchCallback(const uint32_t maxBatch, const uint32_t maxLatency, std::function<void(const XIMU3_$name_pascal_case$Message*, uint32_t)>& callback)
+        {
+            return XIMU3_connection_add_$name_snake_case$_batch_callback(connection, maxBatch, maxLatency, Helpers::wrapCallable<const XIMU3_$name_pascal_case$Message*, uint32_t>(callback), &callback);
+        }
+
+        uint64_t add$name_pascal_case$RateLimitedCallback(const XIMU3_RateLimit rateLimit, const uint32_t value, std::function<void(XIMU3_$name_pascal_case$Message)>& callback)
+        {
+            return XIMU3_connection_add_$name_snake_case$_rate_limited_callback(connection, rateLimit, value, Helpers::wrapCallable<XIMU3_$name_pascal_case$Message>(callback), &callback);
         }\n"""
 
 insert("../../../Cpp/Connection.hpp", template, 0)
@@ -374,6 +476,71 @@ static PyObject* connection_add_$name_snake_case$_callback(Connection* self, PyO
         id = XIMU3_connection_add_$name_snake_case$_callback(self->connection, $name_snake_case$_message_callback, callable);
     Py_END_ALLOW_THREADS
     return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_$name_snake_case$_batch_callback(Connection* self, PyObject* args)
+{
+    unsigned long max_batch;
+    unsigned long max_latency;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "kkO:set_callback", &max_batch, &max_latency, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_$name_snake_case$_batch_callback(self->connection, (uint32_t) max_batch, (uint32_t) max_latency, $name_snake_case$_messages_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
+}
+
+static PyObject* connection_add_$name_snake_case$_rate_limited_callback(Connection* self, PyObject* args)
+{
+    int rate_limit;
+    unsigned long value;
+    PyObject* callable;
+
+    if (PyArg_ParseTuple(args, "ikO:set_callback", &rate_limit, &value, &callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    switch (rate_limit) // validated before cast to enum
+    {
+        case XIMU3_RateLimitDecimate:
+        case XIMU3_RateLimitMaxRate:
+        case XIMU3_RateLimitConflate:
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "Invalid rate limit");
+            return NULL;
+    }
+
+    if (PyCallable_Check(callable) == 0)
+    {
+        PyErr_SetString(PyExc_TypeError, INVALID_ARGUMENTS_STRING);
+        return NULL;
+    }
+
+    Py_INCREF(callable); // this will never be destroyed (memory leak)
+
+    uint64_t id;
+    Py_BEGIN_ALLOW_THREADS // avoid deadlock caused by PyGILState_Ensure in callbacks
+        id = XIMU3_connection_add_$name_snake_case$_rate_limited_callback(self->connection, (XIMU3_RateLimit) rate_limit, (uint32_t) value, $name_snake_case$_message_callback, callable);
+    Py_END_ALLOW_THREADS
+    return Py_BuildValue("K", id);
 }\n"""
 
 insert(file_path, template, 0)
@@ -382,9 +549,13 @@ code = ""
 
 for message in messages:
     template = '        { "add_$name_snake_case$_callback", $whitespace$(PyCFunction) connection_add_$name_snake_case$_callback, $whitespace$METH_VARARGS, "" },\n'
+    template += '        { "add_$name_snake_case$_batch_callback", $batch_whitespace$(PyCFunction) connection_add_$name_snake_case$_batch_callback, $batch_whitespace$METH_VARARGS, "" },\n'
+    template += '        { "add_$name_snake_case$_rate_limited_callback", $rate_limited_whitespace$(PyCFunction) connection_add_$name_snake_case$_rate_limited_callback, $rate_limited_whitespace$METH_VARARGS, "" },\n'
 
     template = template.replace("$name_snake_case$", helpers.snake_case(message.name))
     template = template.replace("$whitespace$", "".ljust(20 - len(message.name)))
+    template = template.replace("$batch_whitespace$", "".ljust(14 - len(message.name)))
+    template = template.replace("$rate_limited_whitespace$", "".ljust(7 - len(message.name)))
 
     code += template
 
@@ -1,19 +1,14 @@
 use core::slice;
 use std::cmp;
+use std::convert::TryInto;
 use std::os::raw::c_char;
+use std::str;
+use crate::decode_error::*;
 
 pub const DATA_MESSAGE_CHAR_ARRAY_SIZE: usize = 256;
 
 pub const DATA_MESSAGE_EMPTY_CHAR_ARRAY: [c_char; DATA_MESSAGE_CHAR_ARRAY_SIZE] = ['\0' as c_char; DATA_MESSAGE_CHAR_ARRAY_SIZE];
 
-pub fn str_to_char_array(mut string: String) -> ([c_char; DATA_MESSAGE_CHAR_ARRAY_SIZE], usize) {
-    let mut char_array = DATA_MESSAGE_EMPTY_CHAR_ARRAY;
-
-    string.truncate(char_array.len() - 1); // last character must remain null
-    string.as_str().chars().enumerate().for_each(|(index, char)| char_array[index] = char as c_char);
-    (char_array, string.len())
-}
-
 pub fn slice_to_char_array(mut slice: &[u8]) -> ([c_char; DATA_MESSAGE_CHAR_ARRAY_SIZE], usize) {
     let mut char_array = DATA_MESSAGE_EMPTY_CHAR_ARRAY;
 
@@ -25,13 +20,252 @@ pub fn slice_to_char_array(mut slice: &[u8]) -> ([c_char; DATA_MESSAGE_CHAR_ARRA
 pub fn char_array_to_string(char_array: &[c_char], number_of_bytes: usize) -> String {
     let bytes = unsafe { slice::from_raw_parts(char_array.as_ptr() as *const u8, cmp::min(number_of_bytes, char_array.len())) };
 
-    let vector: Vec<u8> = bytes.to_vec().iter().map(|&byte| {
-        if byte < 0x20 || byte > 0x7E {
-            ' ' as u8
-        } else {
-            byte
-        }
-    }).collect();
+    let vector: Vec<u8> = bytes.iter().map(|&byte| to_printable(byte)).collect();
 
     String::from_utf8_lossy(&vector).to_string()
 }
+
+pub fn to_printable(byte: u8) -> u8 {
+    if byte < 0x20 || byte > 0x7E {
+        ' ' as u8
+    } else {
+        byte
+    }
+}
+
+pub fn read_u64(bytes: &[u8], offset: usize) -> u64 {
+    u64::from_le_bytes(bytes[offset..(offset + 8)].try_into().unwrap())
+}
+
+pub fn read_f32(bytes: &[u8], offset: usize) -> f32 {
+    f32::from_le_bytes(bytes[offset..(offset + 4)].try_into().unwrap())
+}
+
+pub struct AsciiParser<'a> { // matches the scan_fmt crate previously used, whitespace around fields and anything after the last field are ignored
+    remaining: &'a [u8],
+    first_field: bool,
+}
+
+impl<'a> AsciiParser<'a> {
+    pub fn new(message: &'a [u8]) -> Result<AsciiParser<'a>, DecodeError> {
+        let message = message.strip_suffix(b"\n").unwrap_or(message);
+        let message = message.strip_suffix(b"\r").unwrap_or(message);
+
+        match message.get(1) {
+            Some(b',') => Ok(AsciiParser { remaining: &message[2..], first_field: true }), // skip identifier
+            _ => Err(DecodeError::UnableToParseAsciiMessage),
+        }
+    }
+
+    fn start_field(&mut self) -> Result<(), DecodeError> {
+        self.skip_whitespace();
+
+        if self.first_field == false {
+            match self.remaining.split_first() {
+                Some((b',', remaining)) => self.remaining = remaining,
+                _ => return Err(DecodeError::UnableToParseAsciiMessage), // previous field followed by unexpected characters or missing field
+            }
+            self.skip_whitespace();
+        }
+
+        self.first_field = false;
+        Ok(())
+    }
+
+    fn skip_whitespace(&mut self) {
+        let index = self.remaining.iter().position(|byte| byte.is_ascii_whitespace() == false).unwrap_or(self.remaining.len());
+        self.remaining = &self.remaining[index..];
+    }
+
+    fn count_digits(&self, offset: usize) -> usize {
+        self.remaining.get(offset..).map_or(0, |remaining| remaining.iter().take_while(|byte| byte.is_ascii_digit()).count())
+    }
+
+    fn count_sign(&self, offset: usize) -> usize {
+        matches!(self.remaining.get(offset), Some(b'+') | Some(b'-')) as usize
+    }
+
+    fn take(&mut self, length: usize) -> &'a [u8] {
+        let (field, remaining) = self.remaining.split_at(length);
+        self.remaining = remaining;
+        field
+    }
+
+    pub fn parse_u64(&mut self) -> Result<u64, DecodeError> {
+        self.start_field()?;
+
+        let sign = self.count_sign(0);
+        let field = self.take(sign + self.count_digits(sign));
+
+        if field.len() == sign || field[0] == b'-' { // missing digits or negative
+            return Err(DecodeError::UnableToParseAsciiMessage);
+        }
+
+        field[sign..].iter().try_fold(0u64, |value, &byte| value.checked_mul(10)?.checked_add((byte - b'0') as u64)).ok_or(DecodeError::UnableToParseAsciiMessage)
+    }
+
+    pub fn parse_f32(&mut self) -> Result<f32, DecodeError> {
+        self.start_field()?;
+
+        let mut length = self.count_sign(0);
+        length += self.count_digits(length);
+
+        if self.remaining.get(length) == Some(&b'.') {
+            length += 1;
+            length += self.count_digits(length);
+        }
+
+        if matches!(self.remaining.get(length), Some(b'e') | Some(b'E')) {
+            length += 1;
+            length += self.count_sign(length);
+            length += self.count_digits(length);
+        }
+
+        match str::from_utf8(self.take(length)).map(|field| field.parse::<f32>()) { // standard library used for correctly rounded conversion
+            Ok(Ok(value)) => Ok(value),
+            _ => Err(DecodeError::UnableToParseAsciiMessage),
+        }
+    }
+
+    pub fn parse_remaining(&mut self) -> Result<&'a [u8], DecodeError> {
+        self.start_field()?;
+
+        Ok(self.take(self.remaining.len()))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::data_messages::*;
+    use crate::decode_error::*;
+
+    fn parse<T: DataMessage>(message: &str) -> Result<String, DecodeError> {
+        T::parse_ascii(message.as_bytes()).map(|message| message.to_csv_row())
+    }
+
+    fn float_messages() -> Vec<(u8, usize, fn(&str) -> Result<String, DecodeError>)> {
+        vec![
+            (InertialMessage::get_ascii_id(), 6, parse::<InertialMessage>),
+            (MagnetometerMessage::get_ascii_id(), 3, parse::<MagnetometerMessage>),
+            (QuaternionMessage::get_ascii_id(), 4, parse::<QuaternionMessage>),
+            (RotationMatrixMessage::get_ascii_id(), 9, parse::<RotationMatrixMessage>),
+            (EulerAnglesMessage::get_ascii_id(), 3, parse::<EulerAnglesMessage>),
+            (LinearAccelerationMessage::get_ascii_id(), 7, parse::<LinearAccelerationMessage>),
+            (EarthAccelerationMessage::get_ascii_id(), 7, parse::<EarthAccelerationMessage>),
+            (AhrsStatusMessage::get_ascii_id(), 4, parse::<AhrsStatusMessage>),
+            (HighGAccelerometerMessage::get_ascii_id(), 3, parse::<HighGAccelerometerMessage>),
+            (TemperatureMessage::get_ascii_id(), 1, parse::<TemperatureMessage>),
+            (BatteryMessage::get_ascii_id(), 3, parse::<BatteryMessage>),
+            (RssiMessage::get_ascii_id(), 2, parse::<RssiMessage>),
+        ]
+    }
+
+    fn string_messages() -> Vec<(u8, fn(&str) -> Result<String, DecodeError>)> {
+        vec![
+            (SerialAccessoryMessage::get_ascii_id(), parse::<SerialAccessoryMessage>),
+            (NotificationMessage::get_ascii_id(), parse::<NotificationMessage>),
+            (ErrorMessage::get_ascii_id(), parse::<ErrorMessage>),
+        ]
+    }
+
+    fn fields(number_of_floats: usize) -> Vec<String> {
+        (0..number_of_floats).map(|index| format!("{}", index as f32 * 1.25 - 2.0)).collect()
+    }
+
+    fn expected(timestamp: &str, number_of_floats: usize) -> Result<String, DecodeError> {
+        let floats: Vec<String> = (0..number_of_floats).map(|index| format!("{:.6}", index as f32 * 1.25 - 2.0)).collect();
+        Ok(format!("{},{}\n", timestamp, floats.join(",")))
+    }
+
+    fn is_error(result: Result<String, DecodeError>) -> bool {
+        result == Err(DecodeError::UnableToParseAsciiMessage)
+    }
+
+    #[test]
+    fn float_messages_parse_known_lines() {
+        for (id, number_of_floats, parse) in float_messages() {
+            let id = id as char;
+            let fields = fields(number_of_floats);
+
+            assert!(parse(&format!("{},123,{}\r\n", id, fields.join(","))) == expected("123", number_of_floats), "{}", id);
+            assert!(parse(&format!("{},123,{}", id, fields.join(","))) == expected("123", number_of_floats), "{} without terminator", id);
+            assert!(parse(&format!("{}, 123 , {} \r\n", id, fields.join(" , "))) == expected("123", number_of_floats), "{} with whitespace", id);
+            assert!(parse(&format!("{},+123,{}\r\n", id, fields.join(","))) == expected("123", number_of_floats), "{} with signed timestamp", id);
+            assert!(parse(&format!("{},18446744073709551615,{}\r\n", id, fields.join(","))) == expected("18446744073709551615", number_of_floats), "{} with maximum timestamp", id);
+        }
+    }
+
+    #[test]
+    fn float_messages_ignore_trailing_data() {
+        for (id, number_of_floats, parse) in float_messages() {
+            let id = id as char;
+            let fields = fields(number_of_floats);
+
+            assert!(parse(&format!("{},123,{},9.0,10.0\r\n", id, fields.join(","))) == expected("123", number_of_floats), "{} with extra fields", id);
+            assert!(parse(&format!("{},123,{}abc\r\n", id, fields.join(","))) == expected("123", number_of_floats), "{} with trailing characters", id);
+        }
+    }
+
+    #[test]
+    fn float_messages_reject_malformed_and_missing_fields() {
+        for (id, number_of_floats, parse) in float_messages() {
+            let id = id as char;
+            let fields = fields(number_of_floats);
+            let with_field = |index: usize, field: &str| {
+                let mut fields = fields.clone();
+                fields[index] = field.to_owned();
+                format!("{},123,{}\r\n", id, fields.join(","))
+            };
+
+            assert!(is_error(parse(&format!("{},123,{}\r\n", id, fields[..number_of_floats - 1].join(",")))), "{} with missing field", id);
+            assert!(is_error(parse(&format!("{},123\r\n", id))), "{} without fields", id);
+            assert!(is_error(parse(&format!("{}\r\n", id))), "{} identifier only", id);
+            assert!(is_error(parse("\r\n")), "{} empty", id);
+            assert!(is_error(parse(&format!("{}123,{}\r\n", id, fields.join(",")))), "{} without separator", id);
+            assert!(is_error(parse(&with_field(0, "abc"))), "{} with non-numeric field", id);
+            assert!(is_error(parse(&with_field(0, ""))), "{} with empty field", id);
+            assert!(is_error(parse(&format!("{},-123,{}\r\n", id, fields.join(",")))), "{} with negative timestamp", id);
+            assert!(is_error(parse(&format!("{},1.5,{}\r\n", id, fields.join(",")))), "{} with fractional timestamp", id);
+            assert!(is_error(parse(&format!("{},18446744073709551616,{}\r\n", id, fields.join(",")))), "{} with overflowing timestamp", id);
+
+            if number_of_floats > 1 {
+                assert!(is_error(parse(&with_field(0, "1.0x"))), "{} with malformed field", id);
+            }
+        }
+    }
+
+    #[test]
+    fn float_fields_accept_exponents_and_signs() {
+        assert!(parse::<TemperatureMessage>("T,1,1.5e2\r\n") == Ok("1,150.000000\n".to_owned()));
+        assert!(parse::<TemperatureMessage>("T,1,-2.5E-1\r\n") == Ok("1,-0.250000\n".to_owned()));
+        assert!(parse::<TemperatureMessage>("T,1,+3\r\n") == Ok("1,3.000000\n".to_owned()));
+        assert!(parse::<TemperatureMessage>("T,1,.5\r\n") == Ok("1,0.500000\n".to_owned()));
+        assert!(is_error(parse::<TemperatureMessage>("T,1,-\r\n")));
+        assert!(is_error(parse::<TemperatureMessage>("T,1,e5\r\n")));
+    }
+
+    #[test]
+    fn string_messages_parse_known_lines() {
+        for (id, parse) in string_messages() {
+            let id = id as char;
+
+            assert!(parse(&format!("{},123,Hello World\r\n", id)) == Ok("123,Hello World\n".to_owned()), "{}", id);
+            assert!(parse(&format!("{},123,Hello World", id)) == Ok("123,Hello World\n".to_owned()), "{} without terminator", id);
+            assert!(parse(&format!("{}, 123,  Hello, World \r\n", id)) == Ok("123,Hello, World \n".to_owned()), "{} with whitespace and comma", id);
+            assert!(parse(&format!("{},123,\r\n", id)) == Ok("123,\n".to_owned()), "{} with empty string", id);
+        }
+    }
+
+    #[test]
+    fn string_messages_reject_malformed_and_missing_fields() {
+        for (id, parse) in string_messages() {
+            let id = id as char;
+
+            assert!(is_error(parse(&format!("{},123\r\n", id))), "{} without string", id);
+            assert!(is_error(parse(&format!("{},abc,Hello\r\n", id))), "{} with non-numeric timestamp", id);
+            assert!(is_error(parse(&format!("{},-123,Hello\r\n", id))), "{} with negative timestamp", id);
+            assert!(is_error(parse(&format!("{}123,Hello\r\n", id))), "{} without separator", id);
+            assert!(is_error(parse(&format!("{}\r\n", id))), "{} identifier only", id);
+        }
+    }
+}
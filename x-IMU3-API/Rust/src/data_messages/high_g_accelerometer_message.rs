@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -19,34 +19,26 @@ impl DataMessage for HighGAccelerometerMessage {
         'H' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f}\r\n",  char, u64, f32, f32, f32) {
-            Ok((_, timestamp, x, y, z)) => Ok(HighGAccelerometerMessage { timestamp, x, y, z }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(HighGAccelerometerMessage { timestamp: parser.parse_u64()?, x: parser.parse_f32()?, y: parser.parse_f32()?, z: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            x: f32,
-            y: f32,
-            z: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = HighGAccelerometerMessageView::new(message)?;
+        Ok(HighGAccelerometerMessage { timestamp: view.timestamp(), x: view.x(), y: view.y(), z: view.z() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{}", 'H', self.timestamp, self.x, self.y, self.z).ok();
+    }
 
-        Ok(HighGAccelerometerMessage { timestamp: binary_message.timestamp, x: binary_message.x, y: binary_message.y, z: binary_message.z })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.x.to_le_bytes());
+        bytes.extend_from_slice(&self.y.to_le_bytes());
+        bytes.extend_from_slice(&self.z.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -67,3 +59,63 @@ impl fmt::Display for HighGAccelerometerMessage {
         write!(formatter, "{:>8} us {:>8.3} g {:>8.3} g {:>8.3} g", self.timestamp, self.x, self.y, self.z)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct HighGAccelerometerMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> HighGAccelerometerMessageView<'a> {
+    const LENGTH: usize = 22; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(HighGAccelerometerMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn x(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn y(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn z(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct HighGAccelerometerColumns {
+    pub timestamp: Vec<u64>,
+    pub x: Vec<f32>,
+    pub y: Vec<f32>,
+    pub z: Vec<f32>,
+}
+
+impl HighGAccelerometerColumns {
+    pub fn push(&mut self, message: HighGAccelerometerMessage) {
+        self.timestamp.push(message.timestamp);
+        self.x.push(message.x);
+        self.y.push(message.y);
+        self.z.push(message.z);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.x.clear();
+        self.y.clear();
+        self.z.clear();
+    }
+}
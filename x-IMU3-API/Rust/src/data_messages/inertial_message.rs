@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -22,37 +22,29 @@ impl DataMessage for InertialMessage {
         'I' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f},{f},{f},{f}\r\n",  char, u64, f32, f32, f32, f32, f32, f32) {
-            Ok((_, timestamp, gyroscope_x, gyroscope_y, gyroscope_z, accelerometer_x, accelerometer_y, accelerometer_z)) => Ok(InertialMessage { timestamp, gyroscope_x, gyroscope_y, gyroscope_z, accelerometer_x, accelerometer_y, accelerometer_z }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(InertialMessage { timestamp: parser.parse_u64()?, gyroscope_x: parser.parse_f32()?, gyroscope_y: parser.parse_f32()?, gyroscope_z: parser.parse_f32()?, accelerometer_x: parser.parse_f32()?, accelerometer_y: parser.parse_f32()?, accelerometer_z: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            gyroscope_x: f32,
-            gyroscope_y: f32,
-            gyroscope_z: f32,
-            accelerometer_x: f32,
-            accelerometer_y: f32,
-            accelerometer_z: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = InertialMessageView::new(message)?;
+        Ok(InertialMessage { timestamp: view.timestamp(), gyroscope_x: view.gyroscope_x(), gyroscope_y: view.gyroscope_y(), gyroscope_z: view.gyroscope_z(), accelerometer_x: view.accelerometer_x(), accelerometer_y: view.accelerometer_y(), accelerometer_z: view.accelerometer_z() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{},{},{},{}", 'I', self.timestamp, self.gyroscope_x, self.gyroscope_y, self.gyroscope_z, self.accelerometer_x, self.accelerometer_y, self.accelerometer_z).ok();
+    }
 
-        Ok(InertialMessage { timestamp: binary_message.timestamp, gyroscope_x: binary_message.gyroscope_x, gyroscope_y: binary_message.gyroscope_y, gyroscope_z: binary_message.gyroscope_z, accelerometer_x: binary_message.accelerometer_x, accelerometer_y: binary_message.accelerometer_y, accelerometer_z: binary_message.accelerometer_z })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.gyroscope_x.to_le_bytes());
+        bytes.extend_from_slice(&self.gyroscope_y.to_le_bytes());
+        bytes.extend_from_slice(&self.gyroscope_z.to_le_bytes());
+        bytes.extend_from_slice(&self.accelerometer_x.to_le_bytes());
+        bytes.extend_from_slice(&self.accelerometer_y.to_le_bytes());
+        bytes.extend_from_slice(&self.accelerometer_z.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -73,3 +65,84 @@ impl fmt::Display for InertialMessage {
         write!(formatter, "{:>8} us {:>8.3} deg/s {:>8.3} deg/s {:>8.3} deg/s {:>8.3} g {:>8.3} g {:>8.3} g", self.timestamp, self.gyroscope_x, self.gyroscope_y, self.gyroscope_z, self.accelerometer_x, self.accelerometer_y, self.accelerometer_z)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct InertialMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> InertialMessageView<'a> {
+    const LENGTH: usize = 34; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(InertialMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn gyroscope_x(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn gyroscope_y(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn gyroscope_z(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+
+    pub fn accelerometer_x(&self) -> f32 {
+        read_f32(self.message, 21)
+    }
+
+    pub fn accelerometer_y(&self) -> f32 {
+        read_f32(self.message, 25)
+    }
+
+    pub fn accelerometer_z(&self) -> f32 {
+        read_f32(self.message, 29)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct InertialColumns {
+    pub timestamp: Vec<u64>,
+    pub gyroscope_x: Vec<f32>,
+    pub gyroscope_y: Vec<f32>,
+    pub gyroscope_z: Vec<f32>,
+    pub accelerometer_x: Vec<f32>,
+    pub accelerometer_y: Vec<f32>,
+    pub accelerometer_z: Vec<f32>,
+}
+
+impl InertialColumns {
+    pub fn push(&mut self, message: InertialMessage) {
+        self.timestamp.push(message.timestamp);
+        self.gyroscope_x.push(message.gyroscope_x);
+        self.gyroscope_y.push(message.gyroscope_y);
+        self.gyroscope_z.push(message.gyroscope_z);
+        self.accelerometer_x.push(message.accelerometer_x);
+        self.accelerometer_y.push(message.accelerometer_y);
+        self.accelerometer_z.push(message.accelerometer_z);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.gyroscope_x.clear();
+        self.gyroscope_y.clear();
+        self.gyroscope_z.clear();
+        self.accelerometer_x.clear();
+        self.accelerometer_y.clear();
+        self.accelerometer_z.clear();
+    }
+}
@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -23,38 +23,30 @@ impl DataMessage for LinearAccelerationMessage {
         'L' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f},{f},{f},{f},{f}\r\n",  char, u64, f32, f32, f32, f32, f32, f32, f32) {
-            Ok((_, timestamp, quaternion_w, quaternion_x, quaternion_y, quaternion_z, acceleration_x, acceleration_y, acceleration_z)) => Ok(LinearAccelerationMessage { timestamp, quaternion_w, quaternion_x, quaternion_y, quaternion_z, acceleration_x, acceleration_y, acceleration_z }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(LinearAccelerationMessage { timestamp: parser.parse_u64()?, quaternion_w: parser.parse_f32()?, quaternion_x: parser.parse_f32()?, quaternion_y: parser.parse_f32()?, quaternion_z: parser.parse_f32()?, acceleration_x: parser.parse_f32()?, acceleration_y: parser.parse_f32()?, acceleration_z: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            quaternion_w: f32,
-            quaternion_x: f32,
-            quaternion_y: f32,
-            quaternion_z: f32,
-            acceleration_x: f32,
-            acceleration_y: f32,
-            acceleration_z: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = LinearAccelerationMessageView::new(message)?;
+        Ok(LinearAccelerationMessage { timestamp: view.timestamp(), quaternion_w: view.quaternion_w(), quaternion_x: view.quaternion_x(), quaternion_y: view.quaternion_y(), quaternion_z: view.quaternion_z(), acceleration_x: view.acceleration_x(), acceleration_y: view.acceleration_y(), acceleration_z: view.acceleration_z() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{},{},{},{},{}", 'L', self.timestamp, self.quaternion_w, self.quaternion_x, self.quaternion_y, self.quaternion_z, self.acceleration_x, self.acceleration_y, self.acceleration_z).ok();
+    }
 
-        Ok(LinearAccelerationMessage { timestamp: binary_message.timestamp, quaternion_w: binary_message.quaternion_w, quaternion_x: binary_message.quaternion_x, quaternion_y: binary_message.quaternion_y, quaternion_z: binary_message.quaternion_z, acceleration_x: binary_message.acceleration_x, acceleration_y: binary_message.acceleration_y, acceleration_z: binary_message.acceleration_z })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.quaternion_w.to_le_bytes());
+        bytes.extend_from_slice(&self.quaternion_x.to_le_bytes());
+        bytes.extend_from_slice(&self.quaternion_y.to_le_bytes());
+        bytes.extend_from_slice(&self.quaternion_z.to_le_bytes());
+        bytes.extend_from_slice(&self.acceleration_x.to_le_bytes());
+        bytes.extend_from_slice(&self.acceleration_y.to_le_bytes());
+        bytes.extend_from_slice(&self.acceleration_z.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -75,3 +67,91 @@ impl fmt::Display for LinearAccelerationMessage {
         write!(formatter, "{:>8} us {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3} g {:>8.3} g {:>8.3} g", self.timestamp, self.quaternion_w, self.quaternion_x, self.quaternion_y, self.quaternion_z, self.acceleration_x, self.acceleration_y, self.acceleration_z)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct LinearAccelerationMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> LinearAccelerationMessageView<'a> {
+    const LENGTH: usize = 38; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(LinearAccelerationMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn quaternion_w(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn quaternion_x(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn quaternion_y(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+
+    pub fn quaternion_z(&self) -> f32 {
+        read_f32(self.message, 21)
+    }
+
+    pub fn acceleration_x(&self) -> f32 {
+        read_f32(self.message, 25)
+    }
+
+    pub fn acceleration_y(&self) -> f32 {
+        read_f32(self.message, 29)
+    }
+
+    pub fn acceleration_z(&self) -> f32 {
+        read_f32(self.message, 33)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct LinearAccelerationColumns {
+    pub timestamp: Vec<u64>,
+    pub quaternion_w: Vec<f32>,
+    pub quaternion_x: Vec<f32>,
+    pub quaternion_y: Vec<f32>,
+    pub quaternion_z: Vec<f32>,
+    pub acceleration_x: Vec<f32>,
+    pub acceleration_y: Vec<f32>,
+    pub acceleration_z: Vec<f32>,
+}
+
+impl LinearAccelerationColumns {
+    pub fn push(&mut self, message: LinearAccelerationMessage) {
+        self.timestamp.push(message.timestamp);
+        self.quaternion_w.push(message.quaternion_w);
+        self.quaternion_x.push(message.quaternion_x);
+        self.quaternion_y.push(message.quaternion_y);
+        self.quaternion_z.push(message.quaternion_z);
+        self.acceleration_x.push(message.acceleration_x);
+        self.acceleration_y.push(message.acceleration_y);
+        self.acceleration_z.push(message.acceleration_z);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.quaternion_w.clear();
+        self.quaternion_x.clear();
+        self.quaternion_y.clear();
+        self.quaternion_z.clear();
+        self.acceleration_x.clear();
+        self.acceleration_y.clear();
+        self.acceleration_z.clear();
+    }
+}
@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -20,35 +20,27 @@ impl DataMessage for QuaternionMessage {
         'Q' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f},{f}\r\n",  char, u64, f32, f32, f32, f32) {
-            Ok((_, timestamp, w, x, y, z)) => Ok(QuaternionMessage { timestamp, w, x, y, z }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(QuaternionMessage { timestamp: parser.parse_u64()?, w: parser.parse_f32()?, x: parser.parse_f32()?, y: parser.parse_f32()?, z: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            w: f32,
-            x: f32,
-            y: f32,
-            z: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = QuaternionMessageView::new(message)?;
+        Ok(QuaternionMessage { timestamp: view.timestamp(), w: view.w(), x: view.x(), y: view.y(), z: view.z() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{},{}", 'Q', self.timestamp, self.w, self.x, self.y, self.z).ok();
+    }
 
-        Ok(QuaternionMessage { timestamp: binary_message.timestamp, w: binary_message.w, x: binary_message.x, y: binary_message.y, z: binary_message.z })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.w.to_le_bytes());
+        bytes.extend_from_slice(&self.x.to_le_bytes());
+        bytes.extend_from_slice(&self.y.to_le_bytes());
+        bytes.extend_from_slice(&self.z.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -69,3 +61,70 @@ impl fmt::Display for QuaternionMessage {
         write!(formatter, "{:>8} us {:>8.3} {:>8.3} {:>8.3} {:>8.3}", self.timestamp, self.w, self.x, self.y, self.z)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct QuaternionMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> QuaternionMessageView<'a> {
+    const LENGTH: usize = 26; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(QuaternionMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn w(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn x(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn y(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+
+    pub fn z(&self) -> f32 {
+        read_f32(self.message, 21)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct QuaternionColumns {
+    pub timestamp: Vec<u64>,
+    pub w: Vec<f32>,
+    pub x: Vec<f32>,
+    pub y: Vec<f32>,
+    pub z: Vec<f32>,
+}
+
+impl QuaternionColumns {
+    pub fn push(&mut self, message: QuaternionMessage) {
+        self.timestamp.push(message.timestamp);
+        self.w.push(message.w);
+        self.x.push(message.x);
+        self.y.push(message.y);
+        self.z.push(message.z);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.w.clear();
+        self.x.clear();
+        self.y.clear();
+        self.z.clear();
+    }
+}
@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -25,40 +25,32 @@ impl DataMessage for RotationMatrixMessage {
         'R' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f},{f},{f},{f},{f},{f},{f},{f}\r\n",  char, u64, f32, f32, f32, f32, f32, f32, f32, f32, f32) {
-            Ok((_, timestamp, xx, xy, xz, yx, yy, yz, zx, zy, zz)) => Ok(RotationMatrixMessage { timestamp, xx, xy, xz, yx, yy, yz, zx, zy, zz }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(RotationMatrixMessage { timestamp: parser.parse_u64()?, xx: parser.parse_f32()?, xy: parser.parse_f32()?, xz: parser.parse_f32()?, yx: parser.parse_f32()?, yy: parser.parse_f32()?, yz: parser.parse_f32()?, zx: parser.parse_f32()?, zy: parser.parse_f32()?, zz: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            xx: f32,
-            xy: f32,
-            xz: f32,
-            yx: f32,
-            yy: f32,
-            yz: f32,
-            zx: f32,
-            zy: f32,
-            zz: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = RotationMatrixMessageView::new(message)?;
+        Ok(RotationMatrixMessage { timestamp: view.timestamp(), xx: view.xx(), xy: view.xy(), xz: view.xz(), yx: view.yx(), yy: view.yy(), yz: view.yz(), zx: view.zx(), zy: view.zy(), zz: view.zz() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{},{},{},{},{},{},{},{}", 'R', self.timestamp, self.xx, self.xy, self.xz, self.yx, self.yy, self.yz, self.zx, self.zy, self.zz).ok();
+    }
 
-        Ok(RotationMatrixMessage { timestamp: binary_message.timestamp, xx: binary_message.xx, xy: binary_message.xy, xz: binary_message.xz, yx: binary_message.yx, yy: binary_message.yy, yz: binary_message.yz, zx: binary_message.zx, zy: binary_message.zy, zz: binary_message.zz })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.xx.to_le_bytes());
+        bytes.extend_from_slice(&self.xy.to_le_bytes());
+        bytes.extend_from_slice(&self.xz.to_le_bytes());
+        bytes.extend_from_slice(&self.yx.to_le_bytes());
+        bytes.extend_from_slice(&self.yy.to_le_bytes());
+        bytes.extend_from_slice(&self.yz.to_le_bytes());
+        bytes.extend_from_slice(&self.zx.to_le_bytes());
+        bytes.extend_from_slice(&self.zy.to_le_bytes());
+        bytes.extend_from_slice(&self.zz.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -79,3 +71,105 @@ impl fmt::Display for RotationMatrixMessage {
         write!(formatter, "{:>8} us {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3} {:>8.3}", self.timestamp, self.xx, self.xy, self.xz, self.yx, self.yy, self.yz, self.zx, self.zy, self.zz)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct RotationMatrixMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> RotationMatrixMessageView<'a> {
+    const LENGTH: usize = 46; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(RotationMatrixMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn xx(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn xy(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+
+    pub fn xz(&self) -> f32 {
+        read_f32(self.message, 17)
+    }
+
+    pub fn yx(&self) -> f32 {
+        read_f32(self.message, 21)
+    }
+
+    pub fn yy(&self) -> f32 {
+        read_f32(self.message, 25)
+    }
+
+    pub fn yz(&self) -> f32 {
+        read_f32(self.message, 29)
+    }
+
+    pub fn zx(&self) -> f32 {
+        read_f32(self.message, 33)
+    }
+
+    pub fn zy(&self) -> f32 {
+        read_f32(self.message, 37)
+    }
+
+    pub fn zz(&self) -> f32 {
+        read_f32(self.message, 41)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct RotationMatrixColumns {
+    pub timestamp: Vec<u64>,
+    pub xx: Vec<f32>,
+    pub xy: Vec<f32>,
+    pub xz: Vec<f32>,
+    pub yx: Vec<f32>,
+    pub yy: Vec<f32>,
+    pub yz: Vec<f32>,
+    pub zx: Vec<f32>,
+    pub zy: Vec<f32>,
+    pub zz: Vec<f32>,
+}
+
+impl RotationMatrixColumns {
+    pub fn push(&mut self, message: RotationMatrixMessage) {
+        self.timestamp.push(message.timestamp);
+        self.xx.push(message.xx);
+        self.xy.push(message.xy);
+        self.xz.push(message.xz);
+        self.yx.push(message.yx);
+        self.yy.push(message.yy);
+        self.yz.push(message.yz);
+        self.zx.push(message.zx);
+        self.zy.push(message.zy);
+        self.zz.push(message.zz);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.xx.clear();
+        self.xy.clear();
+        self.xz.clear();
+        self.yx.clear();
+        self.yy.clear();
+        self.yz.clear();
+        self.zx.clear();
+        self.zy.clear();
+        self.zz.clear();
+    }
+}
@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -18,33 +18,25 @@ impl DataMessage for RssiMessage {
         'W' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f},{f}\r\n",  char, u64, f32, f32) {
-            Ok((_, timestamp, percentage, power)) => Ok(RssiMessage { timestamp, percentage, power }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(RssiMessage { timestamp: parser.parse_u64()?, percentage: parser.parse_f32()?, power: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            percentage: f32,
-            power: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = RssiMessageView::new(message)?;
+        Ok(RssiMessage { timestamp: view.timestamp(), percentage: view.percentage(), power: view.power() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{},{}", 'W', self.timestamp, self.percentage, self.power).ok();
+    }
 
-        Ok(RssiMessage { timestamp: binary_message.timestamp, percentage: binary_message.percentage, power: binary_message.power })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.percentage.to_le_bytes());
+        bytes.extend_from_slice(&self.power.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -65,3 +57,56 @@ impl fmt::Display for RssiMessage {
         write!(formatter, "{:>8} us {:>8.3} % {:>8.3} dBm", self.timestamp, self.percentage, self.power)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct RssiMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> RssiMessageView<'a> {
+    const LENGTH: usize = 18; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(RssiMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn percentage(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+
+    pub fn power(&self) -> f32 {
+        read_f32(self.message, 13)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct RssiColumns {
+    pub timestamp: Vec<u64>,
+    pub percentage: Vec<f32>,
+    pub power: Vec<f32>,
+}
+
+impl RssiColumns {
+    pub fn push(&mut self, message: RssiMessage) {
+        self.timestamp.push(message.timestamp);
+        self.percentage.push(message.percentage);
+        self.power.push(message.power);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.percentage.clear();
+        self.power.clear();
+    }
+}
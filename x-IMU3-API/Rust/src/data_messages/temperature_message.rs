@@ -1,7 +1,7 @@
 // This file was generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 use std::fmt;
-use std::mem::size_of;
+use std::io::Write;
 use crate::data_messages::*;
 use crate::decode_error::*;
 
@@ -17,32 +17,24 @@ impl DataMessage for TemperatureMessage {
         'T' as u8
     }
 
-    fn parse_ascii(message: &str) -> Result<Self, DecodeError> {
-        match scan_fmt!( message, "{},{d},{f}\r\n",  char, u64, f32) {
-            Ok((_, timestamp, temperature)) => Ok(TemperatureMessage { timestamp, temperature }),
-            Err(_) => Err(DecodeError::UnableToParseAsciiMessage),
-        }
+    fn parse_ascii(message: &[u8]) -> Result<Self, DecodeError> {
+        let mut parser = AsciiParser::new(message)?;
+        Ok(TemperatureMessage { timestamp: parser.parse_u64()?, temperature: parser.parse_f32()? })
     }
 
     fn parse_binary(message: &[u8]) -> Result<Self, DecodeError> {
-        #[repr(C, packed)]
-        struct BinaryMessage {
-            id: u8,
-            timestamp: u64,
-            temperature: f32,
-            termination: u8,
-        }
-
-        if message.len() != size_of::<BinaryMessage>() {
-            return Err(DecodeError::InvalidBinaryMessageLength);
-        }
+        let view = TemperatureMessageView::new(message)?;
+        Ok(TemperatureMessage { timestamp: view.timestamp(), temperature: view.temperature() })
+    }
 
-        let binary_message = unsafe {
-            let ref binary_message = *(message.as_ptr() as *const BinaryMessage);
-            binary_message
-        };
+    fn write_ascii(&self, bytes: &mut Vec<u8>) {
+        write!(bytes, "{},{},{}", 'T', self.timestamp, self.temperature).ok();
+    }
 
-        Ok(TemperatureMessage { timestamp: binary_message.timestamp, temperature: binary_message.temperature })
+    fn write_binary(&self, bytes: &mut Vec<u8>) {
+        bytes.push(Self::get_binary_id());
+        bytes.extend_from_slice(&self.timestamp.to_le_bytes());
+        bytes.extend_from_slice(&self.temperature.to_le_bytes());
     }
 
     fn get_csv_file_name(&self) -> &'static str {
@@ -63,3 +55,49 @@ impl fmt::Display for TemperatureMessage {
         write!(formatter, "{:>8} us {:>8.3} degC", self.timestamp, self.temperature)
     }
 }
+
+#[derive(Clone, Copy)]
+pub struct TemperatureMessageView<'a> {
+    message: &'a [u8],
+}
+
+impl<'a> TemperatureMessageView<'a> {
+    const LENGTH: usize = 14; // identifier, timestamp, arguments and termination
+
+    pub fn new(message: &'a [u8]) -> Result<Self, DecodeError> {
+        if message.len() != Self::LENGTH {
+            return Err(DecodeError::InvalidBinaryMessageLength);
+        }
+        Ok(TemperatureMessageView { message })
+    }
+
+    pub fn timestamp(&self) -> u64 {
+        read_u64(self.message, 1)
+    }
+
+    pub fn temperature(&self) -> f32 {
+        read_f32(self.message, 9)
+    }
+}
+
+#[derive(Clone, Default)]
+pub struct TemperatureColumns {
+    pub timestamp: Vec<u64>,
+    pub temperature: Vec<f32>,
+}
+
+impl TemperatureColumns {
+    pub fn push(&mut self, message: TemperatureMessage) {
+        self.timestamp.push(message.timestamp);
+        self.temperature.push(message.temperature);
+    }
+
+    pub fn len(&self) -> usize {
+        self.timestamp.len()
+    }
+
+    pub fn clear(&mut self) {
+        self.timestamp.clear();
+        self.temperature.clear();
+    }
+}
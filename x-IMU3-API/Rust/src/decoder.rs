@@ -1,115 +1,269 @@
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use crate::command_message::*;
 use crate::data_messages::*;
 use crate::decode_error::*;
 use crate::dispatcher::*;
 use crate::statistics::*;
 
-const BUFFER_SIZE: usize = 4096;
+const DEFAULT_MAX_FRAME_SIZE: usize = 4096;
+const MIN_MAX_FRAME_SIZE: usize = 1;
+const MAX_MAX_FRAME_SIZE: usize = 1 << 20; // buffer is allocated up front so must be limited
+
+pub(crate) const BYTE_STUFFING_END: u8 = 0x0A;
+pub(crate) const BYTE_STUFFING_ESC: u8 = 0xDB;
+pub(crate) const BYTE_STUFFING_ESC_END: u8 = 0xDC;
+pub(crate) const BYTE_STUFFING_ESC_ESC: u8 = 0xDD;
+
+type DataMessageParser = fn(&[u8]) -> Result<DispatcherData, DecodeError>;
+
+static DATA_MESSAGE_PARSERS: [Option<DataMessageParser>; 256] = { // indexed by message identifier
+    let mut parsers: [Option<DataMessageParser>; 256] = [None; 256];
+
+    macro_rules! parser {
+        ($ascii_id:expr, $data_message:ident, $dispatcher_data:ident) => {{
+            parsers[$ascii_id as usize] = Some(|message: &[u8]| Ok(DispatcherData::$dispatcher_data($data_message::parse_ascii(message)?)));
+            parsers[0x80 + $ascii_id as usize] = Some(|message: &[u8]| Ok(DispatcherData::$dispatcher_data($data_message::parse_binary(message)?)));
+        }}
+    }
+
+    // Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+    parser!('I', InertialMessage, Inertial);
+    parser!('M', MagnetometerMessage, Magnetometer);
+    parser!('Q', QuaternionMessage, Quaternion);
+    parser!('R', RotationMatrixMessage, RotationMatrix);
+    parser!('A', EulerAnglesMessage, EulerAngles);
+    parser!('L', LinearAccelerationMessage, LinearAcceleration);
+    parser!('E', EarthAccelerationMessage, EarthAcceleration);
+    parser!('U', AhrsStatusMessage, AhrsStatus);
+    parser!('H', HighGAccelerometerMessage, HighGAccelerometer);
+    parser!('T', TemperatureMessage, Temperature);
+    parser!('B', BatteryMessage, Battery);
+    parser!('W', RssiMessage, Rssi);
+    parser!('S', SerialAccessoryMessage, SerialAccessory);
+    parser!('N', NotificationMessage, Notification);
+    parser!('F', ErrorMessage, Error);
+    // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+    parsers
+};
+
+#[derive(Clone)]
+pub struct DecoderHandle { // shared by connection and reader, the decoder itself is owned by the reader
+    pub statistics: Arc<AtomicStatistics>,
+    pub dispatcher: Arc<Dispatcher>,
+    max_frame_size: Arc<AtomicUsize>,
+}
+
+impl DecoderHandle {
+    pub fn new() -> DecoderHandle {
+        let statistics: Arc<AtomicStatistics> = Default::default();
+
+        DecoderHandle {
+            statistics: statistics.clone(),
+            dispatcher: Arc::new(Dispatcher::new(statistics)),
+            max_frame_size: Arc::new(AtomicUsize::new(DEFAULT_MAX_FRAME_SIZE)),
+        }
+    }
+
+    pub fn set_max_frame_size(&self, max_frame_size: usize) { // applied by reader before next bytes are processed
+        self.max_frame_size.store(max_frame_size.clamp(MIN_MAX_FRAME_SIZE, MAX_MAX_FRAME_SIZE), Ordering::Relaxed);
+    }
+}
+
+impl PartialEq for DecoderHandle {
+    fn eq(&self, other: &DecoderHandle) -> bool {
+        Arc::ptr_eq(&self.dispatcher, &other.dispatcher)
+    }
+}
 
 pub struct Decoder {
-    buffer: [u8; BUFFER_SIZE],
-    buffer_index: usize,
-    pub statistics: Statistics,
-    pub dispatcher: Dispatcher,
+    stream_decoder: StreamDecoder,
+    max_frame_size: usize,
+    handle: DecoderHandle,
 }
 
 impl Decoder {
-    pub fn new() -> Decoder {
+    pub fn new(handle: &DecoderHandle) -> Decoder {
         Decoder {
-            buffer: [0; BUFFER_SIZE],
-            buffer_index: 0,
-            statistics: Default::default(),
-            dispatcher: Dispatcher::new(),
+            stream_decoder: StreamDecoder::new(),
+            max_frame_size: DEFAULT_MAX_FRAME_SIZE,
+            handle: handle.clone(),
         }
     }
 
+    pub fn get_handle(&self) -> &DecoderHandle {
+        &self.handle
+    }
+
     pub fn process_bytes(&mut self, bytes: &[u8]) {
-        self.statistics.data_total += bytes.len() as u64;
+        let subscriptions = self.handle.dispatcher.get_subscriptions();
 
-        for byte in bytes {
-            self.buffer[self.buffer_index] = *byte;
+        self.decode(bytes, subscriptions, |handle, data| {
+            handle.dispatcher.sender.send(data).ok();
+        });
+    }
 
-            self.buffer_index += 1;
-            if self.buffer_index >= self.buffer.len() {
-                self.statistics.error_total += 1;
-                self.dispatcher.sender.send(DispatcherData::DecodeError(DecodeError::BufferOverrun)).ok();
-                self.buffer_index = 0;
-                continue;
+    pub fn process_bytes_with<F>(&mut self, bytes: &[u8], subscriptions: u64, mut closure: F) where F: FnMut(DispatcherData) { // messages passed to closure instead of dispatcher
+        self.decode(bytes, subscriptions, |_, data| closure(data));
+    }
+
+    fn decode<F>(&mut self, bytes: &[u8], subscriptions: u64, mut closure: F) where F: FnMut(&DecoderHandle, DispatcherData) {
+        let max_frame_size = self.handle.max_frame_size.load(Ordering::Relaxed);
+
+        if max_frame_size != self.max_frame_size {
+            self.stream_decoder.set_max_frame_size(max_frame_size);
+            self.max_frame_size = max_frame_size;
+        }
+
+        let mut message_total = 0;
+        let mut error_total = 0;
+
+        let handle = &self.handle;
+
+        let skipped = self.stream_decoder.process_bytes(bytes, subscriptions, |result| {
+            match result {
+                Ok(Some(data)) => {
+                    message_total += 1;
+                    closure(handle, data);
+                }
+                Ok(None) => message_total += 1, // not parsed because there are no subscribers
+                Err(decode_error) => {
+                    error_total += 1;
+                    closure(handle, DispatcherData::DecodeError(decode_error));
+                }
             }
+        });
+
+        let statistics = &self.handle.statistics;
+
+        statistics.data_total.fetch_add(bytes.len() as u64, Ordering::Relaxed);
+        statistics.message_total.fetch_add(message_total, Ordering::Relaxed);
+        statistics.error_total.fetch_add(error_total, Ordering::Relaxed);
+        statistics.skipped_total.fetch_add(skipped as u64, Ordering::Relaxed);
+    }
+}
 
-            if *byte == '\n' as u8 {
-                match self.process_message() {
-                    Ok(_) => self.statistics.message_total += 1,
-                    Err(decode_error) => {
-                        self.statistics.error_total += 1;
-                        self.dispatcher.sender.send(DispatcherData::DecodeError(decode_error)).ok();
+pub struct StreamDecoder {
+    buffer: Vec<u8>,
+    buffer_index: usize,
+    discarding: bool,
+}
+
+impl StreamDecoder {
+    pub fn new() -> StreamDecoder {
+        StreamDecoder {
+            buffer: vec![0; DEFAULT_MAX_FRAME_SIZE],
+            buffer_index: 0,
+            discarding: false,
+        }
+    }
+
+    pub fn set_max_frame_size(&mut self, max_frame_size: usize) {
+        self.buffer = vec![0; max_frame_size.clamp(MIN_MAX_FRAME_SIZE, MAX_MAX_FRAME_SIZE)];
+        self.buffer_index = 0;
+        self.discarding = false; // partial frame discarded with buffer
+    }
+
+    pub fn process_bytes<F>(&mut self, bytes: &[u8], subscriptions: u64, mut closure: F) -> usize where F: FnMut(Result<Option<DispatcherData>, DecodeError>) {
+        let mut remaining = bytes;
+        let mut skipped = 0;
+
+        while remaining.is_empty() == false {
+            if self.discarding {
+                match memchr::memchr(b'\n', remaining) { // resynchronise by discarding up to the next terminator
+                    Some(index) => {
+                        skipped += index + 1;
+                        remaining = &remaining[(index + 1)..];
+                        self.discarding = false;
+                        continue;
+                    }
+                    None => {
+                        skipped += remaining.len();
+                        break;
                     }
                 }
+            }
+
+            let (segment, terminated) = match memchr::memchr(b'\n', remaining) {
+                Some(index) => (&remaining[..=index], true),
+                None => (remaining, false),
+            };
+            remaining = &remaining[segment.len()..];
+
+            if self.buffer_index + segment.len() > self.buffer.len() {
+                skipped += self.buffer_index + segment.len();
                 self.buffer_index = 0;
+                self.discarding = terminated == false;
+                closure(Err(DecodeError::BufferOverrun));
+                continue;
             }
+
+            if terminated == false {
+                self.buffer[self.buffer_index..(self.buffer_index + segment.len())].copy_from_slice(segment);
+                self.buffer_index += segment.len();
+                continue;
+            }
+
+            if self.buffer_index == 0 {
+                closure(self.process_message(segment, subscriptions)); // message entirely within bytes so no copy required
+            } else {
+                let length = self.buffer_index + segment.len();
+                self.buffer[self.buffer_index..length].copy_from_slice(segment);
+                self.buffer_index = 0;
+                closure(self.process_buffered_message(length, subscriptions));
+            }
+        }
+
+        skipped
+    }
+
+    fn process_message(&mut self, message: &[u8], subscriptions: u64) -> Result<Option<DispatcherData>, DecodeError> {
+        if message[0] == ('{' as u8) {
+            return StreamDecoder::process_command_message(message);
+        }
+
+        if StreamDecoder::is_subscribed(message[0], subscriptions) == false {
+            return Ok(None);
         }
+
+        if memchr::memchr(BYTE_STUFFING_ESC, message).is_some() {
+            self.buffer[..message.len()].copy_from_slice(message); // byte stuffing is undone in place so must be copied
+            return self.process_buffered_message(message.len(), subscriptions);
+        }
+
+        StreamDecoder::process_data_message(message)
     }
 
-    fn process_message(&mut self) -> Result<(), DecodeError> {
+    fn process_buffered_message(&mut self, length: usize, subscriptions: u64) -> Result<Option<DispatcherData>, DecodeError> {
         if self.buffer[0] == ('{' as u8) {
-            self.process_command_message()
-        } else {
-            self.process_data_message()
+            return StreamDecoder::process_command_message(&self.buffer[..length]);
         }
+
+        if StreamDecoder::is_subscribed(self.buffer[0], subscriptions) == false {
+            return Ok(None);
+        }
+
+        let message = StreamDecoder::undo_byte_stuffing(&mut self.buffer[..length])?;
+        StreamDecoder::process_data_message(message)
     }
 
-    fn process_command_message(&self) -> Result<(), DecodeError> {
-        let command = CommandMessage::parse_bytes(&self.buffer[..self.buffer_index])?;
-        self.dispatcher.sender.send(DispatcherData::Command(command)).ok();
-        Ok(())
+    fn process_command_message(message: &[u8]) -> Result<Option<DispatcherData>, DecodeError> {
+        Ok(Some(DispatcherData::Command(CommandMessage::parse_bytes(message)?)))
     }
 
-    fn process_data_message(&mut self) -> Result<(), DecodeError> {
-        let message = Decoder::undo_byte_stuffing(&mut self.buffer[..self.buffer_index])?;
+    fn is_subscribed(identifier: u8, subscriptions: u64) -> bool {
+        DATA_MESSAGE_PARSERS[identifier as usize].is_none() || (subscriptions & subscription_bit(identifier)) != 0 // unknown identifiers must still be reported as errors
+    }
 
-        macro_rules! parse {
-            ($data_message:ident, $dispatcher_data:ident) => {{
-                match $data_message::parse(message) {
-                    Ok(message) => {
-                        self.dispatcher.sender.send(DispatcherData::$dispatcher_data(message)).ok();
-                        return Ok(());
-                    }
-                    Err(error) => {
-                        if error != DecodeError::InvalidMessageIdentifier {
-                            return Err(error);
-                        }
-                    }
-                }
-            }}
+    fn process_data_message(message: &[u8]) -> Result<Option<DispatcherData>, DecodeError> {
+        match DATA_MESSAGE_PARSERS[message[0] as usize] {
+            Some(parser) => parser(message).map(Some),
+            None => Err(DecodeError::InvalidMessageIdentifier),
         }
-
-        // Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-        parse!(InertialMessage, Inertial);
-        parse!(MagnetometerMessage, Magnetometer);
-        parse!(QuaternionMessage, Quaternion);
-        parse!(RotationMatrixMessage, RotationMatrix);
-        parse!(EulerAnglesMessage, EulerAngles);
-        parse!(LinearAccelerationMessage, LinearAcceleration);
-        parse!(EarthAccelerationMessage, EarthAcceleration);
-        parse!(AhrsStatusMessage, AhrsStatus);
-        parse!(HighGAccelerometerMessage, HighGAccelerometer);
-        parse!(TemperatureMessage, Temperature);
-        parse!(BatteryMessage, Battery);
-        parse!(RssiMessage, Rssi);
-        parse!(SerialAccessoryMessage, SerialAccessory);
-        parse!(NotificationMessage, Notification);
-        parse!(ErrorMessage, Error);
-        // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-
-        Err(DecodeError::InvalidMessageIdentifier)
     }
 
     fn undo_byte_stuffing(message: &mut [u8]) -> Result<&[u8], DecodeError> {
-        const BYTE_STUFFING_END: u8 = 0x0A;
-        const BYTE_STUFFING_ESC: u8 = 0xDB;
-        const BYTE_STUFFING_ESC_END: u8 = 0xDC;
-        const BYTE_STUFFING_ESC_ESC: u8 = 0xDD;
-
         let mut source_index = 0;
         let mut destination_index = 0;
 
@@ -135,3 +289,79 @@ impl Decoder {
         Ok(&message[..destination_index])
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn decode(stream_decoder: &mut StreamDecoder, bytes: &[u8]) -> (Vec<Result<Option<DispatcherData>, DecodeError>>, usize) {
+        let mut results = Vec::new();
+        let skipped = stream_decoder.process_bytes(bytes, ALL_SUBSCRIPTIONS, |result| results.push(result));
+        (results, skipped)
+    }
+
+    #[test]
+    fn subscriptions_share_bit_between_identifiers() {
+        let mut stream_decoder = StreamDecoder::new();
+        let mut bytes = Vec::new();
+
+        crate::encoder::encode_binary(&TemperatureMessage { timestamp: 1, temperature: 0.0 }, &mut bytes);
+        bytes.extend_from_slice(b"T,2,20.0\r\n"); // ASCII and binary identifiers share the same bit
+        bytes.extend_from_slice(b"Q,3,1.0,0.0,0.0,0.0\r\n"); // unsubscribed so skipped
+        bytes.extend_from_slice(&[0x94, b'\n']); // unknown identifier with same bit as 'T'
+        bytes.extend_from_slice(&[0x11, b'\n']); // unknown identifier with same bit as 'Q'
+
+        let mut results = Vec::new();
+        let skipped = stream_decoder.process_bytes(&bytes, subscription_bit(b'T'), |result| results.push(result));
+
+        assert_eq!(skipped, 0);
+        assert!(matches!(results.as_slice(), [
+            Ok(Some(DispatcherData::Temperature(first))),
+            Ok(Some(DispatcherData::Temperature(second))),
+            Ok(None),
+            Err(DecodeError::InvalidMessageIdentifier),
+            Err(DecodeError::InvalidMessageIdentifier),
+        ] if first.timestamp == 1 && second.timestamp == 2));
+    }
+
+    #[test]
+    fn unsubscribed_messages_are_not_parsed() {
+        let mut stream_decoder = StreamDecoder::new();
+
+        let mut results = Vec::new();
+        stream_decoder.process_bytes(b"T,not a number\r\nQ,1,1.0,0.0,0.0,0.0\r\n", subscription_bit(b'Q'), |result| results.push(result));
+
+        assert!(matches!(results.as_slice(), [Ok(None), Ok(Some(DispatcherData::Quaternion(message)))] if message.timestamp == 1)); // invalid message not reported because skipped before parsing
+    }
+
+    #[test]
+    fn max_frame_size_is_limited() {
+        let mut stream_decoder = StreamDecoder::new();
+
+        stream_decoder.set_max_frame_size(usize::MAX);
+        assert_eq!(stream_decoder.buffer.len(), MAX_MAX_FRAME_SIZE);
+
+        stream_decoder.set_max_frame_size(0);
+        assert_eq!(stream_decoder.buffer.len(), MIN_MAX_FRAME_SIZE);
+
+        let handle = DecoderHandle::new();
+        handle.set_max_frame_size(u32::MAX as usize);
+        assert_eq!(handle.max_frame_size.load(Ordering::Relaxed), MAX_MAX_FRAME_SIZE);
+    }
+
+    #[test]
+    fn set_max_frame_size_stops_discarding() {
+        let mut stream_decoder = StreamDecoder::new();
+        stream_decoder.set_max_frame_size(8);
+
+        let (results, _) = decode(&mut stream_decoder, b"T,1,20.0 oversized");
+        assert!(matches!(results.as_slice(), [Err(DecodeError::BufferOverrun)]));
+        assert!(stream_decoder.discarding);
+
+        stream_decoder.set_max_frame_size(64);
+
+        let (results, skipped) = decode(&mut stream_decoder, b"T,2,21.0\r\n");
+        assert!(matches!(results.as_slice(), [Ok(Some(DispatcherData::Temperature(message)))] if message.timestamp == 2));
+        assert_eq!(skipped, 0);
+    }
+}
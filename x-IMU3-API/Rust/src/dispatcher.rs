@@ -1,11 +1,17 @@
-use crossbeam::channel::Sender;
-use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::{Arc, Mutex};
+use std::cell::Cell;
+use std::collections::VecDeque;
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
+use std::sync::{Arc, Condvar, Mutex};
+use std::time::{Duration, Instant};
+use crate::closure_timing::*;
 use crate::command_message::*;
 use crate::data_messages::*;
 use crate::decode_error::*;
+use crate::queue_policy::*;
+use crate::rate_limit::*;
 use crate::statistics::*;
 
+#[derive(Clone)]
 pub enum DispatcherData {
     DecodeError(DecodeError),
     Statistics(Statistics),
@@ -30,321 +36,1768 @@ pub enum DispatcherData {
     EndOfFile(),
 }
 
-pub struct Dispatcher {
-    pub sender: Sender<DispatcherData>,
-    closure_counter: AtomicU64,
-    decode_error_closures: Arc<Mutex<Vec<(Box<dyn Fn(DecodeError) + Send>, u64)>>>,
-    statistics_closures: Arc<Mutex<Vec<(Box<dyn Fn(Statistics) + Send>, u64)>>>,
-    command_closures: Arc<Mutex<Vec<(Box<dyn Fn(CommandMessage) + Send>, u64)>>>,
-    data_closures: Arc<Mutex<Vec<(Box<dyn Fn(Box<dyn DataMessage>) + Send>, u64)>>>,
+impl DispatcherData {
+    pub fn get_timestamp(&self) -> Option<u64> {
+        match self {
+            // Start of code block #6 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            DispatcherData::Inertial(message) => Some(message.timestamp),
+            DispatcherData::Magnetometer(message) => Some(message.timestamp),
+            DispatcherData::Quaternion(message) => Some(message.timestamp),
+            DispatcherData::RotationMatrix(message) => Some(message.timestamp),
+            DispatcherData::EulerAngles(message) => Some(message.timestamp),
+            DispatcherData::LinearAcceleration(message) => Some(message.timestamp),
+            DispatcherData::EarthAcceleration(message) => Some(message.timestamp),
+            DispatcherData::AhrsStatus(message) => Some(message.timestamp),
+            DispatcherData::HighGAccelerometer(message) => Some(message.timestamp),
+            DispatcherData::Temperature(message) => Some(message.timestamp),
+            DispatcherData::Battery(message) => Some(message.timestamp),
+            DispatcherData::Rssi(message) => Some(message.timestamp),
+            DispatcherData::SerialAccessory(message) => Some(message.timestamp),
+            DispatcherData::Notification(message) => Some(message.timestamp),
+            DispatcherData::Error(message) => Some(message.timestamp),
+            // End of code block #6 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            _ => None,
+        }
+    }
+
+    pub fn as_data_message(&self) -> Option<&dyn DataMessage> {
+        match self {
+            // Start of code block #7 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            DispatcherData::Inertial(message) => Some(message),
+            DispatcherData::Magnetometer(message) => Some(message),
+            DispatcherData::Quaternion(message) => Some(message),
+            DispatcherData::RotationMatrix(message) => Some(message),
+            DispatcherData::EulerAngles(message) => Some(message),
+            DispatcherData::LinearAcceleration(message) => Some(message),
+            DispatcherData::EarthAcceleration(message) => Some(message),
+            DispatcherData::AhrsStatus(message) => Some(message),
+            DispatcherData::HighGAccelerometer(message) => Some(message),
+            DispatcherData::Temperature(message) => Some(message),
+            DispatcherData::Battery(message) => Some(message),
+            DispatcherData::Rssi(message) => Some(message),
+            DispatcherData::SerialAccessory(message) => Some(message),
+            DispatcherData::Notification(message) => Some(message),
+            DispatcherData::Error(message) => Some(message),
+            // End of code block #7 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            _ => None,
+        }
+    }
+}
+
+const DEFAULT_QUEUE_CAPACITY: usize = 100000;
+
+const DISPATCHING_NONE: u64 = 0;
+const DISPATCHING_PENDING: u64 = u64::MAX;
+
+const NO_THREAD: u64 = 0;
+
+pub(crate) const ALL_SUBSCRIPTIONS: u64 = u64::MAX;
+
+pub(crate) fn subscription_bit(identifier: u8) -> u64 {
+    1 << (identifier & 0x3F) // ASCII and binary identifiers map to the same bit
+}
+
+static THREAD_COUNTER: AtomicU64 = AtomicU64::new(NO_THREAD + 1);
+
+thread_local! {
+    static THREAD_NUMBER: u64 = THREAD_COUNTER.fetch_add(1, Ordering::Relaxed);
+    static SHARED_THREAD: Cell<bool> = Cell::new(false);
+}
+
+fn thread_number() -> u64 {
+    THREAD_NUMBER.with(|thread_number| *thread_number)
+}
+
+pub(crate) fn set_shared_thread() { // called by threads shared by several connections so that one connection cannot stall the others
+    SHARED_THREAD.with(|shared| shared.set(true));
+}
+
+fn is_shared_thread() -> bool {
+    SHARED_THREAD.with(|shared| shared.get())
+}
+
+struct Closure<F: ?Sized> {
+    timing: Arc<AtomicClosureTiming>,
+    removed: Arc<AtomicBool>, // set when removed without waiting for dispatcher so that closure is no longer called
+    closure: Box<F>,
+}
+
+unsafe impl<F: ?Sized + Send> Sync for Closure<F> {} // closures are only ever called by the thread holding the dispatching token
+
+impl<F: ?Sized> Closure<F> {
+    fn new(id: u64, closure: Box<F>) -> Closure<F> {
+        Closure {
+            timing: Arc::new(AtomicClosureTiming::new(id)),
+            removed: Arc::new(AtomicBool::new(false)),
+            closure,
+        }
+    }
+}
+
+type Closures<T> = Vec<(Arc<Closure<dyn Fn(T) + Send>>, u64)>;
+
+struct BatchClosure<T> {
+    closure: Closure<dyn Fn(&[T]) + Send>,
+    max_batch: usize,
+    max_latency: Duration,
+    batch: Mutex<(Vec<T>, Option<Instant>)>, // messages and deadline of first message
+}
+
+impl<T> BatchClosure<T> {
+    fn new(id: u64, closure: Box<dyn Fn(&[T]) + Send>, max_batch: usize, max_latency: u32) -> BatchClosure<T> {
+        BatchClosure {
+            closure: Closure::new(id, closure),
+            max_batch: std::cmp::max(max_batch, 1),
+            max_latency: Duration::from_millis(max_latency as u64),
+            batch: Mutex::new((Vec::with_capacity(max_batch), None)),
+        }
+    }
+
+    fn push(&self, subscribers: &Subscribers, message: T) {
+        let mut batch = self.batch.lock().unwrap();
+
+        if batch.0.is_empty() {
+            let deadline = Instant::now() + self.max_latency;
+            batch.1 = Some(deadline);
+            subscribers.batch_deadline.set(deadline);
+        }
+
+        batch.0.push(message);
+
+        if batch.0.len() >= self.max_batch {
+            subscribers.call(&self.closure, |closure| closure(&batch.0));
+            batch.0.clear();
+            batch.1 = None;
+        }
+    }
+}
+
+struct BatchDeadline { // earliest deadline of all batch and conflating closures so that closures need not be scanned
+    epoch: Instant,
+    earliest: AtomicU64, // nanoseconds since epoch, u64::MAX if none
+}
+
+impl Default for BatchDeadline {
+    fn default() -> BatchDeadline {
+        BatchDeadline {
+            epoch: Instant::now(),
+            earliest: AtomicU64::new(u64::MAX),
+        }
+    }
+}
+
+impl BatchDeadline {
+    fn get(&self) -> Option<Instant> {
+        match self.earliest.load(Ordering::SeqCst) {
+            u64::MAX => None,
+            earliest => Some(self.epoch + Duration::from_nanos(earliest)),
+        }
+    }
+
+    fn set(&self, deadline: Instant) {
+        self.earliest.fetch_min(deadline.saturating_duration_since(self.epoch).as_nanos() as u64, Ordering::SeqCst);
+    }
+
+    fn clear(&self) {
+        self.earliest.store(u64::MAX, Ordering::SeqCst);
+    }
+}
+
+trait Batched {
+    fn deadline(&self) -> Option<Instant>;
+    fn flush(&self, subscribers: &Subscribers);
+}
+
+impl<T> Batched for BatchClosure<T> {
+    fn deadline(&self) -> Option<Instant> {
+        self.batch.lock().unwrap().1
+    }
+
+    fn flush(&self, subscribers: &Subscribers) {
+        let mut batch = self.batch.lock().unwrap();
+
+        if batch.0.is_empty() == false {
+            subscribers.call(&self.closure, |closure| closure(&batch.0));
+            batch.0.clear();
+            batch.1 = None;
+        }
+    }
+}
+
+type BatchClosures<T> = Vec<(Arc<BatchClosure<T>>, u64)>;
+
+struct RateLimitedClosure<T> {
+    closure: Closure<dyn Fn(T) + Send>,
+    rate_limit: RateLimit,
+    divisor: u64,
+    period: Duration,
+    state: Mutex<(u64, Option<Instant>, Option<T>)>, // number of messages, earliest time of next delivery and latest conflated message
+}
+
+impl<T> RateLimitedClosure<T> {
+    fn new(id: u64, closure: Box<dyn Fn(T) + Send>, rate_limit: RateLimit, value: u32) -> RateLimitedClosure<T> {
+        let value = std::cmp::max(value, 1);
+
+        RateLimitedClosure {
+            closure: Closure::new(id, closure),
+            rate_limit,
+            divisor: value as u64,
+            period: Duration::from_secs(1) / value,
+            state: Mutex::new((0, None, None)),
+        }
+    }
+
+    fn push(&self, subscribers: &Subscribers, message: T) {
+        let mut state = self.state.lock().unwrap();
+
+        let deliver = match self.rate_limit {
+            RateLimit::Decimate => state.0 % self.divisor == 0,
+            RateLimit::MaxRate | RateLimit::Conflate => {
+                let now = Instant::now();
+
+                if state.1.map_or(true, |next| now >= next) {
+                    state.1 = Some(now + self.period);
+                    state.2 = None; // conflated message superseded
+                    true
+                } else {
+                    if self.rate_limit == RateLimit::Conflate {
+                        if let Some(next) = state.1 {
+                            subscribers.batch_deadline.set(next);
+                        }
+                        state.2 = Some(message);
+                        return;
+                    }
+                    false
+                }
+            }
+        };
+
+        state.0 += 1;
+
+        if deliver {
+            subscribers.call(&self.closure, |closure| closure(message));
+        }
+    }
+}
+
+impl<T> Batched for RateLimitedClosure<T> {
+    fn deadline(&self) -> Option<Instant> {
+        let state = self.state.lock().unwrap();
+        state.2.as_ref().and(state.1)
+    }
+
+    fn flush(&self, subscribers: &Subscribers) {
+        let mut state = self.state.lock().unwrap();
+
+        if let Some(message) = state.2.take() {
+            state.1 = Some(Instant::now() + self.period);
+            subscribers.call(&self.closure, |closure| closure(message));
+        }
+    }
+}
+
+type RateLimitedClosures<T> = Vec<(Arc<RateLimitedClosure<T>>, u64)>;
+
+struct TimeBudgetClosure {
+    closure: Closure<dyn Fn(u64, u64) + Send>,
+    time_budget: Duration,
+}
+
+#[derive(Clone, Default)]
+struct Subscribers {
+    decode_error_closures: Closures<DecodeError>,
+    statistics_closures: Closures<Statistics>,
+    command_closures: Closures<CommandMessage>,
+    data_closures: Vec<(Arc<Closure<dyn Fn(&DispatcherData) + Send>>, u64)>, // all data messages
     // Start of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-    inertial_closures: Arc<Mutex<Vec<(Box<dyn Fn(InertialMessage) + Send>, u64)>>>,
-    magnetometer_closures: Arc<Mutex<Vec<(Box<dyn Fn(MagnetometerMessage) + Send>, u64)>>>,
-    quaternion_closures: Arc<Mutex<Vec<(Box<dyn Fn(QuaternionMessage) + Send>, u64)>>>,
-    rotation_matrix_closures: Arc<Mutex<Vec<(Box<dyn Fn(RotationMatrixMessage) + Send>, u64)>>>,
-    euler_angles_closures: Arc<Mutex<Vec<(Box<dyn Fn(EulerAnglesMessage) + Send>, u64)>>>,
-    linear_acceleration_closures: Arc<Mutex<Vec<(Box<dyn Fn(LinearAccelerationMessage) + Send>, u64)>>>,
-    earth_acceleration_closures: Arc<Mutex<Vec<(Box<dyn Fn(EarthAccelerationMessage) + Send>, u64)>>>,
-    ahrs_status_closures: Arc<Mutex<Vec<(Box<dyn Fn(AhrsStatusMessage) + Send>, u64)>>>,
-    high_g_accelerometer_closures: Arc<Mutex<Vec<(Box<dyn Fn(HighGAccelerometerMessage) + Send>, u64)>>>,
-    temperature_closures: Arc<Mutex<Vec<(Box<dyn Fn(TemperatureMessage) + Send>, u64)>>>,
-    battery_closures: Arc<Mutex<Vec<(Box<dyn Fn(BatteryMessage) + Send>, u64)>>>,
-    rssi_closures: Arc<Mutex<Vec<(Box<dyn Fn(RssiMessage) + Send>, u64)>>>,
-    serial_accessory_closures: Arc<Mutex<Vec<(Box<dyn Fn(SerialAccessoryMessage) + Send>, u64)>>>,
-    notification_closures: Arc<Mutex<Vec<(Box<dyn Fn(NotificationMessage) + Send>, u64)>>>,
-    error_closures: Arc<Mutex<Vec<(Box<dyn Fn(ErrorMessage) + Send>, u64)>>>,
+    inertial_closures: Closures<InertialMessage>,
+    inertial_batch_closures: BatchClosures<InertialMessage>,
+    inertial_rate_limited_closures: RateLimitedClosures<InertialMessage>,
+    magnetometer_closures: Closures<MagnetometerMessage>,
+    magnetometer_batch_closures: BatchClosures<MagnetometerMessage>,
+    magnetometer_rate_limited_closures: RateLimitedClosures<MagnetometerMessage>,
+    quaternion_closures: Closures<QuaternionMessage>,
+    quaternion_batch_closures: BatchClosures<QuaternionMessage>,
+    quaternion_rate_limited_closures: RateLimitedClosures<QuaternionMessage>,
+    rotation_matrix_closures: Closures<RotationMatrixMessage>,
+    rotation_matrix_batch_closures: BatchClosures<RotationMatrixMessage>,
+    rotation_matrix_rate_limited_closures: RateLimitedClosures<RotationMatrixMessage>,
+    euler_angles_closures: Closures<EulerAnglesMessage>,
+    euler_angles_batch_closures: BatchClosures<EulerAnglesMessage>,
+    euler_angles_rate_limited_closures: RateLimitedClosures<EulerAnglesMessage>,
+    linear_acceleration_closures: Closures<LinearAccelerationMessage>,
+    linear_acceleration_batch_closures: BatchClosures<LinearAccelerationMessage>,
+    linear_acceleration_rate_limited_closures: RateLimitedClosures<LinearAccelerationMessage>,
+    earth_acceleration_closures: Closures<EarthAccelerationMessage>,
+    earth_acceleration_batch_closures: BatchClosures<EarthAccelerationMessage>,
+    earth_acceleration_rate_limited_closures: RateLimitedClosures<EarthAccelerationMessage>,
+    ahrs_status_closures: Closures<AhrsStatusMessage>,
+    ahrs_status_batch_closures: BatchClosures<AhrsStatusMessage>,
+    ahrs_status_rate_limited_closures: RateLimitedClosures<AhrsStatusMessage>,
+    high_g_accelerometer_closures: Closures<HighGAccelerometerMessage>,
+    high_g_accelerometer_batch_closures: BatchClosures<HighGAccelerometerMessage>,
+    high_g_accelerometer_rate_limited_closures: RateLimitedClosures<HighGAccelerometerMessage>,
+    temperature_closures: Closures<TemperatureMessage>,
+    temperature_batch_closures: BatchClosures<TemperatureMessage>,
+    temperature_rate_limited_closures: RateLimitedClosures<TemperatureMessage>,
+    battery_closures: Closures<BatteryMessage>,
+    battery_batch_closures: BatchClosures<BatteryMessage>,
+    battery_rate_limited_closures: RateLimitedClosures<BatteryMessage>,
+    rssi_closures: Closures<RssiMessage>,
+    rssi_batch_closures: BatchClosures<RssiMessage>,
+    rssi_rate_limited_closures: RateLimitedClosures<RssiMessage>,
+    serial_accessory_closures: Closures<SerialAccessoryMessage>,
+    serial_accessory_batch_closures: BatchClosures<SerialAccessoryMessage>,
+    serial_accessory_rate_limited_closures: RateLimitedClosures<SerialAccessoryMessage>,
+    notification_closures: Closures<NotificationMessage>,
+    notification_batch_closures: BatchClosures<NotificationMessage>,
+    notification_rate_limited_closures: RateLimitedClosures<NotificationMessage>,
+    error_closures: Closures<ErrorMessage>,
+    error_batch_closures: BatchClosures<ErrorMessage>,
+    error_rate_limited_closures: RateLimitedClosures<ErrorMessage>,
     // End of code block #1 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-    end_of_file_closures: Arc<Mutex<Vec<(Box<dyn Fn() + Send>, u64)>>>,
+    end_of_file_closures: Vec<(Arc<Closure<dyn Fn() + Send>>, u64)>,
+    batch_closures: Vec<(Arc<dyn Batched + Send + Sync>, u64)>, // all batch and conflating closures, used to flush
+    batch_deadline: Arc<BatchDeadline>, // shared by all snapshots
+    time_budget_closures: Vec<(Arc<TimeBudgetClosure>, u64)>,
+    timings: Vec<(Arc<AtomicClosureTiming>, u64)>, // all timed closures
+    removed_flags: Vec<(Arc<AtomicBool>, u64)>, // all closures that may be removed without waiting for dispatcher
+}
+
+impl Subscribers {
+    fn call<F: ?Sized, C>(&self, closure: &Closure<F>, call: C) where C: FnOnce(&F) {
+        if closure.removed.load(Ordering::SeqCst) {
+            return;
+        }
+
+        let start = Instant::now();
+
+        call(&closure.closure);
+
+        let time = start.elapsed();
+
+        closure.timing.record(time);
+
+        self.time_budget_closures.iter().filter(|(time_budget_closure, _)| time > time_budget_closure.time_budget).for_each(|(time_budget_closure, _)| {
+            (time_budget_closure.closure.closure)(closure.timing.closure_id, time.as_nanos() as u64);
+        });
+    }
+
+    fn remove(&mut self, closure_id: u64) {
+        self.decode_error_closures.retain(|(_, id)| id != &closure_id);
+        self.statistics_closures.retain(|(_, id)| id != &closure_id);
+        self.command_closures.retain(|(_, id)| id != &closure_id);
+        self.data_closures.retain(|(_, id)| id != &closure_id);
+        // Start of code block #4 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+        self.inertial_closures.retain(|(_, id)| id != &closure_id);
+        self.inertial_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.inertial_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.magnetometer_closures.retain(|(_, id)| id != &closure_id);
+        self.magnetometer_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.magnetometer_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.quaternion_closures.retain(|(_, id)| id != &closure_id);
+        self.quaternion_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.quaternion_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.rotation_matrix_closures.retain(|(_, id)| id != &closure_id);
+        self.rotation_matrix_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.rotation_matrix_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.euler_angles_closures.retain(|(_, id)| id != &closure_id);
+        self.euler_angles_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.euler_angles_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.linear_acceleration_closures.retain(|(_, id)| id != &closure_id);
+        self.linear_acceleration_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.linear_acceleration_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.earth_acceleration_closures.retain(|(_, id)| id != &closure_id);
+        self.earth_acceleration_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.earth_acceleration_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.ahrs_status_closures.retain(|(_, id)| id != &closure_id);
+        self.ahrs_status_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.ahrs_status_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.high_g_accelerometer_closures.retain(|(_, id)| id != &closure_id);
+        self.high_g_accelerometer_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.high_g_accelerometer_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.temperature_closures.retain(|(_, id)| id != &closure_id);
+        self.temperature_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.temperature_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.battery_closures.retain(|(_, id)| id != &closure_id);
+        self.battery_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.battery_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.rssi_closures.retain(|(_, id)| id != &closure_id);
+        self.rssi_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.rssi_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.serial_accessory_closures.retain(|(_, id)| id != &closure_id);
+        self.serial_accessory_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.serial_accessory_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.notification_closures.retain(|(_, id)| id != &closure_id);
+        self.notification_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.notification_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        self.error_closures.retain(|(_, id)| id != &closure_id);
+        self.error_batch_closures.retain(|(_, id)| id != &closure_id);
+        self.error_rate_limited_closures.retain(|(_, id)| id != &closure_id);
+        // End of code block #4 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+        self.end_of_file_closures.retain(|(_, id)| id != &closure_id);
+        self.batch_closures.retain(|(_, id)| id != &closure_id);
+        self.time_budget_closures.retain(|(_, id)| id != &closure_id);
+        self.timings.retain(|(_, id)| id != &closure_id);
+        self.removed_flags.retain(|(_, id)| id != &closure_id);
+    }
+
+    fn get_subscriptions(&self) -> u64 {
+        let all = self.data_closures.is_empty() == false;
+
+        let subscriptions = [
+            // Start of code block #5 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            (InertialMessage::get_ascii_id(), self.inertial_closures.len() + self.inertial_batch_closures.len() + self.inertial_rate_limited_closures.len()),
+            (MagnetometerMessage::get_ascii_id(), self.magnetometer_closures.len() + self.magnetometer_batch_closures.len() + self.magnetometer_rate_limited_closures.len()),
+            (QuaternionMessage::get_ascii_id(), self.quaternion_closures.len() + self.quaternion_batch_closures.len() + self.quaternion_rate_limited_closures.len()),
+            (RotationMatrixMessage::get_ascii_id(), self.rotation_matrix_closures.len() + self.rotation_matrix_batch_closures.len() + self.rotation_matrix_rate_limited_closures.len()),
+            (EulerAnglesMessage::get_ascii_id(), self.euler_angles_closures.len() + self.euler_angles_batch_closures.len() + self.euler_angles_rate_limited_closures.len()),
+            (LinearAccelerationMessage::get_ascii_id(), self.linear_acceleration_closures.len() + self.linear_acceleration_batch_closures.len() + self.linear_acceleration_rate_limited_closures.len()),
+            (EarthAccelerationMessage::get_ascii_id(), self.earth_acceleration_closures.len() + self.earth_acceleration_batch_closures.len() + self.earth_acceleration_rate_limited_closures.len()),
+            (AhrsStatusMessage::get_ascii_id(), self.ahrs_status_closures.len() + self.ahrs_status_batch_closures.len() + self.ahrs_status_rate_limited_closures.len()),
+            (HighGAccelerometerMessage::get_ascii_id(), self.high_g_accelerometer_closures.len() + self.high_g_accelerometer_batch_closures.len() + self.high_g_accelerometer_rate_limited_closures.len()),
+            (TemperatureMessage::get_ascii_id(), self.temperature_closures.len() + self.temperature_batch_closures.len() + self.temperature_rate_limited_closures.len()),
+            (BatteryMessage::get_ascii_id(), self.battery_closures.len() + self.battery_batch_closures.len() + self.battery_rate_limited_closures.len()),
+            (RssiMessage::get_ascii_id(), self.rssi_closures.len() + self.rssi_batch_closures.len() + self.rssi_rate_limited_closures.len()),
+            (SerialAccessoryMessage::get_ascii_id(), self.serial_accessory_closures.len() + self.serial_accessory_batch_closures.len() + self.serial_accessory_rate_limited_closures.len()),
+            (NotificationMessage::get_ascii_id(), self.notification_closures.len() + self.notification_batch_closures.len() + self.notification_rate_limited_closures.len()),
+            (ErrorMessage::get_ascii_id(), self.error_closures.len() + self.error_batch_closures.len() + self.error_rate_limited_closures.len()),
+            // End of code block #5 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+        ];
+
+        subscriptions.iter().filter(|(_, number_of_closures)| all || *number_of_closures > 0).fold(0, |subscriptions, (identifier, _)| subscriptions | subscription_bit(*identifier))
+    }
+}
+
+struct Registry {
+    subscribers: Mutex<Arc<Subscribers>>, // immutable snapshot replaced on each change
+    subscriptions: AtomicU64, // message types with at least one closure
+    version: AtomicU64,
+    inline_subscribers: Mutex<(u64, Arc<Subscribers>)>, // version and snapshot used for inline dispatch, dispatcher thread keeps its own
+    dispatching_version: AtomicU64,
+    dispatching_thread: AtomicU64,
+    dispatched: (Mutex<()>, Condvar), // signalled when dispatching version changes if threads are waiting
+    threads_waiting: AtomicUsize,
+    removed: Mutex<Vec<u64>>, // closures marked as removed but not yet reaped
+    removal_pending: AtomicBool,
+}
+
+impl Registry {
+    fn dispatch<F>(&self, dispatching: &mut (u64, Arc<Subscribers>), closure: F) where F: FnOnce(&Subscribers) { // caller must hold the dispatching token
+        self.dispatching_thread.store(thread_number(), Ordering::SeqCst);
+        self.dispatching_version.store(DISPATCHING_PENDING, Ordering::SeqCst);
+
+        self.refresh(dispatching);
+
+        self.dispatching_version.store(dispatching.0, Ordering::SeqCst);
+        self.notify_dispatched();
+
+        closure(&dispatching.1);
+
+        self.dispatching_version.store(DISPATCHING_NONE, Ordering::SeqCst);
+        self.dispatching_thread.store(NO_THREAD, Ordering::SeqCst);
+        self.notify_dispatched();
+    }
+
+    fn notify_dispatched(&self) {
+        if self.threads_waiting.load(Ordering::SeqCst) > 0 {
+            let _lock = self.dispatched.0.lock().unwrap(); // held so that a waiting thread cannot miss the notification
+            self.dispatched.1.notify_all();
+        }
+    }
+
+    fn wait_for_dispatcher(&self, version: u64) { // waits until closures of older versions can no longer be called
+        if self.dispatching_thread.load(Ordering::SeqCst) == thread_number() {
+            return; // called from within a closure
+        }
+
+        let mut lock = self.dispatched.0.lock().unwrap();
+
+        self.threads_waiting.fetch_add(1, Ordering::SeqCst);
+
+        loop {
+            let dispatching_version = self.dispatching_version.load(Ordering::SeqCst);
+
+            if dispatching_version == DISPATCHING_NONE || (dispatching_version != DISPATCHING_PENDING && dispatching_version >= version) {
+                break;
+            }
+            lock = self.dispatched.1.wait(lock).unwrap();
+        }
+
+        self.threads_waiting.fetch_sub(1, Ordering::SeqCst);
+    }
+
+    fn update<F>(&self, closure: F) -> u64 where F: FnOnce(&mut Subscribers) {
+        let mut subscribers = self.subscribers.lock().unwrap();
+
+        let mut updated_subscribers = Subscribers::clone(&subscribers);
+        std::mem::take(&mut *self.removed.lock().unwrap()).into_iter().for_each(|closure_id| updated_subscribers.remove(closure_id));
+        closure(&mut updated_subscribers);
+        self.subscriptions.store(updated_subscribers.get_subscriptions(), Ordering::SeqCst);
+        *subscribers = Arc::new(updated_subscribers);
+
+        self.version.fetch_add(1, Ordering::SeqCst) + 1
+    }
+
+    fn reap(&self) { // removes closures marked as removed, called by dispatcher thread
+        if self.removal_pending.swap(false, Ordering::SeqCst) {
+            self.update(|_| {});
+        }
+    }
+
+    fn refresh(&self, dispatching: &mut (u64, Arc<Subscribers>)) {
+        let latest_version = self.version.load(Ordering::SeqCst);
+
+        if latest_version != dispatching.0 {
+            *dispatching = (latest_version, self.subscribers.lock().unwrap().clone()); // only locked when subscribers have changed
+        }
+    }
+}
+
+struct QueueState {
+    messages: VecDeque<DispatcherData>,
+    conflated: Vec<DispatcherData>, // latest of each type received while queue full, in the order received
+    policy: QueuePolicy,
+    number_of_senders: usize,
+    dispatching: bool, // token held by the dispatcher thread or an inline sender so that closures are never called concurrently
+    dispatcher_waiting: bool,
+    senders_waiting: usize,
+}
+
+struct Queue {
+    state: Mutex<QueueState>,
+    not_empty: Condvar,
+    not_full: Condvar,
+    capacity: AtomicUsize,
+    inline: AtomicBool,
+}
+
+impl Queue {
+    fn notify_dispatcher(&self, state: &QueueState) {
+        if state.dispatcher_waiting {
+            self.not_empty.notify_one();
+        }
+    }
+}
+
+pub struct DispatcherSender {
+    queue: Arc<Queue>,
+    registry: Arc<Registry>,
+    statistics: Arc<AtomicStatistics>,
+}
+
+impl Clone for DispatcherSender {
+    fn clone(&self) -> DispatcherSender {
+        self.queue.state.lock().unwrap().number_of_senders += 1;
+
+        DispatcherSender {
+            queue: self.queue.clone(),
+            registry: self.registry.clone(),
+            statistics: self.statistics.clone(),
+        }
+    }
+}
+
+impl Drop for DispatcherSender {
+    fn drop(&mut self) {
+        let mut state = self.queue.state.lock().unwrap();
+
+        state.number_of_senders -= 1;
+
+        if state.number_of_senders == 0 {
+            self.queue.not_empty.notify_one(); // dispatcher thread exits once all senders dropped
+        }
+    }
+}
+
+impl DispatcherSender {
+    pub fn send(&self, data: DispatcherData) -> Result<(), ()> {
+        let queue = &self.queue;
+        let mut state = queue.state.lock().unwrap();
+
+        if queue.inline.load(Ordering::SeqCst) && is_shared_thread() == false && state.dispatching == false && state.messages.is_empty() && state.conflated.is_empty() {
+            state.dispatching = true; // dispatcher thread is idle so order is maintained
+            drop(state);
+
+            let mut inline_subscribers = self.registry.inline_subscribers.lock().unwrap();
+
+            let deadline = inline_subscribers.1.batch_deadline.get();
+
+            self.registry.dispatch(&mut inline_subscribers, |subscribers| Dispatcher::dispatch(subscribers, data));
+
+            let deadline_changed = inline_subscribers.1.batch_deadline.get() != deadline;
+
+            drop(inline_subscribers);
+
+            let mut state = queue.state.lock().unwrap();
+            state.dispatching = false;
+
+            if deadline_changed || state.messages.is_empty() == false || state.conflated.is_empty() == false {
+                queue.notify_dispatcher(&state); // messages may have been queued while token held, batch deadline may have been set
+            }
+            return Ok(());
+        }
+
+        if state.conflated.is_empty() == false && DispatcherSender::is_droppable(&data) {
+            if let Some(index) = state.conflated.iter().position(|conflated| std::mem::discriminant(conflated) == std::mem::discriminant(&data)) {
+                state.conflated.remove(index); // replaced so that messages of each type remain in order
+                state.conflated.push(data);
+                self.statistics.dropped_total.fetch_add(1, Ordering::Relaxed);
+                return Ok(());
+            }
+        }
+
+        let capacity = queue.capacity.load(Ordering::SeqCst);
+
+        if state.messages.len() >= capacity {
+            let policy = match state.policy {
+                QueuePolicy::Block if is_shared_thread() => QueuePolicy::DropOldest, // blocking would stall all connections sharing the thread
+                policy => policy,
+            };
+
+            match policy {
+                QueuePolicy::Block => {
+                    while state.messages.len() >= queue.capacity.load(Ordering::SeqCst) {
+                        state.senders_waiting += 1;
+                        state = queue.not_full.wait(state).unwrap();
+                        state.senders_waiting -= 1;
+                    }
+                }
+                QueuePolicy::DropNewest => {
+                    if DispatcherSender::is_droppable(&data) {
+                        self.statistics.dropped_total.fetch_add(1, Ordering::Relaxed);
+                        return Ok(());
+                    }
+                }
+                QueuePolicy::DropOldest => {
+                    match state.messages.iter().position(DispatcherSender::is_droppable) {
+                        Some(index) => {
+                            state.messages.remove(index); // messages that cannot be dropped keep their position
+                            self.statistics.dropped_total.fetch_add(1, Ordering::Relaxed);
+                        }
+                        None => {
+                            if DispatcherSender::is_droppable(&data) {
+                                self.statistics.dropped_total.fetch_add(1, Ordering::Relaxed); // new message is the oldest that can be dropped
+                                return Ok(());
+                            }
+                        }
+                    }
+                }
+                QueuePolicy::Conflate => {
+                    if DispatcherSender::is_droppable(&data) {
+                        state.conflated.push(data);
+                        return Ok(());
+                    }
+                }
+            }
+        }
+
+        state.messages.push_back(data); // messages that cannot be dropped may exceed capacity
+        queue.notify_dispatcher(&state);
+        Ok(())
+    }
+
+    fn is_droppable(data: &DispatcherData) -> bool {
+        match data {
+            DispatcherData::Command(_) | DispatcherData::EndOfFile() => false, // responses and end of file must always be delivered
+            _ => true,
+        }
+    }
+}
+
+pub struct Dispatcher {
+    pub sender: DispatcherSender,
+    closure_counter: AtomicU64,
+    registry: Arc<Registry>,
+}
+
+impl Dispatcher {
+    pub fn new(statistics: Arc<AtomicStatistics>) -> Dispatcher {
+        let subscribers: Arc<Subscribers> = Arc::new(Default::default());
+
+        let registry = Arc::new(Registry {
+            subscribers: Mutex::new(subscribers.clone()),
+            subscriptions: AtomicU64::new(0),
+            version: AtomicU64::new(1),
+            inline_subscribers: Mutex::new((0, subscribers)),
+            dispatching_version: AtomicU64::new(DISPATCHING_NONE),
+            dispatching_thread: AtomicU64::new(NO_THREAD),
+            dispatched: (Mutex::new(()), Condvar::new()),
+            threads_waiting: AtomicUsize::new(0),
+            removed: Mutex::new(Vec::new()),
+            removal_pending: AtomicBool::new(false),
+        });
+
+        let queue = Arc::new(Queue {
+            state: Mutex::new(QueueState {
+                messages: VecDeque::new(),
+                conflated: Vec::new(),
+                policy: QueuePolicy::Block,
+                number_of_senders: 1,
+                dispatching: false,
+                dispatcher_waiting: false,
+                senders_waiting: 0,
+            }),
+            not_empty: Condvar::new(),
+            not_full: Condvar::new(),
+            capacity: AtomicUsize::new(DEFAULT_QUEUE_CAPACITY),
+            inline: AtomicBool::new(false),
+        });
+
+        let sender = DispatcherSender {
+            queue: queue.clone(),
+            registry: registry.clone(),
+            statistics,
+        };
+
+        let thread_registry = registry.clone();
+
+        std::thread::spawn(move || {
+            let registry = thread_registry;
+            let mut dispatching = (0, registry.subscribers.lock().unwrap().clone());
+            let mut state = queue.state.lock().unwrap();
+
+            loop {
+                let deadline = match state.dispatching {
+                    true => None,
+                    false => {
+                        registry.refresh(&mut dispatching);
+                        dispatching.1.batch_deadline.get()
+                    }
+                };
+
+                let deadline_due = deadline.map_or(false, |deadline| Instant::now() >= deadline);
+
+                if state.dispatching || (state.messages.is_empty() && state.conflated.is_empty() && deadline_due == false) {
+                    if state.dispatching == false && state.number_of_senders == 0 {
+                        break;
+                    }
+
+                    state.dispatcher_waiting = true;
+
+                    state = match deadline {
+                        Some(deadline) => queue.not_empty.wait_timeout(state, deadline.saturating_duration_since(Instant::now())).unwrap().0,
+                        None => queue.not_empty.wait(state).unwrap(),
+                    };
+
+                    state.dispatcher_waiting = false;
+                    continue;
+                }
+
+                let data = state.messages.pop_front(); // removed while token held so that inline dispatch cannot overtake
+
+                if data.is_some() && state.senders_waiting > 0 {
+                    queue.not_full.notify_all();
+                }
+
+                let conflated = match state.messages.is_empty() {
+                    true => std::mem::take(&mut state.conflated),
+                    false => Vec::new(),
+                };
+
+                state.dispatching = true;
+                drop(state);
+
+                registry.dispatch(&mut dispatching, |subscribers| {
+                    if let Some(data) = data {
+                        Dispatcher::dispatch(subscribers, data);
+                    }
+
+                    conflated.into_iter().for_each(|data| Dispatcher::dispatch(subscribers, data));
+
+                    if deadline_due {
+                        let now = Instant::now();
+
+                        subscribers.batch_deadline.clear(); // recalculated from closures not yet due
+
+                        subscribers.batch_closures.iter().for_each(|(closure, _)| match closure.deadline() {
+                            Some(deadline) if now >= deadline => closure.flush(subscribers),
+                            Some(deadline) => subscribers.batch_deadline.set(deadline),
+                            None => {}
+                        });
+                    }
+                });
+
+                registry.reap();
+
+                state = queue.state.lock().unwrap();
+                state.dispatching = false;
+            }
+        });
+
+        Dispatcher {
+            sender,
+            closure_counter: AtomicU64::new(0),
+            registry,
+        }
+    }
+
+    fn dispatch(subscribers: &Subscribers, data: DispatcherData) {
+        match data {
+            DispatcherData::DecodeError(decode_error) => subscribers.decode_error_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(decode_error))),
+            DispatcherData::Statistics(statistics) => subscribers.statistics_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(statistics))),
+            DispatcherData::Command(command) => subscribers.command_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(command.clone()))),
+            // Start of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            DispatcherData::Inertial(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Inertial(message))));
+                subscribers.inertial_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.inertial_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.inertial_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Magnetometer(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Magnetometer(message))));
+                subscribers.magnetometer_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.magnetometer_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.magnetometer_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Quaternion(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Quaternion(message))));
+                subscribers.quaternion_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.quaternion_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.quaternion_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::RotationMatrix(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::RotationMatrix(message))));
+                subscribers.rotation_matrix_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.rotation_matrix_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.rotation_matrix_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::EulerAngles(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::EulerAngles(message))));
+                subscribers.euler_angles_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.euler_angles_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.euler_angles_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::LinearAcceleration(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::LinearAcceleration(message))));
+                subscribers.linear_acceleration_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.linear_acceleration_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.linear_acceleration_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::EarthAcceleration(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::EarthAcceleration(message))));
+                subscribers.earth_acceleration_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.earth_acceleration_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.earth_acceleration_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::AhrsStatus(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::AhrsStatus(message))));
+                subscribers.ahrs_status_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.ahrs_status_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.ahrs_status_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::HighGAccelerometer(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::HighGAccelerometer(message))));
+                subscribers.high_g_accelerometer_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.high_g_accelerometer_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.high_g_accelerometer_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Temperature(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Temperature(message))));
+                subscribers.temperature_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.temperature_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.temperature_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Battery(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Battery(message))));
+                subscribers.battery_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.battery_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.battery_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Rssi(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Rssi(message))));
+                subscribers.rssi_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.rssi_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.rssi_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::SerialAccessory(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::SerialAccessory(message))));
+                subscribers.serial_accessory_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.serial_accessory_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.serial_accessory_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Notification(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Notification(message))));
+                subscribers.notification_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.notification_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.notification_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            DispatcherData::Error(message) => {
+                subscribers.data_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(&DispatcherData::Error(message))));
+                subscribers.error_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure(message)));
+                subscribers.error_batch_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+                subscribers.error_rate_limited_closures.iter().for_each(|(closure, _)| closure.push(subscribers, message));
+            }
+            // End of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+            DispatcherData::EndOfFile() => {
+                subscribers.batch_closures.iter().for_each(|(closure, _)| closure.flush(subscribers));
+                subscribers.end_of_file_closures.iter().for_each(|(closure, _)| subscribers.call(closure, |closure| closure()));
+            }
+        }
+    }
+
+    fn get_closure_id(&self) -> u64 {
+        self.closure_counter.fetch_add(1, Ordering::SeqCst)
+    }
+
+    fn add_closure<T: ?Sized, F>(&self, closure: Box<T>, closures: F) -> u64 where F: FnOnce(&mut Subscribers) -> &mut Vec<(Arc<Closure<T>>, u64)> {
+        let id = self.get_closure_id();
+        let closure = Closure::new(id, closure);
+
+        self.update_subscribers(|subscribers| {
+            subscribers.timings.push((closure.timing.clone(), id));
+            subscribers.removed_flags.push((closure.removed.clone(), id));
+            closures(subscribers).push((Arc::new(closure), id));
+        });
+        id
+    }
+
+    fn add_batch_closure<T: Send + 'static, F>(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[T]) + Send>, closures: F) -> u64 where F: FnOnce(&mut Subscribers) -> &mut BatchClosures<T> {
+        let id = self.get_closure_id();
+        let closure = Arc::new(BatchClosure::new(id, closure, max_batch, max_latency));
+
+        self.update_subscribers(|subscribers| {
+            subscribers.timings.push((closure.closure.timing.clone(), id));
+            subscribers.removed_flags.push((closure.closure.removed.clone(), id));
+            subscribers.batch_closures.push((closure.clone(), id));
+            closures(subscribers).push((closure, id));
+        });
+        id
+    }
+
+    fn add_rate_limited_closure<T: Send + 'static, F>(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(T) + Send>, closures: F) -> u64 where F: FnOnce(&mut Subscribers) -> &mut RateLimitedClosures<T> {
+        let id = self.get_closure_id();
+        let closure = Arc::new(RateLimitedClosure::new(id, closure, rate_limit, value));
+
+        self.update_subscribers(|subscribers| {
+            subscribers.timings.push((closure.closure.timing.clone(), id));
+            subscribers.removed_flags.push((closure.closure.removed.clone(), id));
+            if rate_limit == RateLimit::Conflate {
+                subscribers.batch_closures.push((closure.clone(), id));
+            }
+            closures(subscribers).push((closure, id));
+        });
+        id
+    }
+
+    fn update_subscribers<F>(&self, closure: F) -> u64 where F: FnOnce(&mut Subscribers) {
+        self.registry.update(closure)
+    }
+
+    pub fn add_decode_error_closure(&self, closure: Box<dyn Fn(DecodeError) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.decode_error_closures)
+    }
+
+    pub fn add_statistics_closure(&self, closure: Box<dyn Fn(Statistics) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.statistics_closures)
+    }
+
+    pub fn add_command_closure(&self, closure: Box<dyn Fn(CommandMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.command_closures)
+    }
+
+    pub fn add_data_closure(&self, closure: Box<dyn Fn(&DispatcherData) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.data_closures)
+    }
+    // Start of code block #3 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+    pub fn add_inertial_closure(&self, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.inertial_closures)
+    }
+
+    pub fn add_inertial_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[InertialMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.inertial_batch_closures)
+    }
+
+    pub fn add_inertial_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.inertial_rate_limited_closures)
+    }
+
+    pub fn add_magnetometer_closure(&self, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.magnetometer_closures)
+    }
+
+    pub fn add_magnetometer_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[MagnetometerMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.magnetometer_batch_closures)
+    }
+
+    pub fn add_magnetometer_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.magnetometer_rate_limited_closures)
+    }
+
+    pub fn add_quaternion_closure(&self, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.quaternion_closures)
+    }
+
+    pub fn add_quaternion_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[QuaternionMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.quaternion_batch_closures)
+    }
+
+    pub fn add_quaternion_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.quaternion_rate_limited_closures)
+    }
+
+    pub fn add_rotation_matrix_closure(&self, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.rotation_matrix_closures)
+    }
+
+    pub fn add_rotation_matrix_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[RotationMatrixMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.rotation_matrix_batch_closures)
+    }
+
+    pub fn add_rotation_matrix_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.rotation_matrix_rate_limited_closures)
+    }
+
+    pub fn add_euler_angles_closure(&self, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.euler_angles_closures)
+    }
+
+    pub fn add_euler_angles_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[EulerAnglesMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.euler_angles_batch_closures)
+    }
+
+    pub fn add_euler_angles_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.euler_angles_rate_limited_closures)
+    }
+
+    pub fn add_linear_acceleration_closure(&self, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.linear_acceleration_closures)
+    }
+
+    pub fn add_linear_acceleration_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[LinearAccelerationMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.linear_acceleration_batch_closures)
+    }
+
+    pub fn add_linear_acceleration_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.linear_acceleration_rate_limited_closures)
+    }
+
+    pub fn add_earth_acceleration_closure(&self, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.earth_acceleration_closures)
+    }
+
+    pub fn add_earth_acceleration_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[EarthAccelerationMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.earth_acceleration_batch_closures)
+    }
+
+    pub fn add_earth_acceleration_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.earth_acceleration_rate_limited_closures)
+    }
+
+    pub fn add_ahrs_status_closure(&self, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.ahrs_status_closures)
+    }
+
+    pub fn add_ahrs_status_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[AhrsStatusMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.ahrs_status_batch_closures)
+    }
+
+    pub fn add_ahrs_status_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.ahrs_status_rate_limited_closures)
+    }
+
+    pub fn add_high_g_accelerometer_closure(&self, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.high_g_accelerometer_closures)
+    }
+
+    pub fn add_high_g_accelerometer_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[HighGAccelerometerMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.high_g_accelerometer_batch_closures)
+    }
+
+    pub fn add_high_g_accelerometer_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.high_g_accelerometer_rate_limited_closures)
+    }
+
+    pub fn add_temperature_closure(&self, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.temperature_closures)
+    }
+
+    pub fn add_temperature_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[TemperatureMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.temperature_batch_closures)
+    }
+
+    pub fn add_temperature_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.temperature_rate_limited_closures)
+    }
+
+    pub fn add_battery_closure(&self, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.battery_closures)
+    }
+
+    pub fn add_battery_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[BatteryMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.battery_batch_closures)
+    }
+
+    pub fn add_battery_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.battery_rate_limited_closures)
+    }
+
+    pub fn add_rssi_closure(&self, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.rssi_closures)
+    }
+
+    pub fn add_rssi_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[RssiMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.rssi_batch_closures)
+    }
+
+    pub fn add_rssi_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.rssi_rate_limited_closures)
+    }
+
+    pub fn add_serial_accessory_closure(&self, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.serial_accessory_closures)
+    }
+
+    pub fn add_serial_accessory_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[SerialAccessoryMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.serial_accessory_batch_closures)
+    }
+
+    pub fn add_serial_accessory_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.serial_accessory_rate_limited_closures)
+    }
+
+    pub fn add_notification_closure(&self, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.notification_closures)
+    }
+
+    pub fn add_notification_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[NotificationMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.notification_batch_closures)
+    }
+
+    pub fn add_notification_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.notification_rate_limited_closures)
+    }
+
+    pub fn add_error_closure(&self, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.error_closures)
+    }
+
+    pub fn add_error_batch_closure(&self, max_batch: usize, max_latency: u32, closure: Box<dyn Fn(&[ErrorMessage]) + Send>) -> u64 {
+        self.add_batch_closure(max_batch, max_latency, closure, |subscribers| &mut subscribers.error_batch_closures)
+    }
+
+    pub fn add_error_rate_limited_closure(&self, rate_limit: RateLimit, value: u32, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
+        self.add_rate_limited_closure(rate_limit, value, closure, |subscribers| &mut subscribers.error_rate_limited_closures)
+    }
+    // End of code block #3 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+    pub fn remove_closure(&self, closure_id: u64) {
+        let version = self.update_subscribers(|subscribers| subscribers.remove(closure_id));
+
+        self.registry.wait_for_dispatcher(version); // closure must not be called after it has been removed
+    }
+
+    #[cfg(feature = "async")]
+    pub fn remove_closure_without_waiting(&self, closure_id: u64) { // closure not called once marked as removed, dispatcher thread removes it later
+        let subscribers = self.registry.subscribers.lock().unwrap();
+
+        subscribers.removed_flags.iter().filter(|(_, id)| id == &closure_id).for_each(|(removed, _)| removed.store(true, Ordering::SeqCst));
+        self.registry.removed.lock().unwrap().push(closure_id);
+        self.registry.removal_pending.store(true, Ordering::SeqCst);
+    }
+
+    pub fn add_end_of_file_closure(&self, closure: Box<dyn Fn() + Send>) -> u64 {
+        self.add_closure(closure, |subscribers| &mut subscribers.end_of_file_closures)
+    }
+
+    pub fn add_time_budget_closure(&self, time_budget: u32, closure: Box<dyn Fn(u64, u64) + Send>) -> u64 {
+        let id = self.get_closure_id();
+        let closure = TimeBudgetClosure { closure: Closure::new(id, closure), time_budget: Duration::from_micros(time_budget as u64) };
+        self.update_subscribers(|subscribers| subscribers.time_budget_closures.push((Arc::new(closure), id)));
+        id
+    }
+
+    pub fn get_closure_timings(&self) -> Vec<ClosureTiming> {
+        self.registry.subscribers.lock().unwrap().timings.iter().map(|(timing, _)| timing.snapshot()).collect()
+    }
+
+    pub fn set_queue_capacity(&self, capacity: usize) {
+        let _state = self.sender.queue.state.lock().unwrap(); // held so that a sender about to wait cannot miss the notification
+        self.sender.queue.capacity.store(capacity, Ordering::SeqCst);
+        self.sender.queue.not_full.notify_all(); // blocked senders may now have space
+    }
+
+    pub fn set_queue_policy(&self, policy: QueuePolicy) {
+        self.sender.queue.state.lock().unwrap().policy = policy;
+    }
+
+    pub fn get_subscriptions(&self) -> u64 {
+        self.registry.subscriptions.load(Ordering::Relaxed)
+    }
+
+    pub fn set_inline_dispatch(&self, inline_dispatch: bool) {
+        self.sender.queue.inline.store(inline_dispatch, Ordering::SeqCst);
+    }
+
+    pub fn remove_all_closures(&self) {
+        let version = self.update_subscribers(|subscribers| *subscribers = Subscribers { batch_deadline: subscribers.batch_deadline.clone(), ..Default::default() });
+
+        self.registry.wait_for_dispatcher(version);
+    }
 }
 
-impl Dispatcher {
-    pub fn new() -> Dispatcher {
-        let (sender, receiver) = crossbeam::channel::unbounded();
+#[cfg(test)]
+mod tests {
+    use super::*;
 
-        let dispatcher = Dispatcher {
-            sender,
-            closure_counter: AtomicU64::new(0),
-            decode_error_closures: Arc::new(Mutex::new(Vec::new())),
-            statistics_closures: Arc::new(Mutex::new(Vec::new())),
-            command_closures: Arc::new(Mutex::new(Vec::new())),
-            data_closures: Arc::new(Mutex::new(Vec::new())),
-            // Start of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-            inertial_closures: Arc::new(Mutex::new(Vec::new())),
-            magnetometer_closures: Arc::new(Mutex::new(Vec::new())),
-            quaternion_closures: Arc::new(Mutex::new(Vec::new())),
-            rotation_matrix_closures: Arc::new(Mutex::new(Vec::new())),
-            euler_angles_closures: Arc::new(Mutex::new(Vec::new())),
-            linear_acceleration_closures: Arc::new(Mutex::new(Vec::new())),
-            earth_acceleration_closures: Arc::new(Mutex::new(Vec::new())),
-            ahrs_status_closures: Arc::new(Mutex::new(Vec::new())),
-            high_g_accelerometer_closures: Arc::new(Mutex::new(Vec::new())),
-            temperature_closures: Arc::new(Mutex::new(Vec::new())),
-            battery_closures: Arc::new(Mutex::new(Vec::new())),
-            rssi_closures: Arc::new(Mutex::new(Vec::new())),
-            serial_accessory_closures: Arc::new(Mutex::new(Vec::new())),
-            notification_closures: Arc::new(Mutex::new(Vec::new())),
-            error_closures: Arc::new(Mutex::new(Vec::new())),
-            // End of code block #2 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-            end_of_file_closures: Arc::new(Mutex::new(Vec::new())),
-        };
+    fn command(key: &str) -> DispatcherData {
+        DispatcherData::Command(CommandMessage {
+            json: String::new(),
+            terminated_json: String::new(),
+            key: key.to_owned(),
+        })
+    }
 
-        let decode_error_closures = dispatcher.decode_error_closures.clone();
-        let statistics_closures = dispatcher.statistics_closures.clone();
-        let command_closures = dispatcher.command_closures.clone();
-        let data_closures = dispatcher.data_closures.clone();
-        // Start of code block #3 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-        let inertial_closures = dispatcher.inertial_closures.clone();
-        let magnetometer_closures = dispatcher.magnetometer_closures.clone();
-        let quaternion_closures = dispatcher.quaternion_closures.clone();
-        let rotation_matrix_closures = dispatcher.rotation_matrix_closures.clone();
-        let euler_angles_closures = dispatcher.euler_angles_closures.clone();
-        let linear_acceleration_closures = dispatcher.linear_acceleration_closures.clone();
-        let earth_acceleration_closures = dispatcher.earth_acceleration_closures.clone();
-        let ahrs_status_closures = dispatcher.ahrs_status_closures.clone();
-        let high_g_accelerometer_closures = dispatcher.high_g_accelerometer_closures.clone();
-        let temperature_closures = dispatcher.temperature_closures.clone();
-        let battery_closures = dispatcher.battery_closures.clone();
-        let rssi_closures = dispatcher.rssi_closures.clone();
-        let serial_accessory_closures = dispatcher.serial_accessory_closures.clone();
-        let notification_closures = dispatcher.notification_closures.clone();
-        let error_closures = dispatcher.error_closures.clone();
-        // End of code block #3 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-        let end_of_file_closures = dispatcher.end_of_file_closures.clone();
-
-        std::thread::spawn(move || loop {
-            match receiver.recv() {
-                Ok(data) => {
-                    match data {
-                        DispatcherData::DecodeError(decode_error) => decode_error_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(decode_error)),
-                        DispatcherData::Statistics(statistics) => statistics_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(statistics)),
-                        DispatcherData::Command(command) => command_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(command.clone())),
-                        // Start of code block #4 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-                        DispatcherData::Inertial(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            inertial_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Magnetometer(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            magnetometer_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Quaternion(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            quaternion_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::RotationMatrix(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            rotation_matrix_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::EulerAngles(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            euler_angles_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::LinearAcceleration(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            linear_acceleration_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::EarthAcceleration(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            earth_acceleration_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::AhrsStatus(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            ahrs_status_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::HighGAccelerometer(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            high_g_accelerometer_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Temperature(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            temperature_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Battery(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            battery_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Rssi(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            rssi_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::SerialAccessory(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            serial_accessory_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Notification(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            notification_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        DispatcherData::Error(message) => {
-                            data_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(Box::new(message)));
-                            error_closures.lock().unwrap().iter().for_each(|(closure, _)| closure(message));
-                        }
-                        // End of code block #4 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-                        DispatcherData::EndOfFile() => end_of_file_closures.lock().unwrap().iter().for_each(|(closure, _)| closure()),
-                    }
+    fn inertial(timestamp: u64) -> DispatcherData {
+        DispatcherData::Inertial(InertialMessage {
+            timestamp,
+            gyroscope_x: 0.0,
+            gyroscope_y: 0.0,
+            gyroscope_z: 0.0,
+            accelerometer_x: 0.0,
+            accelerometer_y: 0.0,
+            accelerometer_z: 0.0,
+        })
+    }
+
+    struct BlockedDispatcher { // dispatcher thread blocked by a command closure until released
+        dispatcher: Dispatcher,
+        statistics: Arc<AtomicStatistics>,
+        received: Arc<Mutex<Vec<String>>>,
+        release_sender: crossbeam::channel::Sender<()>,
+    }
+
+    impl BlockedDispatcher {
+        fn new(capacity: usize, policy: QueuePolicy) -> BlockedDispatcher {
+            let statistics = Arc::new(AtomicStatistics::default());
+            let dispatcher = Dispatcher::new(statistics.clone());
+
+            let (blocked_sender, blocked_receiver) = crossbeam::channel::bounded::<()>(0);
+            let (release_sender, release_receiver) = crossbeam::channel::bounded::<()>(0);
+            let received = Arc::new(Mutex::new(Vec::new()));
+
+            let command_received = received.clone();
+            dispatcher.add_command_closure(Box::new(move |command| {
+                if command.key == "block" {
+                    blocked_sender.send(()).unwrap();
+                    release_receiver.recv().unwrap();
+                    return;
                 }
-                Err(_) => break,
-            }
-        });
+                command_received.lock().unwrap().push(command.key);
+            }));
+
+            let inertial_received = received.clone();
+            dispatcher.add_inertial_closure(Box::new(move |message| inertial_received.lock().unwrap().push(message.timestamp.to_string())));
+
+            let end_of_file_received = received.clone();
+            dispatcher.add_end_of_file_closure(Box::new(move || end_of_file_received.lock().unwrap().push("end of file".to_owned())));
+
+            dispatcher.set_queue_capacity(capacity);
+            dispatcher.set_queue_policy(policy);
+
+            dispatcher.sender.send(command("block")).unwrap();
+            blocked_receiver.recv().unwrap();
+
+            BlockedDispatcher { dispatcher, statistics, received, release_sender }
+        }
+
+        fn release(&self, number_of_messages: usize) -> Vec<String> { // waits for number of messages to be received
+            self.release_sender.send(()).unwrap();
 
-        dispatcher
+            while self.received.lock().unwrap().len() < number_of_messages {
+                std::thread::yield_now();
+            }
+            self.received.lock().unwrap().clone()
+        }
     }
 
-    fn get_closure_id(&self) -> u64 {
-        self.closure_counter.fetch_add(1, Ordering::SeqCst)
+    #[test]
+    fn drop_oldest_keeps_commands_in_order_and_within_capacity() {
+        const CAPACITY: usize = 4;
+
+        let blocked = BlockedDispatcher::new(CAPACITY, QueuePolicy::DropOldest);
+
+        blocked.dispatcher.sender.send(command("head")).unwrap();
+
+        for timestamp in 0..10 {
+            blocked.dispatcher.sender.send(inertial(timestamp)).unwrap();
+        }
+
+        {
+            let state = blocked.dispatcher.sender.queue.state.lock().unwrap();
+
+            assert_eq!(state.messages.len(), CAPACITY);
+            assert!(matches!(state.messages.front(), Some(DispatcherData::Command(command)) if command.key == "head"));
+        }
+
+        assert_eq!(blocked.release(CAPACITY), vec!["head", "7", "8", "9"]);
+        assert_eq!(blocked.statistics.dropped_total.load(Ordering::Relaxed), 7);
     }
 
-    pub fn add_decode_error_closure(&self, closure: Box<dyn Fn(DecodeError) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.decode_error_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn block_waits_until_dispatcher_makes_space() {
+        let blocked = BlockedDispatcher::new(2, QueuePolicy::Block);
+
+        let sender = blocked.dispatcher.sender.clone();
+        let thread = std::thread::spawn(move || (0..5).for_each(|timestamp| sender.send(inertial(timestamp)).unwrap()));
+
+        while blocked.dispatcher.sender.queue.state.lock().unwrap().senders_waiting == 0 {
+            std::thread::yield_now();
+        }
+
+        assert_eq!(blocked.dispatcher.sender.queue.state.lock().unwrap().messages.len(), 2);
+        assert_eq!(thread.is_finished(), false);
+
+        assert_eq!(blocked.release(5), vec!["0", "1", "2", "3", "4"]);
+
+        thread.join().unwrap();
+        assert_eq!(blocked.statistics.dropped_total.load(Ordering::Relaxed), 0);
     }
 
-    pub fn add_statistics_closure(&self, closure: Box<dyn Fn(Statistics) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.statistics_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn set_queue_capacity_wakes_blocked_senders() {
+        let blocked = BlockedDispatcher::new(1, QueuePolicy::Block);
+
+        let sender = blocked.dispatcher.sender.clone();
+        let thread = std::thread::spawn(move || (0..3).for_each(|timestamp| sender.send(inertial(timestamp)).unwrap()));
+
+        while blocked.dispatcher.sender.queue.state.lock().unwrap().senders_waiting == 0 {
+            std::thread::yield_now();
+        }
+
+        blocked.dispatcher.set_queue_capacity(3);
+        thread.join().unwrap(); // completes while dispatcher thread still blocked
+
+        assert_eq!(blocked.dispatcher.sender.queue.state.lock().unwrap().messages.len(), 3);
+        assert_eq!(blocked.release(3), vec!["0", "1", "2"]);
     }
 
-    pub fn add_command_closure(&self, closure: Box<dyn Fn(CommandMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.command_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn drop_newest_keeps_oldest_and_reports_dropped_total() {
+        let blocked = BlockedDispatcher::new(3, QueuePolicy::DropNewest);
+
+        blocked.dispatcher.sender.send(command("head")).unwrap();
+
+        for timestamp in 0..10 {
+            blocked.dispatcher.sender.send(inertial(timestamp)).unwrap();
+        }
+
+        blocked.dispatcher.sender.send(command("tail")).unwrap();
+        blocked.dispatcher.sender.send(DispatcherData::EndOfFile()).unwrap();
+
+        assert_eq!(blocked.release(5), vec!["head", "0", "1", "tail", "end of file"]);
+
+        assert_eq!(blocked.statistics.snapshot().dropped_total, 8);
+        assert_eq!(blocked.statistics.update_rates(1000000, &Statistics::default()).dropped_total, 8); // as sent to statistics closures
     }
 
-    pub fn add_data_closure(&self, closure: Box<dyn Fn(Box<dyn DataMessage>) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.data_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn commands_and_end_of_file_are_never_dropped() {
+        for policy in [QueuePolicy::DropNewest, QueuePolicy::DropOldest, QueuePolicy::Conflate] {
+            let blocked = BlockedDispatcher::new(1, policy);
+
+            for index in 0..3 {
+                blocked.dispatcher.sender.send(inertial(index)).unwrap();
+                blocked.dispatcher.sender.send(command(&format!("command {}", index))).unwrap();
+            }
+            blocked.dispatcher.sender.send(DispatcherData::EndOfFile()).unwrap();
+
+            let received = blocked.release(4);
+            let expected = ["command 0", "command 1", "command 2", "end of file"];
+
+            assert!(received.iter().filter(|message| expected.contains(&message.as_str())).eq(expected.iter()), "{}", policy);
+        }
     }
 
-    // Start of code block #5 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+    #[test]
+    fn conflate_flushes_in_order_received() {
+        let blocked = BlockedDispatcher::new(1, QueuePolicy::Conflate);
 
-    pub fn add_inertial_closure(&self, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.inertial_closures.lock().unwrap().push((closure, id));
-        id
+        let quaternion_received = blocked.received.clone();
+        blocked.dispatcher.add_quaternion_closure(Box::new(move |message| quaternion_received.lock().unwrap().push(format!("quaternion {}", message.timestamp))));
+
+        blocked.dispatcher.sender.send(command("head")).unwrap();
+        blocked.dispatcher.sender.send(inertial(1)).unwrap();
+        blocked.dispatcher.sender.send(quaternion(2)).unwrap();
+        blocked.dispatcher.sender.send(inertial(3)).unwrap(); // replaces inertial 1 and moves behind quaternion 2
+
+        assert_eq!(blocked.release(3), vec!["head", "quaternion 2", "3"]);
     }
 
-    pub fn add_magnetometer_closure(&self, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.magnetometer_closures.lock().unwrap().push((closure, id));
-        id
+    fn quaternion(timestamp: u64) -> DispatcherData {
+        DispatcherData::Quaternion(QuaternionMessage { timestamp, w: 1.0, x: 0.0, y: 0.0, z: 0.0 })
     }
 
-    pub fn add_quaternion_closure(&self, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.quaternion_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn batch_flushes_on_count_and_end_of_file() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let (batch_sender, batch_receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_inertial_batch_closure(3, 60000, Box::new(move |messages| batch_sender.send(messages.iter().map(|message| message.timestamp).collect::<Vec<u64>>()).unwrap()));
+
+        for timestamp in 0..7 {
+            dispatcher.sender.send(inertial(timestamp)).unwrap();
+        }
+
+        assert_eq!(batch_receiver.recv().unwrap(), vec![0, 1, 2]);
+        assert_eq!(batch_receiver.recv().unwrap(), vec![3, 4, 5]);
+        assert!(batch_receiver.recv_timeout(Duration::from_millis(50)).is_err()); // partial batch held until deadline
+
+        dispatcher.sender.send(DispatcherData::EndOfFile()).unwrap();
+
+        assert_eq!(batch_receiver.recv().unwrap(), vec![6]);
     }
 
-    pub fn add_rotation_matrix_closure(&self, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.rotation_matrix_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn batch_flushes_on_deadline() {
+        const MAX_LATENCY: u64 = 50;
+
+        for inline_dispatch in [false, true] {
+            let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+            dispatcher.set_inline_dispatch(inline_dispatch);
+
+            let (batch_sender, batch_receiver) = crossbeam::channel::unbounded();
+            dispatcher.add_inertial_batch_closure(100, MAX_LATENCY as u32, Box::new(move |messages| batch_sender.send((Instant::now(), messages.len())).unwrap()));
+
+            let start = Instant::now();
+
+            dispatcher.sender.send(inertial(0)).unwrap();
+            dispatcher.sender.send(inertial(1)).unwrap();
+
+            let (time, length) = batch_receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+
+            assert_eq!(length, 2);
+            assert!(time - start >= Duration::from_millis(MAX_LATENCY), "inline dispatch {}", inline_dispatch);
+        }
     }
 
-    pub fn add_euler_angles_closure(&self, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.euler_angles_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn batch_deadlines_survive_snapshot_changes() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let (batch_sender, batch_receiver) = crossbeam::channel::unbounded();
+
+        let inertial_sender = batch_sender.clone();
+        dispatcher.add_inertial_batch_closure(100, 200, Box::new(move |_| inertial_sender.send(("inertial", Instant::now())).unwrap()));
+
+        let start = Instant::now();
+        dispatcher.sender.send(inertial(0)).unwrap();
+
+        dispatcher.add_command_closure(Box::new(|_| {})); // new snapshot while batch pending
+        dispatcher.add_quaternion_batch_closure(100, 20, Box::new(move |_| batch_sender.send(("quaternion", Instant::now())).unwrap())); // earlier deadline added later
+
+        dispatcher.sender.send(quaternion(1)).unwrap();
+
+        let (first, first_time) = batch_receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+        let (second, second_time) = batch_receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+
+        assert_eq!((first, second), ("quaternion", "inertial"));
+        assert!(first_time - start >= Duration::from_millis(20));
+        assert!(second_time - start >= Duration::from_millis(200));
     }
 
-    pub fn add_linear_acceleration_closure(&self, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.linear_acceleration_closures.lock().unwrap().push((closure, id));
-        id
+    fn rate_limited(rate_limit: RateLimit, value: u32) -> (Dispatcher, crossbeam::channel::Receiver<(u64, Instant)>) {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_inertial_rate_limited_closure(rate_limit, value, Box::new(move |message| sender.send((message.timestamp, Instant::now())).unwrap()));
+
+        (dispatcher, receiver)
     }
 
-    pub fn add_earth_acceleration_closure(&self, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.earth_acceleration_closures.lock().unwrap().push((closure, id));
-        id
+    fn send_stream(dispatcher: &Dispatcher, number_of_messages: u64, interval: Duration) { // synthetic stream at a fixed rate
+        let start = Instant::now();
+
+        for timestamp in 0..number_of_messages {
+            let time = start + interval * timestamp as u32;
+            std::thread::sleep(time.saturating_duration_since(Instant::now()));
+            dispatcher.sender.send(inertial(timestamp)).unwrap();
+        }
     }
 
-    pub fn add_ahrs_status_closure(&self, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.ahrs_status_closures.lock().unwrap().push((closure, id));
-        id
+    fn wait_for_end_of_file(dispatcher: &Dispatcher) {
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_end_of_file_closure(Box::new(move || sender.send(()).unwrap()));
+        dispatcher.sender.send(DispatcherData::EndOfFile()).unwrap();
+        receiver.recv().unwrap();
     }
 
-    pub fn add_high_g_accelerometer_closure(&self, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.high_g_accelerometer_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn decimate_delivers_every_nth_message() {
+        let (dispatcher, receiver) = rate_limited(RateLimit::Decimate, 4);
+
+        send_stream(&dispatcher, 10, Duration::ZERO);
+        wait_for_end_of_file(&dispatcher);
+
+        assert_eq!(receiver.try_iter().map(|(timestamp, _)| timestamp).collect::<Vec<u64>>(), vec![0, 4, 8]);
     }
 
-    pub fn add_temperature_closure(&self, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.temperature_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn max_rate_limits_delivery_rate() {
+        let (dispatcher, receiver) = rate_limited(RateLimit::MaxRate, 20); // 50 ms period
+
+        let start = Instant::now();
+        send_stream(&dispatcher, 250, Duration::from_millis(1));
+        wait_for_end_of_file(&dispatcher);
+        let duration = start.elapsed();
+        std::thread::sleep(Duration::from_millis(100)); // nothing delivered after stream ends
+
+        let received: Vec<(u64, Instant)> = receiver.try_iter().collect();
+
+        assert_eq!(received[0].0, 0);
+        assert!(received.len() >= 4 && received.len() as u128 <= duration.as_millis() / 50 + 1, "{} messages delivered in {:?}", received.len(), duration);
+        assert!(received.windows(2).all(|pair| pair[1].1 - pair[0].1 >= Duration::from_millis(45))); // closure times include scheduling delay after rate is checked
     }
 
-    pub fn add_battery_closure(&self, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.battery_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn conflate_delivers_latest_message_once_period_has_passed() {
+        let (dispatcher, receiver) = rate_limited(RateLimit::Conflate, 10); // 100 ms period
+
+        send_stream(&dispatcher, 100, Duration::ZERO);
+
+        let (first, first_time) = receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+        let (second, second_time) = receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+
+        assert_eq!((first, second), (0, 99));
+        assert!(second_time - first_time >= Duration::from_millis(100));
+        assert!(receiver.recv_timeout(Duration::from_millis(200)).is_err());
     }
 
-    pub fn add_rssi_closure(&self, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.rssi_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn closure_timing_bins_by_log2_microseconds() {
+        let timing = AtomicClosureTiming::new(7);
+
+        for nanoseconds in [0, 999, 1_000, 3_999, 4_000, 1_000_000_000] {
+            timing.record(Duration::from_nanos(nanoseconds));
+        }
+
+        let snapshot = timing.snapshot();
+        let mut histogram = [0; CLOSURE_TIMING_HISTOGRAM_LENGTH];
+        histogram[0] = 2; // < 1 us
+        histogram[1] = 1; // < 2 us
+        histogram[2] = 1; // < 4 us
+        histogram[3] = 1; // < 8 us
+        histogram[CLOSURE_TIMING_HISTOGRAM_LENGTH - 1] = 1; // everything longer
+
+        assert_eq!(snapshot.closure_id, 7);
+        assert_eq!(snapshot.count, 6);
+        assert_eq!(snapshot.total_time, 1_000_009_998);
+        assert_eq!(snapshot.max_time, 1_000_000_000);
+        assert_eq!(snapshot.histogram, histogram);
     }
 
-    pub fn add_serial_accessory_closure(&self, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.serial_accessory_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn closure_timing_records_dispatched_closure() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let closure_id = dispatcher.add_inertial_closure(Box::new(|_| std::thread::sleep(Duration::from_millis(5))));
+
+        dispatcher.sender.send(inertial(0)).unwrap();
+        dispatcher.sender.send(inertial(1)).unwrap();
+        wait_for_end_of_file(&dispatcher);
+
+        let timing = dispatcher.get_closure_timings().into_iter().find(|timing| timing.closure_id == closure_id).unwrap();
+        let bin = (64 - (timing.max_time / 1000).leading_zeros()) as usize; // bin of longest call
+
+        assert_eq!(timing.count, 2);
+        assert!(timing.max_time >= 5_000_000 && timing.total_time >= 10_000_000 && timing.total_time >= timing.max_time);
+        assert!(bin >= 13); // 5 ms is within 4096 us to 8191 us
+        assert!(timing.histogram[bin] >= 1 && timing.histogram.iter().sum::<u64>() == 2);
+        assert!(timing.histogram[..13].iter().all(|&count| count == 0));
     }
 
-    pub fn add_notification_closure(&self, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.notification_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn time_budget_closure_reports_only_slow_closures() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let slow_id = dispatcher.add_inertial_closure(Box::new(|message| if message.timestamp == 1 { std::thread::sleep(Duration::from_millis(50)) }));
+        dispatcher.add_quaternion_closure(Box::new(|_| {}));
+
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_time_budget_closure(20_000, Box::new(move |closure_id, time| sender.send((closure_id, time)).unwrap()));
+
+        dispatcher.sender.send(inertial(0)).unwrap(); // within budget
+        dispatcher.sender.send(quaternion(0)).unwrap();
+        dispatcher.sender.send(inertial(1)).unwrap(); // exceeds budget
+        wait_for_end_of_file(&dispatcher);
+
+        let exceeded: Vec<(u64, u64)> = receiver.try_iter().collect();
+
+        assert_eq!(exceeded.len(), 1);
+        assert_eq!(exceeded[0].0, slow_id);
+        assert!(exceeded[0].1 >= 50_000_000);
     }
 
-    pub fn add_error_closure(&self, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.error_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn closures_are_never_called_concurrently() { // Closure is only Sync because the dispatching token is held by one thread at a time
+        const NUMBER_OF_THREADS: u64 = 4;
+        const NUMBER_OF_MESSAGES: u64 = 1000;
+
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let calling = Arc::new(AtomicBool::new(false));
+        let overlapped = Arc::new(AtomicBool::new(false));
+        let called = Arc::new(AtomicU64::new(0));
+
+        let (closure_calling, closure_overlapped, closure_called) = (calling.clone(), overlapped.clone(), called.clone());
+        dispatcher.add_inertial_closure(Box::new(move |_| {
+            if closure_calling.swap(true, Ordering::SeqCst) {
+                closure_overlapped.store(true, Ordering::SeqCst);
+            }
+            std::thread::yield_now();
+            closure_calling.store(false, Ordering::SeqCst);
+            closure_called.fetch_add(1, Ordering::SeqCst);
+        }));
+
+        dispatcher.set_inline_dispatch(true); // senders and dispatcher thread compete for the token
+
+        let threads: Vec<_> = (0..NUMBER_OF_THREADS).map(|_| {
+            let sender = dispatcher.sender.clone();
+
+            std::thread::spawn(move || (0..NUMBER_OF_MESSAGES).for_each(|timestamp| sender.send(inertial(timestamp)).unwrap()))
+        }).collect();
+
+        threads.into_iter().for_each(|thread| thread.join().unwrap());
+
+        while called.load(Ordering::SeqCst) < NUMBER_OF_THREADS * NUMBER_OF_MESSAGES {
+            std::thread::yield_now();
+        }
+
+        assert_eq!(overlapped.load(Ordering::SeqCst), false);
     }
-    // End of code block #5 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
-    pub fn remove_closure(&self, closure_id: u64) {
-        self.decode_error_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.statistics_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.command_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.data_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        // Start of code block #6 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-        self.inertial_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.magnetometer_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.quaternion_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.rotation_matrix_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.euler_angles_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.linear_acceleration_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.earth_acceleration_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.ahrs_status_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.high_g_accelerometer_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.temperature_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.battery_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.rssi_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.serial_accessory_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.notification_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        self.error_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
-        // End of code block #6 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
-        self.end_of_file_closures.lock().unwrap().retain(|(_, id)| id != &closure_id);
+    #[test]
+    fn remove_closure_waits_for_running_closure() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let (blocked_sender, blocked_receiver) = crossbeam::channel::bounded::<()>(0);
+        let finished = Arc::new(AtomicBool::new(false));
+
+        let closure_finished = finished.clone();
+        let closure_id = dispatcher.add_command_closure(Box::new(move |_| {
+            blocked_sender.send(()).ok();
+            std::thread::sleep(Duration::from_millis(100));
+            closure_finished.store(true, Ordering::SeqCst);
+        }));
+
+        dispatcher.sender.send(command("block")).unwrap();
+        blocked_receiver.recv().unwrap();
+
+        dispatcher.remove_closure(closure_id);
+
+        assert_eq!(finished.load(Ordering::SeqCst), true);
+        assert_eq!(dispatcher.registry.threads_waiting.load(Ordering::SeqCst), 0);
     }
 
-    pub fn add_end_of_file_closure(&self, closure: Box<dyn Fn() + Send>) -> u64 {
-        let id = self.get_closure_id();
-        self.end_of_file_closures.lock().unwrap().push((closure, id));
-        id
+    #[test]
+    fn inline_dispatch_keeps_order_with_queued_messages() {
+        let blocked = BlockedDispatcher::new(100, QueuePolicy::Block);
+
+        for timestamp in 0..5 {
+            blocked.dispatcher.sender.send(inertial(timestamp)).unwrap();
+        }
+
+        blocked.dispatcher.set_inline_dispatch(true);
+
+        for timestamp in 5..10 {
+            blocked.dispatcher.sender.send(inertial(timestamp)).unwrap(); // queued behind messages already queued
+        }
+
+        let expected: Vec<String> = (0..10).map(|timestamp| timestamp.to_string()).collect();
+        assert_eq!(blocked.release(10), expected);
+
+        loop {
+            let state = blocked.dispatcher.sender.queue.state.lock().unwrap();
+
+            if state.dispatching == false && state.messages.is_empty() {
+                break;
+            }
+        }
+
+        blocked.dispatcher.sender.send(inertial(10)).unwrap();
+
+        assert_eq!(blocked.received.lock().unwrap().last().map(String::as_str), Some("10")); // called before send returned
     }
 
-    pub fn remove_all_closures(&self) {
-        for closure_id in 0..self.closure_counter.load(Ordering::SeqCst) {
-            self.remove_closure(closure_id);
+    #[test]
+    fn shared_thread_does_not_dispatch_inline() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let (thread_sender, thread_receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_inertial_closure(Box::new(move |_| thread_sender.send(std::thread::current().id()).unwrap()));
+
+        dispatcher.set_inline_dispatch(true);
+
+        for shared in [false, true] {
+            let sender = dispatcher.sender.clone();
+
+            let sender_thread = std::thread::spawn(move || {
+                if shared {
+                    set_shared_thread();
+                }
+                sender.send(inertial(0)).unwrap();
+                std::thread::current().id()
+            }).join().unwrap();
+
+            assert_eq!(thread_receiver.recv().unwrap() == sender_thread, shared == false, "shared {}", shared);
         }
     }
+
+    #[test]
+    fn block_does_not_stall_shared_thread() {
+        let statistics = Arc::new(AtomicStatistics::default());
+        let dispatcher = Dispatcher::new(statistics.clone());
+
+        let (blocked_sender, blocked_receiver) = crossbeam::channel::bounded::<()>(0);
+        let (release_sender, release_receiver) = crossbeam::channel::bounded::<()>(0);
+
+        dispatcher.add_command_closure(Box::new(move |_| {
+            blocked_sender.send(()).unwrap();
+            release_receiver.recv().unwrap();
+        }));
+
+        dispatcher.set_queue_capacity(1);
+        dispatcher.set_queue_policy(QueuePolicy::Block);
+
+        dispatcher.sender.send(command("block")).unwrap();
+        blocked_receiver.recv().unwrap();
+
+        let sender = dispatcher.sender.clone();
+
+        std::thread::spawn(move || {
+            set_shared_thread();
+
+            for timestamp in 0..10 {
+                sender.send(inertial(timestamp)).unwrap(); // would block once queue full if not shared
+            }
+        }).join().unwrap();
+
+        assert_eq!(dispatcher.sender.queue.state.lock().unwrap().messages.len(), 1);
+        assert_eq!(statistics.dropped_total.load(Ordering::Relaxed), 9);
+
+        release_sender.send(()).unwrap();
+    }
+
+    #[cfg(feature = "async")]
+    #[test]
+    fn removed_without_waiting_is_not_called_and_is_reaped() {
+        let dispatcher = Dispatcher::new(Arc::new(AtomicStatistics::default()));
+
+        let called = Arc::new(AtomicBool::new(false));
+        let closure_called = called.clone();
+        let closure_id = dispatcher.add_command_closure(Box::new(move |_| closure_called.store(true, Ordering::SeqCst)));
+
+        let (end_sender, end_receiver) = crossbeam::channel::unbounded();
+        dispatcher.add_end_of_file_closure(Box::new(move || end_sender.send(()).unwrap()));
+
+        dispatcher.remove_closure_without_waiting(closure_id);
+
+        dispatcher.sender.send(command("removed")).unwrap();
+        dispatcher.sender.send(DispatcherData::EndOfFile()).unwrap();
+        end_receiver.recv().unwrap();
+
+        assert_eq!(called.load(Ordering::SeqCst), false);
+        assert!(dispatcher.registry.subscribers.lock().unwrap().command_closures.is_empty());
+    }
 }
@@ -0,0 +1,182 @@
+use crate::command_message::*;
+use crate::data_messages::*;
+use crate::decode_error::*;
+use crate::decoder::*;
+
+pub fn encode_ascii(message: &dyn DataMessage, bytes: &mut Vec<u8>) { // NaN and infinite floats are written but cannot be decoded, non-printable characters of char arrays are written as spaces and leading spaces are lost, use binary for these
+    message.write_ascii(bytes);
+    bytes.extend_from_slice(b"\r\n");
+}
+
+pub fn encode_binary(message: &dyn DataMessage, bytes: &mut Vec<u8>) {
+    let start = bytes.len();
+    message.write_binary(bytes);
+    do_byte_stuffing(bytes, start);
+    bytes.push(BYTE_STUFFING_END);
+}
+
+pub fn encode_command(json: &str, bytes: &mut Vec<u8>) -> Result<(), DecodeError> {
+    let command = CommandMessage::parse_json(json)?;
+    bytes.extend_from_slice(command.terminated_json.as_bytes());
+    Ok(())
+}
+
+fn do_byte_stuffing(bytes: &mut Vec<u8>, start: usize) {
+    let number_of_escapes = bytes[start..].iter().filter(|&&byte| byte == BYTE_STUFFING_END || byte == BYTE_STUFFING_ESC).count();
+
+    if number_of_escapes == 0 {
+        return;
+    }
+
+    let mut source_index = bytes.len();
+    bytes.resize(bytes.len() + number_of_escapes, 0);
+    let mut destination_index = bytes.len();
+
+    while source_index > start { // work backwards so that bytes are moved in place
+        source_index -= 1;
+
+        match bytes[source_index] {
+            BYTE_STUFFING_END => {
+                destination_index -= 2;
+                bytes[destination_index] = BYTE_STUFFING_ESC;
+                bytes[destination_index + 1] = BYTE_STUFFING_ESC_END;
+            }
+            BYTE_STUFFING_ESC => {
+                destination_index -= 2;
+                bytes[destination_index] = BYTE_STUFFING_ESC;
+                bytes[destination_index + 1] = BYTE_STUFFING_ESC_ESC;
+            }
+            byte => {
+                destination_index -= 1;
+                bytes[destination_index] = byte;
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::dispatcher::*;
+    use super::*;
+
+    const FLOATS: [f32; 9] = [0.1, -1.5e-7, f32::MAX, f32::MIN_POSITIVE, -0.0, 1e-45, 123456.79, -2.0, 1.0 / 3.0];
+
+    fn message<T: DataMessage>(payload: &[u8]) -> T {
+        let mut bytes = vec![T::get_binary_id()];
+        bytes.extend_from_slice(&0x0A0B_DBDC_0000_0000u64.to_le_bytes()); // timestamp bytes require byte stuffing
+        bytes.extend_from_slice(payload);
+        bytes.push(BYTE_STUFFING_END);
+        T::parse_binary(&bytes).ok().unwrap()
+    }
+
+    fn floats(number_of_floats: usize) -> Vec<u8> {
+        FLOATS[..number_of_floats].iter().flat_map(|float| float.to_le_bytes()).collect()
+    }
+
+    fn decode(bytes: &[u8]) -> Vec<Result<Option<DispatcherData>, DecodeError>> {
+        let mut results = Vec::new();
+        StreamDecoder::new().process_bytes(bytes, ALL_SUBSCRIPTIONS, |result| results.push(result));
+        results
+    }
+
+    fn round_trip(message: &dyn DataMessage, encode: fn(&dyn DataMessage, &mut Vec<u8>)) -> Option<Vec<u8>> { // binary form of decoded message
+        let mut bytes = Vec::new();
+        encode(message, &mut bytes);
+
+        match decode(&bytes).as_slice() {
+            [Ok(Some(data))] => {
+                let mut decoded = Vec::new();
+                data.as_data_message()?.write_binary(&mut decoded);
+                Some(decoded)
+            }
+            _ => None,
+        }
+    }
+
+    fn assert_round_trip<T: DataMessage>(payload: &[u8]) {
+        let message: T = message(payload);
+
+        let mut expected = Vec::new();
+        message.write_binary(&mut expected);
+
+        assert!(round_trip(&message, encode_ascii) == Some(expected.clone()), "{} ASCII", T::get_ascii_id() as char);
+        assert!(round_trip(&message, encode_binary) == Some(expected), "{} binary", T::get_ascii_id() as char);
+    }
+
+    #[test]
+    fn float_messages_round_trip() {
+        assert_round_trip::<InertialMessage>(&floats(6));
+        assert_round_trip::<MagnetometerMessage>(&floats(3));
+        assert_round_trip::<QuaternionMessage>(&floats(4));
+        assert_round_trip::<RotationMatrixMessage>(&floats(9));
+        assert_round_trip::<EulerAnglesMessage>(&floats(3));
+        assert_round_trip::<LinearAccelerationMessage>(&floats(7));
+        assert_round_trip::<EarthAccelerationMessage>(&floats(7));
+        assert_round_trip::<AhrsStatusMessage>(&floats(4));
+        assert_round_trip::<HighGAccelerometerMessage>(&floats(3));
+        assert_round_trip::<TemperatureMessage>(&floats(1));
+        assert_round_trip::<BatteryMessage>(&floats(3));
+        assert_round_trip::<RssiMessage>(&floats(2));
+    }
+
+    #[test]
+    fn char_array_messages_round_trip() {
+        let payload = b"Hello, world! \"quoted\" {not a command}";
+
+        assert_round_trip::<SerialAccessoryMessage>(payload);
+        assert_round_trip::<NotificationMessage>(payload);
+        assert_round_trip::<ErrorMessage>(payload);
+        assert_round_trip::<NotificationMessage>(&[]);
+        assert_round_trip::<NotificationMessage>(&[b'x'; 255]); // longest char array
+    }
+
+    #[test]
+    fn binary_char_array_keeps_all_bytes() {
+        let payload = [b'\n', b'\r', BYTE_STUFFING_ESC, BYTE_STUFFING_ESC_END, 0x00, 0xFF, b' ', b','];
+        let message: NotificationMessage = message(&payload);
+
+        let mut expected = Vec::new();
+        message.write_binary(&mut expected);
+
+        assert!(round_trip(&message, encode_binary) == Some(expected));
+    }
+
+    #[test]
+    fn ascii_char_array_replaces_unframeable_characters() {
+        let message: NotificationMessage = message(b"a\nb\rc\xDBd\xFF\r\n");
+
+        let mut bytes = Vec::new();
+        encode_ascii(&message, &mut bytes);
+
+        assert_eq!(bytes.iter().filter(|&&byte| byte == b'\n').count(), 1); // framing preserved
+
+        match decode(&bytes).as_slice() {
+            [Ok(Some(DispatcherData::Notification(decoded)))] => assert_eq!(decoded.char_array_as_string(), "a b c d   "),
+            _ => panic!("message not decoded"),
+        }
+    }
+
+    #[test]
+    fn ascii_non_finite_floats_cannot_be_decoded() {
+        for value in [f32::NAN, f32::INFINITY, f32::NEG_INFINITY] {
+            let message = TemperatureMessage { timestamp: 0, temperature: value };
+
+            let mut bytes = Vec::new();
+            encode_ascii(&message, &mut bytes);
+
+            assert!(matches!(decode(&bytes).as_slice(), [Err(DecodeError::UnableToParseAsciiMessage)]));
+            assert!(round_trip(&message, encode_binary).is_some());
+        }
+    }
+
+    #[test]
+    fn command_round_trips() {
+        let mut bytes = Vec::new();
+        encode_command("{ \"ping\" : null }", &mut bytes).ok().unwrap();
+
+        match decode(&bytes).as_slice() {
+            [Ok(Some(DispatcherData::Command(command)))] => assert_eq!(command.json, "{\"ping\":null}"),
+            _ => panic!("command not decoded"),
+        }
+    }
+}
@@ -2,6 +2,8 @@ use std::os::raw::c_void;
 
 pub type Callback<T> = extern "C" fn(data: T, context: *mut c_void);
 
+pub type BatchCallback<T> = extern "C" fn(data: *const T, length: u32, context: *mut c_void);
+
 pub struct VoidPtr(pub *mut c_void);
 
 unsafe impl Send for VoidPtr {}
@@ -0,0 +1,35 @@
+use std::mem;
+use std::os::raw::c_char;
+use crate::closure_timing::*;
+use crate::ffi::helpers::*;
+
+#[no_mangle]
+pub extern "C" fn XIMU3_closure_timing_to_string(closure_timing: ClosureTiming) -> *const c_char {
+    str_to_char_ptr!(&closure_timing.to_string())
+}
+
+#[repr(C)]
+pub struct ClosureTimings {
+    array: *mut ClosureTiming,
+    length: u32,
+    capacity: u32,
+}
+
+impl From<Vec<ClosureTiming>> for ClosureTimings {
+    fn from(mut vector: Vec<ClosureTiming>) -> Self {
+        let closure_timings = ClosureTimings {
+            array: vector.as_mut_ptr(),
+            length: vector.len() as u32,
+            capacity: vector.capacity() as u32,
+        };
+        mem::forget(vector);
+        closure_timings
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_closure_timings_free(closure_timings: ClosureTimings) {
+    unsafe {
+        Vec::from_raw_parts(closure_timings.array, closure_timings.length as usize, closure_timings.capacity as usize);
+    }
+}
@@ -5,10 +5,14 @@ use crate::connection_type::*;
 use crate::data_messages::*;
 use crate::decode_error::*;
 use crate::ffi::callback::*;
+use crate::ffi::closure_timing::*;
 use crate::ffi::connection_info::*;
 use crate::ffi::helpers::*;
 use crate::ffi::ping_response::*;
 use crate::ffi::result::*;
+use crate::ffi::subscription::*;
+use crate::queue_policy::*;
+use crate::rate_limit::*;
 use crate::statistics::*;
 
 #[no_mangle]
@@ -170,6 +174,72 @@ pub extern "C" fn XIMU3_connection_get_statistics(connection: *mut Connection) -
     connection.get_statistics()
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_get_closure_timings(connection: *mut Connection) -> ClosureTimings {
+    let connection: &Connection = unsafe { &*connection };
+    connection.get_closure_timings().into()
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_max_frame_size(connection: *mut Connection, max_frame_size: u32) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_max_frame_size(max_frame_size as usize);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_queue_capacity(connection: *mut Connection, queue_capacity: u32) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_queue_capacity(queue_capacity as usize);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_queue_policy(connection: *mut Connection, queue_policy: QueuePolicy) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_queue_policy(queue_policy);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_inline_dispatch(connection: *mut Connection, inline_dispatch: bool) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_inline_dispatch(inline_dispatch);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_reactor_enabled(connection: *mut Connection, reactor_enabled: bool) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_reactor_enabled(reactor_enabled);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_receive_buffer_size(connection: *mut Connection, receive_buffer_size: u32) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_receive_buffer_size(receive_buffer_size as usize);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_receive_port_shared(connection: *mut Connection, receive_port_shared: bool) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_receive_port_shared(receive_port_shared);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_tcp_no_delay(connection: *mut Connection, tcp_no_delay: bool) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_tcp_no_delay(tcp_no_delay);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_memory_mapped(connection: *mut Connection, memory_mapped: bool) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_memory_mapped(memory_mapped);
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_set_replay(connection: *mut Connection, speed: f32, start_time: u64, stop_time: u64) {
+    let connection: &Connection = unsafe { &*connection };
+    connection.set_replay(speed, start_time, stop_time);
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_decode_error_callback(connection: *mut Connection, callback: Callback<DecodeError>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -193,6 +263,32 @@ pub extern "C" fn XIMU3_connection_add_inertial_callback(connection: *mut Connec
     connection.add_inertial_closure(Box::new(move |message: InertialMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_inertial_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<InertialMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_inertial_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[InertialMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_inertial_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<InertialMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_inertial_rate_limited_closure(rate_limit, value, Box::new(move |message: InertialMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_inertial(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<InertialMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_inertial(subscription: *mut SubscriptionC, messages: *mut InertialMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_magnetometer_callback(connection: *mut Connection, callback: Callback<MagnetometerMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -200,6 +296,32 @@ pub extern "C" fn XIMU3_connection_add_magnetometer_callback(connection: *mut Co
     connection.add_magnetometer_closure(Box::new(move |message: MagnetometerMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_magnetometer_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<MagnetometerMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_magnetometer_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[MagnetometerMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_magnetometer_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<MagnetometerMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_magnetometer_rate_limited_closure(rate_limit, value, Box::new(move |message: MagnetometerMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_magnetometer(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<MagnetometerMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_magnetometer(subscription: *mut SubscriptionC, messages: *mut MagnetometerMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_quaternion_callback(connection: *mut Connection, callback: Callback<QuaternionMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -207,6 +329,32 @@ pub extern "C" fn XIMU3_connection_add_quaternion_callback(connection: *mut Conn
     connection.add_quaternion_closure(Box::new(move |message: QuaternionMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_quaternion_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<QuaternionMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_quaternion_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[QuaternionMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_quaternion_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<QuaternionMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_quaternion_rate_limited_closure(rate_limit, value, Box::new(move |message: QuaternionMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_quaternion(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<QuaternionMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_quaternion(subscription: *mut SubscriptionC, messages: *mut QuaternionMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_rotation_matrix_callback(connection: *mut Connection, callback: Callback<RotationMatrixMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -214,6 +362,32 @@ pub extern "C" fn XIMU3_connection_add_rotation_matrix_callback(connection: *mut
     connection.add_rotation_matrix_closure(Box::new(move |message: RotationMatrixMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_rotation_matrix_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<RotationMatrixMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_rotation_matrix_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[RotationMatrixMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_rotation_matrix_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<RotationMatrixMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_rotation_matrix_rate_limited_closure(rate_limit, value, Box::new(move |message: RotationMatrixMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_rotation_matrix(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<RotationMatrixMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_rotation_matrix(subscription: *mut SubscriptionC, messages: *mut RotationMatrixMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_euler_angles_callback(connection: *mut Connection, callback: Callback<EulerAnglesMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -221,6 +395,32 @@ pub extern "C" fn XIMU3_connection_add_euler_angles_callback(connection: *mut Co
     connection.add_euler_angles_closure(Box::new(move |message: EulerAnglesMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_euler_angles_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<EulerAnglesMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_euler_angles_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[EulerAnglesMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_euler_angles_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<EulerAnglesMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_euler_angles_rate_limited_closure(rate_limit, value, Box::new(move |message: EulerAnglesMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_euler_angles(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<EulerAnglesMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_euler_angles(subscription: *mut SubscriptionC, messages: *mut EulerAnglesMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_linear_acceleration_callback(connection: *mut Connection, callback: Callback<LinearAccelerationMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -228,6 +428,32 @@ pub extern "C" fn XIMU3_connection_add_linear_acceleration_callback(connection:
     connection.add_linear_acceleration_closure(Box::new(move |message: LinearAccelerationMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_linear_acceleration_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<LinearAccelerationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_linear_acceleration_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[LinearAccelerationMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_linear_acceleration_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<LinearAccelerationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_linear_acceleration_rate_limited_closure(rate_limit, value, Box::new(move |message: LinearAccelerationMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_linear_acceleration(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<LinearAccelerationMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_linear_acceleration(subscription: *mut SubscriptionC, messages: *mut LinearAccelerationMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_earth_acceleration_callback(connection: *mut Connection, callback: Callback<EarthAccelerationMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -235,6 +461,32 @@ pub extern "C" fn XIMU3_connection_add_earth_acceleration_callback(connection: *
     connection.add_earth_acceleration_closure(Box::new(move |message: EarthAccelerationMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_earth_acceleration_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<EarthAccelerationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_earth_acceleration_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[EarthAccelerationMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_earth_acceleration_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<EarthAccelerationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_earth_acceleration_rate_limited_closure(rate_limit, value, Box::new(move |message: EarthAccelerationMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_earth_acceleration(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<EarthAccelerationMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_earth_acceleration(subscription: *mut SubscriptionC, messages: *mut EarthAccelerationMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_ahrs_status_callback(connection: *mut Connection, callback: Callback<AhrsStatusMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -242,6 +494,32 @@ pub extern "C" fn XIMU3_connection_add_ahrs_status_callback(connection: *mut Con
     connection.add_ahrs_status_closure(Box::new(move |message: AhrsStatusMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_ahrs_status_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<AhrsStatusMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_ahrs_status_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[AhrsStatusMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_ahrs_status_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<AhrsStatusMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_ahrs_status_rate_limited_closure(rate_limit, value, Box::new(move |message: AhrsStatusMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_ahrs_status(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<AhrsStatusMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_ahrs_status(subscription: *mut SubscriptionC, messages: *mut AhrsStatusMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_high_g_accelerometer_callback(connection: *mut Connection, callback: Callback<HighGAccelerometerMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -249,6 +527,32 @@ pub extern "C" fn XIMU3_connection_add_high_g_accelerometer_callback(connection:
     connection.add_high_g_accelerometer_closure(Box::new(move |message: HighGAccelerometerMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_high_g_accelerometer_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<HighGAccelerometerMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_high_g_accelerometer_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[HighGAccelerometerMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_high_g_accelerometer_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<HighGAccelerometerMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_high_g_accelerometer_rate_limited_closure(rate_limit, value, Box::new(move |message: HighGAccelerometerMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_high_g_accelerometer(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<HighGAccelerometerMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_high_g_accelerometer(subscription: *mut SubscriptionC, messages: *mut HighGAccelerometerMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_temperature_callback(connection: *mut Connection, callback: Callback<TemperatureMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -256,6 +560,32 @@ pub extern "C" fn XIMU3_connection_add_temperature_callback(connection: *mut Con
     connection.add_temperature_closure(Box::new(move |message: TemperatureMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_temperature_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<TemperatureMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_temperature_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[TemperatureMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_temperature_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<TemperatureMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_temperature_rate_limited_closure(rate_limit, value, Box::new(move |message: TemperatureMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_temperature(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<TemperatureMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_temperature(subscription: *mut SubscriptionC, messages: *mut TemperatureMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_battery_callback(connection: *mut Connection, callback: Callback<BatteryMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -263,6 +593,32 @@ pub extern "C" fn XIMU3_connection_add_battery_callback(connection: *mut Connect
     connection.add_battery_closure(Box::new(move |message: BatteryMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_battery_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<BatteryMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_battery_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[BatteryMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_battery_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<BatteryMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_battery_rate_limited_closure(rate_limit, value, Box::new(move |message: BatteryMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_battery(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<BatteryMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_battery(subscription: *mut SubscriptionC, messages: *mut BatteryMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_rssi_callback(connection: *mut Connection, callback: Callback<RssiMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -270,6 +626,32 @@ pub extern "C" fn XIMU3_connection_add_rssi_callback(connection: *mut Connection
     connection.add_rssi_closure(Box::new(move |message: RssiMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_rssi_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<RssiMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_rssi_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[RssiMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_rssi_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<RssiMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_rssi_rate_limited_closure(rate_limit, value, Box::new(move |message: RssiMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_rssi(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<RssiMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_rssi(subscription: *mut SubscriptionC, messages: *mut RssiMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_serial_accessory_callback(connection: *mut Connection, callback: Callback<SerialAccessoryMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -277,6 +659,32 @@ pub extern "C" fn XIMU3_connection_add_serial_accessory_callback(connection: *mu
     connection.add_serial_accessory_closure(Box::new(move |message: SerialAccessoryMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_serial_accessory_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<SerialAccessoryMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_serial_accessory_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[SerialAccessoryMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_serial_accessory_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<SerialAccessoryMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_serial_accessory_rate_limited_closure(rate_limit, value, Box::new(move |message: SerialAccessoryMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_serial_accessory(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<SerialAccessoryMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_serial_accessory(subscription: *mut SubscriptionC, messages: *mut SerialAccessoryMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_notification_callback(connection: *mut Connection, callback: Callback<NotificationMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
@@ -284,12 +692,64 @@ pub extern "C" fn XIMU3_connection_add_notification_callback(connection: *mut Co
     connection.add_notification_closure(Box::new(move |message: NotificationMessage| callback(message, void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_notification_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<NotificationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_notification_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[NotificationMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_notification_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<NotificationMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_notification_rate_limited_closure(rate_limit, value, Box::new(move |message: NotificationMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_notification(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<NotificationMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_notification(subscription: *mut SubscriptionC, messages: *mut NotificationMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_add_error_callback(connection: *mut Connection, callback: Callback<ErrorMessage>, context: *mut c_void) -> u64 {
     let connection: &Connection = unsafe { &*connection };
     let void_ptr = VoidPtr(context);
     connection.add_error_closure(Box::new(move |message: ErrorMessage| callback(message, void_ptr.0)))
 }
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_error_batch_callback(connection: *mut Connection, max_batch: u32, max_latency: u32, callback: BatchCallback<ErrorMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_error_batch_closure(max_batch as usize, max_latency, Box::new(move |messages: &[ErrorMessage]| callback(messages.as_ptr(), messages.len() as u32, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_error_rate_limited_callback(connection: *mut Connection, rate_limit: RateLimit, value: u32, callback: Callback<ErrorMessage>, context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_error_rate_limited_closure(rate_limit, value, Box::new(move |message: ErrorMessage| callback(message, void_ptr.0)))
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_subscribe_error(connection: *mut Connection, capacity: u32) -> *mut SubscriptionC {
+    let connection: &Connection = unsafe { &*connection };
+    SubscriptionC::new::<ErrorMessage>(connection, capacity)
+}
+
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_poll_error(subscription: *mut SubscriptionC, messages: *mut ErrorMessage, length: u32) -> u32 {
+    let subscription: &SubscriptionC = unsafe { &*subscription };
+    subscription.poll(messages, length)
+}
 // End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
 
 #[no_mangle]
@@ -299,6 +759,13 @@ pub extern "C" fn XIMU3_connection_add_end_of_file_callback(connection: *mut Con
     connection.add_end_of_file_closure(Box::new(move || callback(void_ptr.0)))
 }
 
+#[no_mangle]
+pub extern "C" fn XIMU3_connection_add_time_budget_callback(connection: *mut Connection, time_budget: u32, callback: extern "C" fn(closure_id: u64, time: u64, context: *mut c_void), context: *mut c_void) -> u64 {
+    let connection: &Connection = unsafe { &*connection };
+    let void_ptr = VoidPtr(context);
+    connection.add_time_budget_closure(time_budget, Box::new(move |closure_id, time| callback(closure_id, time, void_ptr.0)))
+}
+
 #[no_mangle]
 pub extern "C" fn XIMU3_connection_remove_callback(connection: *mut Connection, callback_id: u64) {
     let connection: &Connection = unsafe { &*connection };
@@ -3,6 +3,7 @@ mod helpers;
 
 mod callback;
 mod charging_status;
+mod closure_timing;
 mod connection;
 mod connection_info;
 mod connection_type;
@@ -13,5 +14,8 @@ mod file_converter;
 mod network_announcement;
 mod ping_response;
 mod port_scanner;
+mod queue_policy;
+mod rate_limit;
 mod result;
 mod statistics;
+mod subscription;
@@ -0,0 +1,8 @@
+use std::os::raw::c_char;
+use crate::ffi::helpers::*;
+use crate::queue_policy::*;
+
+#[no_mangle]
+pub extern "C" fn XIMU3_queue_policy_to_string(queue_policy: QueuePolicy) -> *const c_char {
+    str_to_char_ptr!(&queue_policy.to_string())
+}
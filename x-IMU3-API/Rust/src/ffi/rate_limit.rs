@@ -0,0 +1,8 @@
+use std::os::raw::c_char;
+use crate::ffi::helpers::*;
+use crate::rate_limit::*;
+
+#[no_mangle]
+pub extern "C" fn XIMU3_rate_limit_to_string(rate_limit: RateLimit) -> *const c_char {
+    str_to_char_ptr!(&rate_limit.to_string())
+}
@@ -0,0 +1,28 @@
+use std::any::Any;
+use crate::connection::*;
+use crate::subscription::*;
+
+pub struct SubscriptionC {
+    internal: Box<dyn Any>,
+}
+
+impl SubscriptionC {
+    pub fn new<T: Subscribable>(connection: &'static Connection, capacity: u32) -> *mut SubscriptionC { // connection is not 'static, caller must free subscription before connection
+        Box::into_raw(Box::new(SubscriptionC { internal: Box::new(connection.subscribe::<T>(capacity as usize)) }))
+    }
+
+    pub fn poll<T: Subscribable>(&self, messages: *mut T, length: u32) -> u32 {
+        if let Some(subscription) = self.internal.downcast_ref::<Subscription<'static, T>>() {
+            let messages = unsafe { std::slice::from_raw_parts_mut(messages, length as usize) };
+
+            return messages.iter_mut().zip(subscription.try_iter()).map(|(element, message)| *element = message).count() as u32;
+        }
+        0 // subscription is for a different message type
+    }
+}
+
+/// Must be called before XIMU3_connection_free is called for the connection that created the subscription.
+#[no_mangle]
+pub extern "C" fn XIMU3_subscription_free(subscription: *mut SubscriptionC) {
+    unsafe { drop(Box::from_raw(subscription)) };
+}
@@ -1,7 +1,7 @@
 use std::fmt;
 use std::ops::Drop;
+use crossbeam::channel::RecvTimeoutError;
 use std::sync::{Arc, Mutex};
-use std::sync::atomic::{AtomicUsize, Ordering};
 use crate::connection::*;
 use crate::connection_info::*;
 use crate::data_logger::*;
@@ -90,13 +90,13 @@ impl FileConverter {
                 return;
             }
 
-            let end_of_file_counter = Arc::new(AtomicUsize::new(0));
+            let (end_of_file_sender, end_of_file_receiver) = crossbeam::channel::unbounded();
 
             for connection in connections.iter() {
-                let end_of_file_counter = end_of_file_counter.clone();
+                let end_of_file_sender = end_of_file_sender.clone();
 
                 connection.add_end_of_file_closure(Box::new(move || {
-                    end_of_file_counter.fetch_add(1, Ordering::SeqCst);
+                    end_of_file_sender.send(()).ok();
                 }));
 
                 if connection.open().is_err() {
@@ -111,11 +111,13 @@ impl FileConverter {
 
             progress.status = FileConverterStatus::InProgress;
 
+            let mut end_of_file_counter = 0;
+
             loop {
-                progress.bytes_processed = connections.iter().map(|connection| connection.get_statistics().data_total).sum();
+                progress.bytes_processed = connections.iter().map(|connection| connection.get_statistics().data_total).sum(); // statistics are atomic so do not block decoding
                 progress.percentage = 100.0 * ((progress.bytes_processed as f64) / (progress.bytes_total as f64)) as f32;
 
-                if end_of_file_counter.load(Ordering::SeqCst) == connections.len() {
+                if end_of_file_counter == connections.len() {
                     break;
                 }
 
@@ -126,7 +128,11 @@ impl FileConverter {
                     closure(progress.clone());
                 }
 
-                std::thread::sleep(std::time::Duration::from_millis(100));
+                match end_of_file_receiver.recv_timeout(std::time::Duration::from_millis(100)) { // woken immediately on end of file
+                    Ok(()) => end_of_file_counter += 1,
+                    Err(RecvTimeoutError::Timeout) => (),
+                    Err(RecvTimeoutError::Disconnected) => return,
+                }
             }
 
             drop(data_logger.unwrap());
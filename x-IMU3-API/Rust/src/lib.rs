@@ -1,9 +1,10 @@
-#[macro_use]
-extern crate scan_fmt;
-
+pub mod batch_decoder;
 pub mod charging_status;
+pub mod closure_timing;
 mod command_message;
 pub mod connection;
+#[cfg(feature = "async")]
+pub mod connection_async;
 pub mod connection_info;
 pub mod connection_type;
 mod connections;
@@ -11,10 +12,14 @@ pub mod data_logger;
 pub mod data_messages;
 pub mod decode_error;
 mod decoder;
+pub mod encoder;
 mod dispatcher;
 mod ffi;
 pub mod file_converter;
 pub mod network_announcement;
 pub mod ping_response;
 pub mod port_scanner;
+pub mod queue_policy;
+pub mod rate_limit;
 pub mod statistics;
+pub mod subscription;
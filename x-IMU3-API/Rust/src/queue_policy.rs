@@ -0,0 +1,21 @@
+use std::fmt;
+
+#[repr(C)]
+#[derive(Clone, Copy, PartialEq)]
+pub enum QueuePolicy {
+    Block,
+    DropNewest,
+    DropOldest,
+    Conflate,
+}
+
+impl fmt::Display for QueuePolicy {
+    fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            QueuePolicy::Block => write!(formatter, "Block"),
+            QueuePolicy::DropNewest => write!(formatter, "Drop newest"),
+            QueuePolicy::DropOldest => write!(formatter, "Drop oldest"),
+            QueuePolicy::Conflate => write!(formatter, "Conflate"),
+        }
+    }
+}
@@ -0,0 +1,19 @@
+use std::fmt;
+
+#[repr(C)]
+#[derive(Clone, Copy, PartialEq)]
+pub enum RateLimit {
+    Decimate, // value is divisor
+    MaxRate, // value is maximum rate in Hz
+    Conflate, // value is maximum rate in Hz, latest message is always delivered
+}
+
+impl fmt::Display for RateLimit {
+    fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            RateLimit::Decimate => write!(formatter, "Decimate"),
+            RateLimit::MaxRate => write!(formatter, "Max rate"),
+            RateLimit::Conflate => write!(formatter, "Conflate"),
+        }
+    }
+}
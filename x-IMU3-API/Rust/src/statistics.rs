@@ -1,4 +1,5 @@
 use std::fmt;
+use std::sync::atomic::{AtomicU32, AtomicU64, Ordering};
 
 #[repr(C)]
 #[derive(Clone, Copy)]
@@ -10,6 +11,8 @@ pub struct Statistics {
     pub message_rate: u32,
     pub error_total: u64,
     pub error_rate: u32,
+    pub skipped_total: u64,
+    pub dropped_total: u64,
 }
 
 impl Default for Statistics {
@@ -22,19 +25,74 @@ impl Default for Statistics {
             message_rate: 0,
             error_total: 0,
             error_rate: 0,
+            skipped_total: 0,
+            dropped_total: 0,
         }
     }
 }
 
 impl fmt::Display for Statistics {
     fn fmt(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
-        write!(formatter, "{:>8} us {:>8} bytes {:>8} bytes/s {:>8} messages {:>8} messages/s {:>8} errors {:>8} errors/s",
+        write!(formatter, "{:>8} us {:>8} bytes {:>8} bytes/s {:>8} messages {:>8} messages/s {:>8} errors {:>8} errors/s {:>8} bytes skipped {:>8} messages dropped",
                self.timestamp,
                self.data_total,
                self.data_rate,
                self.message_total,
                self.message_rate,
                self.error_total,
-               self.error_rate)
+               self.error_rate,
+               self.skipped_total,
+               self.dropped_total)
+    }
+}
+
+#[derive(Default)]
+pub(crate) struct AtomicStatistics {
+    timestamp: AtomicU64,
+    pub data_total: AtomicU64,
+    data_rate: AtomicU32,
+    pub message_total: AtomicU64,
+    message_rate: AtomicU32,
+    pub error_total: AtomicU64,
+    error_rate: AtomicU32,
+    pub skipped_total: AtomicU64,
+    pub dropped_total: AtomicU64,
+}
+
+impl AtomicStatistics {
+    pub fn snapshot(&self) -> Statistics {
+        Statistics {
+            timestamp: self.timestamp.load(Ordering::Relaxed),
+            data_total: self.data_total.load(Ordering::Relaxed),
+            data_rate: self.data_rate.load(Ordering::Relaxed),
+            message_total: self.message_total.load(Ordering::Relaxed),
+            message_rate: self.message_rate.load(Ordering::Relaxed),
+            error_total: self.error_total.load(Ordering::Relaxed),
+            error_rate: self.error_rate.load(Ordering::Relaxed),
+            skipped_total: self.skipped_total.load(Ordering::Relaxed),
+            dropped_total: self.dropped_total.load(Ordering::Relaxed),
+        }
+    }
+
+    pub fn update_rates(&self, timestamp: u64, previous_statistics: &Statistics) -> Statistics {
+        let mut statistics = self.snapshot();
+
+        statistics.timestamp = timestamp;
+
+        let delta_time = (statistics.timestamp - previous_statistics.timestamp) as f32 / 1E6;
+        let delta_data = statistics.data_total - previous_statistics.data_total;
+        let delta_message = statistics.message_total - previous_statistics.message_total;
+        let delta_error = statistics.error_total - previous_statistics.error_total;
+
+        statistics.data_rate = (delta_data as f32 / delta_time).round() as u32;
+        statistics.message_rate = (delta_message as f32 / delta_time).round() as u32;
+        statistics.error_rate = (delta_error as f32 / delta_time).round() as u32;
+
+        self.timestamp.store(statistics.timestamp, Ordering::Relaxed);
+        self.data_rate.store(statistics.data_rate, Ordering::Relaxed);
+        self.message_rate.store(statistics.message_rate, Ordering::Relaxed);
+        self.error_rate.store(statistics.error_rate, Ordering::Relaxed);
+
+        statistics
     }
 }
@@ -0,0 +1,235 @@
+use crossbeam::channel::{Receiver, TrySendError};
+use std::ops::Drop;
+use crate::connection::*;
+use crate::data_messages::*;
+use crate::decode_error::*;
+use crate::statistics::*;
+
+pub trait Subscribable: Send + Sized + 'static {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(Self) + Send>) -> u64;
+}
+
+impl Subscribable for DecodeError {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(DecodeError) + Send>) -> u64 {
+        connection.add_decode_error_closure(closure)
+    }
+}
+
+impl Subscribable for Statistics {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(Statistics) + Send>) -> u64 {
+        connection.add_statistics_closure(closure)
+    }
+}
+// Start of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+impl Subscribable for InertialMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(InertialMessage) + Send>) -> u64 {
+        connection.add_inertial_closure(closure)
+    }
+}
+
+impl Subscribable for MagnetometerMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(MagnetometerMessage) + Send>) -> u64 {
+        connection.add_magnetometer_closure(closure)
+    }
+}
+
+impl Subscribable for QuaternionMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(QuaternionMessage) + Send>) -> u64 {
+        connection.add_quaternion_closure(closure)
+    }
+}
+
+impl Subscribable for RotationMatrixMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(RotationMatrixMessage) + Send>) -> u64 {
+        connection.add_rotation_matrix_closure(closure)
+    }
+}
+
+impl Subscribable for EulerAnglesMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(EulerAnglesMessage) + Send>) -> u64 {
+        connection.add_euler_angles_closure(closure)
+    }
+}
+
+impl Subscribable for LinearAccelerationMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(LinearAccelerationMessage) + Send>) -> u64 {
+        connection.add_linear_acceleration_closure(closure)
+    }
+}
+
+impl Subscribable for EarthAccelerationMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(EarthAccelerationMessage) + Send>) -> u64 {
+        connection.add_earth_acceleration_closure(closure)
+    }
+}
+
+impl Subscribable for AhrsStatusMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(AhrsStatusMessage) + Send>) -> u64 {
+        connection.add_ahrs_status_closure(closure)
+    }
+}
+
+impl Subscribable for HighGAccelerometerMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(HighGAccelerometerMessage) + Send>) -> u64 {
+        connection.add_high_g_accelerometer_closure(closure)
+    }
+}
+
+impl Subscribable for TemperatureMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(TemperatureMessage) + Send>) -> u64 {
+        connection.add_temperature_closure(closure)
+    }
+}
+
+impl Subscribable for BatteryMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(BatteryMessage) + Send>) -> u64 {
+        connection.add_battery_closure(closure)
+    }
+}
+
+impl Subscribable for RssiMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(RssiMessage) + Send>) -> u64 {
+        connection.add_rssi_closure(closure)
+    }
+}
+
+impl Subscribable for SerialAccessoryMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(SerialAccessoryMessage) + Send>) -> u64 {
+        connection.add_serial_accessory_closure(closure)
+    }
+}
+
+impl Subscribable for NotificationMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(NotificationMessage) + Send>) -> u64 {
+        connection.add_notification_closure(closure)
+    }
+}
+
+impl Subscribable for ErrorMessage {
+    fn add_closure(connection: &Connection, closure: Box<dyn Fn(ErrorMessage) + Send>) -> u64 {
+        connection.add_error_closure(closure)
+    }
+}
+// End of code block #0 generated by x-IMU3-API/Rust/src/data_messages/generate_data_messages.py
+
+pub struct Subscription<'a, T> {
+    connection: &'a Connection,
+    receiver: Receiver<T>,
+    closure_id: u64,
+}
+
+pub(crate) fn add_bounded_closure<T: Subscribable, F>(connection: &Connection, capacity: usize, received: F) -> (Receiver<T>, u64) where F: Fn() + Send + 'static { // received is called after each message is queued
+    let (sender, receiver) = crossbeam::channel::bounded(std::cmp::max(capacity, 1));
+    let closure_receiver = receiver.clone();
+
+    let closure_id = T::add_closure(connection, Box::new(move |message| {
+        if let Err(TrySendError::Full(message)) = sender.try_send(message) {
+            closure_receiver.try_recv().ok(); // discard oldest message so that latest is always available
+            sender.try_send(message).ok();
+        }
+
+        received();
+    }));
+
+    (receiver, closure_id)
+}
+
+impl<T: Subscribable> Subscription<'_, T> {
+    pub fn new<'a>(connection: &'a Connection, capacity: usize) -> Subscription<'a, T> {
+        let (receiver, closure_id) = add_bounded_closure(connection, capacity, || {});
+
+        Subscription {
+            connection,
+            receiver,
+            closure_id,
+        }
+    }
+
+    pub fn poll(&self) -> Option<T> {
+        self.receiver.try_recv().ok()
+    }
+
+    pub fn try_iter(&self) -> impl Iterator<Item=T> + '_ {
+        self.receiver.try_iter()
+    }
+}
+
+impl<T> Drop for Subscription<'_, T> {
+    fn drop(&mut self) {
+        self.connection.remove_closure(self.closure_id);
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+    use crate::connection_info::*;
+    use crate::encoder::*;
+    use super::*;
+
+    fn file_connection(name: &str, number_of_messages: u64) -> (Connection, std::path::PathBuf) {
+        let file_path = std::env::temp_dir().join(format!("ximu3_subscription_test_{}_{}", name, std::process::id()));
+        let mut bytes = Vec::new();
+
+        for timestamp in 0..number_of_messages {
+            encode_binary(&TemperatureMessage { timestamp, temperature: 0.0 }, &mut bytes);
+        }
+
+        std::fs::write(&file_path, bytes).unwrap();
+
+        (Connection::new(&ConnectionInfo::FileConnectionInfo(FileConnectionInfo { file_path: file_path.to_str().unwrap().to_owned() })), file_path)
+    }
+
+    fn read_to_end(connection: &Connection) {
+        let (sender, receiver) = crossbeam::channel::unbounded();
+        connection.add_end_of_file_closure(Box::new(move || sender.send(()).unwrap()));
+
+        connection.open().unwrap();
+        receiver.recv_timeout(Duration::from_secs(5)).unwrap();
+    }
+
+    #[test]
+    fn full_subscription_drops_oldest() {
+        let (connection, file_path) = file_connection("full", 100);
+        let subscription = connection.subscribe::<TemperatureMessage>(4);
+
+        read_to_end(&connection);
+
+        assert_eq!(subscription.try_iter().map(|message| message.timestamp).collect::<Vec<u64>>(), vec![96, 97, 98, 99]);
+        assert!(subscription.poll().is_none());
+
+        drop(subscription);
+        connection.close();
+        std::fs::remove_file(file_path).ok();
+    }
+
+    #[test]
+    fn poll_returns_messages_in_order() {
+        let (connection, file_path) = file_connection("poll", 3);
+        let subscription = connection.subscribe::<TemperatureMessage>(10);
+
+        read_to_end(&connection);
+
+        assert_eq!(subscription.poll().map(|message| message.timestamp), Some(0));
+        assert_eq!(subscription.try_iter().map(|message| message.timestamp).collect::<Vec<u64>>(), vec![1, 2]);
+        assert!(subscription.poll().is_none());
+
+        drop(subscription);
+        connection.close();
+        std::fs::remove_file(file_path).ok();
+    }
+
+    #[test]
+    fn drop_removes_closure() {
+        let (connection, file_path) = file_connection("drop", 0);
+
+        let subscription = connection.subscribe::<TemperatureMessage>(1);
+        assert_eq!(connection.get_closure_timings().len(), 1);
+
+        drop(subscription);
+        assert_eq!(connection.get_closure_timings().len(), 0);
+
+        std::fs::remove_file(file_path).ok();
+    }
+}
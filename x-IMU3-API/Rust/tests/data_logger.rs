@@ -0,0 +1,72 @@
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::cell::Cell;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
+use ximu3::connection::*;
+use ximu3::connection_info::*;
+use ximu3::data_logger::*;
+
+struct CountingAllocator; // installed for this test binary only
+
+static ALLOCATIONS: AtomicU64 = AtomicU64::new(0);
+
+thread_local! {
+    static COUNTING: Cell<bool> = const { Cell::new(false) }; // set for the dispatcher thread only
+}
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        if COUNTING.with(|counting| counting.get()) {
+            ALLOCATIONS.fetch_add(1, Ordering::SeqCst);
+        }
+        System.alloc(layout)
+    }
+
+    unsafe fn dealloc(&self, pointer: *mut u8, layout: Layout) {
+        System.dealloc(pointer, layout)
+    }
+}
+
+#[global_allocator]
+static ALLOCATOR: CountingAllocator = CountingAllocator;
+
+#[test]
+fn dispatcher_does_not_allocate_per_message() {
+    const NUMBER_OF_MESSAGES: u64 = 5000;
+
+    let destination = std::env::temp_dir().join(format!("ximu3_data_logger_test_{}", std::process::id()));
+    std::fs::create_dir_all(&destination).unwrap();
+
+    let file_path = destination.join("messages.txt");
+    let lines: String = (0..NUMBER_OF_MESSAGES).map(|timestamp| format!("I,{},0.0,0.0,0.0,0.0,0.0,1.0\n", timestamp)).collect();
+    std::fs::write(&file_path, lines).unwrap();
+
+    let connection = Connection::new(&ConnectionInfo::FileConnectionInfo(FileConnectionInfo { file_path: file_path.to_str().unwrap().to_owned() }));
+
+    let dispatched = Arc::new(AtomicU64::new(0));
+    let closure_dispatched = dispatched.clone();
+    connection.add_inertial_closure(Box::new(move |_| {
+        COUNTING.with(|counting| counting.set(true)); // closures are called after the data closure for the first message
+        closure_dispatched.fetch_add(1, Ordering::SeqCst);
+    }));
+
+    let data_logger = DataLogger::new(destination.to_str().unwrap(), "log", vec![&connection]).unwrap();
+
+    connection.open().unwrap();
+
+    while dispatched.load(Ordering::SeqCst) < NUMBER_OF_MESSAGES {
+        std::thread::sleep(std::time::Duration::from_millis(1));
+    }
+    std::thread::sleep(std::time::Duration::from_millis(50));
+
+    let allocations = ALLOCATIONS.load(Ordering::SeqCst);
+
+    drop(data_logger);
+
+    let csv = std::fs::read_to_string(destination.join("log").join("Connection 0").join("Inertial.csv")).unwrap();
+    std::fs::remove_dir_all(&destination).ok();
+
+    assert_eq!(csv.lines().count() as u64, NUMBER_OF_MESSAGES + 1); // headings and one row per message
+    assert_eq!(connection.get_statistics().dropped_total, 0);
+    assert_eq!(allocations, 0);
+}